@@ -0,0 +1,135 @@
+"""
+Migration: Replace single-column detection indexes with composite indexes
+
+Date: 2025-11-04
+Purpose:
+    scripts/maintenance/audit_query_plans.py 감사 결과 반영.
+    dynamic_block_detection 조회는 모두 "ticker = ? [AND ...] ORDER BY started_at"
+    형태인데, 단일 컬럼 인덱스만 있어 SQLite가 status/block_type 인덱스를 고른 뒤
+    임시 B-tree로 정렬하고 있었습니다.
+
+New indexes:
+    dynamic_block_detection
+        - idx_dbd_ticker_started            (ticker, started_at)
+        - idx_dbd_ticker_condition_started  (ticker, condition_name, started_at)
+        - idx_dbd_ticker_status_started     (ticker, status, started_at)
+        - idx_dbd_pattern_block_type        (pattern_id, block_type)
+    seed_pattern
+        - idx_status_detection_date         (status, detection_date)
+
+Dropped indexes (복합 인덱스 선두 컬럼과 중복이거나 단독 조회가 없음):
+    dynamic_block_detection: ticker, status, condition_name, block_id, block_type,
+        pattern_id, ended_at, yaml_type, logical_level, is_virtual
+    seed_pattern: ticker, status
+
+Usage:
+    python migrations/migrate_add_detection_composite_indexes.py [db_path]
+
+재실행 안전: CREATE는 checkfirst, DROP은 IF EXISTS
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models import DynamicBlockDetectionModel, SeedPatternModel
+
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] [%(levelname)s] %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+REDUNDANT_INDEXES = (
+    'ix_dynamic_block_detection_ticker',
+    'ix_dynamic_block_detection_status',
+    'ix_dynamic_block_detection_condition_name',
+    'ix_dynamic_block_detection_block_id',
+    'ix_dynamic_block_detection_block_type',
+    'ix_dynamic_block_detection_pattern_id',
+    'ix_dynamic_block_detection_ended_at',
+    'ix_dynamic_block_detection_yaml_type',
+    'ix_dynamic_block_detection_logical_level',
+    'ix_dynamic_block_detection_is_virtual',
+    'ix_seed_pattern_ticker',
+    'ix_seed_pattern_status',
+)
+
+
+def migrate(db_path: str = "data/database/stock_data.db"):
+    """
+    Create composite indexes and drop redundant single-column indexes.
+
+    Migration Steps:
+    1. Create tables if missing (checkfirst)
+    2. Create composite indexes declared in model __table_args__ (checkfirst)
+    3. Drop redundant single-column indexes (IF EXISTS)
+    4. ANALYZE so the planner picks up the new indexes
+    5. Verify indexes
+    """
+    logger.info(f"Connecting to database: {db_path}")
+    db_connection = DatabaseConnection(db_path)
+    engine = db_connection.engine
+    models = (DynamicBlockDetectionModel, SeedPatternModel)
+
+    try:
+        # Step 1 + 2: Composite indexes
+        for model in models:
+            model.__table__.create(engine, checkfirst=True)
+            for index in model.__table__.indexes:
+                if len(index.columns) > 1:
+                    index.create(engine, checkfirst=True)
+                    logger.info(f"  + {index.name}")
+        logger.info("✅ Composite indexes ready")
+
+        # Step 3 + 4: Drop redundant indexes, refresh statistics
+        with engine.begin() as conn:
+            for index_name in REDUNDANT_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+                logger.info(f"  - {index_name}")
+            for model in models:
+                conn.execute(text(f"ANALYZE {model.__tablename__}"))
+        logger.info("✅ Redundant indexes dropped")
+
+        # Step 5: Verify indexes
+        with engine.connect() as conn:
+            for model in models:
+                table_name = model.__tablename__
+                indexes = conn.execute(text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='index' AND tbl_name=:table_name"
+                ), {'table_name': table_name}).fetchall()
+                logger.info(f"\nIndexes on {table_name}:")
+                for idx in indexes:
+                    logger.info(f"  - {idx[0]}")
+
+        logger.info("\n✅ Migration completed successfully")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}", exc_info=True)
+        raise
+
+    finally:
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    logger.info("=" * 70)
+    logger.info("Migration: Detection composite indexes")
+    logger.info("=" * 70)
+
+    try:
+        migrate(*sys.argv[1:2])
+    except KeyboardInterrupt:
+        logger.info("\nMigration interrupted by user")
+    except Exception as e:
+        logger.error(f"\nMigration failed: {e}")
+        sys.exit(1)
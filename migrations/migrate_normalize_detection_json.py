@@ -0,0 +1,206 @@
+"""
+Migration: Normalize JSON-heavy detection columns into child tables
+
+Date: 2025-11-03
+Purpose:
+    dynamic_block_detection.custom_metadata(spots, redetections)와
+    seed_pattern.block_features(JSON)를 SQL로 필터링할 수 있도록
+    정규화 자식 테이블을 생성하고 기존 데이터를 backfill합니다.
+
+New tables:
+    - block_spot                  (custom_metadata['spots'])
+    - block_redetection           (custom_metadata['redetections'])
+    - seed_pattern_block_feature  (seed_pattern.block_features)
+
+각 테이블은 부모 블록의 (ticker, block_type, started_at)을 비정규화하여
+커버링 인덱스를 가집니다. JSON 컬럼은 그대로 유지됩니다 (dual-write).
+
+Usage:
+    python migrations/migrate_normalize_detection_json.py [db_path]
+
+재실행 안전: 자식 테이블은 파생 데이터이므로 매 실행 시 비우고 다시 채웁니다.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import select, text
+
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models import (
+    DynamicBlockDetectionModel,
+    SeedPatternModel,
+    BlockSpotModel,
+    BlockRedetectionModel,
+    SeedPatternBlockFeatureModel,
+)
+from src.infrastructure.repositories.common.detail_rows import (
+    build_spot_rows,
+    build_redetection_rows,
+    build_block_feature_rows,
+)
+
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] [%(levelname)s] %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 2000
+
+DETAIL_MODELS = (BlockSpotModel, BlockRedetectionModel, SeedPatternBlockFeatureModel)
+
+
+def _backfill_blocks(conn) -> tuple:
+    """dynamic_block_detection JSON → block_spot / block_redetection"""
+    block_table = DynamicBlockDetectionModel.__table__
+    spot_count = 0
+    redetection_count = 0
+    last_id = 0
+
+    while True:
+        rows = conn.execute(
+            select(
+                block_table.c.id,
+                block_table.c.ticker,
+                block_table.c.block_type,
+                block_table.c.started_at,
+                block_table.c.custom_metadata,
+            )
+            .where(block_table.c.id > last_id)
+            .order_by(block_table.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        spot_rows = []
+        redetection_rows = []
+        for block_id, ticker, block_type, started_at, metadata in rows:
+            metadata = metadata or {}
+            spot_rows.extend(build_spot_rows(
+                block_id, ticker, block_type, started_at, metadata.get('spots', [])
+            ))
+            redetection_rows.extend(build_redetection_rows(
+                block_id, ticker, block_type, started_at, metadata.get('redetections', [])
+            ))
+
+        if spot_rows:
+            conn.execute(BlockSpotModel.__table__.insert(), spot_rows)
+        if redetection_rows:
+            conn.execute(BlockRedetectionModel.__table__.insert(), redetection_rows)
+
+        spot_count += len(spot_rows)
+        redetection_count += len(redetection_rows)
+        last_id = rows[-1][0]
+
+    return spot_count, redetection_count
+
+
+def _backfill_seed_patterns(conn) -> int:
+    """seed_pattern.block_features JSON → seed_pattern_block_feature"""
+    pattern_table = SeedPatternModel.__table__
+    feature_count = 0
+    last_id = 0
+
+    while True:
+        rows = conn.execute(
+            select(
+                pattern_table.c.id,
+                pattern_table.c.ticker,
+                pattern_table.c.block_features,
+            )
+            .where(pattern_table.c.id > last_id)
+            .order_by(pattern_table.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        feature_rows = []
+        for pattern_id, ticker, block_features in rows:
+            feature_rows.extend(build_block_feature_rows(pattern_id, ticker, block_features or []))
+
+        if feature_rows:
+            conn.execute(SeedPatternBlockFeatureModel.__table__.insert(), feature_rows)
+
+        feature_count += len(feature_rows)
+        last_id = rows[-1][0]
+
+    return feature_count
+
+
+def migrate(db_path: str = "data/database/stock_data.db"):
+    """
+    Create normalized detail tables and backfill them from JSON columns.
+
+    Migration Steps:
+    1. Create child tables with covering indexes (checkfirst)
+    2. Clear child tables (derived data, rebuilt every run)
+    3. Backfill spots / redetections / block features in id-ordered batches
+    4. Verify row counts and indexes
+    """
+    logger.info(f"Connecting to database: {db_path}")
+    db_connection = DatabaseConnection(db_path)
+    engine = db_connection.engine
+
+    try:
+        # Step 1: Create tables (parents must exist for FK references)
+        for model in (DynamicBlockDetectionModel, SeedPatternModel) + DETAIL_MODELS:
+            model.__table__.create(engine, checkfirst=True)
+        logger.info("✅ Detail tables ready")
+
+        # Step 2 + 3: Rebuild in a single transaction
+        with engine.begin() as conn:
+            for model in DETAIL_MODELS:
+                conn.execute(model.__table__.delete())
+
+            spot_count, redetection_count = _backfill_blocks(conn)
+            feature_count = _backfill_seed_patterns(conn)
+
+        logger.info(f"  - block_spot: {spot_count} rows")
+        logger.info(f"  - block_redetection: {redetection_count} rows")
+        logger.info(f"  - seed_pattern_block_feature: {feature_count} rows")
+
+        # Step 4: Verify indexes
+        with engine.connect() as conn:
+            for model in DETAIL_MODELS:
+                table_name = model.__tablename__
+                indexes = conn.execute(text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='index' AND tbl_name=:table_name"
+                ), {'table_name': table_name}).fetchall()
+                logger.info(f"\nIndexes on {table_name}:")
+                for idx in indexes:
+                    logger.info(f"  - {idx[0]}")
+
+        logger.info("\n✅ Migration completed successfully")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}", exc_info=True)
+        raise
+
+    finally:
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    logger.info("=" * 70)
+    logger.info("Migration: Normalize detection JSON columns")
+    logger.info("=" * 70)
+
+    try:
+        migrate(*sys.argv[1:2])
+    except KeyboardInterrupt:
+        logger.info("\nMigration interrupted by user")
+    except Exception as e:
+        logger.error(f"\nMigration failed: {e}")
+        sys.exit(1)
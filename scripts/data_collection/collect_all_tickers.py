@@ -30,6 +30,9 @@ Usage:
 
     # 전체 재수집 (증분 무시)
     uv run python scripts/collect_all_tickers.py --force-full
+
+    # 보유 구간 내부 누락 거래일까지 재수집 (시장 캘린더 기준)
+    uv run python scripts/collect_all_tickers.py --fill-gaps
 """
 import argparse
 import asyncio
@@ -401,7 +404,8 @@ async def collect_all_tickers_main(
     collect_investor: bool = True,
     force_full: bool = False,
     concurrency: int = DEFAULT_CONCURRENCY,
-    db_path: str = DEFAULT_DB_PATH
+    db_path: str = DEFAULT_DB_PATH,
+    fill_gaps: bool = False
 ) -> None:
     """
     전체 종목 데이터 수집
@@ -414,6 +418,7 @@ async def collect_all_tickers_main(
         force_full: 전체 재수집 강제 (증분 수집 무시)
         concurrency: 동시 처리 종목 수
         db_path: 데이터베이스 파일 경로
+        fill_gaps: 보유 구간 내부 누락 거래일 재수집 여부
     """
     start_time = datetime.now()
 
@@ -443,7 +448,8 @@ async def collect_all_tickers_main(
             tickers=tickers,
             fromdate=fromdate,
             todate=todate,
-            force_full=force_full
+            force_full=force_full,
+            fill_gaps=fill_gaps
         )
 
     if not plans:
@@ -676,6 +682,12 @@ def main() -> None:
         help="전체 재수집 강제 (증분 수집 무시)"
     )
 
+    parser.add_argument(
+        "--fill-gaps",
+        action="store_true",
+        help="보유 구간 내부 누락 거래일도 재수집 (거래정지 구간 제외)"
+    )
+
     parser.add_argument(
         "--concurrency",
         type=int,
@@ -708,7 +720,8 @@ def main() -> None:
             collect_investor=not args.no_investor,
             force_full=args.force_full,
             concurrency=args.concurrency,
-            db_path=args.db
+            db_path=args.db,
+            fill_gaps=args.fill_gaps
         ))
     except KeyboardInterrupt:
         console.print(ERROR_MSG_INTERRUPTED)
@@ -0,0 +1,97 @@
+"""
+Query Plan 감사 스크립트
+
+Repository / queries.py가 실행하는 모든 쿼리 shape에 대해 EXPLAIN QUERY PLAN을 실행하고
+풀 스캔, 임시 B-tree 정렬을 찾아 복합 인덱스와 삭제 가능한 단일 컬럼 인덱스를 제안합니다.
+
+조회는 존재하지 않는 ticker/id로 실행되며 마지막에 rollback 하므로 데이터는 변경되지 않습니다.
+
+사용법:
+    python scripts/maintenance/audit_query_plans.py
+    python scripts/maintenance/audit_query_plans.py --db data/database/stock_data.db
+    python scripts/maintenance/audit_query_plans.py --verbose
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.query_plan_audit import (
+    QueryPlanAuditor,
+    find_redundant_indexes,
+    run_repository_workload,
+    summarize_proposals,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query Plan 감사')
+    parser.add_argument(
+        '--db',
+        type=str,
+        default='data/database/stock_data.db',
+        help='데이터베이스 경로'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='문제 없는 쿼리의 실행 계획도 출력'
+    )
+    args = parser.parse_args()
+
+    db = DatabaseConnection(args.db)
+    session = db.get_session()
+
+    try:
+        auditor = QueryPlanAuditor(session)
+        with auditor.capture():
+            run_repository_workload(session)
+        findings = auditor.audit()
+    finally:
+        session.rollback()
+
+    problems = [f for f in findings if f.has_problem]
+
+    print("=" * 80)
+    print(f"Query Plan 감사: {len(findings)}개 shape, 문제 {len(problems)}개")
+    print("=" * 80)
+
+    for finding in findings:
+        if not finding.has_problem and not args.verbose:
+            continue
+        marker = "❌" if finding.has_problem else "✅"
+        print(f"\n{marker} {finding.name}")
+        for detail in finding.plan:
+            print(f"    {detail}")
+        if finding.proposed_index:
+            print(f"    → 제안 인덱스: ({', '.join(finding.proposed_index)})")
+
+    summary = summarize_proposals(problems)
+    if summary:
+        print("\n" + "=" * 80)
+        print("제안 복합 인덱스 (해결되는 shape 수)")
+        print("=" * 80)
+        for table, ranked in summary.items():
+            print(f"\n[{table}]")
+            for columns, count in ranked:
+                print(f"  ({', '.join(columns)})  x{count}")
+
+            redundant = find_redundant_indexes(session, table, [c for c, _ in ranked])
+            for index in redundant:
+                print(
+                    f"  - 삭제 후보: {index.index_name} "
+                    f"(선두 컬럼 포함: {', '.join(index.covered_by)})"
+                )
+    else:
+        print("\n✅ 제안할 인덱스 없음 (남은 항목은 서브쿼리 집계 / PK로 한정된 결과 정렬)")
+
+    session.close()
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
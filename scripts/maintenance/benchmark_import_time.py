@@ -0,0 +1,205 @@
+"""
+Import 시간 벤치마크 스크립트
+
+src 최상위 패키지(및 선택한 하위 패키지)별 import 비용을 새 인터프리터에서 측정합니다.
+패키지 하위 모듈 전체를 import 합니다 (--shallow: 패키지 __init__만).
+- 소요 시간 (반복 측정 중 최소값)
+- 최대 RSS
+- 무거운 의존성(tensorflow, pandas, sqlalchemy 등) 로드 여부
+- -X importtime 기준 누적 시간 상위 모듈
+
+--save로 결과를 JSON 기준선으로 저장하고 --baseline으로 비교하면
+허용치(--tolerance)를 넘는 회귀가 있을 때 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/maintenance/benchmark_import_time.py
+    python scripts/maintenance/benchmark_import_time.py --packages src.learning.training src.learning.inference
+    python scripts/maintenance/benchmark_import_time.py --save data/benchmarks/import_time.json
+    python scripts/maintenance/benchmark_import_time.py --baseline data/benchmarks/import_time.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+HEAVY_MODULES = ['tensorflow', 'keras', 'torch', 'pandas', 'sqlalchemy', 'yaml', 'rich']
+
+# 새 인터프리터에서 실행되는 측정 코드
+_PROBE = """
+import importlib, json, pkgutil, resource, sys, time
+preloaded = sorted(sys.modules)
+failed = []
+start = time.perf_counter()
+package = importlib.import_module({package!r})
+if {recursive!r} and hasattr(package, '__path__'):
+    for info in pkgutil.walk_packages(package.__path__, package.__name__ + '.',
+                                      onerror=failed.append):
+        try:
+            importlib.import_module(info.name)
+        except Exception:
+            failed.append(info.name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy': [m for m in {heavy!r} if m in sys.modules],
+    'failed': sorted(set(failed)),
+    'preloaded': preloaded,
+}}))
+"""
+
+
+def top_level_packages() -> List[str]:
+    """src 바로 아래 패키지 목록"""
+    src_dir = project_root / 'src'
+    return sorted(
+        f"src.{path.name}" for path in src_dir.iterdir()
+        if path.is_dir() and (path / '__init__.py').exists()
+    )
+
+
+def measure(package: str, repeat: int = 3, top: int = 5, recursive: bool = True) -> Dict:
+    """
+    패키지 import 비용 측정
+
+    Args:
+        package: 모듈 경로 (예: src.learning)
+        repeat: 반복 횟수 (시간은 최소값, RSS는 최대값)
+        top: -X importtime 누적 상위 모듈 수
+        recursive: 하위 모듈 전체 import 여부
+
+    Returns:
+        측정 결과 dict (실패 시 'error')
+    """
+    probe = _PROBE.format(package=package, heavy=HEAVY_MODULES, recursive=recursive)
+    runs = []
+    importtime_log = ""
+
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', probe],
+            cwd=project_root,
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            last_line = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else ''
+            return {'package': package, 'error': last_line}
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        importtime_log = proc.stderr
+
+    return {
+        'package': package,
+        'seconds': min(run['seconds'] for run in runs),
+        'max_rss_mb': max(run['max_rss_mb'] for run in runs),
+        'heavy': runs[-1]['heavy'],
+        'failed': runs[-1]['failed'],
+        'top_modules': _top_modules(importtime_log, top, set(runs[-1]['preloaded'])),
+    }
+
+
+def _top_modules(importtime_log: str, top: int, preloaded: set) -> List[List]:
+    """-X importtime 출력에서 누적 시간 상위 최상위 모듈 ([name, ms], 인터프리터 시작 시 로드분 제외)"""
+    modules = []
+    for line in importtime_log.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # 들여쓰기 없는 항목 = 직접 import된 최상위 모듈
+        if not name[1:].startswith(' ') and name.strip() not in preloaded:
+            modules.append([name.strip(), int(cumulative) / 1000])
+    return sorted(modules, key=lambda item: -item[1])[:top]
+
+
+def compare(results: List[Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """기준선 대비 회귀 항목 (시간이 tolerance 비율 이상 증가 또는 새 무거운 의존성)"""
+    regressions = []
+    for result in results:
+        base = baseline.get(result['package'])
+        if not base or 'error' in result or 'error' in base:
+            continue
+        if result['seconds'] > base['seconds'] * (1 + tolerance):
+            regressions.append(
+                f"{result['package']}: {base['seconds']:.3f}s → {result['seconds']:.3f}s"
+            )
+        new_heavy = set(result['heavy']) - set(base['heavy'])
+        if new_heavy:
+            regressions.append(f"{result['package']}: 새 무거운 의존성 {sorted(new_heavy)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='src 패키지 import 시간 벤치마크')
+    parser.add_argument(
+        '--packages',
+        nargs='+',
+        default=None,
+        help='측정할 모듈 (기본: src 최상위 패키지 전체)'
+    )
+    parser.add_argument('--shallow', action='store_true', help='패키지 __init__만 import')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--top', type=int, default=5, help='출력할 상위 모듈 수')
+    parser.add_argument('--save', type=str, default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', type=str, default=None, help='비교할 기준선 JSON')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='허용 시간 증가 비율 (기본 0.25 = 25%%)'
+    )
+    args = parser.parse_args()
+
+    packages = args.packages or top_level_packages()
+    results = [
+        measure(package, args.repeat, args.top, recursive=not args.shallow)
+        for package in packages
+    ]
+
+    print("=" * 80)
+    print(f"Import 시간 벤치마크 (반복 {args.repeat}회, 최소값)")
+    print("=" * 80)
+    print(f"{'package':<36} {'time':>9} {'max RSS':>10}  heavy deps")
+    print("-" * 80)
+    for result in results:
+        if 'error' in result:
+            print(f"{result['package']:<36} ❌ {result['error']}")
+            continue
+        heavy = ', '.join(result['heavy']) or '-'
+        print(
+            f"{result['package']:<36} {result['seconds'] * 1000:>7.1f}ms "
+            f"{result['max_rss_mb']:>8.1f}MB  {heavy}"
+        )
+        for name, ms in result['top_modules']:
+            print(f"    {name:<60} {ms:>8.1f}ms")
+        if result['failed']:
+            print(f"    ⚠️  import 실패 {len(result['failed'])}개: {', '.join(result['failed'][:5])}")
+
+    if args.save:
+        save_path = Path(args.save)
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(save_path, 'w', encoding='utf-8') as f:
+            json.dump({r['package']: r for r in results}, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {save_path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ 기준선 대비 회귀:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ 기준선 대비 회귀 없음")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
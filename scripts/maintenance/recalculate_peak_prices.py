@@ -3,12 +3,20 @@ Peak Price 재계산 스크립트
 
 DB에 저장된 잘못된 peak_price를 실제 차트 데이터로부터 재계산하여 수정합니다.
 verify_peak_prices.py에서 발견된 불일치 문제를 해결하는 스크립트입니다.
+
+블록 테이블 종류와 무관한 set-based 엔진:
+배치(기본 5,000 블록)마다 SELECT 1회 + executemany UPDATE 1회로 처리합니다.
+
+사용법:
+    python scripts/maintenance/recalculate_peak_prices.py                  # dry-run
+    python scripts/maintenance/recalculate_peak_prices.py --apply
+    python scripts/maintenance/recalculate_peak_prices.py --ticker 025980 --apply
 """
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import date
-from typing import Tuple, List, Dict
-from sqlalchemy import text
+from typing import List, Dict
+from sqlalchemy import inspect, text
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -17,467 +25,239 @@ sys.path.insert(0, str(project_root))
 from src.infrastructure.database.connection import DatabaseConnection
 
 DEFAULT_DB_PATH = 'data/database/stock_data.db'
+DEFAULT_BATCH_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class BlockTable:
+    """peak 재계산 대상 블록 테이블 정의"""
+    name: str         # 테이블 이름
+    key_column: str   # 출력용 블록 식별 컬럼
+    label: str        # 출력용 이름
+
+
+BLOCK_TABLES = (
+    BlockTable('block1_detection', 'block1_id', 'Block1'),
+    BlockTable('block2_detection', 'block2_id', 'Block2'),
+    BlockTable('block3_detection', 'block3_id', 'Block3'),
+    BlockTable('block4_detection', 'block4_id', 'Block4'),
+    BlockTable('dynamic_block_detection', 'block_id', 'DynamicBlock'),
+)
 
 
 class PeakPriceRecalculator:
     """Peak Price 재계산 클래스"""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, batch_size: int = DEFAULT_BATCH_SIZE):
         """
         초기화
 
         Args:
             db_path: 데이터베이스 경로
+            batch_size: 배치당 블록 수
         """
         self.db = DatabaseConnection(db_path)
+        self.batch_size = batch_size
 
-    def get_actual_peak(
-        self,
-        ticker: str,
-        from_date: date,
-        to_date: date
-    ) -> Tuple[float, date, int]:
-        """
-        실제 차트에서 최고가와 최고거래량 조회
-
-        Args:
-            ticker: 종목 코드
-            from_date: 시작일
-            to_date: 종료일
-
-        Returns:
-            (최고가, 최고가 날짜, 최고거래량) 튜플
-        """
-        with self.db.session_scope() as session:
-            # 최고가 조회
-            query_price = text("""
-                SELECT high, date
-                FROM stock_price
-                WHERE ticker = :ticker
-                  AND date >= :from_date
-                  AND date <= :to_date
-                ORDER BY high DESC
-                LIMIT 1
-            """)
-
-            result_price = session.execute(
-                query_price,
-                {
-                    'ticker': ticker,
-                    'from_date': from_date.isoformat(),
-                    'to_date': to_date.isoformat()
-                }
-            ).fetchone()
-
-            if not result_price:
-                return None, None, None
-
-            peak_price = float(result_price[0])
-            peak_date = date.fromisoformat(result_price[1])
-
-            # 최고거래량 조회
-            query_volume = text("""
-                SELECT volume
-                FROM stock_price
-                WHERE ticker = :ticker
-                  AND date >= :from_date
-                  AND date <= :to_date
-                ORDER BY volume DESC
-                LIMIT 1
-            """)
-
-            result_volume = session.execute(
-                query_volume,
-                {
-                    'ticker': ticker,
-                    'from_date': from_date.isoformat(),
-                    'to_date': to_date.isoformat()
-                }
-            ).fetchone()
-
-            peak_volume = int(result_volume[0]) if result_volume else 0
-
-            return peak_price, peak_date, peak_volume
-
-    def recalculate_block1(
+    def recalculate_table(
         self,
+        table: BlockTable,
         ticker: str = None,
         dry_run: bool = True
     ) -> Dict:
         """
-        Block1의 peak_price, peak_date, peak_volume 재계산
-
-        Args:
-            ticker: 특정 종목만 처리 (None이면 전체)
-            dry_run: True면 실제 업데이트 안 함
+        블록 테이블의 peak_price, peak_date, peak_volume 일괄 재계산 (set-based)
 
-        Returns:
-            처리 결과 통계
-        """
-        with self.db.session_scope() as session:
-            # Block1 조회 (completed 블록만)
-            query = text("""
-                SELECT block1_id, ticker, started_at, ended_at,
-                       peak_price, peak_date, peak_volume
-                FROM block1_detection
-                WHERE status = 'completed'
-                  AND ended_at IS NOT NULL
-            """ + (" AND ticker = :ticker" if ticker else ""))
-
-            params = {'ticker': ticker} if ticker else {}
-            blocks = session.execute(query, params).fetchall()
-
-            print(f"총 {len(blocks)}개 Block1 블록 처리 중...")
-            print()
-
-            updated_count = 0
-            error_count = 0
-            unchanged_count = 0
-
-            for block in blocks:
-                block1_id = block[0]
-                ticker = block[1]
-                started_at = date.fromisoformat(block[2])
-                ended_at = date.fromisoformat(block[3])
-                db_peak_price = float(block[4]) if block[4] else None
-                db_peak_date = date.fromisoformat(block[5]) if block[5] else None
-                db_peak_volume = int(block[6]) if block[6] else None
-
-                # 실제 peak 계산
-                actual_peak_price, actual_peak_date, actual_peak_volume = self.get_actual_peak(
-                    ticker, started_at, ended_at
-                )
-
-                if actual_peak_price is None:
-                    print(f"  [ERROR] Block1 #{block1_id}: 데이터 없음")
-                    error_count += 1
-                    continue
-
-                # 불일치 체크 (가격만 체크, 0.01 허용 오차)
-                if abs(db_peak_price - actual_peak_price) > 0.01:
-                    diff_pct = ((actual_peak_price - db_peak_price) / db_peak_price) * 100
-                    print(f"  [UPDATE] Block1 #{block1_id}")
-                    print(f"           Period: {started_at} ~ {ended_at}")
-                    print(f"           Peak Price:  {db_peak_price:>12,.0f} → {actual_peak_price:>12,.0f} ({diff_pct:+.2f}%)")
-                    print(f"           Peak Date:   {db_peak_date} → {actual_peak_date}")
-                    print(f"           Peak Volume: {db_peak_volume:>12,} → {actual_peak_volume:>12,}")
-                    print()
-
-                    if not dry_run:
-                        # DB 업데이트
-                        update_query = text("""
-                            UPDATE block1_detection
-                            SET peak_price = :peak_price,
-                                peak_date = :peak_date,
-                                peak_volume = :peak_volume
-                            WHERE block1_id = :block1_id
-                        """)
-
-                        session.execute(
-                            update_query,
-                            {
-                                'block1_id': block1_id,
-                                'peak_price': actual_peak_price,
-                                'peak_date': actual_peak_date.isoformat(),
-                                'peak_volume': actual_peak_volume
-                            }
-                        )
-
-                    updated_count += 1
-                else:
-                    unchanged_count += 1
-
-            if not dry_run:
-                session.commit()
-
-        return {
-            'total': len(blocks),
-            'updated': updated_count,
-            'unchanged': unchanged_count,
-            'errors': error_count
-        }
-
-    def recalculate_block2(
-        self,
-        ticker: str = None,
-        dry_run: bool = True
-    ) -> Dict:
-        """
-        Block2의 peak_price, peak_date, peak_volume 재계산
+        블록을 id 순으로 batch_size씩 읽어, 배치마다 SQL 한 번으로
+        모든 블록의 최고가/최고가 날짜/최고거래량을 계산하고,
+        변경이 필요한 블록만 executemany UPDATE로 반영합니다.
 
         Args:
+            table: 대상 블록 테이블 정의
             ticker: 특정 종목만 처리 (None이면 전체)
             dry_run: True면 실제 업데이트 안 함
 
         Returns:
             처리 결과 통계
         """
-        with self.db.session_scope() as session:
-            query = text("""
-                SELECT block2_id, ticker, started_at, ended_at,
-                       peak_price, peak_date, peak_volume
-                FROM block2_detection
-                WHERE status = 'completed'
-                  AND ended_at IS NOT NULL
-            """ + (" AND ticker = :ticker" if ticker else ""))
-
-            params = {'ticker': ticker} if ticker else {}
-            blocks = session.execute(query, params).fetchall()
-
-            print(f"총 {len(blocks)}개 Block2 블록 처리 중...")
-            print()
-
-            updated_count = 0
-            error_count = 0
-            unchanged_count = 0
-
-            for block in blocks:
-                block2_id = block[0]
-                ticker = block[1]
-                started_at = date.fromisoformat(block[2])
-                ended_at = date.fromisoformat(block[3])
-                db_peak_price = float(block[4]) if block[4] else None
-                db_peak_date = date.fromisoformat(block[5]) if block[5] else None
-                db_peak_volume = int(block[6]) if block[6] else None
-
-                actual_peak_price, actual_peak_date, actual_peak_volume = self.get_actual_peak(
-                    ticker, started_at, ended_at
-                )
-
-                if actual_peak_price is None:
-                    print(f"  [ERROR] Block2 #{block2_id}: 데이터 없음")
-                    error_count += 1
-                    continue
-
-                if abs(db_peak_price - actual_peak_price) > 0.01:
-                    diff_pct = ((actual_peak_price - db_peak_price) / db_peak_price) * 100
-                    print(f"  [UPDATE] Block2 #{block2_id}")
-                    print(f"           Period: {started_at} ~ {ended_at}")
-                    print(f"           Peak Price:  {db_peak_price:>12,.0f} → {actual_peak_price:>12,.0f} ({diff_pct:+.2f}%)")
-                    print(f"           Peak Date:   {db_peak_date} → {actual_peak_date}")
-                    print(f"           Peak Volume: {db_peak_volume:>12,} → {actual_peak_volume:>12,}")
-                    print()
-
-                    if not dry_run:
-                        update_query = text("""
-                            UPDATE block2_detection
-                            SET peak_price = :peak_price,
-                                peak_date = :peak_date,
-                                peak_volume = :peak_volume
-                            WHERE block2_id = :block2_id
-                        """)
-
-                        session.execute(
-                            update_query,
-                            {
-                                'block2_id': block2_id,
-                                'peak_price': actual_peak_price,
-                                'peak_date': actual_peak_date.isoformat(),
-                                'peak_volume': actual_peak_volume
-                            }
-                        )
-
-                    updated_count += 1
-                else:
-                    unchanged_count += 1
-
-            if not dry_run:
-                session.commit()
+        total_count = 0
+        updated_count = 0
+        error_count = 0
+        unchanged_count = 0
+        last_id = 0
 
-        return {
-            'total': len(blocks),
-            'updated': updated_count,
-            'unchanged': unchanged_count,
-            'errors': error_count
-        }
+        print(f"{table.label} 블록 처리 중 (배치 크기: {self.batch_size:,})...")
+        print()
 
-    def recalculate_block3(
-        self,
-        ticker: str = None,
-        dry_run: bool = True
-    ) -> Dict:
-        """
-        Block3의 peak_price, peak_date, peak_volume 재계산
-
-        Args:
-            ticker: 특정 종목만 처리 (None이면 전체)
-            dry_run: True면 실제 업데이트 안 함
-
-        Returns:
-            처리 결과 통계
-        """
         with self.db.session_scope() as session:
-            query = text("""
-                SELECT block3_id, ticker, started_at, ended_at,
-                       peak_price, peak_date, peak_volume
-                FROM block3_detection
-                WHERE status = 'completed'
-                  AND ended_at IS NOT NULL
-            """ + (" AND ticker = :ticker" if ticker else ""))
-
-            params = {'ticker': ticker} if ticker else {}
-            blocks = session.execute(query, params).fetchall()
-
-            print(f"총 {len(blocks)}개 Block3 블록 처리 중...")
-            print()
-
-            updated_count = 0
-            error_count = 0
-            unchanged_count = 0
-
-            for block in blocks:
-                block3_id = block[0]
-                ticker = block[1]
-                started_at = date.fromisoformat(block[2])
-                ended_at = date.fromisoformat(block[3])
-                db_peak_price = float(block[4]) if block[4] else None
-                db_peak_date = date.fromisoformat(block[5]) if block[5] else None
-                db_peak_volume = int(block[6]) if block[6] else None
-
-                actual_peak_price, actual_peak_date, actual_peak_volume = self.get_actual_peak(
-                    ticker, started_at, ended_at
-                )
-
-                if actual_peak_price is None:
-                    print(f"  [ERROR] Block3 #{block3_id}: 데이터 없음")
-                    error_count += 1
-                    continue
-
-                if abs(db_peak_price - actual_peak_price) > 0.01:
-                    diff_pct = ((actual_peak_price - db_peak_price) / db_peak_price) * 100
-                    print(f"  [UPDATE] Block3 #{block3_id}")
-                    print(f"           Period: {started_at} ~ {ended_at}")
-                    print(f"           Peak Price:  {db_peak_price:>12,.0f} → {actual_peak_price:>12,.0f} ({diff_pct:+.2f}%)")
-                    print(f"           Peak Date:   {db_peak_date} → {actual_peak_date}")
-                    print(f"           Peak Volume: {db_peak_volume:>12,} → {actual_peak_volume:>12,}")
-                    print()
-
-                    if not dry_run:
-                        update_query = text("""
-                            UPDATE block3_detection
+            while True:
+                rows = self._fetch_peak_batch(session, table, last_id, ticker)
+                if not rows:
+                    break
+
+                updates = []
+
+                for row in rows:
+                    (row_id, block_key, started_at, ended_at,
+                     db_peak_price, db_peak_date, db_peak_volume,
+                     actual_peak_price, actual_peak_date, actual_peak_volume) = row
+
+                    if actual_peak_price is None:
+                        print(f"  [ERROR] {table.label} #{block_key}: 데이터 없음")
+                        error_count += 1
+                        continue
+
+                    # 불일치 체크 (가격만 체크, 0.01 허용 오차)
+                    if db_peak_price is not None and abs(db_peak_price - actual_peak_price) <= 0.01:
+                        unchanged_count += 1
+                        continue
+
+                    self._print_update(
+                        table, block_key, started_at, ended_at,
+                        db_peak_price, db_peak_date, db_peak_volume,
+                        actual_peak_price, actual_peak_date, actual_peak_volume
+                    )
+                    updates.append({
+                        'id': row_id,
+                        'peak_price': float(actual_peak_price),
+                        'peak_date': actual_peak_date,
+                        'peak_volume': int(actual_peak_volume or 0)
+                    })
+
+                if updates and not dry_run:
+                    # executemany: 배치당 UPDATE 문 1개
+                    session.execute(
+                        text(f"""
+                            UPDATE {table.name}
                             SET peak_price = :peak_price,
                                 peak_date = :peak_date,
                                 peak_volume = :peak_volume
-                            WHERE block3_id = :block3_id
-                        """)
-
-                        session.execute(
-                            update_query,
-                            {
-                                'block3_id': block3_id,
-                                'peak_price': actual_peak_price,
-                                'peak_date': actual_peak_date.isoformat(),
-                                'peak_volume': actual_peak_volume
-                            }
-                        )
-
-                    updated_count += 1
-                else:
-                    unchanged_count += 1
+                            WHERE id = :id
+                        """),
+                        updates
+                    )
+
+                total_count += len(rows)
+                updated_count += len(updates)
+                last_id = rows[-1][0]
 
             if not dry_run:
                 session.commit()
 
         return {
-            'total': len(blocks),
+            'total': total_count,
             'updated': updated_count,
             'unchanged': unchanged_count,
             'errors': error_count
         }
 
-    def recalculate_block4(
+    def _fetch_peak_batch(
         self,
-        ticker: str = None,
-        dry_run: bool = True
-    ) -> Dict:
+        session,
+        table: BlockTable,
+        last_id: int,
+        ticker: str = None
+    ) -> List[tuple]:
         """
-        Block4의 peak_price, peak_date, peak_volume 재계산
+        블록 배치 + 실제 peak 값 조회 (SQL 1회)
 
-        Args:
-            ticker: 특정 종목만 처리 (None이면 전체)
-            dry_run: True면 실제 업데이트 안 함
+        - blocks: id > last_id 인 completed 블록 batch_size개
+        - ranked: 블록 구간 내 일봉에 ROW_NUMBER(고가 내림차순, 같은 고가면 이른 날짜)와
+                  MAX(volume) 윈도우 계산
+        - 구간에 데이터가 없는 블록은 actual 값이 NULL (LEFT JOIN)
 
         Returns:
-            처리 결과 통계
+            (id, block_key, started_at, ended_at, db_peak_price, db_peak_date, db_peak_volume,
+             actual_peak_price, actual_peak_date, actual_peak_volume) 튜플 리스트
         """
-        with self.db.session_scope() as session:
-            query = text("""
-                SELECT block4_id, ticker, started_at, ended_at,
+        query = text(f"""
+            WITH blocks AS (
+                SELECT id, {table.key_column} AS block_key, ticker, started_at, ended_at,
                        peak_price, peak_date, peak_volume
-                FROM block4_detection
+                FROM {table.name}
                 WHERE status = 'completed'
                   AND ended_at IS NOT NULL
-            """ + (" AND ticker = :ticker" if ticker else ""))
-
-            params = {'ticker': ticker} if ticker else {}
-            blocks = session.execute(query, params).fetchall()
-
-            print(f"총 {len(blocks)}개 Block4 블록 처리 중...")
-            print()
-
-            updated_count = 0
-            error_count = 0
-            unchanged_count = 0
-
-            for block in blocks:
-                block4_id = block[0]
-                ticker = block[1]
-                started_at = date.fromisoformat(block[2])
-                ended_at = date.fromisoformat(block[3])
-                db_peak_price = float(block[4]) if block[4] else None
-                db_peak_date = date.fromisoformat(block[5]) if block[5] else None
-                db_peak_volume = int(block[6]) if block[6] else None
-
-                actual_peak_price, actual_peak_date, actual_peak_volume = self.get_actual_peak(
-                    ticker, started_at, ended_at
-                )
-
-                if actual_peak_price is None:
-                    print(f"  [ERROR] Block4 #{block4_id}: 데이터 없음")
-                    error_count += 1
-                    continue
-
-                if abs(db_peak_price - actual_peak_price) > 0.01:
-                    diff_pct = ((actual_peak_price - db_peak_price) / db_peak_price) * 100
-                    print(f"  [UPDATE] Block4 #{block4_id}")
-                    print(f"           Period: {started_at} ~ {ended_at}")
-                    print(f"           Peak Price:  {db_peak_price:>12,.0f} → {actual_peak_price:>12,.0f} ({diff_pct:+.2f}%)")
-                    print(f"           Peak Date:   {db_peak_date} → {actual_peak_date}")
-                    print(f"           Peak Volume: {db_peak_volume:>12,} → {actual_peak_volume:>12,}")
-                    print()
-
-                    if not dry_run:
-                        update_query = text("""
-                            UPDATE block4_detection
-                            SET peak_price = :peak_price,
-                                peak_date = :peak_date,
-                                peak_volume = :peak_volume
-                            WHERE block4_id = :block4_id
-                        """)
-
-                        session.execute(
-                            update_query,
-                            {
-                                'block4_id': block4_id,
-                                'peak_price': actual_peak_price,
-                                'peak_date': actual_peak_date.isoformat(),
-                                'peak_volume': actual_peak_volume
-                            }
-                        )
-
-                    updated_count += 1
-                else:
-                    unchanged_count += 1
-
-            if not dry_run:
-                session.commit()
-
-        return {
-            'total': len(blocks),
-            'updated': updated_count,
-            'unchanged': unchanged_count,
-            'errors': error_count
-        }
+                  AND id > :last_id
+                  {"AND ticker = :ticker" if ticker else ""}
+                ORDER BY id
+                LIMIT :batch_size
+            ),
+            ranked AS (
+                SELECT b.id,
+                       p.high,
+                       p.date,
+                       MAX(p.volume) OVER (PARTITION BY b.id) AS max_volume,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY b.id ORDER BY p.high DESC, p.date
+                       ) AS price_rank
+                FROM blocks b
+                JOIN stock_price p
+                  ON p.ticker = b.ticker
+                 AND p.date >= b.started_at
+                 AND p.date <= b.ended_at
+            )
+            SELECT b.id, b.block_key, b.started_at, b.ended_at,
+                   b.peak_price, b.peak_date, b.peak_volume,
+                   r.high, r.date, r.max_volume
+            FROM blocks b
+            LEFT JOIN ranked r ON r.id = b.id AND r.price_rank = 1
+            ORDER BY b.id
+        """)
+
+        params = {'last_id': last_id, 'batch_size': self.batch_size}
+        if ticker:
+            params['ticker'] = ticker
+
+        return session.execute(query, params).fetchall()
+
+    @staticmethod
+    def _print_update(
+        table: BlockTable,
+        block_key,
+        started_at,
+        ended_at,
+        db_peak_price,
+        db_peak_date,
+        db_peak_volume,
+        actual_peak_price,
+        actual_peak_date,
+        actual_peak_volume
+    ) -> None:
+        """변경 예정 블록 출력"""
+        db_price_str = f"{db_peak_price:>12,.0f}" if db_peak_price is not None else f"{'-':>12}"
+        db_volume_str = f"{int(db_peak_volume):>12,}" if db_peak_volume is not None else f"{'-':>12}"
+        diff_str = (
+            f" ({(actual_peak_price - db_peak_price) / db_peak_price * 100:+.2f}%)"
+            if db_peak_price else ""
+        )
+
+        print(f"  [UPDATE] {table.label} #{block_key}")
+        print(f"           Period: {started_at} ~ {ended_at}")
+        print(f"           Peak Price:  {db_price_str} → {actual_peak_price:>12,.0f}{diff_str}")
+        print(f"           Peak Date:   {db_peak_date} → {actual_peak_date}")
+        print(f"           Peak Volume: {db_volume_str} → {int(actual_peak_volume or 0):>12,}")
+        print()
+
+    def existing_tables(self) -> List[BlockTable]:
+        """DB에 존재하는 블록 테이블만 반환 (레거시 blockN_detection은 없을 수 있음)"""
+        table_names = set(inspect(self.db.engine).get_table_names())
+        return [table for table in BLOCK_TABLES if table.name in table_names]
+
+    def recalculate_block1(self, ticker: str = None, dry_run: bool = True) -> Dict:
+        """Block1의 peak_price, peak_date, peak_volume 재계산"""
+        return self.recalculate_table(BLOCK_TABLES[0], ticker, dry_run)
+
+    def recalculate_block2(self, ticker: str = None, dry_run: bool = True) -> Dict:
+        """Block2의 peak_price, peak_date, peak_volume 재계산"""
+        return self.recalculate_table(BLOCK_TABLES[1], ticker, dry_run)
+
+    def recalculate_block3(self, ticker: str = None, dry_run: bool = True) -> Dict:
+        """Block3의 peak_price, peak_date, peak_volume 재계산"""
+        return self.recalculate_table(BLOCK_TABLES[2], ticker, dry_run)
+
+    def recalculate_block4(self, ticker: str = None, dry_run: bool = True) -> Dict:
+        """Block4의 peak_price, peak_date, peak_volume 재계산"""
+        return self.recalculate_table(BLOCK_TABLES[3], ticker, dry_run)
 
 
 def main():
@@ -501,6 +281,12 @@ def main():
         default=DEFAULT_DB_PATH,
         help=f'데이터베이스 경로 (기본: {DEFAULT_DB_PATH})'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'배치당 블록 수 (기본: {DEFAULT_BATCH_SIZE})'
+    )
 
     args = parser.parse_args()
 
@@ -517,64 +303,31 @@ def main():
         print("실제 반영하려면 --apply 옵션을 사용하세요.")
     print()
 
-    recalculator = PeakPriceRecalculator(args.db)
-
-    # Block1 재계산
-    print(separator)
-    print("Block1 재계산 시작")
-    print(separator)
-    result1 = recalculator.recalculate_block1(
-        ticker=args.ticker,
-        dry_run=not args.apply
-    )
-    print(f"Block1 결과: {result1['updated']}개 업데이트, "
-          f"{result1['unchanged']}개 정상, {result1['errors']}개 오류")
-    print()
-
-    # Block2 재계산
-    print(separator)
-    print("Block2 재계산 시작")
-    print(separator)
-    result2 = recalculator.recalculate_block2(
-        ticker=args.ticker,
-        dry_run=not args.apply
-    )
-    print(f"Block2 결과: {result2['updated']}개 업데이트, "
-          f"{result2['unchanged']}개 정상, {result2['errors']}개 오류")
-    print()
-
-    # Block3 재계산
-    print(separator)
-    print("Block3 재계산 시작")
-    print(separator)
-    result3 = recalculator.recalculate_block3(
-        ticker=args.ticker,
-        dry_run=not args.apply
-    )
-    print(f"Block3 결과: {result3['updated']}개 업데이트, "
-          f"{result3['unchanged']}개 정상, {result3['errors']}개 오류")
-    print()
-
-    # Block4 재계산
-    print(separator)
-    print("Block4 재계산 시작")
-    print(separator)
-    result4 = recalculator.recalculate_block4(
-        ticker=args.ticker,
-        dry_run=not args.apply
-    )
-    print(f"Block4 결과: {result4['updated']}개 업데이트, "
-          f"{result4['unchanged']}개 정상, {result4['errors']}개 오류")
-    print()
+    recalculator = PeakPriceRecalculator(args.db, batch_size=args.batch_size)
+
+    results = []
+    for table in recalculator.existing_tables():
+        print(separator)
+        print(f"{table.label} 재계산 시작")
+        print(separator)
+        result = recalculator.recalculate_table(
+            table,
+            ticker=args.ticker,
+            dry_run=not args.apply
+        )
+        print(f"{table.label} 결과: {result['updated']}개 업데이트, "
+              f"{result['unchanged']}개 정상, {result['errors']}개 오류")
+        print()
+        results.append(result)
 
     # 전체 요약
     print(separator)
     print("전체 요약")
     print(separator)
-    total_blocks = result1['total'] + result2['total'] + result3['total'] + result4['total']
-    total_updated = result1['updated'] + result2['updated'] + result3['updated'] + result4['updated']
-    total_unchanged = result1['unchanged'] + result2['unchanged'] + result3['unchanged'] + result4['unchanged']
-    total_errors = result1['errors'] + result2['errors'] + result3['errors'] + result4['errors']
+    total_blocks = sum(r['total'] for r in results)
+    total_updated = sum(r['updated'] for r in results)
+    total_unchanged = sum(r['unchanged'] for r in results)
+    total_errors = sum(r['errors'] for r in results)
 
     print(f"총 블록 수: {total_blocks:,}")
     print(f"  - 업데이트: {total_updated:,}")
@@ -10,6 +10,7 @@ Peak Price 검증 스크립트
 """
 import argparse
 import sys
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from datetime import date, timedelta
 from typing import List, Dict, Tuple
@@ -19,6 +20,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.queries import get_missing_dates_bulk
 from sqlalchemy import text
 
 
@@ -63,164 +65,99 @@ class PeakPriceVerifier:
                 return float(result[0]), date.fromisoformat(result[1])
             return 0.0, None
 
-    def verify_block1(self, ticker: str = None) -> List[Dict]:
-        """Block1 peak_price 검증"""
+    def _verify_table(self, table: str, id_column: str, label: str, ticker: str = None) -> List[Dict]:
+        """
+        블록 테이블 peak_price 검증 (set-based)
+
+        블록마다 stock_price를 조회하지 않고, 블록 × stock_price 조인 후
+        블록 단위 GROUP BY 한 번으로 실제 최고가/최고가 날짜를 계산합니다.
+        (SQLite: MAX()와 함께 선택한 bare column은 최대값 행의 값)
+
+        불일치 블록에는 시장 거래일 캘린더 기준 누락 거래일 수(missing_days)를 함께 기록하여
+        데이터 누락으로 인한 불일치를 구분할 수 있게 합니다.
+        """
         with self.db.session_scope() as session:
-            query_str = """
-                SELECT id, block1_id, ticker, started_at, ended_at,
-                       peak_price, peak_date, status
-                FROM block1_detection
-                WHERE ended_at IS NOT NULL
+            query_str = f"""
+                SELECT b.{id_column}, b.ticker, b.started_at, b.ended_at,
+                       b.peak_price, b.peak_date,
+                       COALESCE(MAX(p.high), 0.0) AS actual_high, p.date AS actual_date
+                FROM {table} b
+                LEFT JOIN stock_price p
+                    ON p.ticker = b.ticker
+                    AND p.date >= b.started_at
+                    AND p.date <= b.ended_at
+                WHERE b.ended_at IS NOT NULL
             """
             params = {}
 
             if ticker:
-                query_str += " AND ticker = :ticker"
+                query_str += " AND b.ticker = :ticker"
                 params['ticker'] = ticker
 
-            query_str += " ORDER BY started_at"
+            query_str += " GROUP BY b.id ORDER BY b.started_at"
 
             blocks = session.execute(text(query_str), params).fetchall()
 
-        mismatches = []
+            mismatches = []
 
-        for block in blocks:
-            block_id, block1_id, ticker, started_at, ended_at, peak_price, peak_date, status = block
+            for block in blocks:
+                block_id, block_ticker, started_at, ended_at, peak_price, peak_date, actual_high, actual_date = block
 
-            started_at = date.fromisoformat(started_at)
-            ended_at = date.fromisoformat(ended_at)
-            peak_date_db = date.fromisoformat(peak_date) if peak_date else None
+                # 불일치 확인
+                if abs(actual_high - peak_price) <= 0.01:  # 부동소수점 오차 허용
+                    continue
 
-            # 실제 최고가 계산
-            actual_high, actual_date = self.get_actual_max_high(
-                ticker,
-                started_at,
-                ended_at
-            )
+                started_at = date.fromisoformat(started_at)
+                ended_at = date.fromisoformat(ended_at)
 
-            # 불일치 확인
-            if abs(actual_high - peak_price) > 0.01:  # 부동소수점 오차 허용
                 mismatches.append({
-                    'block_type': 'Block1',
-                    'block_id': block1_id,
-                    'ticker': ticker,
+                    'block_type': label,
+                    'block_id': block_id,
+                    'ticker': block_ticker,
                     'started_at': started_at,
                     'ended_at': ended_at,
                     'db_peak_price': peak_price,
-                    'db_peak_date': peak_date_db,
-                    'actual_peak_price': actual_high,
-                    'actual_peak_date': actual_date,
+                    'db_peak_date': date.fromisoformat(peak_date) if peak_date else None,
+                    'actual_peak_price': float(actual_high),
+                    'actual_peak_date': date.fromisoformat(actual_date) if actual_date else None,
                     'diff': actual_high - peak_price,
                     'diff_pct': ((actual_high - peak_price) / peak_price * 100) if peak_price > 0 else 0
                 })
 
-        return mismatches
-
-    def verify_block2(self, ticker: str = None) -> List[Dict]:
-        """Block2 peak_price 검증"""
-        with self.db.session_scope() as session:
-            query_str = """
-                SELECT id, block2_id, ticker, started_at, ended_at,
-                       peak_price, peak_date, status
-                FROM block2_detection
-                WHERE ended_at IS NOT NULL
-            """
-            params = {}
+            self._attach_missing_days(session, mismatches)
 
-            if ticker:
-                query_str += " AND ticker = :ticker"
-                params['ticker'] = ticker
-
-            query_str += " ORDER BY started_at"
-
-            blocks = session.execute(text(query_str), params).fetchall()
-
-        mismatches = []
-
-        for block in blocks:
-            block_id, block2_id, ticker, started_at, ended_at, peak_price, peak_date, status = block
-
-            started_at = date.fromisoformat(started_at)
-            ended_at = date.fromisoformat(ended_at)
-            peak_date_db = date.fromisoformat(peak_date) if peak_date else None
+        return mismatches
 
-            # 실제 최고가 계산
-            actual_high, actual_date = self.get_actual_max_high(
-                ticker,
-                started_at,
-                ended_at
+    def _attach_missing_days(self, session, mismatches: List[Dict]) -> None:
+        """불일치 블록 구간의 누락 거래일 수 기록 (시장 전체 gap 분석 1회)"""
+        if not mismatches:
+            return
+
+        missing_dates = get_missing_dates_bulk(
+            session,
+            min(m['started_at'] for m in mismatches),
+            max(m['ended_at'] for m in mismatches),
+            sorted({m['ticker'] for m in mismatches})
+        )
+
+        for mismatch in mismatches:
+            dates = missing_dates.get(mismatch['ticker'], [])
+            mismatch['missing_days'] = (
+                bisect_right(dates, mismatch['ended_at'])
+                - bisect_left(dates, mismatch['started_at'])
             )
 
-            # 불일치 확인
-            if abs(actual_high - peak_price) > 0.01:
-                mismatches.append({
-                    'block_type': 'Block2',
-                    'block_id': block2_id,
-                    'ticker': ticker,
-                    'started_at': started_at,
-                    'ended_at': ended_at,
-                    'db_peak_price': peak_price,
-                    'db_peak_date': peak_date_db,
-                    'actual_peak_price': actual_high,
-                    'actual_peak_date': actual_date,
-                    'diff': actual_high - peak_price,
-                    'diff_pct': ((actual_high - peak_price) / peak_price * 100) if peak_price > 0 else 0
-                })
+    def verify_block1(self, ticker: str = None) -> List[Dict]:
+        """Block1 peak_price 검증"""
+        return self._verify_table('block1_detection', 'block1_id', 'Block1', ticker)
 
-        return mismatches
+    def verify_block2(self, ticker: str = None) -> List[Dict]:
+        """Block2 peak_price 검증"""
+        return self._verify_table('block2_detection', 'block2_id', 'Block2', ticker)
 
     def verify_block3(self, ticker: str = None) -> List[Dict]:
         """Block3 peak_price 검증"""
-        with self.db.session_scope() as session:
-            query_str = """
-                SELECT id, block3_id, ticker, started_at, ended_at,
-                       peak_price, peak_date, status
-                FROM block3_detection
-                WHERE ended_at IS NOT NULL
-            """
-            params = {}
-
-            if ticker:
-                query_str += " AND ticker = :ticker"
-                params['ticker'] = ticker
-
-            query_str += " ORDER BY started_at"
-
-            blocks = session.execute(text(query_str), params).fetchall()
-
-        mismatches = []
-
-        for block in blocks:
-            block_id, block3_id, ticker, started_at, ended_at, peak_price, peak_date, status = block
-
-            started_at = date.fromisoformat(started_at)
-            ended_at = date.fromisoformat(ended_at)
-            peak_date_db = date.fromisoformat(peak_date) if peak_date else None
-
-            # 실제 최고가 계산
-            actual_high, actual_date = self.get_actual_max_high(
-                ticker,
-                started_at,
-                ended_at
-            )
-
-            # 불일치 확인
-            if abs(actual_high - peak_price) > 0.01:
-                mismatches.append({
-                    'block_type': 'Block3',
-                    'block_id': block3_id,
-                    'ticker': ticker,
-                    'started_at': started_at,
-                    'ended_at': ended_at,
-                    'db_peak_price': peak_price,
-                    'db_peak_date': peak_date_db,
-                    'actual_peak_price': actual_high,
-                    'actual_peak_date': actual_date,
-                    'diff': actual_high - peak_price,
-                    'diff_pct': ((actual_high - peak_price) / peak_price * 100) if peak_price > 0 else 0
-                })
-
-        return mismatches
+        return self._verify_table('block3_detection', 'block3_id', 'Block3', ticker)
 
     def verify_all_blocks(self, ticker: str = None) -> Dict[str, List[Dict]]:
         """모든 블록 타입 검증"""
@@ -252,6 +189,8 @@ def print_summary(results: Dict[str, List[Dict]], verbose: bool = False):
                 print(f"    DB peak_price: {mismatch['db_peak_price']:,.0f} ({mismatch['db_peak_date']})")
                 print(f"    실제 최고가: {mismatch['actual_peak_price']:,.0f} ({mismatch['actual_peak_date']})")
                 print(f"    차이: {mismatch['diff']:+,.0f} ({mismatch['diff_pct']:+.2f}%)")
+                if mismatch.get('missing_days'):
+                    print(f"    구간 내 누락 거래일: {mismatch['missing_days']}일")
 
     print("\n" + "=" * 80)
     print(f"총 불일치: {total_mismatches}개")
@@ -0,0 +1,60 @@
+"""
+Hyperparameter Sweep
+
+TrainingConfig YAML의 sweep 섹션으로 grid / random search를 병렬 실행합니다.
+
+사용법:
+    python scripts/ml_system/run_sweep.py --config configs/lstm_sweep.yaml --data data/ml/sequences
+    python scripts/ml_system/run_sweep.py --config configs/lstm_sweep.yaml --data data/ml/sequences \\
+        --threads-per-worker 2 --output-dir models/sweeps/lstm
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.learning.training.config import TrainingConfig
+from src.learning.training.sweep import SearchSpace, SweepRunner
+
+
+def main():
+    parser = argparse.ArgumentParser(description='하이퍼파라미터 병렬 탐색')
+    parser.add_argument('--config', required=True, help='sweep 섹션이 있는 TrainingConfig YAML')
+    parser.add_argument('--data', required=True, help='Shard 디렉토리 (index.json) 또는 X.npy / y.npy 디렉토리')
+    parser.add_argument('--output-dir', default=None, help='Sweep 결과 디렉토리')
+    parser.add_argument('--max-workers', type=int, default=None, help='워커 프로세스 수 (기본: 코어 수 / 스레드 수)')
+    parser.add_argument('--threads-per-worker', type=int, default=None, help='워커당 스레드 수')
+    args = parser.parse_args()
+
+    config = TrainingConfig.from_yaml(args.config)
+    if not config.sweep:
+        print(f"❌ sweep 섹션이 없습니다: {args.config}")
+        return 1
+
+    sweep = dict(config.sweep)
+    if args.max_workers is not None:
+        sweep['max_workers'] = args.max_workers
+    if args.threads_per_worker is not None:
+        sweep['threads_per_worker'] = args.threads_per_worker
+
+    runner = SweepRunner(config, SearchSpace.from_dict(sweep), output_dir=args.output_dir)
+    result = runner.run(data_path=args.data)
+
+    print(f"\n{'='*60}")
+    print(f"🏆 Leaderboard ({runner.space.metric}, {runner.space.mode})")
+    print(f"{'='*60}")
+    for rank, trial in enumerate(result.results[:10], 1):
+        if trial.status != 'completed':
+            print(f"  {rank:>2}. trial {trial.trial_id:03d}  ❌ {trial.error}")
+            continue
+        print(f"  {rank:>2}. trial {trial.trial_id:03d}  {trial.score:.4f}  {trial.params}")
+    print(f"\n💾 {result.leaderboard_path}")
+
+    return 0 if result.best else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,6 +17,7 @@ from sqlalchemy.orm import sessionmaker
 
 from src.infrastructure.repositories.dynamic_block_repository_impl import DynamicBlockRepositoryImpl
 from src.infrastructure.repositories.seed_pattern_repository_impl import SeedPatternRepositoryImpl
+from src.application.use_cases.ml_dataset import GenerateMLDatasetUseCase
 
 
 class MLDatasetGenerator:
@@ -195,6 +196,13 @@ def main():
     parser.add_argument("--min-similarity", type=float, default=0.7,
                         help="Minimum similarity score")
     parser.add_argument("--db", default="data/database/stock_data.db", help="Database path")
+    parser.add_argument("--sequence-dir", default=None,
+                        help="Also write windowed sequence tensors (memmap .npy shards) here")
+    parser.add_argument("--sequence-length", type=int, default=60, help="Days per window")
+    parser.add_argument("--stride", type=int, default=1, help="Step between window starts")
+    parser.add_argument("--shard-size", type=int, default=50_000, help="Samples per shard")
+    parser.add_argument("--condition", default=None,
+                        help="Detection condition for sequence labels (default: all)")
 
     args = parser.parse_args()
 
@@ -213,10 +221,23 @@ def main():
             output_file=args.output_report
         )
 
+        # Sequence tensors
+        if args.sequence_dir:
+            use_case = GenerateMLDatasetUseCase(session=generator.session)
+            use_case.execute(
+                output_dir=args.sequence_dir,
+                condition_name=args.condition,
+                sequence_length=args.sequence_length,
+                stride=args.stride,
+                shard_size=args.shard_size
+            )
+
         print(f"\n{'='*60}")
         print(f"✅ ML Dataset Generation Complete!")
         print(f"   Labels CSV: {args.output_csv}")
         print(f"   Report: {args.output_report}")
+        if args.sequence_dir:
+            print(f"   Sequences: {args.sequence_dir}")
         print(f"{'='*60}\n")
 
         return 0 if label_count > 0 else 1
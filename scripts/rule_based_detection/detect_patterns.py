@@ -77,6 +77,7 @@ from src.application.use_cases.highlight_centric_detector import HighlightCentri
 from src.application.services.indicators.block1_indicator_calculator import Block1IndicatorCalculator
 from src.application.services.highlight_detector import HighlightDetector
 from src.application.services.support_resistance_analyzer import SupportResistanceAnalyzer
+from src.application.services.condition_planner import ConditionPlanner
 from src.domain.entities.conditions import ExpressionEngine, function_registry
 from src.domain.entities.detections import DynamicBlockDetection
 from src.domain.entities.patterns import SeedPatternTree, HighlightCentricPattern
@@ -211,7 +212,9 @@ def detect_patterns_for_ticker(
     dry_run: bool = False,
     mode: str = "sequential",
     backward_days: int = 30,
-    forward_days: int = 1125
+    forward_days: int = 1125,
+    single_pass: bool = False,
+    condition_plan: bool = False
 ) -> List[DynamicBlockDetection]:
     """
     단일 종목에 대한 블록 패턴 탐지
@@ -227,6 +230,8 @@ def detect_patterns_for_ticker(
         mode: 탐지 모드 ("sequential" or "highlight-centric")
         backward_days: 하이라이트 모드 역방향 스캔 일수
         forward_days: 하이라이트 모드 순방향 스캔 일수
+        single_pass: 하이라이트 모드 블록 탐지를 종목당 1회만 실행
+        condition_plan: 진입 조건을 측정된 비용/통과율 순서로 평가 (<yaml>.plan.json 저장)
 
     Returns:
         List[DynamicBlockDetection]: 탐지된 블록 리스트
@@ -306,13 +311,19 @@ def detect_patterns_for_ticker(
         try:
             expression_engine = ExpressionEngine(function_registry)
 
+            condition_planner = None
+            if condition_plan:
+                condition_planner = ConditionPlanner(expression_engine, yaml_path=config_path)
+                condition_planner.load()
+
             if mode == "sequential":
                 # Sequential Detection Mode (기존)
                 seed_pattern_repo = SeedPatternRepositoryImpl(session) if not dry_run else None
                 orchestrator = SeedPatternDetectionOrchestrator(
                     block_graph=block_graph,
                     expression_engine=expression_engine,
-                    seed_pattern_repository=seed_pattern_repo
+                    seed_pattern_repository=seed_pattern_repo,
+                    condition_planner=condition_planner
                 )
                 orchestrator.set_yaml_config_path(config_path)
 
@@ -339,7 +350,8 @@ def detect_patterns_for_ticker(
                 # Initialize components
                 dynamic_block_detector = DynamicBlockDetector(
                     block_graph=block_graph,
-                    expression_engine=expression_engine
+                    expression_engine=expression_engine,
+                    condition_planner=condition_planner
                 )
                 highlight_detector = HighlightDetector(expression_engine)
                 sr_analyzer = SupportResistanceAnalyzer(tolerance_pct=2.0)
@@ -359,7 +371,8 @@ def detect_patterns_for_ticker(
                     scan_from=from_date,
                     scan_to=to_date,
                     backward_days=backward_days,
-                    forward_days=forward_days
+                    forward_days=forward_days,
+                    single_pass=single_pass
                 )
 
                 progress.update(task, completed=True)
@@ -385,6 +398,11 @@ def detect_patterns_for_ticker(
             console.print(f"   [red]ERROR[/red] Detection failed: {e}\n")
             raise
 
+    if condition_planner is not None:
+        plan_path = condition_planner.save()
+        if verbose and plan_path:
+            console.print(f"   [green]OK[/green] Condition plan saved to {plan_path}\n")
+
     # 5. 데이터베이스 저장 (dry-run이 아닌 경우)
     if not dry_run:
         console.print("[cyan]5. Database operations...[/cyan]")
@@ -627,6 +645,18 @@ def main() -> None:
         help="하이라이트 중심 모드: 순방향 스캔 일수 (기본값: 1125, 4.5년)"
     )
 
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="하이라이트 중심 모드: 블록 탐지를 종목당 1회만 실행하고 구간 색인으로 조회"
+    )
+
+    parser.add_argument(
+        "--condition-plan",
+        action="store_true",
+        help="진입 조건을 측정된 비용/통과율 순서로 평가 (YAML 옆 .plan.json에 통계 저장, 결과 동일)"
+    )
+
     args = parser.parse_args()
 
     # 날짜 파싱
@@ -670,7 +700,9 @@ def main() -> None:
                 dry_run=args.dry_run,
                 mode=args.mode,
                 backward_days=args.backward_days,
-                forward_days=args.forward_days
+                forward_days=args.forward_days,
+                single_pass=args.single_pass,
+                condition_plan=args.condition_plan
             )
 
             # 다음 종목 전에 구분선
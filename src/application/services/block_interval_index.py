@@ -0,0 +1,65 @@
+"""
+Block Interval Index
+
+한 번의 탐지 결과(블록 생애주기 구간)를 날짜로 조회하는 색인
+
+Highlight-centric detection asks the same questions for every highlight: which
+blocks started in the 30 days before it, and which started in the 1,125 days after
+its root. Answering them from one sequential detection pass (blocks sorted by start
+date, bisect over the start ordinals) replaces re-running the detector on an
+overlapping sub-series per highlight.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import List, Optional, Sequence
+
+from src.domain.entities.detections import DynamicBlockDetection
+
+
+class BlockIntervalIndex:
+    """블록 [started_at, ended_at] 구간 색인 (시작일 기준 정렬)"""
+
+    def __init__(
+        self,
+        blocks: Sequence[DynamicBlockDetection],
+        data_from: Optional[date] = None,
+        data_to: Optional[date] = None
+    ):
+        """
+        Args:
+            blocks: 한 번의 탐지 패스에서 나온 블록들
+            data_from: 탐지 패스에 사용된 첫 캔들 날짜
+            data_to: 탐지 패스에 사용된 마지막 캔들 날짜
+        """
+        # 시작일 기준 안정 정렬 (같은 날 시작한 블록은 탐지 순서 유지)
+        self.blocks: List[DynamicBlockDetection] = sorted(blocks, key=lambda b: b.started_at)
+        self._starts: List[int] = [b.started_at.toordinal() for b in self.blocks]
+        self.data_from = data_from
+        self.data_to = data_to
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def started_between(
+        self,
+        start: date,
+        end: date,
+        block_type: Optional[int] = None
+    ) -> List[DynamicBlockDetection]:
+        """
+        start <= started_at <= end 인 블록 (시작일 순)
+
+        Args:
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+            block_type: 지정 시 해당 타입만
+
+        Returns:
+            블록 리스트
+        """
+        lo = bisect_left(self._starts, start.toordinal())
+        hi = bisect_right(self._starts, end.toordinal())
+        blocks = self.blocks[lo:hi]
+        if block_type is not None:
+            blocks = [b for b in blocks if b.block_type == block_type]
+        return blocks
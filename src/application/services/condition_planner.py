@@ -0,0 +1,357 @@
+"""
+Condition Planner
+
+진입 조건 평가 순서 최적화 (측정된 비용 + 통과율 기반)
+
+Entry conditions are an AND list evaluated in YAML order, so a cheap and highly
+selective check written after `is_volume_high(365)` pays for the expensive one on
+every candle. The planner profiles each condition (and each operand of an
+`and`/`or` inside an expression) for mean evaluation time and pass rate, then orders
+them by expected cost: cost / P(stop) ascending, where P(stop) is the fail rate for
+AND and the pass rate for OR.
+
+Results stay identical to YAML order:
+    - Profiling evaluates every condition/operand but replays the outcomes in the
+      original order (first error or deciding value wins).
+    - The top-level AND list may be freely reordered: an evaluation error already
+      makes _check_entry_conditions() return False, same as a failing condition.
+    - Operands inside an expression are reordered only if none of them raised while
+      profiling, and a reordered tree that raises is re-evaluated in original order.
+
+Learned statistics are persisted per YAML file (`<yaml>.plan.json`) together with a
+hash of the YAML so that editing the conditions discards the old plan.
+"""
+import ast
+import copy
+import hashlib
+import json
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.domain.entities.conditions import Condition, ExpressionEngine
+from src.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+PLAN_FILE_SUFFIX = '.plan.json'
+PLAN_FORMAT_VERSION = 1
+
+
+@dataclass
+class ConditionStats:
+    """조건(또는 피연산자) 하나의 측정 통계"""
+    evaluations: int = 0
+    passed: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def mean_cost(self) -> float:
+        return self.total_seconds / self.evaluations if self.evaluations else 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.evaluations if self.evaluations else 0.0
+
+    def record(self, seconds: float, outcome: Optional[bool]) -> None:
+        """평가 1회 기록 (outcome=None이면 에러)"""
+        self.evaluations += 1
+        self.total_seconds += seconds
+        if outcome is None:
+            self.errors += 1
+        elif outcome:
+            self.passed += 1
+
+    def rank(self, is_and: bool) -> float:
+        """
+        평가 순위 (낮을수록 먼저)
+
+        AND는 실패(에러 포함) 시, OR는 통과 시 평가가 끝나므로
+        cost / P(stop)이 작은 조건을 먼저 평가하면 기대 비용이 최소.
+        """
+        if is_and:
+            stop = (self.evaluations - self.passed) / self.evaluations
+        else:
+            stop = self.pass_rate
+        if stop <= 0:
+            return float('inf')
+        return self.mean_cost / stop
+
+
+class ConditionPlanner:
+    """
+    진입 조건 평가 순서 플래너
+
+    Example:
+        >>> planner = ConditionPlanner(engine, yaml_path="presets/seed.yaml")
+        >>> planner.load()        # 저장된 통계가 있으면 바로 재배치
+        >>> detector = DynamicBlockDetector(graph, engine, condition_planner=planner)
+        >>> ...                   # 조건별 min_samples회 프로파일 후 재배치
+        >>> planner.save()
+    """
+
+    def __init__(
+        self,
+        expression_engine: ExpressionEngine,
+        yaml_path: Optional[str] = None,
+        min_samples: int = 50,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Args:
+            expression_engine: 표현식 평가 엔진 (AST 캐시 공유)
+            yaml_path: 조건을 정의한 YAML 파일 (통계 저장 위치/해시 기준)
+            min_samples: 재배치 전 조건별 최소 프로파일 횟수
+            clock: 시간 측정 함수 (테스트용)
+        """
+        self.engine = expression_engine
+        self.yaml_path = yaml_path
+        self.min_samples = min_samples
+        self.clock = clock
+
+        # 표현식 텍스트(ast.unparse) → 통계
+        self.stats: Dict[str, ConditionStats] = {}
+
+        # id(AST 노드) → 표현식 텍스트 (트리는 엔진 캐시가 유지)
+        self._keys: Dict[int, str] = {}
+        # 재배치 결과 캐시
+        self._ordered: Dict[int, Tuple[List[Condition], List[Condition]]] = {}
+        self._planned: Dict[str, Optional[ast.Expression]] = {}
+
+    # ============================================================
+    # Evaluation
+    # ============================================================
+
+    def needs_profiling(self, conditions: List[Condition]) -> bool:
+        """아직 min_samples만큼 측정되지 않은 조건이 있는지"""
+        cached = self._ordered.get(id(conditions))
+        if cached is not None and cached[0] is conditions:
+            return False
+
+        for condition in conditions:
+            stats = self.stats.get(self._key(self._tree(condition.expression).body))
+            if stats is None or stats.evaluations < self.min_samples:
+                return True
+        return False
+
+    def profile_conditions(self, conditions: List[Condition], context: Dict[str, Any]) -> bool:
+        """
+        모든 조건을 평가하며 통계 기록 후 YAML 순서 AND 결과 반환
+
+        Raises:
+            ValueError: YAML 순서상 첫 실패 조건보다 앞선 조건이 에러를 낸 경우
+        """
+        outcomes = []
+        for condition in conditions:
+            tree = self._tree(condition.expression)
+            value, error = self._profile_operand(tree.body, context)
+            outcomes.append((condition, value, error))
+
+        for condition, value, error in outcomes:
+            if error is not None:
+                raise ValueError(f"표현식 평가 실패: {condition.expression}\n오류: {error}") from error
+            if not value:
+                return False
+        return True
+
+    def order_conditions(self, conditions: List[Condition]) -> List[Condition]:
+        """AND 조건 리스트를 기대 비용 순으로 재배치 (통계 부족 시 원래 순서)"""
+        cached = self._ordered.get(id(conditions))
+        if cached is not None and cached[0] is conditions:
+            return cached[1]
+
+        if self.needs_profiling(conditions):
+            return conditions
+
+        ordered = self._sorted(
+            conditions,
+            [self._key(self._tree(c.expression).body) for c in conditions],
+            is_and=True
+        )
+        self._ordered[id(conditions)] = (conditions, ordered)
+
+        if ordered != conditions:
+            logger.debug(
+                "Entry conditions reordered",
+                context={
+                    'yaml_order': [c.name for c in conditions],
+                    'planned_order': [c.name for c in ordered]
+                }
+            )
+        return ordered
+
+    def evaluate(self, condition: Condition, context: Dict[str, Any]) -> Any:
+        """
+        조건 평가 (표현식 내부 and/or 피연산자 재배치 적용)
+
+        재배치된 트리가 에러를 내면 원래 순서로 다시 평가해 같은 결과/에러를 반환.
+        """
+        tree = self._planned_tree(condition.expression)
+        if tree is None:
+            return condition.evaluate(self.engine, context)
+        try:
+            return self.engine.evaluate_node(tree.body, context)
+        except Exception:
+            return condition.evaluate(self.engine, context)
+
+    # ============================================================
+    # Persistence (YAML 파일별)
+    # ============================================================
+
+    @property
+    def plan_path(self) -> Optional[Path]:
+        """통계 저장 경로 (<yaml>.plan.json)"""
+        if not self.yaml_path:
+            return None
+        path = Path(self.yaml_path)
+        return path.with_name(path.stem + PLAN_FILE_SUFFIX)
+
+    def save(self, path: Optional[str] = None) -> Optional[Path]:
+        """
+        측정 통계 저장
+
+        Args:
+            path: 저장 경로 (None이면 plan_path)
+
+        Returns:
+            저장한 경로 (경로가 없으면 None)
+        """
+        target = Path(path) if path else self.plan_path
+        if target is None:
+            return None
+
+        data = {
+            'version': PLAN_FORMAT_VERSION,
+            'yaml_sha256': self._yaml_fingerprint(),
+            'stats': {key: asdict(stats) for key, stats in sorted(self.stats.items())}
+        }
+        target.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+        logger.info(
+            "Condition plan saved",
+            context={'path': str(target), 'num_expressions': len(self.stats)}
+        )
+        return target
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """
+        저장된 통계 로드
+
+        YAML 내용이 바뀌었으면(해시 불일치) 로드하지 않음.
+
+        Returns:
+            로드 성공 여부
+        """
+        source = Path(path) if path else self.plan_path
+        if source is None or not source.exists():
+            return False
+
+        try:
+            data = json.loads(source.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning("Condition plan unreadable", context={'path': str(source)}, exc=e)
+            return False
+
+        if data.get('version') != PLAN_FORMAT_VERSION or data.get('yaml_sha256') != self._yaml_fingerprint():
+            logger.info("Condition plan is stale, re-profiling", context={'path': str(source)})
+            return False
+
+        self.stats = {key: ConditionStats(**values) for key, values in data.get('stats', {}).items()}
+        self._ordered.clear()
+        self._planned.clear()
+        return True
+
+    def _yaml_fingerprint(self) -> Optional[str]:
+        if not self.yaml_path or not Path(self.yaml_path).exists():
+            return None
+        return hashlib.sha256(Path(self.yaml_path).read_bytes()).hexdigest()
+
+    # ============================================================
+    # Internals
+    # ============================================================
+
+    def _tree(self, expression: str) -> ast.Expression:
+        return self.engine.compile(expression)
+
+    def _key(self, node: ast.AST) -> str:
+        key = self._keys.get(id(node))
+        if key is None:
+            key = ast.unparse(node)
+            self._keys[id(node)] = key
+        return key
+
+    def _profile_operand(self, node: ast.AST, context: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        """노드 1개 평가 + 시간/결과 기록"""
+        started = self.clock()
+        try:
+            value, error = self._profile_node(node, context), None
+        except Exception as e:
+            value, error = None, e
+        elapsed = self.clock() - started
+
+        stats = self.stats.setdefault(self._key(node), ConditionStats())
+        stats.record(elapsed, None if error is not None else bool(value))
+        return value, error
+
+    def _profile_node(self, node: ast.AST, context: Dict[str, Any]) -> Any:
+        """
+        and/or 피연산자를 모두 평가하고 원래 순서로 결과 재생
+
+        ExpressionEngine의 단락 평가와 같은 값(또는 같은 에러)을 반환.
+        """
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, (ast.And, ast.Or)):
+            is_and = isinstance(node.op, ast.And)
+            outcomes = [self._profile_operand(v, context) for v in node.values]
+            for value, error in outcomes:
+                if error is not None:
+                    raise error
+                if bool(value) != is_and:
+                    return not is_and
+            return is_and
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return not self._profile_node(node.operand, context)
+
+        return self.engine.evaluate_node(node, context)
+
+    def _sorted(self, items: List[Any], keys: List[str], is_and: bool) -> List[Any]:
+        """rank 오름차순 안정 정렬 (같은 rank는 원래 순서)"""
+        ranks = [self.stats[key].rank(is_and) for key in keys]
+        order = sorted(range(len(items)), key=lambda i: (ranks[i], i))
+        return [items[i] for i in order]
+
+    def _planned_tree(self, expression: str) -> Optional[ast.Expression]:
+        """피연산자를 재배치한 AST (바뀐 것이 없으면 None)"""
+        if expression in self._planned:
+            return self._planned[expression]
+
+        original = self._tree(expression)
+        planned = copy.deepcopy(original)
+        changed = self._reorder(original.body, planned.body)
+        result = planned if changed else None
+        self._planned[expression] = result
+        return result
+
+    def _reorder(self, original: ast.AST, planned: ast.AST) -> bool:
+        """original과 같은 모양의 planned 트리에서 and/or 피연산자 재배치"""
+        if isinstance(original, ast.UnaryOp) and isinstance(original.op, ast.Not):
+            return self._reorder(original.operand, planned.operand)
+
+        if not (isinstance(original, ast.BoolOp) and isinstance(original.op, (ast.And, ast.Or))):
+            return False
+
+        changed = False
+        for child, planned_child in zip(original.values, planned.values):
+            changed = self._reorder(child, planned_child) or changed
+
+        keys = [self._key(v) for v in original.values]
+        stats = [self.stats.get(key) for key in keys]
+        if any(s is None or s.evaluations < self.min_samples or s.errors for s in stats):
+            return changed
+
+        indices = self._sorted(list(range(len(keys))), keys, isinstance(original.op, ast.And))
+        if indices != list(range(len(keys))):
+            planned.values = [planned.values[i] for i in indices]
+            changed = True
+        return changed
@@ -0,0 +1,180 @@
+"""
+Detection Write Buffer
+
+탐지 결과(시드 패턴 + 블록)를 메모리에 모았다가 일괄 저장하는 스테이징 버퍼
+"""
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.domain.entities.detections import DynamicBlockDetection
+from src.domain.entities.patterns import SeedPattern
+from src.domain.repositories.dynamic_block_repository import DynamicBlockRepository
+from src.domain.repositories.seed_pattern_repository import SeedPatternRepository
+
+
+# 블록 자연키: (ticker, condition_name, pattern_id, block_id, started_at)
+BlockKey = Tuple[str, str, Optional[str], str, Optional[date]]
+
+
+class DetectionWriteBuffer:
+    """
+    탐지 결과 스테이징 버퍼 (run 단위)
+
+    책임:
+    1. 저장할 패턴/블록을 메모리에 모음 (자연키 기준 중복 제거, 마지막 값 우선)
+    2. flush() 시 Repository.save_all()로 한 번에 기록
+    3. flush_threshold 도달 시 자동 flush (배치 단위 트랜잭션)
+
+    자연키:
+    - SeedPattern: pattern_name
+    - DynamicBlockDetection: (ticker, condition_name, pattern_id, block_id, started_at)
+
+    Example:
+        >>> buffer = DetectionWriteBuffer(seed_pattern_repo, block_repo)
+        >>> for tree in completed_patterns:
+        ...     buffer.stage_pattern(tree.to_seed_pattern(yaml_path))
+        ...     buffer.stage_blocks(tree.blocks.values())
+        >>> buffer.flush()
+        (26, 78)
+
+    Note:
+        Repository 구현체의 save_all()은 청크 단위 multi-row INSERT/UPDATE를
+        사용하므로, 한 번의 flush가 행 수와 무관하게 소수의 SQL 문으로 처리됩니다.
+    """
+
+    def __init__(
+        self,
+        seed_pattern_repository: Optional[SeedPatternRepository] = None,
+        block_repository: Optional[DynamicBlockRepository] = None,
+        flush_threshold: Optional[int] = None
+    ):
+        """
+        초기화
+
+        Args:
+            seed_pattern_repository: 시드 패턴 저장소 (None이면 패턴 저장 안 함)
+            block_repository: 블록 저장소 (None이면 블록 저장 안 함)
+            flush_threshold: 대기 건수가 이 값 이상이면 자동 flush (None이면 수동 flush만)
+        """
+        if flush_threshold is not None and flush_threshold < 1:
+            raise ValueError(f"flush_threshold must be >= 1, got {flush_threshold}")
+
+        self.seed_pattern_repository = seed_pattern_repository
+        self.block_repository = block_repository
+        self.flush_threshold = flush_threshold
+
+        self._patterns: Dict[str, SeedPattern] = {}
+        self._blocks: Dict[BlockKey, DynamicBlockDetection] = {}
+
+    @staticmethod
+    def block_key(block: DynamicBlockDetection) -> BlockKey:
+        """블록 자연키 생성"""
+        return (
+            block.ticker,
+            block.condition_name,
+            block.pattern_id,
+            block.block_id,
+            block.started_at
+        )
+
+    @property
+    def pending_count(self) -> int:
+        """저장 대기 중인 패턴 + 블록 수"""
+        return len(self._patterns) + len(self._blocks)
+
+    def stage_pattern(self, seed_pattern: SeedPattern) -> None:
+        """
+        시드 패턴 스테이징
+
+        Args:
+            seed_pattern: 저장할 시드 패턴 (pattern_name 기준 중복 제거)
+        """
+        if self.seed_pattern_repository is None:
+            return
+
+        self._patterns[seed_pattern.pattern_name] = seed_pattern
+        self._auto_flush()
+
+    def stage_blocks(self, blocks) -> None:
+        """
+        블록 스테이징
+
+        Args:
+            blocks: 저장할 블록 iterable (자연키 기준 중복 제거)
+        """
+        if self.block_repository is None:
+            return
+
+        for block in blocks:
+            self._blocks[self.block_key(block)] = block
+        self._auto_flush()
+
+    def flush(self) -> Tuple[int, int]:
+        """
+        스테이징된 패턴/블록 일괄 저장
+
+        패턴 → 블록 순서로 기록합니다. 블록 저장소는 save_all()에서 한 번만
+        commit하므로 같은 세션을 공유하면 패턴과 블록이 하나의 트랜잭션으로 저장됩니다.
+        실패 시 저장소 세션을 rollback하고 버퍼는 유지되어 재시도할 수 있습니다.
+
+        Returns:
+            (저장된 패턴 수, 저장된 블록 수)
+
+        Raises:
+            Exception: save_all() 실패 시 (rollback 후 원래 예외 전달)
+        """
+        patterns: List[SeedPattern] = list(self._patterns.values())
+        blocks: List[DynamicBlockDetection] = list(self._blocks.values())
+
+        try:
+            if patterns:
+                self.seed_pattern_repository.save_all(patterns)
+            if blocks:
+                self.block_repository.save_all(blocks)
+        except Exception:
+            self._rollback()
+            raise
+
+        self.clear()
+
+        if patterns or blocks:
+            logger.debug(
+                "Flushed detection write buffer",
+                extra={'patterns': len(patterns), 'blocks': len(blocks)}
+            )
+
+        return len(patterns), len(blocks)
+
+    def clear(self) -> None:
+        """스테이징 버퍼 비우기 (저장하지 않음)"""
+        self._patterns.clear()
+        self._blocks.clear()
+
+    def _rollback(self) -> None:
+        """
+        저장소 세션 rollback (실패한 트랜잭션 상태를 풀어 다음 flush가 가능하도록)
+
+        두 저장소가 같은 세션을 공유하면 한 번만 rollback합니다.
+        """
+        sessions = []
+        for repository in (self.seed_pattern_repository, self.block_repository):
+            session = getattr(repository, 'session', None)
+            if session is not None and all(session is not s for s in sessions):
+                sessions.append(session)
+
+        for session in sessions:
+            try:
+                session.rollback()
+            except Exception as e:
+                logger.error(
+                    "Failed to roll back session after flush error",
+                    extra={'error': str(e)},
+                    exc_info=True
+                )
+
+    def _auto_flush(self) -> None:
+        """대기 건수가 임계값에 도달하면 flush"""
+        if self.flush_threshold is not None and self.pending_count >= self.flush_threshold:
+            self.flush()
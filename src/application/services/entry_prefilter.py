@@ -0,0 +1,419 @@
+"""
+Entry Condition Prefilter
+
+상태 없는 진입 조건을 전체 시계열 NumPy 마스크로 미리 계산
+
+Most block1 entry conditions only look at the current candle, the previous valid
+candle and rolling windows over the series (`current.high >= ma(120)`,
+`prev != None and (current.high - prev.close) / prev.close >= 0.10`,
+`is_new_high(365)`). Those conditions do not depend on detection state, so they can
+be evaluated for every candle at once. The prefilter compiles that subset of a
+node's AND list to boolean masks; the sequential loop then only evaluates the full
+condition list (through the AST interpreter) on candles where the mask is True.
+
+The mask is conservative: a candle is dropped only when the vectorized result is
+definitely False. Missing values, comparisons within a relative 1e-9 of each other
+(rolling sums are not summed in the interpreter's order) and anything the compiler
+does not understand count as "unknown" and keep the candle.
+"""
+import ast
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from src.domain.entities.core import Stock
+from src.domain.entities.conditions import Condition, ExpressionEngine, builtin_functions
+from src.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 이 범위 안의 비교는 판정 불가로 간주 (float 합산 순서 차이 흡수)
+COMPARE_REL_TOL = 1e-9
+
+_STATE_FREE_NAMES = ('current', 'prev')
+
+
+class _Vec(NamedTuple):
+    """캔들별 값 + 판정 가능 여부"""
+    values: np.ndarray  # float64
+    known: np.ndarray   # bool (False면 통과로 간주)
+
+
+class _Unsupported(Exception):
+    """상태 없는 벡터화가 불가능한 표현식"""
+
+
+class _SeriesColumns:
+    """한 시계열의 열(column) 캐시"""
+
+    def __init__(self, stocks: Sequence[Stock], prev_index: Sequence[int]):
+        self.stocks = stocks
+        self.n = len(stocks)
+        self.prev_index = np.asarray(prev_index, dtype=np.int64)
+        self.has_prev = self.prev_index >= 0
+        self._prev_take = np.where(self.has_prev, self.prev_index, 0)
+        self._cache: Dict[Any, _Vec] = {}
+
+    def cached(self, key: Any, build: Callable[[], _Vec]) -> _Vec:
+        vec = self._cache.get(key)
+        if vec is None:
+            vec = build()
+            self._cache[key] = vec
+        return vec
+
+    def attribute(self, owner: str, attr: str) -> _Vec:
+        current = self.cached(('attr', attr), lambda: self._attribute_column(attr))
+        if owner == 'current':
+            return current
+        return _Vec(current.values[self._prev_take], current.known[self._prev_take] & self.has_prev)
+
+    def raw(self, attr: str) -> np.ndarray:
+        """필수 필드 (open/high/low/close/volume) 배열"""
+        return self.cached(
+            ('raw', attr),
+            lambda: _Vec(np.array([getattr(s, attr) for s in self.stocks], dtype=np.float64),
+                         np.ones(self.n, dtype=bool))
+        ).values
+
+    def indicator(self, key: str, fallback: np.ndarray) -> _Vec:
+        """
+        current.indicators[key], 없거나 None이면 fallback (내장 함수의 '방법 2')
+
+        값이 있지만 숫자가 아니면 known=False.
+        """
+        values = fallback.astype(np.float64, copy=True)
+        known = np.ones(self.n, dtype=bool)
+        for j, stock in enumerate(self.stocks):
+            indicators = getattr(stock, 'indicators', None)
+            if isinstance(indicators, dict):
+                value = indicators.get(key)
+                if value is not None:
+                    known[j] = False
+                    _store(values, known, j, value)
+        return _Vec(values, known)
+
+    def _attribute_column(self, attr: str) -> _Vec:
+        # ExpressionEngine 속성 접근과 같은 순서: 객체 속성 → indicators 딕셔너리
+        values = np.full(self.n, np.nan)
+        known = np.zeros(self.n, dtype=bool)
+        for j, stock in enumerate(self.stocks):
+            if hasattr(stock, attr):
+                _store(values, known, j, getattr(stock, attr))
+            else:
+                indicators = getattr(stock, 'indicators', None)
+                if isinstance(indicators, dict):
+                    _store(values, known, j, indicators.get(attr))
+        return _Vec(values, known)
+
+
+def _store(values: np.ndarray, known: np.ndarray, j: int, value: Any) -> None:
+    if isinstance(value, (bool, int, float, np.number)) and not (
+        isinstance(value, (float, np.floating)) and np.isnan(value)
+    ):
+        values[j] = float(value)
+        known[j] = True
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """마지막 period개 평균 (앞부분은 있는 만큼) - builtin ma()/volume_ma()와 동일한 창"""
+    padded = np.concatenate([np.zeros(period - 1), values])
+    sums = np.lib.stride_tricks.sliding_window_view(padded, period).sum(axis=1)
+    counts = np.minimum(np.arange(1, len(values) + 1), period)
+    return sums / counts
+
+
+def _calendar_window_max(values: np.ndarray, stocks: Sequence[Stock], days: int) -> np.ndarray:
+    """[date - days, date] 달력 구간 최대값 (현재 캔들 포함)"""
+    ordinals = np.array([s.date.toordinal() for s in stocks], dtype=np.int64)
+    if np.any(np.diff(ordinals) < 0):
+        raise _Unsupported("stocks not sorted by date")
+    starts = np.searchsorted(ordinals, ordinals - days, side='left')
+    return np.array([values[lo:i + 1].max() for i, lo in enumerate(starts)])
+
+
+class EntryConditionPrefilter:
+    """
+    진입 조건 중 상태 없는 부분집합을 NumPy 마스크로 컴파일
+
+    Example:
+        >>> prefilter = EntryConditionPrefilter(engine)
+        >>> mask = prefilter.candidate_mask(node.entry_conditions, stocks, last_valid_index)
+        >>> # mask[i]가 False인 캔들은 진입 조건을 만족할 수 없음
+    """
+
+    def __init__(self, expression_engine: ExpressionEngine):
+        """
+        Args:
+            expression_engine: 표현식 평가 엔진 (AST 캐시 + 함수 레지스트리)
+        """
+        self.engine = expression_engine
+        self._functions: Dict[str, Callable[[_SeriesColumns, List[float]], _Vec]] = {
+            'ma': self._ma,
+            'volume_ma': self._volume_ma,
+            'normalized_volume': self._normalized_volume,
+            'is_new_high': self._is_new_high,
+            'is_volume_high': self._is_volume_high,
+        }
+
+    # ============================================================
+    # Public API
+    # ============================================================
+
+    def is_state_free(self, condition: Condition) -> bool:
+        """current/prev와 상태 없는 내장 함수만 쓰는 조건인지"""
+        expression = getattr(condition, 'expression', None)
+        if not isinstance(expression, str):
+            return False
+        try:
+            tree = self.engine.compile(expression)
+        except Exception:
+            return False
+        return isinstance(tree, ast.Expression) and self._check(tree.body)
+
+    def candidate_mask(
+        self,
+        conditions: Optional[List[Condition]],
+        stocks: Sequence[Stock],
+        prev_index: Sequence[int]
+    ) -> Optional[np.ndarray]:
+        """
+        AND 조건 리스트의 후보 캔들 마스크
+
+        Args:
+            conditions: 진입 조건 리스트 (AND)
+            stocks: 컨텍스트의 current로 쓰이는 주가 시계열 (forward fill 후)
+            prev_index: 캔들별 prev 위치 (-1이면 prev=None)
+
+        Returns:
+            bool 배열 (False면 조건 불만족 확정), 상태 없는 조건이 없으면 None
+        """
+        if not conditions or not stocks:
+            return None
+        if len(prev_index) != len(stocks):
+            raise ValueError(f"prev_index length {len(prev_index)} != stocks length {len(stocks)}")
+
+        columns = _SeriesColumns(stocks, prev_index)
+        mask = None
+        compiled = 0
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for condition in conditions:
+                if not self.is_state_free(condition):
+                    continue
+                try:
+                    vec = self._eval(self.engine.compile(condition.expression).body, columns)
+                except _Unsupported:
+                    continue
+                passed = self._truth(vec) | ~vec.known
+                mask = passed if mask is None else (mask & passed)
+                compiled += 1
+
+        if mask is not None:
+            logger.debug(
+                "Entry prefilter mask computed",
+                context={
+                    'num_conditions': len(conditions),
+                    'state_free_conditions': compiled,
+                    'candidates': int(mask.sum()),
+                    'candles': len(stocks)
+                }
+            )
+        return mask
+
+    # ============================================================
+    # Analysis (상태 없는 조건 판별)
+    # ============================================================
+
+    def _check(self, node: ast.AST) -> bool:
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, (bool, int, float)) or node.value is None
+        if isinstance(node, ast.Name):
+            return node.id in _STATE_FREE_NAMES
+        if isinstance(node, ast.Attribute):
+            return isinstance(node.value, ast.Name) and node.value.id in _STATE_FREE_NAMES
+        if isinstance(node, ast.Call):
+            return (
+                isinstance(node.func, ast.Name)
+                and self._is_builtin(node.func.id)
+                and not node.keywords
+                and all(isinstance(a, ast.Constant) and isinstance(a.value, (int, float))
+                        and not isinstance(a.value, bool) for a in node.args)
+            )
+        if isinstance(node, ast.BinOp):
+            return isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div)) and \
+                self._check(node.left) and self._check(node.right)
+        if isinstance(node, ast.UnaryOp):
+            return isinstance(node.op, (ast.Not, ast.USub, ast.UAdd)) and self._check(node.operand)
+        if isinstance(node, ast.BoolOp):
+            return isinstance(node.op, (ast.And, ast.Or)) and all(self._check(v) for v in node.values)
+        if isinstance(node, ast.Compare):
+            return all(
+                isinstance(op, (ast.Gt, ast.GtE, ast.Lt, ast.LtE, ast.Eq, ast.NotEq))
+                for op in node.ops
+            ) and all(self._check(v) for v in [node.left] + node.comparators)
+        return False
+
+    def _is_builtin(self, name: str) -> bool:
+        registry = self.engine.function_registry
+        if name not in self._functions or registry is None:
+            return False
+        try:
+            return registry.get(name) is getattr(builtin_functions, name)
+        except Exception:
+            return False
+
+    # ============================================================
+    # Vectorized evaluation
+    # ============================================================
+
+    def _eval(self, node: ast.AST, columns: _SeriesColumns) -> _Vec:
+        n = columns.n
+
+        if isinstance(node, ast.Constant):
+            if node.value is None or isinstance(node.value, str):
+                raise _Unsupported(ast.unparse(node))
+            return _Vec(np.full(n, float(node.value)), np.ones(n, dtype=bool))
+
+        if isinstance(node, ast.Attribute):
+            return columns.attribute(node.value.id, node.attr)
+
+        if isinstance(node, ast.Call):
+            args = [a.value for a in node.args]
+            return self._functions[node.func.id](columns, args)
+
+        if isinstance(node, ast.BinOp):
+            left = self._eval(node.left, columns)
+            right = self._eval(node.right, columns)
+            if isinstance(node.op, ast.Add):
+                values = left.values + right.values
+            elif isinstance(node.op, ast.Sub):
+                values = left.values - right.values
+            elif isinstance(node.op, ast.Mult):
+                values = left.values * right.values
+            else:
+                # 0으로 나누기는 인터프리터에서 에러 → 진입 실패이므로 값은 무관
+                values = left.values / right.values
+            return _Vec(values, left.known & right.known)
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._eval(node.operand, columns)
+            if isinstance(node.op, ast.Not):
+                return _Vec((~self._truth(operand)).astype(np.float64), operand.known)
+            if isinstance(node.op, ast.USub):
+                return _Vec(-operand.values, operand.known)
+            return operand
+
+        if isinstance(node, ast.BoolOp):
+            operands = [self._eval(v, columns) for v in node.values]
+            if isinstance(node.op, ast.And):
+                decided_false = np.zeros(n, dtype=bool)
+                all_true = np.ones(n, dtype=bool)
+                for vec in operands:
+                    truth = self._truth(vec)
+                    decided_false |= vec.known & ~truth
+                    all_true &= vec.known & truth
+                return _Vec(all_true.astype(np.float64), decided_false | all_true)
+            decided_true = np.zeros(n, dtype=bool)
+            all_false = np.ones(n, dtype=bool)
+            for vec in operands:
+                truth = self._truth(vec)
+                decided_true |= vec.known & truth
+                all_false &= vec.known & ~truth
+            return _Vec(decided_true.astype(np.float64), decided_true | all_false)
+
+        if isinstance(node, ast.Compare):
+            return self._compare(node, columns)
+
+        raise _Unsupported(ast.unparse(node))
+
+    def _compare(self, node: ast.Compare, columns: _SeriesColumns) -> _Vec:
+        operands = [node.left] + node.comparators
+
+        # "prev != None" / "prev == None" (current는 항상 존재)
+        if len(node.ops) == 1 and any(_is_none(o) for o in operands):
+            other = operands[1] if _is_none(operands[0]) else operands[0]
+            if not isinstance(other, ast.Name) or not isinstance(node.ops[0], (ast.Eq, ast.NotEq)):
+                raise _Unsupported(ast.unparse(node))
+            present = columns.has_prev if other.id == 'prev' else np.ones(columns.n, dtype=bool)
+            result = present if isinstance(node.ops[0], ast.NotEq) else ~present
+            return _Vec(result.astype(np.float64), np.ones(columns.n, dtype=bool))
+
+        if any(isinstance(o, ast.Name) or _is_none(o) for o in operands):
+            raise _Unsupported(ast.unparse(node))
+
+        vecs = [self._eval(o, columns) for o in operands]
+        decided_false = np.zeros(columns.n, dtype=bool)
+        all_true = np.ones(columns.n, dtype=bool)
+        for op, left, right in zip(node.ops, vecs, vecs[1:]):
+            a, b = left.values, right.values
+            if isinstance(op, ast.Gt):
+                truth = a > b
+            elif isinstance(op, ast.GtE):
+                truth = a >= b
+            elif isinstance(op, ast.Lt):
+                truth = a < b
+            elif isinstance(op, ast.LtE):
+                truth = a <= b
+            elif isinstance(op, ast.Eq):
+                truth = a == b
+            else:
+                truth = a != b
+            near = np.abs(a - b) <= COMPARE_REL_TOL * np.maximum(np.abs(a), np.abs(b))
+            known = left.known & right.known & ~near & ~np.isnan(a) & ~np.isnan(b)
+            decided_false |= known & ~truth
+            all_true &= known & truth
+        return _Vec(all_true.astype(np.float64), decided_false | all_true)
+
+    @staticmethod
+    def _truth(vec: _Vec) -> np.ndarray:
+        return vec.values != 0
+
+    # ============================================================
+    # Builtin functions (builtin_functions.py와 같은 의미)
+    # ============================================================
+
+    @staticmethod
+    def _single_ticker(columns: _SeriesColumns) -> None:
+        # all_stocks 계산 경로는 current와 같은 ticker만 사용
+        tickers = {s.ticker for s in columns.stocks}
+        if len(tickers) != 1:
+            raise _Unsupported("mixed tickers")
+
+    def _ma(self, columns: _SeriesColumns, args: List[float]) -> _Vec:
+        period = int(args[0])
+        if period < 1:
+            raise _Unsupported(f"ma({period})")
+        self._single_ticker(columns)
+        return columns.indicator(f'ma_{period}', _rolling_mean(columns.raw('close'), period))
+
+    def _volume_ma(self, columns: _SeriesColumns, args: List[float]) -> _Vec:
+        period = int(args[0])
+        if period < 1:
+            raise _Unsupported(f"volume_ma({period})")
+        self._single_ticker(columns)
+        return columns.cached(
+            ('volume_ma', period),
+            lambda: _Vec(_rolling_mean(columns.raw('volume'), period), np.ones(columns.n, dtype=bool))
+        )
+
+    def _normalized_volume(self, columns: _SeriesColumns, args: List[float]) -> _Vec:
+        volume = columns.raw('volume')
+        average = self._volume_ma(columns, args).values
+        values = np.where((volume == 0) | (average == 0), 0.0, volume / average * 100.0)
+        return _Vec(values, np.ones(columns.n, dtype=bool))
+
+    def _window_high(self, columns: _SeriesColumns, args: List[float], field: str, indicator_key: str) -> _Vec:
+        days = int(args[0])
+        self._single_ticker(columns)
+        raw = columns.raw(field)
+        fallback = raw == _calendar_window_max(raw, columns.stocks, days)
+        return columns.indicator(indicator_key.format(days=days), fallback)
+
+    def _is_new_high(self, columns: _SeriesColumns, args: List[float]) -> _Vec:
+        return self._window_high(columns, args, 'high', 'is_new_high_{days}d')
+
+    def _is_volume_high(self, columns: _SeriesColumns, args: List[float]) -> _Vec:
+        return self._window_high(columns, args, 'volume', 'is_volume_high_{days}d')
+
+
+def _is_none(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and node.value is None
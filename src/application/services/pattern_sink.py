@@ -0,0 +1,135 @@
+"""
+Pattern Sink
+
+완료/보관된 시드 패턴을 탐지 직후 내보내는 출력 대상 (스트리밍 모드용)
+
+SeedPatternDetectionOrchestrator(streaming=True)는 check_and_complete_patterns()가
+완료 처리한 패턴을 sink로 내보낸 뒤 메모리에서 제거합니다. 전체 시장을 돌려도
+메모리에는 처리 중인 종목의 패턴만 남습니다.
+"""
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+from src.application.services.detection_write_buffer import DetectionWriteBuffer
+from src.domain.entities.patterns import SeedPatternTree
+
+
+class PatternSink(ABC):
+    """
+    패턴 출력 대상 인터페이스
+
+    emit()은 패턴마다, flush()는 종목 처리가 끝날 때 1회 호출됩니다.
+    """
+
+    @abstractmethod
+    def emit(self, pattern: SeedPatternTree) -> None:
+        """
+        완료(또는 보관)된 패턴 1개 내보내기
+
+        Args:
+            pattern: 완료 처리된 패턴 (호출 후 오케스트레이터는 참조를 버림)
+        """
+        pass
+
+    def flush(self) -> None:
+        """버퍼링된 출력 기록 (기본: 아무것도 안 함)"""
+        pass
+
+    def close(self) -> None:
+        """자원 정리 (기본: flush)"""
+        self.flush()
+
+
+class WriteBufferPatternSink(PatternSink):
+    """
+    DB 저장 sink
+
+    DetectionWriteBuffer에 패턴/블록을 스테이징하고 flush() 시 일괄 저장.
+    flush_threshold를 지정한 버퍼를 넘기면 종목 중간에도 배치 단위로 저장됩니다.
+    """
+
+    def __init__(self, write_buffer: DetectionWriteBuffer, yaml_config_path: str = ""):
+        """
+        Args:
+            write_buffer: 저장 스테이징 버퍼
+            yaml_config_path: SeedPattern에 기록할 YAML 경로
+        """
+        self.write_buffer = write_buffer
+        self.yaml_config_path = yaml_config_path
+
+    def emit(self, pattern: SeedPatternTree) -> None:
+        self.write_buffer.stage_pattern(pattern.to_seed_pattern(self.yaml_config_path))
+        self.write_buffer.stage_blocks(pattern.blocks.values())
+
+    def flush(self) -> None:
+        self.write_buffer.flush()
+
+
+class JsonlPatternSink(PatternSink):
+    """
+    파일 sink (JSON Lines)
+
+    패턴 1개당 1줄: get_metadata() + 블록 목록(to_dict()).
+    날짜는 ISO 문자열로 기록합니다.
+    """
+
+    def __init__(self, path: str, append: bool = True):
+        """
+        Args:
+            path: 출력 파일 경로
+            append: 기존 파일에 이어 쓰기 (False면 덮어쓰기)
+        """
+        self.path = Path(path)
+        self._file = self.path.open('a' if append else 'w', encoding='utf-8')
+        self.count = 0
+
+    def emit(self, pattern: SeedPatternTree) -> None:
+        record = pattern.get_metadata()
+        record['blocks'] = [block.to_dict() for block in pattern.blocks.values()]
+        self._file.write(json.dumps(record, ensure_ascii=False, default=_json_default))
+        self._file.write('\n')
+        self.count += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            logger.debug(
+                "Closed pattern sink",
+                extra={'path': str(self.path), 'patterns': self.count}
+            )
+
+
+class QueuePatternSink(PatternSink):
+    """
+    큐 sink (다른 스레드/프로세스의 writer로 전달)
+
+    queue.Queue, multiprocessing.Queue 등 put()을 가진 객체를 받습니다.
+    """
+
+    def __init__(self, queue: Any, timeout: Optional[float] = None):
+        """
+        Args:
+            queue: put(item, timeout=...)을 지원하는 큐
+            timeout: put() 대기 시간 (None이면 공간이 생길 때까지 대기, 메모리 상한 역할)
+        """
+        self.queue = queue
+        self.timeout = timeout
+
+    def emit(self, pattern: SeedPatternTree) -> None:
+        self.queue.put(pattern, timeout=self.timeout)
+
+
+def _json_default(value: Any) -> Any:
+    """date/datetime/Enum 등 JSON 비호환 값 변환"""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if hasattr(value, 'value'):
+        return value.value
+    return str(value)
@@ -0,0 +1,146 @@
+"""
+Price Series Index
+
+일봉 시계열의 날짜 → 위치 조회 + 구간 최소/최대 조회 색인
+
+Support/resistance analysis asks the same two questions for every block: which
+candles fall inside [started_at, ended_at], and does any high/low in that range come
+within tolerance of Block1.high. Sparse tables over the highs and lows answer the
+range min/max in O(1) after an O(n log n) build, so blocks whose range cannot touch
+the band are skipped without looking at a single candle.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.entities.core import Stock
+
+
+def _build_sparse_table(
+    values: np.ndarray,
+    op: Callable[[np.ndarray, np.ndarray], np.ndarray]
+) -> List[np.ndarray]:
+    """
+    Sparse table 구성 (table[k][i] = op over values[i:i + 2**k])
+
+    Args:
+        values: 원본 배열
+        op: np.minimum 또는 np.maximum
+
+    Returns:
+        레벨별 배열 리스트
+    """
+    table = [values]
+    width = 1
+    while width * 2 <= len(values):
+        prev = table[-1]
+        table.append(op(prev[:-width], prev[width:]))
+        width *= 2
+    return table
+
+
+class PriceSeriesIndex:
+    """고가/저가 구간 최소·최대 색인 (날짜 오름차순)"""
+
+    def __init__(self, stocks: Sequence[Stock]):
+        """
+        Args:
+            stocks: 주가 데이터 (날짜 순이 아니면 안정 정렬)
+        """
+        ordinals = [s.date.toordinal() for s in stocks]
+        if any(a > b for a, b in zip(ordinals, ordinals[1:])):
+            stocks = sorted(stocks, key=lambda s: s.date)
+            ordinals = [s.date.toordinal() for s in stocks]
+
+        self.stocks: List[Stock] = list(stocks)
+        self._ordinals = ordinals
+        self.highs = np.array([s.high for s in self.stocks], dtype=np.float64)
+        self.lows = np.array([s.low for s in self.stocks], dtype=np.float64)
+
+        self._min_high = _build_sparse_table(self.highs, np.minimum)
+        self._max_high = _build_sparse_table(self.highs, np.maximum)
+        self._min_low = _build_sparse_table(self.lows, np.minimum)
+        self._max_low = _build_sparse_table(self.lows, np.maximum)
+
+    def __len__(self) -> int:
+        return len(self.stocks)
+
+    def covers(self, stocks: Sequence[Stock]) -> bool:
+        """같은 시계열로 만든 색인인지 확인 (길이 + 양 끝 날짜)"""
+        if len(stocks) != len(self.stocks):
+            return False
+        if not stocks:
+            return True
+        return (
+            stocks[0].date.toordinal() == self._ordinals[0]
+            and stocks[-1].date.toordinal() == self._ordinals[-1]
+        )
+
+    def range(self, start: date, end: date) -> Tuple[int, int]:
+        """
+        start <= date <= end 인 캔들 위치 [lo, hi)
+
+        Args:
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+
+        Returns:
+            (lo, hi) - 비어 있으면 lo >= hi
+        """
+        lo = bisect_left(self._ordinals, start.toordinal())
+        hi = bisect_right(self._ordinals, end.toordinal())
+        return lo, hi
+
+    @staticmethod
+    def _query(table: List[np.ndarray], op, lo: int, hi: int) -> float:
+        k = (hi - lo).bit_length() - 1
+        return float(op(table[k][lo], table[k][hi - (1 << k)]))
+
+    def min_low(self, lo: int, hi: int) -> float:
+        """lows[lo:hi] 최소값 (O(1), lo < hi)"""
+        return self._query(self._min_low, min, lo, hi)
+
+    def max_low(self, lo: int, hi: int) -> float:
+        """lows[lo:hi] 최대값 (O(1), lo < hi)"""
+        return self._query(self._max_low, max, lo, hi)
+
+    def min_high(self, lo: int, hi: int) -> float:
+        """highs[lo:hi] 최소값 (O(1), lo < hi)"""
+        return self._query(self._min_high, min, lo, hi)
+
+    def max_high(self, lo: int, hi: int) -> float:
+        """highs[lo:hi] 최대값 (O(1), lo < hi)"""
+        return self._query(self._max_high, max, lo, hi)
+
+    def highs_near(self, lo: int, hi: int, reference: float, tolerance: float) -> List[int]:
+        """
+        abs(high - reference) <= tolerance 인 위치 (오름차순)
+
+        구간 최소/최대가 [reference - tolerance, reference + tolerance] 밖이면
+        캔들을 보지 않고 빈 리스트 반환.
+        """
+        if lo >= hi:
+            return []
+        if (reference - self.max_high(lo, hi) > tolerance
+                or self.min_high(lo, hi) - reference > tolerance):
+            return []
+        mask = np.abs(self.highs[lo:hi] - reference) <= tolerance
+        return (np.flatnonzero(mask) + lo).tolist()
+
+    def first_low_near(self, lo: int, hi: int, reference: float, tolerance: float) -> int:
+        """
+        abs(low - reference) <= tolerance 인 첫 위치 (없으면 -1)
+
+        highs_near()와 같은 방식으로 구간 최소/최대로 먼저 걸러냄.
+        """
+        if lo >= hi:
+            return -1
+        if (reference - self.max_low(lo, hi) > tolerance
+                or self.min_low(lo, hi) - reference > tolerance):
+            return -1
+        mask = np.abs(self.lows[lo:hi] - reference) <= tolerance
+        if not mask.any():
+            return -1
+        return lo + int(np.argmax(mask))
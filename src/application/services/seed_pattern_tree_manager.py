@@ -3,8 +3,9 @@ Seed Pattern Tree Manager
 
 시드 패턴 트리의 생명주기를 관리하는 서비스
 """
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from loguru import logger
 
@@ -28,6 +29,8 @@ class SeedPatternTreeManager:
     - 자동 pattern_id 생성 (ticker + date + sequence)
     - 패턴 완료 자동 감지
     - 메모리 기반 관리 (처리 속도 우선)
+    - 종목별 활성 패턴 색인 (root 시작일 순, bisect 조회)
+      완료된 패턴은 색인에서 빠지므로 활성 패턴 수만큼만 유지
 
     Example:
         >>> manager = SeedPatternTreeManager()
@@ -38,10 +41,30 @@ class SeedPatternTreeManager:
 
     def __init__(self):
         """초기화"""
-        self.active_patterns: List[SeedPatternTree] = []
+        # 활성 패턴 (생성 순서 유지, id(pattern) → pattern)
+        self._active: Dict[int, SeedPatternTree] = {}
+        # 종목별 활성 패턴 색인: ticker → _TickerIndex (root 시작일 오름차순)
+        self._active_by_ticker: Dict[str, _TickerIndex] = {}
+        # 생성 순번 (같은 시작일 패턴의 정렬 기준)
+        self._insert_seq = 0
+
         self.completed_patterns: List[SeedPatternTree] = []
+        self._completed_by_ticker: Dict[str, List[SeedPatternTree]] = {}
         self.pattern_sequence: Dict[str, int] = {}  # ticker → sequence
 
+    @property
+    def active_patterns(self) -> List[SeedPatternTree]:
+        """활성 패턴 리스트 (생성 순서)"""
+        return list(self._active.values())
+
+    @active_patterns.setter
+    def active_patterns(self, patterns: List[SeedPatternTree]) -> None:
+        """활성 패턴 교체 (색인 재구성)"""
+        self._active.clear()
+        self._active_by_ticker.clear()
+        for pattern in patterns:
+            self._index_active(pattern)
+
     def create_new_pattern(
         self,
         ticker: str,
@@ -83,7 +106,7 @@ class SeedPatternTreeManager:
             created_at=datetime.now()
         )
 
-        self.active_patterns.append(pattern)
+        self._index_active(pattern)
 
         logger.info(
             f"Created new seed pattern: {pattern_id}",
@@ -107,6 +130,7 @@ class SeedPatternTreeManager:
         로직:
         1. block_id가 'block1'이면 → None (새 패턴 생성 필요)
         2. 시간 기반: 현재 블록보다 먼저 시작된 활성 패턴 중 가장 최근 것
+           (종목 색인에서 bisect, 같은 시작일이면 먼저 생성된 패턴)
 
         Args:
             block: 추가할 블록
@@ -121,24 +145,18 @@ class SeedPatternTreeManager:
         if block.block_id == 'block1':
             return None
 
+        index = self._active_by_ticker.get(block.ticker)
+
         # Virtual Block 처리: started_at이 None이므로 시간 기반 매칭 불가
         # 대신 ticker만 매칭하여 가장 최근 활성 패턴에 할당
         if block.is_virtual:
-            candidate_patterns = [
-                p for p in self.active_patterns
-                if p.ticker == block.ticker
-            ]
+            pattern = index.latest() if index else None
         else:
             # Real Block: 시간 기반 현재 블록보다 먼저 시작된 활성 패턴 중 가장 최근 것
-            candidate_patterns = [
-                p for p in self.active_patterns
-                if p.ticker == block.ticker
-                and p.root_block.started_at
-                and block.started_at
-                and p.root_block.started_at <= block.started_at
-            ]
-
-        if not candidate_patterns:
+            pattern = index.latest_started_on_or_before(block.started_at) \
+                if index and block.started_at else None
+
+        if pattern is None:
             logger.warning(
                 f"No active pattern found for {block.block_id}",
                 extra={
@@ -146,14 +164,11 @@ class SeedPatternTreeManager:
                     'block_type': block.block_type,
                     'ticker': block.ticker,
                     'date': str(block.started_at) if block.started_at else None,
-                    'active_patterns_count': len(self.active_patterns)
+                    'active_patterns_count': len(self._active)
                 }
             )
             return None
 
-        # 가장 최근에 시작된 패턴
-        pattern = max(candidate_patterns, key=lambda p: p.root_block.started_at)
-
         logger.debug(
             f"Found parent pattern {pattern.pattern_id} for {block.block_id}",
             extra={
@@ -195,28 +210,38 @@ class SeedPatternTreeManager:
             }
         )
 
-    def check_and_complete_patterns(self) -> List[SeedPatternTree]:
+    def check_and_complete_patterns(self, ticker: Optional[str] = None) -> List[SeedPatternTree]:
         """
         완료 가능한 패턴들 확인 및 완료 처리
 
+        Args:
+            ticker: 확인할 종목 (None이면 모든 종목)
+
         Returns:
             완료된 패턴 리스트
 
         Example:
-            >>> completed = manager.check_and_complete_patterns()
+            >>> completed = manager.check_and_complete_patterns("025980")
             >>> len(completed)
             2
         """
         completed = []
 
-        for pattern in self.active_patterns[:]:  # 복사본 순회 (원본 수정 안전)
+        if ticker is None:
+            candidates = self.active_patterns
+        else:
+            index = self._active_by_ticker.get(ticker)
+            candidates = sorted(index.patterns, key=lambda p: index.seq[id(p)]) if index else []
+
+        for pattern in candidates:  # 복사본 순회 (원본 수정 안전)
             if pattern.check_completion():
                 try:
                     pattern.complete()
 
-                    # active → completed로 이동
-                    self.active_patterns.remove(pattern)
+                    # active → completed로 이동 (색인에서 제거)
+                    self._unindex_active(pattern)
                     self.completed_patterns.append(pattern)
+                    self._completed_by_ticker.setdefault(pattern.ticker, []).append(pattern)
 
                     completed.append(pattern)
 
@@ -257,7 +282,7 @@ class SeedPatternTreeManager:
 
     def get_active_patterns(self) -> List[SeedPatternTree]:
         """활성 패턴만 반환"""
-        return self.active_patterns.copy()
+        return self.active_patterns
 
     def get_completed_patterns(self) -> List[SeedPatternTree]:
         """완료된 패턴만 반환"""
@@ -273,7 +298,9 @@ class SeedPatternTreeManager:
         Returns:
             해당 종목의 패턴 리스트
         """
-        return [p for p in self.get_all_patterns() if p.ticker == ticker]
+        index = self._active_by_ticker.get(ticker)
+        active = sorted(index.patterns, key=lambda p: index.seq[id(p)]) if index else []
+        return active + self._completed_by_ticker.get(ticker, [])
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -288,9 +315,9 @@ class SeedPatternTreeManager:
             10
         """
         return {
-            'active_patterns': len(self.active_patterns),
+            'active_patterns': len(self._active),
             'completed_patterns': len(self.completed_patterns),
-            'total_patterns': len(self.active_patterns) + len(self.completed_patterns),
+            'total_patterns': len(self._active) + len(self.completed_patterns),
             'patterns_by_ticker': self._count_by_ticker()
         }
 
@@ -302,16 +329,16 @@ class SeedPatternTreeManager:
             {ticker: {'active': N, 'completed': M}}
         """
         result: Dict[str, Dict[str, int]] = {}
-        all_patterns = self.get_all_patterns()
 
-        for pattern in all_patterns:
-            if pattern.ticker not in result:
-                result[pattern.ticker] = {'active': 0, 'completed': 0}
+        for ticker, index in self._active_by_ticker.items():
+            result[ticker] = {
+                'active': sum(1 for p in index.patterns if p.status == PatternStatus.ACTIVE),
+                'completed': 0
+            }
 
-            if pattern.status == PatternStatus.ACTIVE:
-                result[pattern.ticker]['active'] += 1
-            elif pattern.status == PatternStatus.COMPLETED:
-                result[pattern.ticker]['completed'] += 1
+        for ticker, patterns in self._completed_by_ticker.items():
+            counts = result.setdefault(ticker, {'active': 0, 'completed': 0})
+            counts['completed'] += sum(1 for p in patterns if p.status == PatternStatus.COMPLETED)
 
         return result
 
@@ -328,6 +355,7 @@ class SeedPatternTreeManager:
         """
         count = len(self.completed_patterns)
         self.completed_patterns.clear()
+        self._completed_by_ticker.clear()
 
         if count > 0:
             logger.info(
@@ -337,10 +365,94 @@ class SeedPatternTreeManager:
 
         return count
 
+    def _index_active(self, pattern: SeedPatternTree) -> None:
+        """활성 패턴을 생성 순서 맵과 종목 색인에 추가"""
+        self._insert_seq += 1
+        self._active[id(pattern)] = pattern
+        index = self._active_by_ticker.get(pattern.ticker)
+        if index is None:
+            index = self._active_by_ticker[pattern.ticker] = _TickerIndex()
+        index.add(pattern, self._insert_seq)
+
+    def _unindex_active(self, pattern: SeedPatternTree) -> None:
+        """활성 패턴을 색인에서 제거 (빈 종목 색인은 삭제)"""
+        del self._active[id(pattern)]
+        index = self._active_by_ticker[pattern.ticker]
+        index.remove(pattern)
+        if not index.patterns:
+            del self._active_by_ticker[pattern.ticker]
+
     def __repr__(self) -> str:
         """개발자용 문자열 표현"""
         return (
             f"SeedPatternTreeManager("
-            f"active={len(self.active_patterns)}, "
+            f"active={len(self._active)}, "
             f"completed={len(self.completed_patterns)})"
         )
+
+
+class _TickerIndex:
+    """
+    종목 하나의 활성 패턴 색인
+
+    (root 시작일, 생성 순번) 오름차순으로 정렬된 키와 패턴을 나란히 유지.
+    root 시작일이 없는 패턴은 시간 기반 조회에서 제외 (가상 블록 조회에만 사용).
+    """
+
+    __slots__ = ('keys', 'dated', 'undated', 'seq')
+
+    def __init__(self):
+        self.keys: List[Tuple[date, int]] = []
+        self.dated: List[SeedPatternTree] = []
+        self.undated: List[SeedPatternTree] = []
+        self.seq: Dict[int, int] = {}  # id(pattern) → 생성 순번
+
+    @property
+    def patterns(self) -> List[SeedPatternTree]:
+        return self.dated + self.undated
+
+    def add(self, pattern: SeedPatternTree, seq: int) -> None:
+        self.seq[id(pattern)] = seq
+        started_at = pattern.root_block.started_at
+        if started_at is None:
+            self.undated.append(pattern)
+            return
+
+        key = (started_at, seq)
+        position = bisect_right(self.keys, key)
+        self.keys.insert(position, key)
+        self.dated.insert(position, pattern)
+
+    def remove(self, pattern: SeedPatternTree) -> None:
+        seq = self.seq.pop(id(pattern))
+        started_at = pattern.root_block.started_at
+        if started_at is not None:
+            position = bisect_left(self.keys, (started_at, seq))
+            if position < len(self.keys) and self.dated[position] is pattern:
+                del self.keys[position]
+                del self.dated[position]
+                return
+
+        # 색인 후 root 시작일이 바뀐 경우 (드묾): 선형 탐색
+        for patterns in (self.dated, self.undated):
+            for position, candidate in enumerate(patterns):
+                if candidate is pattern:
+                    del patterns[position]
+                    if patterns is self.dated:
+                        del self.keys[position]
+                    return
+
+    def latest_started_on_or_before(self, day: date) -> Optional[SeedPatternTree]:
+        """root 시작일 <= day 중 가장 최근 시작일, 같은 날이면 먼저 생성된 패턴"""
+        position = bisect_right(self.keys, (day, float('inf')))
+        if position == 0:
+            return None
+        latest_day = self.keys[position - 1][0]
+        return self.dated[bisect_left(self.keys, (latest_day, 0))]
+
+    def latest(self) -> Optional[SeedPatternTree]:
+        """가장 최근 시작된 패턴 (시작일이 있는 패턴이 없으면 먼저 생성된 패턴)"""
+        if self.dated:
+            latest_day = self.keys[-1][0]
+            return self.dated[bisect_left(self.keys, (latest_day, 0))]
+        return self.undated[0] if self.undated else None
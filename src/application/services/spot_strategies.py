@@ -6,14 +6,14 @@ SpotStrategy - Spot 판정 전략 패턴
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Sequence
 from dataclasses import dataclass
 from datetime import date
-import re
 
 from src.domain.entities.block_graph import BlockNode
 from src.domain.entities.detections import DynamicBlockDetection
-from src.domain.entities.conditions import ExpressionEngine
+from src.domain.entities.conditions import Condition, ExpressionEngine
+from src.domain.entities.core import DateIndex, DATE_INDEX_KEY
 from src.common.logging import get_logger
 
 logger = get_logger(__name__)
@@ -105,10 +105,8 @@ class ExpressionBasedSpotStrategy(SpotStrategy):
             if not is_spot:
                 return None
 
-            # spot_condition expression에서 이전 블록 ID 추출
-            prev_block_id = self._extract_prev_block_id(
-                current_node.spot_condition.expression
-            )
+            # 이전 블록 ID (그래프 로드 시 spot_condition에서 추출)
+            prev_block_id = current_node.get_spot_plan().prev_block_id
 
             if not prev_block_id:
                 logger.warning(
@@ -146,28 +144,6 @@ class ExpressionBasedSpotStrategy(SpotStrategy):
             )
             return None
 
-    def _extract_prev_block_id(self, expression: str) -> Optional[str]:
-        """
-        Expression에서 이전 블록 ID 추출
-
-        일반화된 패턴으로 함수명에 관계없이 첫 번째 문자열 인자 추출.
-
-        Examples:
-            >>> _extract_prev_block_id("is_backward_spot('block1', -1, -2)")
-            'block1'
-            >>> _extract_prev_block_id("is_levelup_spot('block2', 1, 2)")
-            'block2'
-
-        Args:
-            expression: spot_condition expression
-
-        Returns:
-            이전 블록 ID (추출 실패 시 None)
-        """
-        # 첫 번째 문자열 인자 추출 (함수명 무관)
-        match = re.search(r"\(['\"](\w+)['\"]", expression)
-        return match.group(1) if match else None
-
 
 class StaySpotStrategy(SpotStrategy):
     """
@@ -224,10 +200,9 @@ class StaySpotStrategy(SpotStrategy):
             if not should_stay:
                 return None
 
-            # 이전 블록 ID 추출
-            prev_block_id = self._extract_prev_block_id(
-                current_node.spot_condition.expression
-            )
+            # 그래프 로드 시 계산된 spot 계획 (이전 블록 ID, 회고 범위, spot_entry_conditions)
+            spot_plan = current_node.get_spot_plan()
+            prev_block_id = spot_plan.prev_block_id
 
             if not prev_block_id:
                 return None
@@ -243,17 +218,12 @@ class StaySpotStrategy(SpotStrategy):
             detection_day_stock = context.get('current')  # D일 데이터
             current_date = detection_day_stock.date
 
-            # 현재 날짜의 인덱스 찾기
-            current_index = None
-            for i, stock in enumerate(all_stocks):
-                if stock.date == current_date:
-                    current_index = i
-                    break
+            # 현재 날짜의 인덱스 찾기 (날짜 색인, O(1))
+            date_index = DateIndex.for_context(context)
+            current_index = date_index.position(current_date, len(all_stocks))
 
-            # 파라미터 기반 동적 범위 추출 (음수 오프셋)
-            offset_start, offset_end = self._extract_days_range(
-                current_node.spot_condition.expression
-            )
+            # 파라미터 기반 동적 범위 (음수 오프셋)
+            offset_start, offset_end = spot_plan.offset_range
 
             # 데이터 부족 체크 (최소 abs(offset_start)만큼 필요)
             if current_index is None or current_index < abs(offset_start):
@@ -273,9 +243,11 @@ class StaySpotStrategy(SpotStrategy):
                 # spot_entry_conditions 평가
                 if self._check_spot_entry_conditions(
                     current_node,
+                    spot_plan.entry_conditions,
                     all_stocks,
                     check_index,
-                    detection_day_stock
+                    detection_day_stock,
+                    date_index=date_index
                 ):
                     spot1_index = check_index
                     break  # 첫 번째 만족하는 날짜 선택
@@ -334,54 +306,25 @@ class StaySpotStrategy(SpotStrategy):
             )
             return None
 
-    def _extract_prev_block_id(self, expression: str) -> Optional[str]:
-        """Expression에서 이전 블록 ID 추출"""
-        match = re.search(r"\(['\"](\w+)['\"]", expression)
-        return match.group(1) if match else None
-
-    def _extract_days_range(self, expression: str) -> tuple[int, int]:
-        """
-        Expression에서 offset_start, offset_end 추출 (음수 오프셋)
-
-        Args:
-            expression: spot_condition 표현식
-                예: "is_backward_spot('block1', -1, -2)"  # D-1, D-2 체크
-                예: "is_backward_spot('block1', -1, -5)"  # D-1~D-5 체크
-
-        Returns:
-            (offset_start, offset_end) 튜플 (음수)
-            예: (-1, -2) → D-1, D-2 체크
-            예: (-1, -5) → D-1~D-5 체크
-
-        Note:
-            파싱 실패 시 기본값 (-1, -2) 반환
-        """
-        # 정규식: is_xxx_spot('block_id', offset_start, offset_end)
-        # 음수를 포함한 정수 파싱
-        match = re.search(r"is_\w+_spot\(['\"](\w+)['\"]\s*,\s*(-?\d+)\s*,\s*(-?\d+)\)", expression)
-        if match:
-            offset_start = int(match.group(2))
-            offset_end = int(match.group(3))
-            return offset_start, offset_end
-
-        # 기본값: D-1, D-2
-        return -1, -2
-
     def _check_spot_entry_conditions(
         self,
         node: BlockNode,
+        conditions: Sequence[Condition],
         all_stocks: list,
         stock_index: int,
-        detection_day_stock=None
+        detection_day_stock=None,
+        date_index: Optional[DateIndex] = None
     ) -> bool:
         """
         특정 날짜의 데이터로 spot_entry_conditions 평가
 
         Args:
             node: BlockNode
+            conditions: 평가할 spot_entry_conditions (SpotPlan.entry_conditions)
             all_stocks: 전체 주가 데이터
             stock_index: 평가할 날짜의 인덱스 (D-1 또는 D-2)
             detection_day_stock: 원래 탐지일(D일) 데이터
+            date_index: all_stocks의 날짜 색인 (prefix 컨텍스트에 그대로 전달)
 
         Returns:
             모든 spot_entry_conditions 만족 시 True
@@ -400,10 +343,12 @@ class StaySpotStrategy(SpotStrategy):
             'check_day_prev': check_day_prev_stock,  # D-2 또는 D-3 (검사일 전날)
             'all_stocks': all_stocks[:stock_index + 1]
         }
+        if date_index is not None:
+            temp_context[DATE_INDEX_KEY] = date_index
 
         # 모든 spot_entry_conditions 평가 (AND 조건)
         try:
-            for condition in node.spot_entry_conditions:
+            for condition in conditions:
                 result = condition.evaluate(self.expression_engine, temp_context)
                 if not result:
                     return False
@@ -413,7 +358,7 @@ class StaySpotStrategy(SpotStrategy):
                 "spot_entry_conditions evaluation failed",
                 context={
                     'node_id': node.block_id,
-                    'stock_date': stock.date,
+                    'stock_date': check_day_stock.date,
                     'stock_index': stock_index
                 },
                 exc=e
@@ -481,10 +426,9 @@ class LevelupSpotStrategy(SpotStrategy):
             if not should_levelup:
                 return None
 
-            # 이전 블록 ID 추출
-            prev_block_id = self._extract_prev_block_id(
-                current_node.spot_condition.expression
-            )
+            # 그래프 로드 시 계산된 spot 계획 (이전 블록 ID, 회고 범위, spot_entry_conditions)
+            spot_plan = current_node.get_spot_plan()
+            prev_block_id = spot_plan.prev_block_id
 
             if not prev_block_id:
                 return None
@@ -500,17 +444,12 @@ class LevelupSpotStrategy(SpotStrategy):
             detection_day_stock = context.get('current')  # D일 데이터
             current_date = detection_day_stock.date
 
-            # 현재 날짜의 인덱스 찾기
-            current_index = None
-            for i, stock in enumerate(all_stocks):
-                if stock.date == current_date:
-                    current_index = i
-                    break
+            # 현재 날짜의 인덱스 찾기 (날짜 색인, O(1))
+            date_index = DateIndex.for_context(context)
+            current_index = date_index.position(current_date, len(all_stocks))
 
-            # 파라미터 기반 동적 범위 추출 (음수 오프셋)
-            offset_start, offset_end = self._extract_days_range(
-                current_node.spot_condition.expression
-            )
+            # 파라미터 기반 동적 범위 (음수 오프셋)
+            offset_start, offset_end = spot_plan.offset_range
 
             # 데이터 부족 체크 (최소 abs(offset_start)만큼 필요)
             if current_index is None or current_index < abs(offset_start):
@@ -527,13 +466,14 @@ class LevelupSpotStrategy(SpotStrategy):
                 if check_index < 0 or check_index >= len(all_stocks):
                     continue
 
-                # spot_entry_conditions 평가 (exclude_conditions 필터링)
+                # spot_entry_conditions 평가 (exclude_conditions는 계획에서 이미 제외)
                 if self._check_spot_entry_conditions(
                     current_node,
+                    spot_plan.levelup_entry_conditions,
                     all_stocks,
                     check_index,
-                    current_node.exclude_conditions,
-                    detection_day_stock
+                    detection_day_stock,
+                    date_index=date_index
                 ):
                     early_index = check_index
                     break  # 첫 번째 만족하는 날짜 선택
@@ -599,58 +539,27 @@ class LevelupSpotStrategy(SpotStrategy):
             )
             return None
 
-    def _extract_prev_block_id(self, expression: str) -> Optional[str]:
-        """Expression에서 이전 블록 ID 추출"""
-        match = re.search(r"\(['\"](\w+)['\"]", expression)
-        return match.group(1) if match else None
-
-    def _extract_days_range(self, expression: str) -> tuple[int, int]:
-        """
-        Expression에서 offset_start, offset_end 추출 (음수 오프셋)
-
-        Args:
-            expression: spot_condition 표현식
-                예: "is_levelup_spot('block1', -1, -2)"  # D-1, D-2 체크
-                예: "is_levelup_spot('block1', -1, -5)"  # D-1~D-5 체크
-
-        Returns:
-            (offset_start, offset_end) 튜플 (음수)
-            예: (-1, -2) → D-1, D-2 체크
-            예: (-1, -5) → D-1~D-5 체크
-
-        Note:
-            파싱 실패 시 기본값 (-1, -2) 반환
-        """
-        # 정규식: is_xxx_spot('block_id', offset_start, offset_end)
-        # 음수를 포함한 정수 파싱
-        match = re.search(r"is_\w+_spot\(['\"](\w+)['\"]\s*,\s*(-?\d+)\s*,\s*(-?\d+)\)", expression)
-        if match:
-            offset_start = int(match.group(2))
-            offset_end = int(match.group(3))
-            return offset_start, offset_end
-
-        # 기본값: D-1, D-2
-        return -1, -2
-
     def _check_spot_entry_conditions(
         self,
         node: BlockNode,
+        conditions: Sequence[Condition],
         all_stocks: list,
         stock_index: int,
-        exclude_conditions: Optional[List[str]] = None,
-        detection_day_stock=None
+        detection_day_stock=None,
+        date_index: Optional[DateIndex] = None
     ) -> bool:
         """
         특정 날짜의 데이터로 spot_entry_conditions 평가
 
-        exclude_conditions에 지정된 조건은 제외하고 평가합니다.
+        exclude_conditions에 지정된 조건은 SpotPlan.levelup_entry_conditions에서 이미 제외됨.
 
         Args:
             node: BlockNode
+            conditions: 평가할 조건 (SpotPlan.levelup_entry_conditions)
             all_stocks: 전체 주가 데이터
             stock_index: 평가할 날짜의 인덱스 (D-1 또는 D-2)
-            exclude_conditions: 제외할 조건 이름 리스트 (선택적)
             detection_day_stock: 원래 탐지일(D일) 데이터
+            date_index: all_stocks의 날짜 색인 (prefix 컨텍스트에 그대로 전달)
 
         Returns:
             필터링된 spot_entry_conditions 모두 만족 시 True
@@ -669,21 +578,12 @@ class LevelupSpotStrategy(SpotStrategy):
             'check_day_prev': check_day_prev_stock,  # D-2 또는 D-3 (검사일 전날)
             'all_stocks': all_stocks[:stock_index + 1]
         }
-
-        # exclude_conditions 필터링
-        conditions_to_check = node.spot_entry_conditions
-        if exclude_conditions:
-            # 제외할 조건 이름 세트 생성
-            exclude_set = set(exclude_conditions)
-            # 제외되지 않은 조건만 선택
-            conditions_to_check = [
-                cond for cond in node.spot_entry_conditions
-                if cond.name not in exclude_set
-            ]
+        if date_index is not None:
+            temp_context[DATE_INDEX_KEY] = date_index
 
         # 필터링된 조건 평가 (AND 조건)
         try:
-            for condition in conditions_to_check:
+            for condition in conditions:
                 result = condition.evaluate(self.expression_engine, temp_context)
                 if not result:
                     return False
@@ -693,9 +593,9 @@ class LevelupSpotStrategy(SpotStrategy):
                 "spot_entry_conditions evaluation failed",
                 context={
                     'node_id': node.block_id,
-                    'stock_date': stock.date,
+                    'stock_date': check_day_stock.date,
                     'stock_index': stock_index,
-                    'exclude_conditions': exclude_conditions
+                    'exclude_conditions': node.exclude_conditions
                 },
                 exc=e
             )
@@ -6,7 +6,7 @@ Stock Data Utilities - 주가 데이터 전처리 유틸리티
 NOTE: 이 모듈은 infrastructure/utils/stock_data_utils.py에서 이동되었습니다.
       Clean Architecture 원칙에 따라 application layer로 이동.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.domain.entities.core import Stock
 from src.common.logging import get_logger
 
@@ -43,17 +43,43 @@ def forward_fill_prices(stocks: List[Stock]) -> List[Stock]:
         - 원본 리스트는 수정하지 않음 (새 리스트 반환)
         - 거래량(`volume`)은 0으로 유지
         - 첫 거래일 이전 데이터는 그대로 유지
+        - 마지막 정상 거래일 위치 배열이 필요하면 `forward_fill_with_last_valid_index()` 사용
+    """
+    return forward_fill_with_last_valid_index(stocks)[0]
+
+
+def forward_fill_with_last_valid_index(stocks: List[Stock]) -> Tuple[List[Stock], List[int]]:
+    """
+    Forward fill + 마지막 정상 거래일 위치 배열 (한 번의 순회)
+
+    last_valid_index[i]는 i 이전(i 제외) 마지막 정상 거래일(`volume > 0`)의 위치이며,
+    없으면 -1입니다. `prev`(마지막 정상 거래일) 조회가 배열 읽기 한 번이 됩니다.
+
+    Args:
+        stocks: 주가 데이터 리스트 (시간순 정렬)
+
+    Returns:
+        (Forward-fill 적용된 새 주가 데이터 리스트, last_valid_index)
+
+    Example:
+        volume: [100, 0, 0, 200]
+        last_valid_index: [-1, 0, 0, 0]
     """
     if not stocks:
         logger.debug("Forward fill: empty stock list, returning empty")
-        return []
+        return [], []
 
     result = []
+    last_valid_index = []
+    last_valid = -1
     last_valid_prices = None
     fill_count = 0
 
     for i, stock in enumerate(stocks):
+        last_valid_index.append(last_valid)
+
         if stock.volume > 0:
+            last_valid = i
             # 정상 거래일: 그대로 추가하고 가격 기록
             last_valid_prices = {
                 'open': stock.open,
@@ -104,10 +130,14 @@ def forward_fill_prices(stocks: List[Stock]) -> List[Stock]:
             }
         )
 
-    return result
+    return result, last_valid_index
 
 
-def get_last_valid_stock(stocks: List[Stock], current_index: int) -> Optional[Stock]:
+def get_last_valid_stock(
+    stocks: List[Stock],
+    current_index: int,
+    last_valid_index: Optional[List[int]] = None
+) -> Optional[Stock]:
     """
     마지막 정상 거래일 주가 반환
 
@@ -116,6 +146,7 @@ def get_last_valid_stock(stocks: List[Stock], current_index: int) -> Optional[St
     Args:
         stocks: 주가 데이터 리스트
         current_index: 현재 인덱스
+        last_valid_index: `forward_fill_with_last_valid_index()`의 위치 배열 (있으면 O(1))
 
     Returns:
         마지막 정상 거래일 주가, 없으면 None
@@ -124,6 +155,10 @@ def get_last_valid_stock(stocks: List[Stock], current_index: int) -> Optional[St
         stocks = [day1(vol=100), day2(vol=0), day3(vol=0), day4(vol=200)]
         get_last_valid_stock(stocks, 3) → day1
     """
+    if last_valid_index is not None:
+        i = last_valid_index[current_index]
+        return stocks[i] if i >= 0 else None
+
     for i in range(current_index - 1, -1, -1):
         if stocks[i].volume > 0:
             return stocks[i]
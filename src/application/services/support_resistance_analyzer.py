@@ -10,6 +10,7 @@ from datetime import date
 
 from src.domain.entities.detections import DynamicBlockDetection
 from src.domain.entities.core import Stock
+from src.application.services.price_series_index import PriceSeriesIndex
 from src.common.logging import get_logger
 
 logger = get_logger(__name__)
@@ -122,6 +123,11 @@ class SupportResistanceAnalyzer:
                 예: Block1.high가 10000원이면 9800~10200원 범위를 "근처"로 인정
         """
         self.tolerance_pct = tolerance_pct
+
+        # 마지막으로 만든 가격 색인 (같은 all_stocks로 여러 번 analyze() 호출 시 재사용)
+        self._price_index: Optional[PriceSeriesIndex] = None
+        self._price_index_source: Optional[List[Stock]] = None
+
         logger.debug(f"SupportResistanceAnalyzer initialized with tolerance={tolerance_pct}%")
 
     def analyze(
@@ -129,7 +135,8 @@ class SupportResistanceAnalyzer:
         reference_block: DynamicBlockDetection,
         forward_blocks: List[DynamicBlockDetection],
         all_stocks: List[Stock],
-        analysis_period_days: int = 1125
+        analysis_period_days: int = 1125,
+        price_index: Optional[PriceSeriesIndex] = None
     ) -> SupportResistanceAnalysis:
         """
         Complete support/resistance 분석 수행
@@ -139,6 +146,8 @@ class SupportResistanceAnalyzer:
             forward_blocks: 분석 대상 블록 리스트 (Block2, Block3, ...)
             all_stocks: 전체 주가 데이터 (일별)
             analysis_period_days: 분석 기간 (일수, 기본 1125일 = 4.5년)
+            price_index: all_stocks로 만든 PriceSeriesIndex
+                (None이면 생성, 직전 호출과 같은 all_stocks면 재사용)
 
         Returns:
             SupportResistanceAnalysis 결과
@@ -156,9 +165,12 @@ class SupportResistanceAnalyzer:
             }
         )
 
+        if price_index is None:
+            price_index = self._get_price_index(all_stocks)
+
         # Block1 range 추출
         reference_high = reference_block.peak_price
-        reference_low = self._get_lowest_price(reference_block, all_stocks)
+        reference_low = self._get_lowest_price(reference_block, all_stocks, price_index)
 
         if reference_high is None or reference_low is None:
             logger.warning("Cannot analyze: reference_high or reference_low is None")
@@ -194,14 +206,16 @@ class SupportResistanceAnalyzer:
         retest_events = self._detect_retest_events(
             forward_blocks=forward_blocks,
             reference_high=reference_high,
-            all_stocks=all_stocks
+            all_stocks=all_stocks,
+            price_index=price_index
         )
 
         # 저항→지지 전환 이벤트 탐지
         flips = self._detect_resistance_to_support_flips(
             forward_blocks=forward_blocks,
             reference_high=reference_high,
-            all_stocks=all_stocks
+            all_stocks=all_stocks,
+            price_index=price_index
         )
 
         analysis = SupportResistanceAnalysis(
@@ -271,10 +285,26 @@ class SupportResistanceAnalyzer:
             analysis_date=analysis_date
         )
 
+    def _get_price_index(self, all_stocks: List[Stock]) -> PriceSeriesIndex:
+        """
+        all_stocks의 PriceSeriesIndex 반환 (내부 메서드)
+
+        직전 호출과 같은 리스트 객체이고 길이/양 끝 날짜가 같으면 재사용.
+        """
+        if (
+            self._price_index is None
+            or self._price_index_source is not all_stocks
+            or not self._price_index.covers(all_stocks)
+        ):
+            self._price_index = PriceSeriesIndex(all_stocks)
+            self._price_index_source = all_stocks
+        return self._price_index
+
     def _get_lowest_price(
         self,
         block: DynamicBlockDetection,
-        all_stocks: List[Stock]
+        all_stocks: List[Stock],
+        price_index: Optional[PriceSeriesIndex] = None
     ) -> Optional[float]:
         """
         블록 기간 내 최저가 조회 (내부 메서드)
@@ -282,6 +312,7 @@ class SupportResistanceAnalyzer:
         Args:
             block: 블록
             all_stocks: 전체 주가 데이터
+            price_index: all_stocks 색인 (None이면 생성)
 
         Returns:
             최저가 (없으면 None)
@@ -289,24 +320,22 @@ class SupportResistanceAnalyzer:
         if not block.started_at or not block.ended_at:
             return None
 
-        # 블록 기간 내 주가 필터링
-        period_stocks = [
-            stock for stock in all_stocks
-            if block.started_at <= stock.date <= block.ended_at
-        ]
+        if price_index is None:
+            price_index = self._get_price_index(all_stocks)
 
-        if not period_stocks:
+        # 블록 기간 [lo, hi) 구간 최소값 (sparse table, O(1))
+        lo, hi = price_index.range(block.started_at, block.ended_at)
+        if lo >= hi:
             return None
 
-        # 최저가 반환
-        lowest = min(period_stocks, key=lambda s: s.low)
-        return lowest.low
+        return price_index.min_low(lo, hi)
 
     def _detect_retest_events(
         self,
         forward_blocks: List[DynamicBlockDetection],
         reference_high: float,
-        all_stocks: List[Stock]
+        all_stocks: List[Stock],
+        price_index: Optional[PriceSeriesIndex] = None
     ) -> List[Dict[str, Any]]:
         """
         재시험 이벤트 탐지 (내부 메서드)
@@ -317,33 +346,32 @@ class SupportResistanceAnalyzer:
             forward_blocks: Forward blocks
             reference_high: Block1.peak_price
             all_stocks: 전체 주가 데이터
+            price_index: all_stocks 색인 (None이면 생성)
 
         Returns:
             재시험 이벤트 리스트
         """
         retest_events = []
 
+        if price_index is None:
+            price_index = self._get_price_index(all_stocks)
+        tolerance = reference_high * (self.tolerance_pct / 100)
+
         for block in forward_blocks:
             if not block.started_at or not block.ended_at:
                 continue
 
-            # 블록 기간 내 주가 데이터
-            period_stocks = [
-                stock for stock in all_stocks
-                if block.started_at <= stock.date <= block.ended_at
-            ]
-
-            for stock in period_stocks:
-                # Block1.high ± tolerance 범위로 복귀한 경우
-                tolerance = reference_high * (self.tolerance_pct / 100)
-                if abs(stock.high - reference_high) <= tolerance:
-                    retest_events.append({
-                        'date': stock.date,
-                        'price': stock.high,
-                        'reference_high': reference_high,
-                        'distance_pct': (stock.high - reference_high) / reference_high * 100,
-                        'block_id': block.block_id
-                    })
+            # 블록 기간 내 Block1.high ± tolerance 범위로 복귀한 캔들
+            lo, hi = price_index.range(block.started_at, block.ended_at)
+            for position in price_index.highs_near(lo, hi, reference_high, tolerance):
+                stock = price_index.stocks[position]
+                retest_events.append({
+                    'date': stock.date,
+                    'price': stock.high,
+                    'reference_high': reference_high,
+                    'distance_pct': (stock.high - reference_high) / reference_high * 100,
+                    'block_id': block.block_id
+                })
 
         logger.debug(
             f"Detected {len(retest_events)} retest events",
@@ -356,7 +384,8 @@ class SupportResistanceAnalyzer:
         self,
         forward_blocks: List[DynamicBlockDetection],
         reference_high: float,
-        all_stocks: List[Stock]
+        all_stocks: List[Stock],
+        price_index: Optional[PriceSeriesIndex] = None
     ) -> List[Dict[str, Any]]:
         """
         저항→지지 전환 이벤트 탐지 (내부 메서드)
@@ -367,12 +396,17 @@ class SupportResistanceAnalyzer:
             forward_blocks: Forward blocks
             reference_high: Block1.peak_price
             all_stocks: 전체 주가 데이터
+            price_index: all_stocks 색인 (None이면 생성)
 
         Returns:
             전환 이벤트 리스트
         """
         flips = []
 
+        if price_index is None:
+            price_index = self._get_price_index(all_stocks)
+        tolerance = reference_high * (self.tolerance_pct / 100)
+
         # 각 forward block 검사
         for i, block in enumerate(forward_blocks):
             if not block.peak_price or block.peak_price <= reference_high:
@@ -382,26 +416,22 @@ class SupportResistanceAnalyzer:
             if i + 1 < len(forward_blocks):
                 next_block = forward_blocks[i + 1]
                 if next_block.started_at:
-                    # 이후 블록 기간 내 주가 데이터
-                    period_stocks = [
-                        stock for stock in all_stocks
-                        if next_block.started_at <= stock.date <= (next_block.ended_at or date.today())
-                    ]
-
-                    # Block1.high 위에서 지지받는지 확인
-                    for stock in period_stocks:
-                        tolerance = reference_high * (self.tolerance_pct / 100)
-                        # 저가가 Block1.high ± tolerance 범위에서 지지
-                        if abs(stock.low - reference_high) <= tolerance:
-                            flips.append({
-                                'breakout_block_id': block.block_id,
-                                'breakout_price': block.peak_price,
-                                'support_date': stock.date,
-                                'support_price': stock.low,
-                                'reference_high': reference_high,
-                                'flip_confirmed': True
-                            })
-                            break  # 첫 번째 이벤트만 기록
+                    # 이후 블록 기간 내 저가가 Block1.high ± tolerance 범위에서
+                    # 지지받은 첫 캔들 (첫 번째 이벤트만 기록)
+                    lo, hi = price_index.range(
+                        next_block.started_at, next_block.ended_at or date.today()
+                    )
+                    position = price_index.first_low_near(lo, hi, reference_high, tolerance)
+                    if position >= 0:
+                        stock = price_index.stocks[position]
+                        flips.append({
+                            'breakout_block_id': block.block_id,
+                            'breakout_price': block.peak_price,
+                            'support_date': stock.date,
+                            'support_price': stock.low,
+                            'reference_high': reference_high,
+                            'flip_confirmed': True
+                        })
 
         logger.debug(
             f"Detected {len(flips)} resistance-to-support flips",
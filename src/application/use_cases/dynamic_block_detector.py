@@ -4,15 +4,17 @@ DynamicBlockDetector - 동적 블록 감지 Use Case
 BlockGraph와 ExpressionEngine을 활용하여 주가 데이터에서 블록 패턴을 감지.
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from datetime import date
 
-from src.domain.entities.core import Stock
+from src.domain.entities.core import Stock, DateIndex, DATE_INDEX_KEY
 from src.domain.entities.detections import DynamicBlockDetection, BlockStatus
 from src.domain.entities.block_graph import BlockGraph, BlockNode
 from src.domain.entities.conditions import ExpressionEngine
 from src.domain.exceptions import ExpressionEvaluationError
 from src.application.services.spot_strategies import SpotStrategy, CompositeSpotStrategy
+from src.application.services.condition_planner import ConditionPlanner
+from src.application.services.entry_prefilter import EntryConditionPrefilter
 from src.application.use_cases.pattern_detection_state import PatternDetectionState
 from src.common.logging import get_logger
 
@@ -34,17 +36,23 @@ class DynamicBlockDetector:
         self,
         block_graph: BlockGraph,
         expression_engine: ExpressionEngine,
-        spot_strategy: Optional[SpotStrategy] = None
+        spot_strategy: Optional[SpotStrategy] = None,
+        condition_planner: Optional[ConditionPlanner] = None,
+        entry_prefilter: Optional[EntryConditionPrefilter] = None
     ):
         """
         Args:
             block_graph: 블록 그래프 정의
             expression_engine: 표현식 평가 엔진
             spot_strategy: Spot 판정 전략 (None이면 CompositeSpotStrategy 사용)
+            condition_planner: 진입 조건 평가 순서 플래너 (None이면 YAML 순서)
+            entry_prefilter: 상태 없는 진입 조건 사전 마스크 (None이면 기본 생성)
         """
         self.block_graph = block_graph
         self.expression_engine = expression_engine
         self.spot_strategy = spot_strategy or CompositeSpotStrategy(expression_engine)
+        self.condition_planner = condition_planner
+        self.entry_prefilter = entry_prefilter or EntryConditionPrefilter(expression_engine)
 
     def detect_blocks(
         self,
@@ -80,8 +88,9 @@ class DynamicBlockDetector:
             active_blocks = []
 
         # 데이터 전처리: 거래 없는 날의 가격을 마지막 거래 종가로 채움
-        from src.application.services.stock_data_utils import forward_fill_prices
-        stocks = forward_fill_prices(stocks)
+        # last_valid_index: 각 캔들 이전 마지막 정상 거래일 위치 (prev 조회용)
+        from src.application.services.stock_data_utils import forward_fill_with_last_valid_index
+        stocks, last_valid_index = forward_fill_with_last_valid_index(stocks)
         logger.info(
             "Applied forward-fill preprocessing",
             context={'ticker': ticker, 'total_records': len(stocks)}
@@ -96,10 +105,16 @@ class DynamicBlockDetector:
         # 스킵된 블록 추적 (is_backward_spot으로 스킵된 블록을 다음에 재탐지)
         next_target_blocks = []
 
+        # 날짜 색인 (종목당 1회 생성, 모든 캔들의 context에서 공유)
+        date_index = DateIndex(stocks, last_valid_index)
+
+        # 노드별 후보 캔들 마스크 (상태 없는 진입 조건을 전체 시계열에 대해 1회 계산)
+        entry_masks = self.compute_entry_masks(stocks, last_valid_index, condition_name)
+
         # 주가 데이터 순회
         for i, current_stock in enumerate(stocks):
             # 이전 주가: 마지막 정상 거래일
-            prev_stock = self._find_last_valid_day(stocks, i)
+            prev_stock = self._find_last_valid_day(stocks, i, last_valid_index)
             prev_raw = stocks[i - 1] if i > 0 else None
 
             # Context 구성
@@ -108,7 +123,8 @@ class DynamicBlockDetector:
                 prev=prev_stock,
                 prev_raw=prev_raw,
                 all_stocks=stocks[:i + 1],  # 현재까지의 주가
-                active_blocks=active_blocks_map
+                active_blocks=active_blocks_map,
+                date_index=date_index
             )
 
             # 1. 새로운 블록 감지 (peak 갱신 전에 먼저 체크!)
@@ -122,7 +138,9 @@ class DynamicBlockDetector:
                 context=context,
                 active_blocks_map=active_blocks_map,
                 next_target_blocks=next_target_blocks,
-                pattern_state=pattern_state
+                pattern_state=pattern_state,
+                entry_masks=entry_masks,
+                position=i
             )
 
             # 2. 새로운 블록을 active_blocks_map에 추가
@@ -136,7 +154,8 @@ class DynamicBlockDetector:
                     prev=prev_stock,
                     prev_raw=prev_raw,
                     all_stocks=stocks[:i + 1],
-                    active_blocks=active_blocks_map
+                    active_blocks=active_blocks_map,
+                    date_index=date_index
                 )
 
             # 4. 진행 중인 블록 종료 조건 확인
@@ -282,7 +301,8 @@ class DynamicBlockDetector:
     def _find_last_valid_day(
         self,
         stocks: List[Stock],
-        current_index: int
+        current_index: int,
+        last_valid_index: Optional[List[int]] = None
     ) -> Optional[Stock]:
         """
         마지막 정상 거래일 찾기
@@ -292,6 +312,7 @@ class DynamicBlockDetector:
         Args:
             stocks: 주가 데이터 리스트
             current_index: 현재 인덱스
+            last_valid_index: forward fill 시 함께 계산된 위치 배열 (있으면 O(1))
 
         Returns:
             마지막 정상 거래일 주가, 없으면 None
@@ -300,6 +321,10 @@ class DynamicBlockDetector:
             stocks = [day1(vol=100), day2(vol=0), day3(vol=0), day4(vol=200)]
             _find_last_valid_day(stocks, 3) → day1
         """
+        if last_valid_index is not None:
+            i = last_valid_index[current_index]
+            return stocks[i] if i >= 0 else None
+
         for i in range(current_index - 1, -1, -1):
             if stocks[i].volume > 0:
                 logger.debug(
@@ -324,7 +349,8 @@ class DynamicBlockDetector:
         prev: Optional[Stock],
         all_stocks: List[Stock],
         active_blocks: Dict[str, DynamicBlockDetection],
-        prev_raw: Optional[Stock] = None
+        prev_raw: Optional[Stock] = None,
+        date_index: Optional[DateIndex] = None
     ) -> dict:
         """
         표현식 평가를 위한 context 구성
@@ -335,6 +361,7 @@ class DynamicBlockDetector:
             all_stocks: 전체 주가 데이터 (forward-fill 적용됨)
             active_blocks: 진행 중인 블록 맵 (block_id → DynamicBlockDetection)
             prev_raw: 무조건 바로 전날 (거래 없어도 반환, None 가능)
+            date_index: 전체 시계열의 날짜 색인 (all_stocks는 그 prefix)
 
         Returns:
             Context 딕셔너리
@@ -343,6 +370,7 @@ class DynamicBlockDetector:
                 - prev_raw: 바로 전날 주가 (원본)
                 - days_since_prev: 마지막 정상 거래일로부터 경과일
                 - all_stocks: 전체 주가 데이터
+                - date_index: 날짜 색인 (없으면 조회 시점에 생성)
                 - block1, block2, ... : 활성 블록들
         """
         context = {
@@ -351,6 +379,8 @@ class DynamicBlockDetector:
             'prev_raw': prev_raw,
             'all_stocks': all_stocks,
         }
+        if date_index is not None:
+            context[DATE_INDEX_KEY] = date_index
 
         # days_since_prev 계산
         if prev and current:
@@ -439,7 +469,9 @@ class DynamicBlockDetector:
                     end_date = current_date  # 시작일과 같은 날 종료되면 당일로
                 else:
                     # 블록이 최소 하루 이상 진행된 경우 → 전 거래일로 종료
-                    end_date = self._find_last_trading_day_before(current_date, all_stocks)
+                    end_date = self._find_last_trading_day_before(
+                        current_date, all_stocks, context.get(DATE_INDEX_KEY)
+                    )
             else:
                 # 가격/지표 조건: 조건 만족 당일로 종료
                 end_date = current_date
@@ -481,7 +513,9 @@ class DynamicBlockDetector:
         context: dict,
         active_blocks_map: Dict[str, DynamicBlockDetection],
         next_target_blocks: List[str],
-        pattern_state: PatternDetectionState
+        pattern_state: PatternDetectionState,
+        entry_masks: Optional[Dict[str, Any]] = None,
+        position: int = -1
     ) -> List[DynamicBlockDetection]:
         """
         새로운 블록 감지
@@ -496,6 +530,8 @@ class DynamicBlockDetector:
             active_blocks_map: 활성 + 완료된 블록 맵 (context 참조용, 최신 블록만 유지)
             next_target_blocks: 스킵된 블록 리스트 (is_backward_spot으로 스킵된 블록을 재탐지)
             pattern_state: Virtual Block System 상태 관리 객체
+            entry_masks: compute_entry_masks() 결과 (block_id → 후보 마스크)
+            position: 현재 캔들 위치 (entry_masks 조회용)
 
         Returns:
             신규 감지된 블록 리스트 (real + virtual 블록 포함)
@@ -522,6 +558,10 @@ class DynamicBlockDetector:
             if node_id in active_blocks_map and active_blocks_map[node_id].is_active():
                 continue
 
+            # 상태 없는 진입 조건이 이미 불만족으로 확정된 캔들은 스킵
+            if entry_masks and node_id in entry_masks and not entry_masks[node_id][position]:
+                continue
+
             # 진입 조건 확인 (AND 조건)
             if self._check_entry_conditions(node, context, condition_name):
                 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -676,9 +716,11 @@ class DynamicBlockDetector:
                     # Peak 업데이트 (early start date부터 계산)
                     # spot1 날짜부터 peak 계산
                     all_stocks = context.get('all_stocks', [])
-                    for stock in all_stocks:
-                        if stock.date >= early_start_info.early_start_date and stock.date <= current_date:
-                            new_block.update_peak(stock.date, stock.close, stock.volume)
+                    date_index = DateIndex.for_context(context)
+                    first = date_index.count_before(early_start_info.early_start_date)
+                    last = min(date_index.count_through(current_date), len(all_stocks))
+                    for stock in all_stocks[first:last]:
+                        new_block.update_peak(stock.date, stock.close, stock.volume)
 
                     # 이전 블록 종료 (spot1 - 1일)
                     prev_block_id = early_start_info.prev_block_id
@@ -688,7 +730,8 @@ class DynamicBlockDetector:
                             # spot1 이전의 마지막 거래일 찾기
                             actual_end_date = self._find_last_trading_day_before(
                                 early_start_info.spot1_date,
-                                all_stocks
+                                all_stocks,
+                                date_index
                             )
                             prev_block.complete(actual_end_date)
                             logger.info(
@@ -757,6 +800,39 @@ class DynamicBlockDetector:
 
         return new_blocks
 
+    def compute_entry_masks(
+        self,
+        stocks: List[Stock],
+        prev_index: List[int],
+        condition_name: str = "seed"
+    ) -> Dict[str, Any]:
+        """
+        노드별 진입 후보 캔들 마스크 계산
+
+        각 노드의 진입 조건 중 current/prev만 참조하는 상태 없는 조건을
+        전체 시계열에 대해 NumPy로 한 번에 평가합니다. mask[i]가 False인 캔들은
+        _check_entry_conditions()가 반드시 False를 반환하므로 평가를 건너뛸 수 있습니다.
+
+        Args:
+            stocks: forward fill된 주가 데이터
+            prev_index: 캔들별 prev(마지막 정상 거래일) 위치, 없으면 -1
+            condition_name: 조건 이름 ("seed" 또는 "reentry")
+
+        Returns:
+            block_id → bool 배열 (상태 없는 조건이 없는 노드는 제외)
+        """
+        masks = {}
+        for node_id, node in self.block_graph.nodes.items():
+            if condition_name == "reentry":
+                conditions = node.reentry_entry_conditions
+            else:
+                conditions = node.entry_conditions
+
+            mask = self.entry_prefilter.candidate_mask(conditions, stocks, prev_index)
+            if mask is not None:
+                masks[node_id] = mask
+        return masks
+
     def _check_entry_conditions(
         self,
         node: BlockNode,
@@ -778,6 +854,8 @@ class DynamicBlockDetector:
             - condition_name="seed": node.entry_conditions 사용
             - condition_name="reentry": node.reentry_entry_conditions 사용
             - 디버깅을 위해 각 조건의 평가 결과를 DEBUG 레벨로 로깅합니다.
+            - condition_planner가 있으면 측정된 비용/통과율 순서로 평가합니다
+              (결과는 YAML 순서와 동일).
         """
         # condition_name에 따라 조건 선택
         if condition_name == "reentry":
@@ -789,11 +867,22 @@ class DynamicBlockDetector:
             return False
 
         current_date = context.get('current').date if context.get('current') else None
+        planner = self.condition_planner
 
         try:
+            # 프로파일 단계: 모든 조건 평가 + 통계 기록 (결과는 YAML 순서 기준)
+            if planner is not None and planner.needs_profiling(conditions):
+                return planner.profile_conditions(conditions, context)
+
+            if planner is not None:
+                conditions = planner.order_conditions(conditions)
+
             for condition in conditions:
                 # Condition 객체의 evaluate() 메서드 사용
-                result = condition.evaluate(self.expression_engine, context)
+                if planner is not None:
+                    result = planner.evaluate(condition, context)
+                else:
+                    result = condition.evaluate(self.expression_engine, context)
 
                 # 각 조건의 평가 결과를 DEBUG 레벨로 로깅
                 logger.debug(
@@ -1037,7 +1126,8 @@ class DynamicBlockDetector:
     def _find_last_trading_day_before(
         self,
         target_date: date,
-        all_stocks: List[Stock]
+        all_stocks: List[Stock],
+        date_index: Optional[DateIndex] = None
     ) -> date:
         """
         현재 날짜 이전의 마지막 정상 거래일 찾기
@@ -1045,10 +1135,15 @@ class DynamicBlockDetector:
         Args:
             target_date: 기준 날짜
             all_stocks: 주가 데이터 리스트
+            date_index: all_stocks의 날짜 색인 (있으면 bisect로 시작 위치 결정)
 
         Returns:
             마지막 정상 거래일 (찾지 못하면 target_date)
         """
+        if date_index is not None and date_index.covers(all_stocks):
+            pos = date_index.last_traded_before(all_stocks, target_date)
+            return all_stocks[pos].date if pos is not None else target_date
+
         for stock in reversed(all_stocks):
             if stock.date < target_date and stock.volume > 0:
                 return stock.date
@@ -1243,11 +1338,10 @@ class DynamicBlockDetector:
             # check_day를 Block 시작일 데이터로 설정
             # spot_entry_conditions에서 check_day.high를 사용할 수 있도록
             all_stocks = context.get('all_stocks', [])
-            started_at_stock = None
-            for stock in all_stocks:
-                if stock.date == block.started_at:
-                    started_at_stock = stock
-                    break
+            started_at_index = DateIndex.for_context(context).position(
+                block.started_at, len(all_stocks)
+            )
+            started_at_stock = all_stocks[started_at_index] if started_at_index is not None else None
 
             if not started_at_stock:
                 logger.debug(
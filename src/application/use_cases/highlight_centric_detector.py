@@ -6,6 +6,10 @@ Detects patterns using a highlight-first approach:
 2. For each highlight, scan backward (30 days) to find true root
 3. Scan forward (1125 days) to track long-term evolution
 4. Analyze support/resistance behavior
+
+With single_pass=True the detector runs once over the whole needed period and the
+highlight/backward/forward queries are answered from a BlockIntervalIndex instead of
+re-running detection on overlapping sub-series.
 """
 
 import logging
@@ -21,6 +25,7 @@ from src.domain.entities.patterns import (
     PatternStatus,
     create_highlight_centric_pattern
 )
+from src.application.services.block_interval_index import BlockIntervalIndex
 from src.application.services.highlight_detector import HighlightDetector
 from src.application.services.support_resistance_analyzer import SupportResistanceAnalyzer
 from src.application.use_cases.dynamic_block_detector import DynamicBlockDetector
@@ -91,7 +96,8 @@ class HighlightCentricDetector:
         scan_from: date,
         scan_to: date,
         backward_days: int = 30,
-        forward_days: int = 1125
+        forward_days: int = 1125,
+        single_pass: bool = False
     ) -> List[HighlightCentricPattern]:
         """
         Main detection workflow - highlight-first approach.
@@ -103,6 +109,10 @@ class HighlightCentricDetector:
             scan_to: End date for highlight scanning
             backward_days: Days to scan backward from highlight (default: 30)
             forward_days: Days to scan forward from highlight (default: 1125 = 4.5 years)
+            single_pass: Run block detection once over
+                [scan_from - backward_days, scan_to + forward_days] and answer every
+                phase from the resulting BlockIntervalIndex (blocks then carry the
+                state of the full sequential pass instead of a per-window restart)
 
         Returns:
             List of HighlightCentricPattern objects
@@ -120,12 +130,23 @@ class HighlightCentricDetector:
             f"from {scan_from} to {scan_to}"
         )
 
+        # Single-pass mode: one detection pass shared by all phases
+        block_index = None
+        if single_pass:
+            block_index = self._build_block_index(
+                ticker=ticker,
+                stocks=stocks,
+                pass_from=scan_from - timedelta(days=backward_days),
+                pass_to=scan_to + timedelta(days=forward_days)
+            )
+
         # Phase 1: Scan for highlights
         highlights = self._scan_for_highlights(
             ticker=ticker,
             stocks=stocks,
             scan_from=scan_from,
-            scan_to=scan_to
+            scan_to=scan_to,
+            block_index=block_index
         )
 
         logger.info(f"Found {len(highlights)} highlight(s) for {ticker}")
@@ -152,7 +173,8 @@ class HighlightCentricDetector:
                 backward_result = self._backward_scan(
                     highlight=highlight,
                     stocks=stocks,
-                    lookback_days=backward_days
+                    lookback_days=backward_days,
+                    block_index=block_index
                 )
 
                 if backward_result:
@@ -165,7 +187,8 @@ class HighlightCentricDetector:
                 forward_blocks = self._forward_scan(
                     root_block=pattern.root_block,
                     stocks=stocks,
-                    forward_days=forward_days
+                    forward_days=forward_days,
+                    block_index=block_index
                 )
 
                 for block in forward_blocks:
@@ -204,6 +227,56 @@ class HighlightCentricDetector:
         )
         return self.patterns
 
+    # ============================================================
+    # Single-Pass Block Index
+    # ============================================================
+
+    def _build_block_index(
+        self,
+        ticker: str,
+        stocks: List[Stock],
+        pass_from: date,
+        pass_to: date
+    ) -> BlockIntervalIndex:
+        """
+        Run one sequential detection pass and index the resulting blocks.
+
+        The pass covers every window the highlight phases can ask about: highlights
+        start in [scan_from, scan_to], backward windows reach backward_days before
+        them and forward windows forward_days after a root that is never later
+        than the highlight.
+
+        Args:
+            ticker: Stock ticker
+            stocks: Historical price data
+            pass_from: First date needed by any phase
+            pass_to: Last date needed by any phase
+
+        Returns:
+            BlockIntervalIndex (empty if the period has no data)
+        """
+        filtered_stocks = self._filter_stocks_by_date(stocks, pass_from, pass_to)
+
+        if not filtered_stocks:
+            logger.warning(f"No stock data in detection pass {pass_from} to {pass_to}")
+            return BlockIntervalIndex([])
+
+        blocks = self.block_detector.detect_blocks(
+            ticker=ticker,
+            stocks=filtered_stocks
+        )
+
+        logger.debug(
+            f"Single detection pass found {len(blocks)} block(s) "
+            f"over {len(filtered_stocks)} candle(s)"
+        )
+
+        return BlockIntervalIndex(
+            blocks,
+            data_from=filtered_stocks[0].date,
+            data_to=filtered_stocks[-1].date
+        )
+
     # ============================================================
     # Phase 1: Highlight Scanning
     # ============================================================
@@ -213,7 +286,8 @@ class HighlightCentricDetector:
         ticker: str,
         stocks: List[Stock],
         scan_from: date,
-        scan_to: date
+        scan_to: date,
+        block_index: Optional[BlockIntervalIndex] = None
     ) -> List[DynamicBlockDetection]:
         """
         Scan for highlight candidates (blocks with 2+ forward spots).
@@ -228,6 +302,7 @@ class HighlightCentricDetector:
             stocks: Historical price data
             scan_from: Start date
             scan_to: End date
+            block_index: Single-pass detection result (None = detect on the period)
 
         Returns:
             List of highlight blocks sorted by date (earliest first)
@@ -236,18 +311,22 @@ class HighlightCentricDetector:
             f"Scanning for highlights: {ticker} from {scan_from} to {scan_to}"
         )
 
-        # Filter stocks to scan period
-        filtered_stocks = self._filter_stocks_by_date(stocks, scan_from, scan_to)
+        if block_index is not None:
+            # Step 1: Blocks started in the scan period (from the shared pass)
+            all_blocks = block_index.started_between(scan_from, scan_to)
+        else:
+            # Filter stocks to scan period
+            filtered_stocks = self._filter_stocks_by_date(stocks, scan_from, scan_to)
 
-        if not filtered_stocks:
-            logger.warning(f"No stock data in scan period {scan_from} to {scan_to}")
-            return []
+            if not filtered_stocks:
+                logger.warning(f"No stock data in scan period {scan_from} to {scan_to}")
+                return []
 
-        # Step 1: Detect all blocks using sequential detector
-        all_blocks = self.block_detector.detect_blocks(
-            ticker=ticker,
-            stocks=filtered_stocks
-        )
+            # Step 1: Detect all blocks using sequential detector
+            all_blocks = self.block_detector.detect_blocks(
+                ticker=ticker,
+                stocks=filtered_stocks
+            )
 
         logger.debug(f"Sequential detection found {len(all_blocks)} block(s)")
 
@@ -282,7 +361,8 @@ class HighlightCentricDetector:
         self,
         highlight: DynamicBlockDetection,
         stocks: List[Stock],
-        lookback_days: int = 30
+        lookback_days: int = 30,
+        block_index: Optional[BlockIntervalIndex] = None
     ) -> Optional[BackwardScanResult]:
         """
         Scan backward from highlight to find stronger root Block1.
@@ -296,6 +376,7 @@ class HighlightCentricDetector:
             highlight: The highlight block
             stocks: Historical price data
             lookback_days: Number of days to scan backward (default: 30)
+            block_index: Single-pass detection result (None = detect on the period)
 
         Returns:
             BackwardScanResult if scan performed, None if data insufficient
@@ -310,7 +391,8 @@ class HighlightCentricDetector:
         scan_from = highlight_date - timedelta(days=lookback_days)
         scan_to = highlight_date - timedelta(days=1)  # Exclude highlight date
 
-        # Check if we have data for backward period
+        # Check if we have data for backward period (full loaded series, not the
+        # single-pass window, whose first candle can fall after pass_from)
         earliest_stock_date = min(s.date for s in stocks)
         if scan_from < earliest_stock_date:
             logger.warning(
@@ -319,27 +401,30 @@ class HighlightCentricDetector:
             )
             return BackwardScanResult.no_stronger_root(lookback_days=lookback_days)
 
-        # Filter stocks to backward period
-        filtered_stocks = self._filter_stocks_by_date(stocks, scan_from, scan_to)
+        if block_index is not None:
+            backward_blocks = block_index.started_between(scan_from, scan_to)
+        else:
+            # Filter stocks to backward period
+            filtered_stocks = self._filter_stocks_by_date(stocks, scan_from, scan_to)
 
-        if not filtered_stocks:
-            logger.warning(f"No stock data in backward period {scan_from} to {scan_to}")
-            return BackwardScanResult.no_stronger_root(lookback_days=lookback_days)
+            if not filtered_stocks:
+                logger.warning(f"No stock data in backward period {scan_from} to {scan_to}")
+                return BackwardScanResult.no_stronger_root(lookback_days=lookback_days)
 
-        # Detect blocks in backward period
-        try:
-            backward_blocks = self.block_detector.detect_blocks(
-                ticker=highlight.ticker,
-                stocks=filtered_stocks
-            )
+            # Detect blocks in backward period
+            try:
+                backward_blocks = self.block_detector.detect_blocks(
+                    ticker=highlight.ticker,
+                    stocks=filtered_stocks
+                )
 
-            logger.debug(
-                f"Backward scan found {len(backward_blocks)} block(s) in period"
-            )
+            except Exception as e:
+                logger.error(f"Error in backward detection: {e}", exc_info=True)
+                return BackwardScanResult.no_stronger_root(lookback_days=lookback_days)
 
-        except Exception as e:
-            logger.error(f"Error in backward detection: {e}", exc_info=True)
-            return BackwardScanResult.no_stronger_root(lookback_days=lookback_days)
+        logger.debug(
+            f"Backward scan found {len(backward_blocks)} block(s) in period"
+        )
 
         # Find Block1s with higher peak than highlight
         block1_blocks = [b for b in backward_blocks if b.block_type == 1]
@@ -378,7 +463,8 @@ class HighlightCentricDetector:
         self,
         root_block: DynamicBlockDetection,
         stocks: List[Stock],
-        forward_days: int = 1125
+        forward_days: int = 1125,
+        block_index: Optional[BlockIntervalIndex] = None
     ) -> List[DynamicBlockDetection]:
         """
         Scan forward from root block to track long-term pattern evolution.
@@ -393,6 +479,7 @@ class HighlightCentricDetector:
             root_block: Root Block1 of the pattern
             stocks: Historical price data
             forward_days: Number of days to scan forward (default: 1125 = 4.5 years)
+            block_index: Single-pass detection result (None = detect on the period)
 
         Returns:
             List of blocks in chronological order
@@ -407,8 +494,11 @@ class HighlightCentricDetector:
         scan_to = root_date + timedelta(days=forward_days)
 
         # Check if we have data for forward period
-        latest_stock_date = max(s.date for s in stocks)
-        if scan_from > latest_stock_date:
+        if block_index is not None:
+            latest_stock_date = block_index.data_to
+        else:
+            latest_stock_date = max(s.date for s in stocks)
+        if latest_stock_date is None or scan_from > latest_stock_date:
             logger.warning(
                 f"No data available for forward scan: "
                 f"need {scan_from}, have {latest_stock_date}"
@@ -424,6 +514,12 @@ class HighlightCentricDetector:
             f"(requested: {forward_days})"
         )
 
+        if block_index is not None:
+            # Already sorted by start date
+            forward_blocks = block_index.started_between(scan_from, actual_scan_to)
+            logger.debug(f"Forward scan found {len(forward_blocks)} block(s)")
+            return forward_blocks
+
         # Filter stocks to forward period
         filtered_stocks = self._filter_stocks_by_date(stocks, scan_from, actual_scan_to)
 
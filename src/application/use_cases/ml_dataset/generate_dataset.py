@@ -3,20 +3,142 @@ Generate ML Dataset Use Case
 
 Create ML training dataset from detections
 """
+from datetime import date
+from typing import List, Optional
+
+import pandas as pd
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.database.models import StockPrice
+from src.infrastructure.database.models.dynamic_block_detection_model import DynamicBlockDetectionModel
+from src.infrastructure.repositories.dynamic_block_repository_impl import DynamicBlockRepositoryImpl
+from src.learning.dataset import SequenceDatasetBuilder, ShardWriter, DatasetIndex
+
 
 class GenerateMLDatasetUseCase:
     """
     ML Dataset Generation Use Case
-    
+
     Generate labeled dataset for machine learning
+
+    탐지된 블록 + 가격 시계열 → strided sliding window float32 텐서
+    (num_samples, sequence_length, num_features)를 memmap .npy shard로 저장합니다.
+    윈도우 라벨은 마지막 날에 진행 중인 블록의 block_type (블록 밖은 0)입니다.
     """
-    
-    def __init__(self, db_path: str = "data/database/stock_data.db"):
-        """Initialize use case"""
-        # TODO: Move implementation from scripts/redetection/generate_ml_dataset.py
-        pass
-        
-    def execute(self, **kwargs):
-        """Execute dataset generation"""
-        # TODO: Implement
-        raise NotImplementedError("Move MLDatasetGenerator class here and rename to GenerateMLDatasetUseCase")
+
+    def __init__(self, db_path: str = "data/database/stock_data.db", session=None):
+        """
+        Args:
+            db_path: Database file path
+            session: 기존 SQLAlchemy 세션 (None이면 db_path로 생성)
+        """
+        self.db_path = db_path
+        if session is None:
+            engine = create_engine(f'sqlite:///{db_path}')
+            Session = sessionmaker(bind=engine)
+            session = Session()
+        self.session = session
+
+        self.detection_repo = DynamicBlockRepositoryImpl(self.session)
+
+    def execute(
+        self,
+        output_dir: str = "data/ml/sequences",
+        tickers: Optional[List[str]] = None,
+        condition_name: Optional[str] = None,
+        feature_names: Optional[List[str]] = None,
+        sequence_length: int = 60,
+        stride: int = 1,
+        shard_size: int = 50_000,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None
+    ) -> DatasetIndex:
+        """
+        Execute dataset generation
+
+        Args:
+            output_dir: Shard output directory
+            tickers: Tickers to include (None = tickers with detected blocks)
+            condition_name: Detection condition filter (e.g. 'seed', 'redetection')
+            feature_names: Registry feature names (None = all context-free features)
+            sequence_length: Days per window
+            stride: Step between window starts
+            shard_size: Samples per shard
+            from_date: Price series start date
+            to_date: Price series end date
+
+        Returns:
+            DatasetIndex (index.json contents)
+        """
+        builder = SequenceDatasetBuilder(
+            feature_names=feature_names,
+            sequence_length=sequence_length,
+            stride=stride
+        )
+        writer = ShardWriter(
+            output_dir,
+            sequence_length=sequence_length,
+            stride=stride,
+            feature_names=builder.feature_names,
+            shard_size=shard_size
+        )
+
+        if tickers is None:
+            tickers = self._detected_tickers(condition_name)
+
+        print(f"\n{'='*60}")
+        print("📊 Generating ML Sequence Dataset")
+        print(f"{'='*60}")
+        print(f"   Tickers: {len(tickers)}, features: {len(builder.feature_names)}, "
+              f"window: {sequence_length} (stride {stride})")
+
+        for ticker in tickers:
+            prices = self._load_prices(ticker, from_date, to_date)
+            if len(prices) < sequence_length:
+                continue
+
+            blocks = self.detection_repo.find_by_ticker(ticker, condition_name=condition_name)
+            writer.add(builder.build_ticker(ticker, prices, blocks))
+
+        index = writer.close()
+
+        print(f"   ✅ {index.num_samples} samples in {len(index.shards)} shards → {output_dir}")
+        print(f"   Label distribution: {index.label_counts}")
+
+        return index
+
+    def _detected_tickers(self, condition_name: Optional[str]) -> List[str]:
+        """블록이 탐지된 종목 목록"""
+        stmt = select(DynamicBlockDetectionModel.ticker).distinct()
+        if condition_name:
+            stmt = stmt.where(DynamicBlockDetectionModel.condition_name == condition_name)
+        return sorted(self.session.execute(stmt).scalars().all())
+
+    def _load_prices(
+        self,
+        ticker: str,
+        from_date: Optional[date],
+        to_date: Optional[date]
+    ) -> pd.DataFrame:
+        """종목 OHLCV 시계열 (날짜 오름차순)"""
+        stmt = select(
+            StockPrice.date, StockPrice.open, StockPrice.high,
+            StockPrice.low, StockPrice.close, StockPrice.volume
+        ).where(StockPrice.ticker == ticker)
+
+        if from_date:
+            stmt = stmt.where(StockPrice.date >= from_date)
+        if to_date:
+            stmt = stmt.where(StockPrice.date <= to_date)
+
+        rows = self.session.execute(stmt.order_by(StockPrice.date)).all()
+        prices = pd.DataFrame(rows, columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+        prices[['open', 'high', 'low', 'close', 'volume']] = (
+            prices[['open', 'high', 'low', 'close', 'volume']].astype(float)
+        )
+        return prices
+
+    def close(self):
+        """Close session"""
+        self.session.close()
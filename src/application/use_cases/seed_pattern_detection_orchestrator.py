@@ -3,23 +3,29 @@ Seed Pattern Detection Orchestrator
 
 블록 탐지와 패턴 관리를 조율하는 최상위 Use Case
 """
+import bisect
+import heapq
 from datetime import date
 from typing import List, Optional, Dict
 
 from loguru import logger
 
 from src.application.services.seed_pattern_tree_manager import SeedPatternTreeManager
+from src.application.services.detection_write_buffer import DetectionWriteBuffer
 from src.application.services.redetection_detector import RedetectionDetector
 from src.application.services.highlight_detector import HighlightDetector
 from src.application.services.support_resistance_analyzer import SupportResistanceAnalyzer
+from src.application.services.condition_planner import ConditionPlanner
+from src.application.services.pattern_sink import PatternSink
 from src.application.use_cases.dynamic_block_detector import DynamicBlockDetector
 from src.application.use_cases.pattern_detection_state import PatternContext, PatternDetectionState
 from src.domain.entities.block_graph import BlockGraph
 from src.domain.entities.conditions import ExpressionEngine
-from src.domain.entities.core import Stock
+from src.domain.entities.core import Stock, DateIndex, DATE_INDEX_KEY
 from src.domain.entities.detections import DynamicBlockDetection
 from src.domain.entities.patterns import SeedPatternTree, PatternId
 from src.domain.repositories.seed_pattern_repository import SeedPatternRepository
+from src.domain.repositories.dynamic_block_repository import DynamicBlockRepository
 
 
 class SeedPatternDetectionOrchestrator:
@@ -55,7 +61,11 @@ class SeedPatternDetectionOrchestrator:
         self,
         block_graph: BlockGraph,
         expression_engine: ExpressionEngine,
-        seed_pattern_repository: Optional[SeedPatternRepository] = None
+        seed_pattern_repository: Optional[SeedPatternRepository] = None,
+        block_repository: Optional[DynamicBlockRepository] = None,
+        condition_planner: Optional[ConditionPlanner] = None,
+        streaming: bool = False,
+        pattern_sink: Optional[PatternSink] = None
     ):
         """
         초기화
@@ -64,15 +74,27 @@ class SeedPatternDetectionOrchestrator:
             block_graph: 블록 그래프 정의
             expression_engine: 표현식 엔진
             seed_pattern_repository: 시드 패턴 저장소 (선택사항)
+            block_repository: 블록 저장소 (선택사항, 지정 시 패턴의 블록도 함께 저장)
+            condition_planner: 진입 조건 평가 순서 플래너 (선택사항)
+            streaming: 완료된 패턴을 종목 처리 직후 내보내고 메모리에서 제거
+            pattern_sink: 스트리밍 모드에서 완료 패턴을 받을 출력 대상 (선택사항)
         """
         self.block_graph = block_graph
         self.expression_engine = expression_engine
-        self.block_detector = DynamicBlockDetector(block_graph, expression_engine)
+        self.block_detector = DynamicBlockDetector(
+            block_graph, expression_engine, condition_planner=condition_planner
+        )
         self.pattern_manager = SeedPatternTreeManager()
         self.redetection_detector = RedetectionDetector(expression_engine)
         self.seed_pattern_repository = seed_pattern_repository
         self.yaml_config_path = ""  # 외부에서 설정
 
+        # 저장 스테이징 버퍼 (ticker 단위 일괄 저장)
+        self.write_buffer = DetectionWriteBuffer(
+            seed_pattern_repository=seed_pattern_repository,
+            block_repository=block_repository
+        )
+
         # Shared Application Services (NEW - 2025-10-27 Phase 2)
         self.highlight_detector = HighlightDetector(expression_engine)
         self.support_resistance_analyzer = SupportResistanceAnalyzer(tolerance_pct=2.0)
@@ -80,6 +102,10 @@ class SeedPatternDetectionOrchestrator:
         # Option D: 패턴 시퀀스 카운터 (ticker별)
         self.pattern_sequence_counter: Dict[str, int] = {}
 
+        # 스트리밍 모드: 완료 패턴을 sink로 내보낸 뒤 pattern_manager에서 제거
+        self.streaming = streaming
+        self.pattern_sink = pattern_sink
+
     def detect_patterns(
         self,
         ticker: str,
@@ -107,6 +133,7 @@ class SeedPatternDetectionOrchestrator:
 
         Returns:
             탐지된 모든 패턴 리스트 (active + completed)
+            스트리밍 모드에서는 이번 종목의 패턴만 (반환 후 오케스트레이터는 참조하지 않음)
 
         Example:
             >>> patterns = orchestrator.detect_patterns("025980", stocks)
@@ -129,8 +156,15 @@ class SeedPatternDetectionOrchestrator:
         )
 
         # Forward fill 전처리
-        from src.infrastructure.utils.stock_data_utils import forward_fill_prices
-        stocks = forward_fill_prices(stocks)
+        # last_valid_index: 각 캔들 이전 마지막 정상 거래일 위치 (prev 조회용)
+        from src.application.services.stock_data_utils import forward_fill_with_last_valid_index
+        stocks, last_valid_index = forward_fill_with_last_valid_index(stocks)
+
+        # 날짜 색인 (종목당 1회 생성, 모든 컨텍스트에서 공유)
+        date_index = DateIndex(stocks, last_valid_index)
+
+        # Block1 후보 캔들 (상태 없는 진입 조건을 NumPy로 1회 평가, None이면 전체)
+        root_candidates = self._root_entry_candidates(ticker, stocks, last_valid_index)
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # 핵심: 패턴별 독립 탐지 (Single Pass)
@@ -139,12 +173,13 @@ class SeedPatternDetectionOrchestrator:
 
         for i, current_stock in enumerate(stocks):
             # 이전 주가 찾기
-            prev_stock = self._find_last_valid_day(stocks, i)
+            prev_stock = self._find_last_valid_day(stocks, i, last_valid_index)
 
             # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
             # 1. Block1 조건 체크 (패턴 무관)
             # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-            if self._should_start_new_pattern(ticker, current_stock, prev_stock, stocks[:i+1]):
+            if (root_candidates is None or root_candidates[i]) and \
+                    self._should_start_new_pattern(ticker, current_stock, prev_stock, stocks[:i+1], date_index):
                 new_pattern = self._create_pattern_context(ticker, current_stock, prev_stock, stocks[:i+1])
                 active_pattern_contexts.append(new_pattern)
 
@@ -165,7 +200,8 @@ class SeedPatternDetectionOrchestrator:
                     pattern=pattern_ctx,
                     current=current_stock,
                     prev=prev_stock,
-                    all_stocks=stocks[:i+1]
+                    all_stocks=stocks[:i+1],
+                    date_index=date_index
                 )
 
                 # 활성 블록 peak 갱신
@@ -241,16 +277,17 @@ class SeedPatternDetectionOrchestrator:
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # 4. 재탐지 탐지
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        self._detect_redetections_for_patterns(ticker, stocks)
+        self._detect_redetections_for_patterns(ticker, stocks, date_index)
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # 5. 완료된 패턴 저장
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        completed_patterns = self.pattern_manager.check_and_complete_patterns()
+        completed_patterns = self.pattern_manager.check_and_complete_patterns(ticker)
 
         if save_to_db and self.seed_pattern_repository:
             for pattern in completed_patterns:
-                self._save_pattern_to_db(pattern, auto_archive)
+                self._stage_pattern_for_db(pattern, auto_archive)
+            self._flush_write_buffer(ticker)
 
         # 최종 통계
         stats = self.pattern_manager.get_statistics()
@@ -262,6 +299,11 @@ class SeedPatternDetectionOrchestrator:
             }
         )
 
+        if self.streaming:
+            ticker_patterns = self.pattern_manager.get_patterns_by_ticker(ticker)
+            self._stream_completed_patterns(ticker, completed_patterns)
+            return ticker_patterns
+
         return self.pattern_manager.get_all_patterns()
 
     def _organize_blocks_into_patterns(
@@ -375,27 +417,36 @@ class SeedPatternDetectionOrchestrator:
     def _detect_redetections_for_patterns(
         self,
         ticker: str,
-        stocks: List[Stock]
+        stocks: List[Stock],
+        date_index: Optional[DateIndex] = None
     ) -> None:
         """
         모든 패턴의 모든 블록에 대해 재탐지 탐지 (NEW - 2025-10-25)
 
         프로세스:
-        1. 모든 패턴 순회
-        2. 각 패턴의 각 블록 순회
-        3. 재탐지 지원 블록만 처리
-        4. 해당 블록 종료 이후 캔들들에 대해 재탐지 탐지
+        1. 재탐지 지원 + 완료된 블록 수집, 종료일 다음 캔들 위치를 bisect로 계산
+        2. 시작 위치 기준 min-heap으로 모든 블록을 한 번의 전진 순회에 합류
+        3. 각 캔들에서 합류한 블록들의 재진입 조건 평가 (패턴별 컨텍스트 1회 구성)
+
+        블록마다 전체 시계열을 다시 훑지 않으므로 O(n + 평가 횟수)입니다.
 
         Args:
             ticker: 종목 코드
             stocks: 전체 주가 데이터
+            date_index: stocks의 날짜 색인 (None이면 생성)
 
         Note:
             재탐지는 Seed Block이 completed 상태여야 시작 가능.
             한 블록당 한 번에 1개 재탐지만 active 가능.
+            조건이 다른 블록의 재탐지 상태를 참조하면 현재 캔들 시점의 상태를 봅니다.
         """
         all_patterns = self.pattern_manager.get_all_patterns()
+        if date_index is None:
+            date_index = DateIndex(stocks)
 
+        # 1. 재탐지 대상 블록 수집: (시작 위치, 순서) min-heap
+        #    시작 위치 = 블록 종료일 다음 캔들 (bisect로 바로 이동)
+        pending = []
         for pattern in all_patterns:
             for block_id, block in pattern.blocks.items():
                 # 재진입 가능 여부 확인
@@ -403,29 +454,48 @@ class SeedPatternDetectionOrchestrator:
                 if not block_node or not block_node.has_reentry():
                     continue  # 재진입 설정 없음
 
-                if not block.is_completed():
+                if not block.is_completed() or not block.ended_at:
                     continue  # 아직 완료 안된 블록은 재탐지 불가
 
-                # 해당 블록 종료 이후 캔들들 순회
-                for stock in stocks:
-                    if not block.ended_at or stock.date <= block.ended_at:
-                        continue  # 블록 종료 전 캔들은 스킵
+                start_index = date_index.count_through(block.ended_at)
+                if start_index < len(stocks):
+                    # order: 같은 캔들 안에서는 기존 순서(패턴 → 블록)대로 평가
+                    order = len(pending)
+                    pending.append((start_index, order, pattern, block, block_node))
 
-                    # 평가 컨텍스트 구성
+        heapq.heapify(pending)
+
+        # 2. 한 번의 전진 순회: 시작 위치에 도달한 블록을 합류시키며 매 캔들 평가
+        active = []  # (order, pattern, block, block_node), order 오름차순
+        first_index = pending[0][0] if pending else len(stocks)
+
+        for i in range(first_index, len(stocks)):
+            while pending and pending[0][0] <= i:
+                _, order, pattern, block, block_node = heapq.heappop(pending)
+                bisect.insort(active, (order, pattern, block, block_node))
+
+            stock = stocks[i]
+            contexts = {}  # 같은 캔들의 패턴별 컨텍스트 재사용
+
+            for _, pattern, block, block_node in active:
+                context = contexts.get(id(pattern))
+                if context is None:
                     context = self._build_redetection_context(
                         ticker=ticker,
                         current=stock,
                         all_stocks=stocks,
-                        pattern=pattern
-                    )
-
-                    # 재탐지 탐지
-                    self.redetection_detector.detect_redetections(
-                        block=block,
-                        block_node=block_node,
-                        current=stock,
-                        context=context
+                        pattern=pattern,
+                        date_index=date_index
                     )
+                    contexts[id(pattern)] = context
+
+                # 재탐지 탐지
+                self.redetection_detector.detect_redetections(
+                    block=block,
+                    block_node=block_node,
+                    current=stock,
+                    context=context
+                )
 
         # 재탐지 통계 로깅
         total_redetections = sum(
@@ -449,7 +519,8 @@ class SeedPatternDetectionOrchestrator:
         ticker: str,
         current: Stock,
         all_stocks: List[Stock],
-        pattern: SeedPatternTree
+        pattern: SeedPatternTree,
+        date_index: Optional[DateIndex] = None
     ) -> dict:
         """
         재탐지 평가를 위한 컨텍스트 구성
@@ -459,24 +530,23 @@ class SeedPatternDetectionOrchestrator:
             current: 현재 캔들
             all_stocks: 전체 주가 데이터
             pattern: 현재 패턴
+            date_index: all_stocks의 날짜 색인 (None이면 생성)
 
         Returns:
             평가 컨텍스트 딕셔너리
         """
-        # 이전 캔들 찾기
-        current_idx = next(
-            (i for i, s in enumerate(all_stocks) if s.date == current.date),
-            None
-        )
-        prev = all_stocks[current_idx - 1] if current_idx and current_idx > 0 else None
-
         # 기본 컨텍스트
         context = {
             'ticker': ticker,
             'current': current,
-            'prev': prev,
             'all_stocks': all_stocks,
         }
+        if date_index is not None:
+            context[DATE_INDEX_KEY] = date_index
+
+        # 이전 캔들 찾기 (날짜 색인, O(1))
+        current_idx = DateIndex.for_context(context).position(current.date, len(all_stocks))
+        context['prev'] = all_stocks[current_idx - 1] if current_idx and current_idx > 0 else None
 
         # 패턴의 각 블록을 컨텍스트에 추가 (block1, block2, ...)
         for block_id, block in pattern.blocks.items():
@@ -484,49 +554,118 @@ class SeedPatternDetectionOrchestrator:
 
         return context
 
-    def _save_pattern_to_db(
+    def _stage_pattern_for_db(
         self,
         pattern: SeedPatternTree,
         auto_archive: bool = True
     ) -> None:
         """
-        패턴을 DB에 저장
+        패턴을 저장 버퍼에 스테이징 (실제 저장은 _flush_write_buffer에서 일괄 처리)
 
         Args:
             pattern: 저장할 패턴
             auto_archive: 저장 후 자동 보관 여부
 
         Example:
-            >>> orchestrator._save_pattern_to_db(pattern)
+            >>> orchestrator._stage_pattern_for_db(pattern)
+            >>> orchestrator._flush_write_buffer("025980")
         """
         try:
             # 저장 전 archive 처리 (auto_archive=True인 경우)
             if auto_archive:
                 pattern.archive()
 
-            seed_pattern = pattern.to_seed_pattern(self.yaml_config_path)
+            self.write_buffer.stage_pattern(pattern.to_seed_pattern(self.yaml_config_path))
+            self.write_buffer.stage_blocks(pattern.blocks.values())
 
-            saved = self.seed_pattern_repository.save(seed_pattern)
+        except Exception as e:
+            logger.error(
+                f"Failed to stage pattern {pattern.pattern_id}",
+                extra={
+                    'pattern_id': str(pattern.pattern_id),
+                    'error': str(e)
+                },
+                exc_info=True
+            )
+
+    def _flush_write_buffer(self, ticker: str) -> None:
+        """
+        스테이징된 패턴/블록을 DB에 일괄 저장 (ticker당 1회)
+
+        Args:
+            ticker: 종목 코드 (로깅용)
+        """
+        try:
+            saved_patterns, saved_blocks = self.write_buffer.flush()
 
             logger.info(
-                f"Saved pattern to DB: {pattern.pattern_id}",
+                f"Saved {saved_patterns} patterns to DB",
                 extra={
-                    'pattern_id': str(pattern.pattern_id),
-                    'db_id': saved.id,
-                    'status': seed_pattern.status.value
+                    'ticker': ticker,
+                    'patterns': saved_patterns,
+                    'blocks': saved_blocks
                 }
             )
 
         except Exception as e:
+            # 세션은 flush()에서 rollback됨, 버퍼는 유지되어 다음 flush에서 재시도
             logger.error(
-                f"Failed to save pattern {pattern.pattern_id}",
+                f"Failed to save patterns for {ticker}",
                 extra={
-                    'pattern_id': str(pattern.pattern_id),
+                    'ticker': ticker,
+                    'pending': self.write_buffer.pending_count,
                     'error': str(e)
                 },
                 exc_info=True
             )
 
+    def _stream_completed_patterns(
+        self,
+        ticker: str,
+        completed_patterns: List[SeedPatternTree]
+    ) -> None:
+        """
+        완료(또는 보관)된 패턴을 sink로 내보내고 pattern_manager에서 제거 (스트리밍 모드)
+
+        sink 오류는 로깅만 하고 제거는 계속 진행합니다 (DB 저장 실패와 동일한 정책).
+
+        Args:
+            ticker: 종목 코드 (로깅용)
+            completed_patterns: check_and_complete_patterns() 결과
+        """
+        if self.pattern_sink is not None:
+            emitted = 0
+            for pattern in completed_patterns:
+                try:
+                    self.pattern_sink.emit(pattern)
+                    emitted += 1
+                except Exception as e:
+                    logger.error(
+                        f"Failed to emit pattern {pattern.pattern_id}",
+                        extra={
+                            'pattern_id': str(pattern.pattern_id),
+                            'error': str(e)
+                        },
+                        exc_info=True
+                    )
+
+            try:
+                self.pattern_sink.flush()
+            except Exception as e:
+                logger.error(
+                    f"Failed to flush pattern sink for {ticker}",
+                    extra={'ticker': ticker, 'error': str(e)},
+                    exc_info=True
+                )
+
+            logger.info(
+                f"Streamed {emitted} patterns to sink",
+                extra={'ticker': ticker, 'patterns': emitted}
+            )
+
+        # 완료 패턴은 이미 저장/전달됨 → 메모리에서 제거
+        self.pattern_manager.clear_completed_patterns()
+
     def get_all_patterns(self) -> List[SeedPatternTree]:
         """모든 패턴 조회"""
         return self.pattern_manager.get_all_patterns()
@@ -542,7 +681,8 @@ class SeedPatternDetectionOrchestrator:
     def _find_last_valid_day(
         self,
         stocks: List[Stock],
-        current_index: int
+        current_index: int,
+        last_valid_index: Optional[List[int]] = None
     ) -> Optional[Stock]:
         """
         마지막 정상 거래일 찾기 (volume > 0)
@@ -550,21 +690,62 @@ class SeedPatternDetectionOrchestrator:
         Args:
             stocks: 주가 데이터 리스트
             current_index: 현재 인덱스
+            last_valid_index: forward fill 시 함께 계산된 위치 배열 (있으면 O(1))
 
         Returns:
             마지막 정상 거래일 주가, 없으면 None
         """
+        if last_valid_index is not None:
+            i = last_valid_index[current_index]
+            return stocks[i] if i >= 0 else None
+
         for i in range(current_index - 1, -1, -1):
             if stocks[i].volume > 0:
                 return stocks[i]
         return None
 
+    def _root_entry_candidates(
+        self,
+        ticker: str,
+        stocks: List[Stock],
+        last_valid_index: List[int]
+    ):
+        """
+        Block1 진입 후보 캔들 마스크
+
+        mask[i]가 False면 _should_start_new_pattern()이 반드시 False이므로
+        컨텍스트 구성과 조건 평가를 건너뜁니다.
+
+        Args:
+            ticker: 종목 코드
+            stocks: forward fill된 주가 데이터
+            last_valid_index: 캔들별 prev 위치
+
+        Returns:
+            bool 배열 (상태 없는 진입 조건이 없으면 None)
+        """
+        root_node = self.block_graph.get_node(self.block_graph.root_node_id) \
+            if self.block_graph.root_node_id else None
+        if not root_node:
+            return None
+
+        mask = self.block_detector.entry_prefilter.candidate_mask(
+            root_node.entry_conditions, stocks, last_valid_index
+        )
+        if mask is not None:
+            logger.debug(
+                f"Block1 entry prefilter: {int(mask.sum())}/{len(stocks)} candidate candles",
+                extra={'ticker': ticker, 'candidates': int(mask.sum()), 'candles': len(stocks)}
+            )
+        return mask
+
     def _should_start_new_pattern(
         self,
         ticker: str,
         current: Stock,
         prev: Optional[Stock],
-        all_stocks: List[Stock]
+        all_stocks: List[Stock],
+        date_index: Optional[DateIndex] = None
     ) -> bool:
         """
         Block1 진입 조건 평가 (패턴 무관)
@@ -576,6 +757,7 @@ class SeedPatternDetectionOrchestrator:
             current: 현재 주가
             prev: 이전 주가
             all_stocks: 전체 주가 데이터
+            date_index: 날짜 색인 (all_stocks는 그 prefix)
 
         Returns:
             Block1 조건 만족 여부
@@ -594,6 +776,8 @@ class SeedPatternDetectionOrchestrator:
             'prev': prev,
             'all_stocks': all_stocks
         }
+        if date_index is not None:
+            context[DATE_INDEX_KEY] = date_index
 
         return self.block_detector.evaluate_entry_condition(
             node=root_node,
@@ -667,7 +851,8 @@ class SeedPatternDetectionOrchestrator:
         pattern: PatternContext,
         current: Stock,
         prev: Optional[Stock],
-        all_stocks: List[Stock]
+        all_stocks: List[Stock],
+        date_index: Optional[DateIndex] = None
     ) -> dict:
         """
         패턴별 평가 컨텍스트 구축
@@ -679,6 +864,7 @@ class SeedPatternDetectionOrchestrator:
             current: 현재 주가
             prev: 이전 주가
             all_stocks: 전체 주가 데이터
+            date_index: 날짜 색인 (all_stocks는 그 prefix)
 
         Returns:
             평가 컨텍스트
@@ -690,6 +876,8 @@ class SeedPatternDetectionOrchestrator:
             'pattern_id': pattern.pattern_id,
             'active_blocks': pattern.blocks  # Spot 전략용
         }
+        if date_index is not None:
+            context[DATE_INDEX_KEY] = date_index
 
         # 이 패턴의 블록들 추가
         for block_id, block in pattern.blocks.items():
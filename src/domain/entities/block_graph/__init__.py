@@ -13,10 +13,12 @@ Block Graph Package - Dynamic Block Relationships
 from .block_node import BlockNode
 from .block_edge import BlockEdge, EdgeType
 from .block_graph import BlockGraph
+from .spot_plan import SpotPlan
 
 __all__ = [
     'BlockNode',
     'BlockEdge',
     'EdgeType',
     'BlockGraph',
+    'SpotPlan',
 ]
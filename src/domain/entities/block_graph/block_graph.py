@@ -56,6 +56,9 @@ class BlockGraph:
 
         self.nodes[node.block_id] = node
 
+        # spot 판정 메타데이터는 로드 시 1회 계산 (캔들마다 표현식 파싱 방지)
+        node.compile_spot_plan()
+
         # 첫 번째 노드를 루트로 설정
         if self.root_node_id is None:
             self.root_node_id = node.block_id
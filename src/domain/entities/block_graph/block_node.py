@@ -7,6 +7,8 @@ BlockNode - 블록 그래프의 노드
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 
+from .spot_plan import SpotPlan
+
 if TYPE_CHECKING:
     from src.domain.entities.conditions import Condition
     from src.domain.entities.highlights import HighlightCondition
@@ -63,6 +65,9 @@ class BlockNode:
     parameters: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Spot 판정 계획 (그래프 로드 시 compile_spot_plan()으로 1회 계산)
+    spot_plan: Optional[SpotPlan] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """블록 ID와 타입 검증"""
         if not self.block_id:
@@ -114,6 +119,30 @@ class BlockNode:
         """
         return self.parameters.get(key, default)
 
+    def compile_spot_plan(self) -> SpotPlan:
+        """
+        spot 판정 계획 계산 후 노드에 저장
+
+        spot_condition, spot_entry_conditions, exclude_conditions를 바꾼 뒤에는
+        다시 호출해야 합니다.
+
+        Returns:
+            계산된 SpotPlan
+        """
+        self.spot_plan = SpotPlan.from_node(self)
+        return self.spot_plan
+
+    def get_spot_plan(self) -> SpotPlan:
+        """
+        spot 판정 계획 조회 (그래프에 추가되지 않은 노드는 이때 계산)
+
+        Returns:
+            SpotPlan
+        """
+        if self.spot_plan is None:
+            return self.compile_spot_plan()
+        return self.spot_plan
+
     def has_reentry(self) -> bool:
         """
         이 블록이 재진입을 지원하는지 확인
@@ -0,0 +1,91 @@
+"""
+SpotPlan - 블록 노드의 spot 판정 메타데이터
+
+spot_condition 표현식에서 추출한 이전 블록 ID와 회고 범위(오프셋),
+spot_entry_conditions(및 exclude_conditions 적용 결과)를 노드별로 한 번만 계산해 보관.
+SpotStrategy는 캔들마다 표현식을 다시 파싱하지 않고 이 계획을 사용합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.domain.entities.conditions import Condition
+    from .block_node import BlockNode
+
+
+# 첫 번째 문자열 인자 (함수명 무관): is_backward_spot('block1', ...) → block1
+_PREV_BLOCK_ID_PATTERN = re.compile(r"\(['\"](\w+)['\"]")
+
+# is_xxx_spot('block_id', offset_start, offset_end) (음수 포함 정수)
+_DAYS_RANGE_PATTERN = re.compile(r"is_\w+_spot\(['\"](\w+)['\"]\s*,\s*(-?\d+)\s*,\s*(-?\d+)\)")
+
+# 파싱 실패 시 기본 회고 범위: D-1, D-2
+DEFAULT_OFFSET_RANGE = (-1, -2)
+
+
+@dataclass(frozen=True)
+class SpotPlan:
+    """
+    노드별 spot 판정 계획
+
+    Attributes:
+        prev_block_id: spot_condition의 첫 번째 문자열 인자 (없으면 None)
+        offset_start: 회고 시작 오프셋 (예: -1 → D-1)
+        offset_end: 회고 종료 오프셋 (예: -2 → D-2)
+        entry_conditions: spot_entry_conditions (StaySpot용)
+        levelup_entry_conditions: exclude_conditions를 제외한 spot_entry_conditions (LevelupSpot용)
+    """
+
+    prev_block_id: Optional[str] = None
+    offset_start: int = DEFAULT_OFFSET_RANGE[0]
+    offset_end: int = DEFAULT_OFFSET_RANGE[1]
+    entry_conditions: Tuple['Condition', ...] = ()
+    levelup_entry_conditions: Tuple['Condition', ...] = ()
+
+    @property
+    def offset_range(self) -> Tuple[int, int]:
+        """(offset_start, offset_end) 튜플"""
+        return self.offset_start, self.offset_end
+
+    @classmethod
+    def from_node(cls, node: 'BlockNode') -> 'SpotPlan':
+        """
+        BlockNode의 spot 관련 필드로 계획 생성
+
+        Args:
+            node: 블록 노드
+
+        Returns:
+            SpotPlan (spot_condition이 없으면 기본값)
+        """
+        prev_block_id = None
+        offset_start, offset_end = DEFAULT_OFFSET_RANGE
+
+        if node.spot_condition:
+            expression = node.spot_condition.expression
+
+            match = _PREV_BLOCK_ID_PATTERN.search(expression)
+            if match:
+                prev_block_id = match.group(1)
+
+            match = _DAYS_RANGE_PATTERN.search(expression)
+            if match:
+                offset_start, offset_end = int(match.group(2)), int(match.group(3))
+
+        entry_conditions = tuple(node.spot_entry_conditions or ())
+        levelup_entry_conditions = entry_conditions
+        if node.exclude_conditions:
+            exclude_set = set(node.exclude_conditions)
+            levelup_entry_conditions = tuple(
+                cond for cond in entry_conditions if cond.name not in exclude_set
+            )
+
+        return cls(
+            prev_block_id=prev_block_id,
+            offset_start=offset_start,
+            offset_end=offset_end,
+            entry_conditions=entry_conditions,
+            levelup_entry_conditions=levelup_entry_conditions
+        )
@@ -12,6 +12,7 @@ Builtin Functions - 내장 함수 모음
 from datetime import date, timedelta
 from typing import List, Any, Optional
 from .function_registry import function_registry
+from src.domain.entities.core.date_index import DateIndex, DATE_INDEX_KEY
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -604,6 +605,12 @@ def last_valid_volume(context: dict) -> int:
     if not all_stocks or not current:
         return 0
 
+    # 날짜 색인이 있으면 마지막 정상 거래일 위치를 바로 조회
+    date_index = context.get(DATE_INDEX_KEY)
+    if isinstance(date_index, DateIndex) and date_index.covers(all_stocks):
+        pos = date_index.last_valid_before(all_stocks, len(all_stocks) - 1)
+        return all_stocks[pos].volume if pos is not None else 0
+
     # 현재 날짜 이전의 주가들을 역순으로 검색
     for i in range(len(all_stocks) - 2, -1, -1):  # 현재(마지막) 제외하고 역순
         stock = all_stocks[i]
@@ -1183,14 +1190,10 @@ def is_forward_spot(
     if not all_stocks:
         return False
 
-    # 시작일 인덱스 찾기
-    start_index = None
-    current_index = None
-    for i, stock in enumerate(all_stocks):
-        if stock.date == started_at:
-            start_index = i
-        if stock.date == current_date:
-            current_index = i
+    # 시작일/현재일 인덱스 찾기 (날짜 색인, O(1))
+    date_index = DateIndex.for_context(context)
+    start_index = date_index.position(started_at, len(all_stocks))
+    current_index = date_index.position(current_date, len(all_stocks))
 
     if start_index is None or current_index is None:
         return False
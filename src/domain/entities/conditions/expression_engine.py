@@ -70,6 +70,29 @@ class ExpressionEngine:
         # 함수 레지스트리 (외부에서 주입)
         self.function_registry = function_registry
 
+        # 파싱된 AST 캐시 (표현식 문자열 → ast.Expression)
+        # YAML 조건은 고정된 문자열이므로 캔들마다 다시 파싱할 필요가 없음
+        self._compiled: Dict[str, ast.Expression] = {}
+
+    def compile(self, expression: str) -> ast.Expression:
+        """
+        표현식을 파싱하고 결과를 캐시합니다.
+
+        Args:
+            expression: 표현식
+
+        Returns:
+            파싱된 AST (mode='eval')
+
+        Raises:
+            SyntaxError: 구문 오류 (evaluate()에서 ValueError로 변환)
+        """
+        tree = self._compiled.get(expression)
+        if tree is None:
+            tree = ast.parse(expression, mode='eval')
+            self._compiled[expression] = tree
+        return tree
+
     def evaluate(self, expression: str, context: Dict[str, Any]) -> Any:
         """
         표현식을 평가합니다.
@@ -93,8 +116,8 @@ class ExpressionEngine:
             ValueError: 표현식이 유효하지 않거나 평가 실패 시
         """
         try:
-            # AST 파싱
-            tree = ast.parse(expression, mode='eval')
+            # AST 파싱 (캐시)
+            tree = self.compile(expression)
 
             # 평가
             result = self._eval_node(tree.body, context)
@@ -106,6 +129,21 @@ class ExpressionEngine:
         except Exception as e:
             raise ValueError(f"표현식 평가 실패: {expression}\n오류: {e}")
 
+    def evaluate_node(self, node: ast.AST, context: Dict[str, Any]) -> Any:
+        """
+        이미 파싱된 AST 노드를 평가합니다 (예외 변환 없음).
+
+        조건 순서를 재배치한 AST처럼 compile() 결과를 가공해 평가할 때 사용.
+
+        Args:
+            node: 평가할 AST 노드 (예: compile(expr).body)
+            context: 평가에 사용할 컨텍스트
+
+        Returns:
+            평가 결과
+        """
+        return self._eval_node(node, context)
+
     def _eval_node(self, node: ast.AST, context: Dict[str, Any]) -> Any:
         """
         AST 노드를 재귀적으로 평가합니다.
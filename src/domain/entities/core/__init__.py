@@ -1,11 +1,14 @@
 """
 Core Domain Entities
-기본 도메인 엔티티 (Stock, DetectionResult)
+기본 도메인 엔티티 (Stock, DetectionResult, DateIndex)
 """
 from .stock import Stock
 from .detection_result import DetectionResult
+from .date_index import DateIndex, DATE_INDEX_KEY
 
 __all__ = [
     'Stock',
     'DetectionResult',
+    'DateIndex',
+    'DATE_INDEX_KEY',
 ]
@@ -0,0 +1,162 @@
+"""
+Date Index - 주가 시계열 날짜 색인
+
+날짜 → 위치(position) 조회 테이블
+
+A DateIndex is built once per ticker over the (date-sorted) price series and carried
+in the evaluation context under ``DATE_INDEX_KEY``. Lookups that used to scan
+``all_stocks`` linearly on every candle become a dict lookup (exact date) or a bisect
+over the ordinal array (range queries).
+
+Contexts usually hold a prefix of the series (``stocks[:i + 1]``); positions in a
+prefix are the same as in the full series, so one index serves every candle.
+
+When built with the ``last_valid_index`` array from
+``forward_fill_with_last_valid_index`` the "last trading day (volume > 0)" queries are
+array reads as well.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+from .stock import Stock
+
+
+DATE_INDEX_KEY = 'date_index'
+
+
+class DateIndex:
+    """날짜 → 위치 조회 테이블 (시간순 정렬된 주가 리스트 기준)"""
+
+    __slots__ = ('_positions', '_dates', '_ordinals', '_last_valid')
+
+    def __init__(
+        self,
+        stocks: Sequence[Stock],
+        last_valid_index: Optional[Sequence[int]] = None
+    ):
+        """
+        Args:
+            stocks: 주가 데이터 리스트 (시간순 정렬)
+            last_valid_index: i 이전 마지막 정상 거래일 위치 배열 (-1 = 없음, 선택)
+        """
+        if last_valid_index is not None and len(last_valid_index) != len(stocks):
+            raise ValueError(
+                f"last_valid_index length {len(last_valid_index)} != stocks length {len(stocks)}"
+            )
+
+        # 중복 날짜는 첫 번째 위치 (기존 선형 탐색의 break 동작과 동일)
+        positions: Dict[date, int] = {}
+        for i, stock in enumerate(stocks):
+            positions.setdefault(stock.date, i)
+
+        self._positions = positions
+        self._dates: List[date] = [stock.date for stock in stocks]
+        self._ordinals: List[int] = [d.toordinal() for d in self._dates]
+        self._last_valid = last_valid_index
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def position(self, target_date: date, end: Optional[int] = None) -> Optional[int]:
+        """
+        날짜의 위치 (O(1))
+
+        Args:
+            target_date: 조회할 날짜
+            end: 이 위치 이상은 없는 것으로 간주 (prefix 리스트 길이)
+
+        Returns:
+            위치, 없으면 None
+        """
+        pos = self._positions.get(target_date)
+        if pos is None or (end is not None and pos >= end):
+            return None
+        return pos
+
+    def count_before(self, target_date: date) -> int:
+        """target_date보다 이전 날짜의 개수 (= 첫 위치 >= target_date)"""
+        return bisect_left(self._ordinals, target_date.toordinal())
+
+    def count_through(self, target_date: date) -> int:
+        """target_date 이하 날짜의 개수 (= 첫 위치 > target_date)"""
+        return bisect_right(self._ordinals, target_date.toordinal())
+
+    def last_traded_before(
+        self,
+        stocks: Sequence[Stock],
+        target_date: date
+    ) -> Optional[int]:
+        """
+        target_date 이전 마지막 정상 거래일(volume > 0)의 위치
+
+        Args:
+            stocks: 색인된 리스트 또는 그 prefix
+            target_date: 기준 날짜
+
+        Returns:
+            위치, 없으면 None
+        """
+        pos = min(self.count_before(target_date), len(stocks)) - 1
+        if pos < 0:
+            return None
+        if stocks[pos].volume > 0:
+            return pos
+        return self.last_valid_before(stocks, pos)
+
+    def last_valid_before(self, stocks: Sequence[Stock], position: int) -> Optional[int]:
+        """
+        position 이전(position 제외) 마지막 정상 거래일(volume > 0)의 위치
+
+        last_valid_index가 있으면 O(1), 없으면 역순 탐색합니다.
+
+        Args:
+            stocks: 색인된 리스트 또는 그 prefix
+            position: 기준 위치
+
+        Returns:
+            위치, 없으면 None
+        """
+        if self._last_valid is not None:
+            pos = self._last_valid[position]
+            return pos if pos >= 0 else None
+
+        for pos in range(position - 1, -1, -1):
+            if stocks[pos].volume > 0:
+                return pos
+        return None
+
+    def covers(self, stocks: Sequence[Stock]) -> bool:
+        """
+        stocks가 색인된 시계열(또는 그 prefix)인지 확인 (O(1))
+
+        양 끝 날짜만 비교하므로 같은 시계열의 prefix 판별용입니다.
+        """
+        n = len(stocks)
+        if n > len(self._dates):
+            return False
+        if n == 0:
+            return True
+        return stocks[0].date == self._dates[0] and stocks[-1].date == self._dates[n - 1]
+
+    @classmethod
+    def for_context(cls, context: dict) -> 'DateIndex':
+        """
+        컨텍스트의 all_stocks에 대한 색인
+
+        context에 유효한 색인이 있으면 재사용하고, 없으면 생성해서 context에 저장합니다.
+
+        Args:
+            context: 평가 컨텍스트 (all_stocks 포함)
+
+        Returns:
+            all_stocks를 포함하는 DateIndex
+        """
+        all_stocks = context.get('all_stocks') or []
+        index = context.get(DATE_INDEX_KEY)
+        if isinstance(index, cls) and index.covers(all_stocks):
+            return index
+
+        index = cls(all_stocks)
+        context[DATE_INDEX_KEY] = index
+        return index
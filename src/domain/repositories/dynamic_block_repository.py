@@ -131,6 +131,60 @@ class DynamicBlockRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_min_spot_count(
+        self,
+        min_spots: int,
+        start_date: date,
+        end_date: date,
+        ticker: Optional[str] = None,
+        block_type: Optional[int] = None
+    ) -> List[DynamicBlockDetection]:
+        """
+        spot 개수 조건으로 블록 조회
+
+        Args:
+            min_spots: 최소 spot 개수 (1 이상, 0 이하는 find_by_date_range 사용)
+            start_date: 블록 시작일 범위 (시작)
+            end_date: 블록 시작일 범위 (끝)
+            ticker: 종목 코드 (None이면 전체 시장)
+            block_type: 블록 타입 필터 (None이면 모두)
+
+        Returns:
+            spot이 min_spots개 이상인 블록 리스트 (started_at 순)
+
+        Raises:
+            ValueError: min_spots < 1 (spot 행 집계로는 spot 없는 블록을 찾을 수 없음)
+        """
+        pass
+
+    @abstractmethod
+    def find_by_min_redetection_count(
+        self,
+        min_redetections: int,
+        start_date: date,
+        end_date: date,
+        ticker: Optional[str] = None,
+        block_type: Optional[int] = None
+    ) -> List[DynamicBlockDetection]:
+        """
+        재탐지 횟수 조건으로 블록 조회
+
+        Args:
+            min_redetections: 최소 재탐지 횟수 (1 이상, 0 이하는 find_by_date_range 사용)
+            start_date: 블록 시작일 범위 (시작)
+            end_date: 블록 시작일 범위 (끝)
+            ticker: 종목 코드 (None이면 전체 시장)
+            block_type: 블록 타입 필터 (None이면 모두)
+
+        Returns:
+            재탐지가 min_redetections회 이상인 블록 리스트 (started_at 순)
+
+        Raises:
+            ValueError: min_redetections < 1
+        """
+        pass
+
     @abstractmethod
     def delete_by_id(self, detection_id: int) -> bool:
         """
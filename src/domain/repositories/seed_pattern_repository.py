@@ -120,6 +120,30 @@ class SeedPatternRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_block_feature(
+        self,
+        start_date: date,
+        end_date: date,
+        block_type: Optional[int] = None,
+        ticker: Optional[str] = None,
+        min_peak_price: Optional[float] = None
+    ) -> List[SeedPattern]:
+        """
+        블록 특징 조건으로 seed pattern 조회
+
+        Args:
+            start_date: 블록 시작일 범위 (시작)
+            end_date: 블록 시작일 범위 (끝)
+            block_type: 블록 타입 필터 (None이면 모두)
+            ticker: 종목 코드 (None이면 전체)
+            min_peak_price: 최소 블록 고점 (None이면 제한 없음)
+
+        Returns:
+            조건을 만족하는 블록을 하나 이상 가진 SeedPattern 리스트
+        """
+        pass
+
     @abstractmethod
     def find_all(
         self,
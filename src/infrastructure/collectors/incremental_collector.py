@@ -11,8 +11,10 @@ from ..database.connection import DatabaseConnection
 from ..database.queries import (
     get_latest_dates_bulk,
     get_date_range_bulk,
-    get_tickers_without_data,
-    get_tickers_needing_update
+    get_coverage_bulk,
+    get_missing_dates_bulk,
+    get_trading_calendar,
+    split_gap_runs,
 )
 
 
@@ -40,7 +42,8 @@ class IncrementalCollector:
         tickers: List[str],
         fromdate: date,
         todate: date,
-        force_full: bool = False
+        force_full: bool = False,
+        fill_gaps: bool = False
     ) -> List[CollectionPlan]:
         """
         종목별 수집 계획 수립
@@ -50,6 +53,8 @@ class IncrementalCollector:
             fromdate: 요청 시작 날짜
             todate: 요청 종료 날짜
             force_full: True면 모든 종목을 전체 수집 (증분 무시)
+            fill_gaps: True면 보유 구간 내부의 누락 거래일도 재수집
+                (시장 캘린더 기준 gap 분석, 거래정지 구간은 제외)
 
         Returns:
             CollectionPlan 리스트 (수집이 필요한 종목만)
@@ -71,6 +76,12 @@ class IncrementalCollector:
             # 1. 모든 종목의 최신 날짜 조회 (단일 쿼리)
             latest_dates = get_latest_dates_bulk(session, tickers)
 
+            # 1-1. 내부 누락 거래일의 첫 날짜 (시장 전체 gap 분석, 단일 패스)
+            first_gap_dates = (
+                self._get_first_gap_dates(session, tickers, fromdate, todate)
+                if fill_gaps and not force_full else {}
+            )
+
             # 2. 수집 계획 수립
             plans = []
 
@@ -100,8 +111,19 @@ class IncrementalCollector:
                     )
                     plans.append(plan)
 
-                # 이미 최신 데이터 보유 → 건너뛰기
+                # 이미 최신 데이터 보유
                 elif latest_date >= todate:
+                    first_gap = first_gap_dates.get(ticker)
+
+                    # 내부 누락만 재수집 (첫 누락일 ~ 최신일)
+                    if first_gap is not None:
+                        plans.append(CollectionPlan(
+                            ticker=ticker,
+                            fromdate=first_gap,
+                            todate=latest_date,
+                            is_full_collection=False,
+                            existing_latest_date=latest_date
+                        ))
                     # Skip silently (already up-to-date)
                     continue
 
@@ -113,6 +135,11 @@ class IncrementalCollector:
                     if incremental_from < fromdate:
                         incremental_from = fromdate
 
+                    # 내부 누락이 있으면 첫 누락일부터 함께 수집
+                    first_gap = first_gap_dates.get(ticker)
+                    if first_gap is not None and first_gap < incremental_from:
+                        incremental_from = first_gap
+
                     plan = CollectionPlan(
                         ticker=ticker,
                         fromdate=incremental_from,
@@ -127,6 +154,32 @@ class IncrementalCollector:
         finally:
             session.close()
 
+    def _get_first_gap_dates(
+        self,
+        session,
+        tickers: List[str],
+        fromdate: date,
+        todate: date
+    ) -> Dict[str, date]:
+        """
+        종목별 첫 재수집 대상 누락 거래일 (거래정지 구간 제외)
+
+        Returns:
+            {ticker: 첫 누락 거래일} - 재수집할 누락이 있는 종목만
+        """
+        missing_dates = get_missing_dates_bulk(session, fromdate, todate, tickers)
+        if not missing_dates:
+            return {}
+
+        calendar = get_trading_calendar(session, fromdate, todate)
+        first_gap_dates = {}
+        for ticker, dates in missing_dates.items():
+            missing, _ = split_gap_runs(dates, calendar)
+            if missing:
+                first_gap_dates[ticker] = missing[0]
+
+        return first_gap_dates
+
     def optimize_collection_order(
         self,
         plans: List[CollectionPlan],
@@ -270,6 +323,9 @@ class IncrementalCollector:
         """
         수집 완료 후 검증
 
+        시장 거래일 캘린더(stock_price 날짜 합집합)를 한 번 만들고
+        전 종목 커버리지를 단일 그룹 쿼리로 계산합니다.
+
         Args:
             tickers: 종목 코드 리스트
             fromdate: 시작 날짜
@@ -277,26 +333,38 @@ class IncrementalCollector:
 
         Returns:
             검증 결과 딕셔너리
+            - gap_tickers: [(ticker, 누락 거래일 수, 거래정지 구간 리스트), ...]
         """
         session = self.db.get_session()
         try:
-            latest_dates = get_latest_dates_bulk(session, tickers)
+            coverage = get_coverage_bulk(session, fromdate, todate, tickers)
+            missing_dates = get_missing_dates_bulk(
+                session, fromdate, todate, tickers, coverage=coverage
+            )
+            calendar = get_trading_calendar(session, fromdate, todate) if missing_dates else []
 
             # 검증
             up_to_date = []
             needs_update = []
             no_data = []
+            gap_tickers = []
 
             for ticker in tickers:
-                latest = latest_dates.get(ticker)
+                ticker_coverage = coverage[ticker]
+                latest = ticker_coverage.last_date
 
-                if latest is None:
+                if not ticker_coverage.has_data:
                     no_data.append(ticker)
+                    continue
                 elif latest >= todate:
                     up_to_date.append(ticker)
                 else:
                     needs_update.append((ticker, latest))
 
+                if ticker in missing_dates:
+                    missing, suspended = split_gap_runs(missing_dates[ticker], calendar)
+                    gap_tickers.append((ticker, len(missing), suspended))
+
             return {
                 'total': len(tickers),
                 'up_to_date': len(up_to_date),
@@ -304,7 +372,9 @@ class IncrementalCollector:
                 'no_data': len(no_data),
                 'up_to_date_tickers': up_to_date,
                 'needs_update_tickers': needs_update,
-                'no_data_tickers': no_data
+                'no_data_tickers': no_data,
+                'gaps': len(gap_tickers),
+                'gap_tickers': gap_tickers
             }
 
         finally:
@@ -339,4 +409,13 @@ class IncrementalCollector:
             if validation['no_data'] > 5:
                 print(f"  ... 외 {validation['no_data'] - 5}개")
 
+        if validation.get('gaps', 0) > 0:
+            print(f"[yellow]내부 누락:      {validation['gaps']:>10,}개[/yellow]")
+            # 샘플 출력
+            for ticker, missing_count, suspended in validation['gap_tickers'][:5]:
+                suspended_str = f", 거래정지 {len(suspended)}구간" if suspended else ""
+                print(f"  - {ticker}: 누락 {missing_count}일{suspended_str}")
+            if validation['gaps'] > 5:
+                print(f"  ... 외 {validation['gaps'] - 5}개")
+
         print("=" * 80 + "\n")
@@ -24,6 +24,13 @@ from .seed_pattern_model import SeedPatternModel
 # Highlight-centric pattern models
 from .highlight_centric_pattern import HighlightCentricPatternModel
 
+# Normalized detection detail models (JSON 컬럼 정규화)
+from .detection_detail_models import (
+    BlockSpotModel,
+    BlockRedetectionModel,
+    SeedPatternBlockFeatureModel
+)
+
 # Preset models
 from .presets import (
     SeedConditionPreset,
@@ -56,6 +63,11 @@ __all__ = [
     # Highlight-centric pattern models
     'HighlightCentricPatternModel',
 
+    # Normalized detection detail models
+    'BlockSpotModel',
+    'BlockRedetectionModel',
+    'SeedPatternBlockFeatureModel',
+
     # Preset models
     'SeedConditionPreset',
     'RedetectionConditionPreset',
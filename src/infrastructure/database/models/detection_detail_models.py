@@ -0,0 +1,160 @@
+"""
+Detection Detail ORM Models
+
+JSON 컬럼(custom_metadata.spots, custom_metadata.redetections,
+seed_pattern.block_features)을 SQL로 조회할 수 있도록 정규화한 자식 테이블.
+
+부모 블록의 (ticker, block_type, started_at)을 비정규화해 두어
+"2024년에 spot이 2개 이상인 블록" 같은 분석 쿼리가
+JSON 디코딩 없이 커버링 인덱스만으로 처리됩니다.
+
+Note:
+    JSON 컬럼은 엔티티 복원용으로 그대로 유지되며,
+    Repository 구현체가 저장 시 자식 테이블을 함께 갱신합니다 (dual-write).
+"""
+from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, Index
+
+from .base import Base
+
+
+class BlockSpotModel(Base):
+    """
+    블록 spot 테이블
+
+    Table: block_spot (dynamic_block_detection.custom_metadata['spots'])
+    """
+
+    __tablename__ = 'block_spot'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    block_detection_id = Column(
+        Integer,
+        ForeignKey('dynamic_block_detection.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+
+    # 부모 블록 비정규화 (커버링 인덱스용)
+    ticker = Column(String(20), nullable=False)
+    block_type = Column(Integer, nullable=False)
+    started_at = Column(Date, nullable=True)
+
+    # Spot 데이터
+    spot_number = Column(Integer, nullable=False)
+    spot_date = Column(Date, nullable=False)
+    open_price = Column(Float, nullable=True)
+    high_price = Column(Float, nullable=True)
+    low_price = Column(Float, nullable=True)
+    close_price = Column(Float, nullable=True)
+    volume = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        Index(
+            'idx_block_spot_ticker_type_started',
+            'ticker', 'block_type', 'started_at', 'block_detection_id', 'spot_number'
+        ),
+        Index('idx_block_spot_started_block', 'started_at', 'block_detection_id'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<BlockSpotModel(block_detection_id={self.block_detection_id}, "
+            f"spot_number={self.spot_number}, spot_date={self.spot_date})>"
+        )
+
+
+class BlockRedetectionModel(Base):
+    """
+    블록 재탐지 이벤트 테이블
+
+    Table: block_redetection (dynamic_block_detection.custom_metadata['redetections'])
+    """
+
+    __tablename__ = 'block_redetection'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    block_detection_id = Column(
+        Integer,
+        ForeignKey('dynamic_block_detection.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+
+    # 부모 블록 비정규화 (커버링 인덱스용)
+    ticker = Column(String(20), nullable=False)
+    block_type = Column(Integer, nullable=False)
+    started_at = Column(Date, nullable=True)
+
+    # RedetectionEvent 데이터
+    sequence = Column(Integer, nullable=False)
+    parent_block_id = Column(String(50), nullable=False)
+    redetection_started_at = Column(Date, nullable=False)
+    redetection_ended_at = Column(Date, nullable=True)
+    peak_price = Column(Float, nullable=True)
+    peak_volume = Column(Integer, nullable=True)
+    status = Column(String(20), nullable=False)
+
+    __table_args__ = (
+        Index(
+            'idx_block_redet_ticker_type_started',
+            'ticker', 'block_type', 'started_at', 'block_detection_id', 'sequence'
+        ),
+        Index('idx_block_redet_started_block', 'started_at', 'block_detection_id'),
+        Index('idx_block_redet_redet_started', 'redetection_started_at'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<BlockRedetectionModel(block_detection_id={self.block_detection_id}, "
+            f"sequence={self.sequence}, status='{self.status}')>"
+        )
+
+
+class SeedPatternBlockFeatureModel(Base):
+    """
+    시드 패턴 블록 특징 테이블
+
+    Table: seed_pattern_block_feature (seed_pattern.block_features)
+    """
+
+    __tablename__ = 'seed_pattern_block_feature'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    seed_pattern_id = Column(
+        Integer,
+        ForeignKey('seed_pattern.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    ticker = Column(String(20), nullable=False)
+    position = Column(Integer, nullable=False)  # block_features 리스트 내 순서
+
+    # BlockFeatures 데이터
+    block_id = Column(String(50), nullable=False)
+    block_type = Column(Integer, nullable=False)
+    condition_name = Column(String(50), nullable=True)  # metadata['condition_name']
+    started_at = Column(Date, nullable=False)
+    ended_at = Column(Date, nullable=True)
+    duration_candles = Column(Integer, nullable=False)
+    low_price = Column(Float, nullable=False)
+    high_price = Column(Float, nullable=False)
+    peak_price = Column(Float, nullable=False)
+    peak_date = Column(Date, nullable=False)
+    min_volume = Column(Integer, nullable=False)
+    max_volume = Column(Integer, nullable=False)
+    peak_volume = Column(Integer, nullable=False)
+    avg_volume = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index(
+            'idx_spbf_ticker_type_started',
+            'ticker', 'block_type', 'started_at', 'seed_pattern_id', 'peak_price'
+        ),
+        Index('idx_spbf_started_pattern', 'started_at', 'seed_pattern_id'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<SeedPatternBlockFeatureModel(seed_pattern_id={self.seed_pattern_id}, "
+            f"block_id='{self.block_id}', started_at={self.started_at})>"
+        )
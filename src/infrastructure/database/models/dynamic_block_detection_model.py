@@ -2,7 +2,7 @@
 DynamicBlockDetection ORM Model
 """
 
-from sqlalchemy import Column, Integer, String, Date, Float, JSON
+from sqlalchemy import Column, Integer, String, Date, Float, JSON, Index
 from .base import Base
 
 
@@ -19,24 +19,24 @@ class DynamicBlockDetectionModel(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # 블록 정의
-    block_id = Column(String(50), nullable=False, index=True)
-    block_type = Column(Integer, nullable=False, index=True)
+    block_id = Column(String(50), nullable=False)
+    block_type = Column(Integer, nullable=False)
 
     # 종목 정보
-    ticker = Column(String(20), nullable=False, index=True)
+    ticker = Column(String(20), nullable=False)
 
     # 패턴 연결
-    pattern_id = Column(Integer, nullable=True, index=True)
+    pattern_id = Column(Integer, nullable=True)
 
     # 조건 정보
-    condition_name = Column(String(50), nullable=False, index=True)
+    condition_name = Column(String(50), nullable=False)
 
     # 시간 정보
     started_at = Column(Date, nullable=True, index=True)
-    ended_at = Column(Date, nullable=True, index=True)
+    ended_at = Column(Date, nullable=True)
 
     # 상태
-    status = Column(String(20), nullable=False, index=True)
+    status = Column(String(20), nullable=False)
 
     # 가격/거래량 정보
     peak_price = Column(Float, nullable=True)
@@ -48,14 +48,24 @@ class DynamicBlockDetectionModel(Base):
     parent_blocks = Column(JSON, nullable=False, default=list)
 
     # Virtual Block System (NEW - 2025-10-26)
-    yaml_type = Column(Integer, nullable=False, default=0, index=True)  # YAML 정의 block_type (불변)
-    logical_level = Column(Integer, nullable=False, default=0, index=True)  # 실제 급등 순서 (1, 2, 3, ...)
+    yaml_type = Column(Integer, nullable=False, default=0)  # YAML 정의 block_type (불변)
+    logical_level = Column(Integer, nullable=False, default=0)  # 실제 급등 순서 (1, 2, 3, ...)
     pattern_sequence = Column(Integer, nullable=False, default=0)  # 패턴 내 생성 순서
-    is_virtual = Column(Integer, nullable=False, default=0, index=True)  # 0/1 (Spot으로 스킵된 가상 블록 여부)
+    is_virtual = Column(Integer, nullable=False, default=0)  # 0/1 (Spot으로 스킵된 가상 블록 여부)
 
     # 메타데이터 (JSON) - 'metadata'는 SQLAlchemy 예약어이므로 'custom_metadata' 사용
     custom_metadata = Column(JSON, nullable=False, default=dict)
 
+    # 복합 인덱스 (scripts/maintenance/audit_query_plans.py 감사 결과)
+    # - 모든 조회가 ticker 동등 조건 + started_at 정렬이므로 (ticker, ..., started_at) 형태
+    # - 단일 컬럼 인덱스(ticker, status, block_type 등)는 선두 컬럼 중복 또는 미사용으로 제거
+    __table_args__ = (
+        Index('idx_dbd_ticker_started', 'ticker', 'started_at'),
+        Index('idx_dbd_ticker_condition_started', 'ticker', 'condition_name', 'started_at'),
+        Index('idx_dbd_ticker_status_started', 'ticker', 'status', 'started_at'),
+        Index('idx_dbd_pattern_block_type', 'pattern_id', 'block_type'),
+    )
+
     def __repr__(self):
         return (
             f"<DynamicBlockDetectionModel(id={self.id}, block_id='{self.block_id}', "
@@ -20,7 +20,7 @@ class SeedPatternModel(Base):
 
     # 기본 정보
     pattern_name = Column(String(100), nullable=False, unique=True, index=True)
-    ticker = Column(String(20), nullable=False, index=True)
+    ticker = Column(String(20), nullable=False)
     yaml_config_path = Column(String(500), nullable=False)
     detection_date = Column(Date, nullable=False, index=True)
 
@@ -32,7 +32,7 @@ class SeedPatternModel(Base):
     volume_shape = Column(JSON, nullable=False)
 
     # 상태
-    status = Column(String(20), nullable=False, default='active', index=True)
+    status = Column(String(20), nullable=False, default='active')
 
     # 추가 정보
     description = Column(Text, nullable=True)
@@ -42,6 +42,7 @@ class SeedPatternModel(Base):
     __table_args__ = (
         Index('idx_ticker_detection_date', 'ticker', 'detection_date'),
         Index('idx_ticker_status', 'ticker', 'status'),
+        Index('idx_status_detection_date', 'status', 'detection_date'),
     )
 
     def __repr__(self) -> str:
@@ -5,14 +5,44 @@ Database Query Helpers
 Note: 이 모듈은 주로 IncrementalCollector에서 사용됨.
       Repository 패턴과 중복되지 않는 복잡한 분석 쿼리만 포함.
 """
+from dataclasses import dataclass
 from datetime import date
 from typing import Dict, List, Optional, Tuple
-from sqlalchemy import func
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
 
 from .models import StockPrice, StockInfo
 
 
+# 연속 누락 거래일이 이 값 이상이면 거래정지 구간으로 분류
+SUSPENSION_MIN_DAYS = 5
+
+
+@dataclass
+class TickerCoverage:
+    """
+    시장 거래일 캘린더 대비 종목별 데이터 커버리지
+
+    거래일 캘린더는 stock_price 전체 종목 날짜의 합집합입니다.
+    (한 종목이라도 거래된 날 = 거래일)
+    """
+    ticker: str
+    first_date: Optional[date]
+    last_date: Optional[date]
+    record_count: int
+    expected_days: int  # first_date ~ last_date 사이 거래일 수
+    stale_days: int     # last_date 이후 캘린더 끝까지 거래일 수
+
+    @property
+    def missing_days(self) -> int:
+        """보유 구간 내 누락 거래일 수 (누락 + 거래정지)"""
+        return max(0, self.expected_days - self.record_count)
+
+    @property
+    def has_data(self) -> bool:
+        return self.record_count > 0
+
+
 def get_latest_dates_bulk(session: Session, tickers: List[str]) -> Dict[str, Optional[date]]:
     """
     여러 종목의 최신 날짜를 단일 쿼리로 조회 (성능 최적화)
@@ -228,50 +258,238 @@ def has_data_in_range(session: Session, ticker: str, fromdate: date, todate: dat
     return count > 0
 
 
-def get_missing_dates(session: Session, ticker: str, fromdate: date, todate: date) -> List[date]:
+def get_trading_calendar(session: Session, fromdate: date, todate: date) -> List[date]:
     """
-    특정 기간 중 데이터가 누락된 날짜 리스트 조회
-    (모든 날짜와 비교하는 것이 아니라, 기존 데이터의 gap 찾기)
+    시장 거래일 캘린더 조회 (stock_price 전체 날짜의 합집합)
 
     Args:
         session: DB 세션
-        ticker: 종목 코드
         fromdate: 시작 날짜
         todate: 종료 날짜
 
     Returns:
-        누락된 날짜 리스트
-
-    Note:
-        이 함수는 복잡한 쿼리가 필요하므로, 실제로는 Python에서 처리하는 것이 더 효율적일 수 있음
+        정렬된 거래일 리스트
     """
-    # 기존 데이터 조회
-    existing_dates = session.query(StockPrice.date).filter(
-        StockPrice.ticker == ticker,
+    results = session.query(StockPrice.date).filter(
         StockPrice.date >= fromdate,
         StockPrice.date <= todate
-    ).order_by(StockPrice.date).all()
+    ).distinct().order_by(StockPrice.date).all()
 
-    existing_dates = [d[0] for d in existing_dates]
+    return [d[0] for d in results]
 
-    if not existing_dates:
-        return []
 
-    # 연속된 날짜 중 누락된 날짜 찾기 (단순 버전 - 거래일 고려하지 않음)
-    missing = []
-    for i in range(len(existing_dates) - 1):
-        current = existing_dates[i]
-        next_date = existing_dates[i + 1]
-        gap_days = (next_date - current).days
+def _calendar_cte(fromdate: date, todate: date):
+    """거래일 캘린더 CTE (date, pos) - pos는 1부터 시작하는 거래일 순번"""
+    days = select(StockPrice.date.label('date')).where(
+        StockPrice.date >= fromdate,
+        StockPrice.date <= todate
+    ).distinct().subquery('trading_days')
+
+    return select(
+        days.c.date,
+        func.row_number().over(order_by=days.c.date).label('pos')
+    ).cte('calendar')
+
+
+def _spans_cte(fromdate: date, todate: date, tickers: Optional[List[str]]):
+    """종목별 보유 구간 CTE (ticker, first_date, last_date, record_count)"""
+    query = select(
+        StockPrice.ticker.label('ticker'),
+        func.min(StockPrice.date).label('first_date'),
+        func.max(StockPrice.date).label('last_date'),
+        func.count(StockPrice.id).label('record_count')
+    ).where(
+        StockPrice.date >= fromdate,
+        StockPrice.date <= todate
+    )
+    if tickers is not None:
+        query = query.where(StockPrice.ticker.in_(tickers))
+
+    return query.group_by(StockPrice.ticker).cte('spans')
+
+
+def get_coverage_bulk(
+    session: Session,
+    fromdate: date,
+    todate: date,
+    tickers: Optional[List[str]] = None
+) -> Dict[str, TickerCoverage]:
+    """
+    전 종목 거래일 커버리지를 단일 그룹 쿼리로 조회
+
+    거래일 캘린더에 순번(pos)을 매긴 뒤, 종목별 first/last 날짜의 순번 차이로
+    기대 거래일 수를 계산합니다. 날짜를 종목별로 Python에서 순회하지 않습니다.
+
+    Args:
+        session: DB 세션
+        fromdate: 시작 날짜
+        todate: 종료 날짜
+        tickers: 대상 종목 (None이면 데이터가 있는 전 종목)
+
+    Returns:
+        {ticker: TickerCoverage}
+        - tickers로 지정했지만 데이터가 없는 종목은 record_count=0
+
+    Example:
+        >>> coverage = get_coverage_bulk(session, date(2024, 1, 1), date(2024, 12, 31))
+        >>> [t for t, c in coverage.items() if c.missing_days > 0]
+        ['000660']
+    """
+    if tickers is not None and not tickers:
+        return {}
+
+    calendar = _calendar_cte(fromdate, todate)
+    spans = _spans_cte(fromdate, todate, tickers)
+    first_cal = calendar.alias('first_cal')
+    last_cal = calendar.alias('last_cal')
+    total_days = select(func.max(calendar.c.pos)).scalar_subquery()
+
+    results = session.execute(
+        select(
+            spans.c.ticker,
+            spans.c.first_date,
+            spans.c.last_date,
+            spans.c.record_count,
+            (last_cal.c.pos - first_cal.c.pos + 1).label('expected_days'),
+            (total_days - last_cal.c.pos).label('stale_days')
+        )
+        .join(first_cal, first_cal.c.date == spans.c.first_date)
+        .join(last_cal, last_cal.c.date == spans.c.last_date)
+    ).all()
+
+    coverage = {
+        row.ticker: TickerCoverage(
+            ticker=row.ticker,
+            first_date=row.first_date,
+            last_date=row.last_date,
+            record_count=row.record_count,
+            expected_days=row.expected_days,
+            stale_days=row.stale_days
+        )
+        for row in results
+    }
+
+    for ticker in tickers or []:
+        if ticker not in coverage:
+            coverage[ticker] = TickerCoverage(ticker, None, None, 0, 0, 0)
+
+    return coverage
+
+
+def get_missing_dates_bulk(
+    session: Session,
+    fromdate: date,
+    todate: date,
+    tickers: Optional[List[str]] = None,
+    coverage: Optional[Dict[str, TickerCoverage]] = None
+) -> Dict[str, List[date]]:
+    """
+    전 종목의 누락 거래일 조회 (보유 구간 내부 gap)
+
+    1. get_coverage_bulk()로 누락이 있는 종목만 추림
+    2. 해당 종목에 대해서만 캘린더 × 보유 구간 anti-join (단일 쿼리)
+
+    Args:
+        session: DB 세션
+        fromdate: 시작 날짜
+        todate: 종료 날짜
+        tickers: 대상 종목 (None이면 전 종목)
+        coverage: 이미 조회한 커버리지 (재사용 시)
 
-        # 3일 이상 gap이 있으면 의심 (주말 제외)
-        if gap_days > 3:
-            # 실제로는 거래일 캘린더가 필요하지만, 여기서는 단순화
-            pass
+    Returns:
+        {ticker: [누락 거래일, ...]} - 누락이 있는 종목만 포함
+    """
+    if coverage is None:
+        coverage = get_coverage_bulk(session, fromdate, todate, tickers)
+
+    gap_tickers = [ticker for ticker, c in coverage.items() if c.missing_days > 0]
+    if not gap_tickers:
+        return {}
+
+    calendar = _calendar_cte(fromdate, todate)
+    spans = _spans_cte(fromdate, todate, gap_tickers)
+
+    results = session.execute(
+        select(spans.c.ticker, calendar.c.date)
+        .join(
+            calendar,
+            calendar.c.date.between(spans.c.first_date, spans.c.last_date)
+        )
+        .where(
+            ~exists().where(
+                StockPrice.ticker == spans.c.ticker,
+                StockPrice.date == calendar.c.date
+            )
+        )
+        .order_by(spans.c.ticker, calendar.c.date)
+    ).all()
+
+    missing: Dict[str, List[date]] = {}
+    for ticker, missing_date in results:
+        missing.setdefault(ticker, []).append(missing_date)
 
     return missing
 
 
+def split_gap_runs(
+    missing_dates: List[date],
+    calendar: List[date],
+    suspension_min_days: int = SUSPENSION_MIN_DAYS
+) -> Tuple[List[date], List[Tuple[date, date]]]:
+    """
+    누락 거래일을 단발 누락과 거래정지 구간으로 분리
+
+    캘린더상 연속된 누락 거래일이 suspension_min_days 이상이면 거래정지로 봅니다.
+    (재수집해도 채워지지 않는 구간)
+
+    Args:
+        missing_dates: 정렬된 누락 거래일 리스트
+        calendar: get_trading_calendar() 결과
+        suspension_min_days: 거래정지 판정 최소 연속 거래일 수
+
+    Returns:
+        (단발 누락 거래일 리스트, [(정지 시작일, 정지 종료일), ...])
+    """
+    positions = {d: i for i, d in enumerate(calendar)}
+    runs: List[List[date]] = []
+
+    for missing_date in missing_dates:
+        if runs and positions[missing_date] == positions[runs[-1][-1]] + 1:
+            runs[-1].append(missing_date)
+        else:
+            runs.append([missing_date])
+
+    missing: List[date] = []
+    suspended: List[Tuple[date, date]] = []
+    for run in runs:
+        if len(run) >= suspension_min_days:
+            suspended.append((run[0], run[-1]))
+        else:
+            missing.extend(run)
+
+    return missing, suspended
+
+
+def get_missing_dates(session: Session, ticker: str, fromdate: date, todate: date) -> List[date]:
+    """
+    특정 기간 중 데이터가 누락된 거래일 리스트 조회
+    (시장 거래일 캘린더 기준, 보유 구간 내부 gap)
+
+    Args:
+        session: DB 세션
+        ticker: 종목 코드
+        fromdate: 시작 날짜
+        todate: 종료 날짜
+
+    Returns:
+        누락된 거래일 리스트
+
+    Note:
+        여러 종목은 get_missing_dates_bulk()를 사용하세요 (단일 쿼리).
+    """
+    return get_missing_dates_bulk(session, fromdate, todate, [ticker]).get(ticker, [])
+
+
 def get_tickers_without_data(session: Session, tickers: List[str]) -> List[str]:
     """
     데이터가 전혀 없는 종목 리스트 조회
@@ -312,12 +530,18 @@ def get_tickers_needing_update(
     Returns:
         업데이트가 필요한 종목 코드 리스트
     """
-    latest_dates = get_latest_dates_bulk(session, tickers)
+    if not tickers:
+        return []
 
-    needing_update = []
-    for ticker in tickers:
-        latest = latest_dates.get(ticker)
-        if latest is None or latest < target_date:
-            needing_update.append(ticker)
+    # 최신 상태인 종목만 조회 (HAVING으로 DB에서 필터링)
+    up_to_date = session.query(StockPrice.ticker).filter(
+        StockPrice.ticker.in_(tickers)
+    ).group_by(
+        StockPrice.ticker
+    ).having(
+        func.max(StockPrice.date) >= target_date
+    ).all()
+
+    up_to_date = {t[0] for t in up_to_date}
 
-    return needing_update
+    return [t for t in tickers if t not in up_to_date]
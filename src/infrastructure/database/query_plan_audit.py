@@ -0,0 +1,432 @@
+"""
+Query Plan Audit
+Repository / queries.py가 실행하는 쿼리의 SQLite 실행 계획 점검
+
+동작:
+1. capture(): Session의 do_orm_execute 이벤트로 실제 실행되는 SQL statement 수집
+2. run_repository_workload(): 모든 Repository 조회/삭제 메서드를 센티널 값으로 1회씩 실행
+   (결과가 0건이 되도록 존재하지 않는 ticker/id 사용, 마지막에 rollback)
+3. audit(): 각 statement에 대해 EXPLAIN QUERY PLAN 실행
+   - 풀 스캔 (SCAN <table>) 탐지
+   - 정렬/그룹용 임시 B-tree (USE TEMP B-TREE) 탐지
+4. 문제가 있는 statement의 WHERE/ORDER BY/GROUP BY에서 복합 인덱스 제안
+   (동등 조건 컬럼 → GROUP BY/ORDER BY 컬럼 → 범위 조건 컬럼 순)
+5. find_redundant_indexes(): 복합 인덱스의 선두 컬럼과 겹치는 단일 컬럼 인덱스 탐지
+
+Example:
+    >>> auditor = QueryPlanAuditor(session)
+    >>> with auditor.capture():
+    ...     run_repository_workload(session)
+    >>> findings = auditor.audit()
+    >>> [f.proposed_index for f in findings if f.has_problem]
+    [('ticker', 'status', 'started_at'), ...]
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.dml import Delete, Update
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, UnaryExpression
+from sqlalchemy.sql.schema import Column
+from sqlalchemy.sql.selectable import Select
+
+
+EQUALITY_OPERATORS = (operators.eq, operators.in_op)
+RANGE_OPERATORS = (operators.gt, operators.ge, operators.lt, operators.le)
+
+# 워크로드 센티널 값 (실제 데이터와 겹치지 않음)
+AUDIT_TICKER = '__audit__'
+AUDIT_ID = -1
+
+
+@dataclass
+class PlanFinding:
+    """EXPLAIN QUERY PLAN 점검 결과 (statement 1개)"""
+
+    name: str
+    sql: str
+    table: Optional[str]
+    plan: List[str]
+    full_scans: List[str] = field(default_factory=list)
+    temp_btree: List[str] = field(default_factory=list)
+    proposed_index: Optional[Tuple[str, ...]] = None
+
+    @property
+    def has_problem(self) -> bool:
+        """풀 스캔 또는 임시 B-tree 사용 여부"""
+        return bool(self.full_scans or self.temp_btree)
+
+
+@dataclass
+class RedundantIndex:
+    """삭제 후보 단일 컬럼 인덱스"""
+
+    table: str
+    index_name: str
+    column: str
+    covered_by: Tuple[str, ...]
+
+
+class QueryPlanAuditor:
+    """
+    SQLite 쿼리 실행 계획 감사기
+
+    Session에서 실행된 statement를 수집해 EXPLAIN QUERY PLAN으로 점검하고,
+    풀 스캔 / 임시 B-tree를 없앨 복합 인덱스를 제안합니다.
+    """
+
+    def __init__(self, session: Session):
+        """
+        Args:
+            session: 점검 대상 DB에 연결된 SQLAlchemy 세션
+        """
+        self.session = session
+        self._statements: Dict[str, object] = {}
+        self._table_names = set(inspect(session.get_bind()).get_table_names())
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """
+        블록 내에서 실행된 SELECT/UPDATE/DELETE statement 수집
+
+        컴파일된 SQL 문자열 기준으로 중복을 제거합니다 (query shape 단위).
+        """
+        def _on_execute(orm_execute_state):
+            statement = orm_execute_state.statement
+            is_filtered_dml = isinstance(statement, (Delete, Update)) \
+                and statement.whereclause is not None
+            if isinstance(statement, Select) or is_filtered_dml:
+                sql, _ = self._compile(statement)
+                self._statements.setdefault(sql, statement)
+
+        event.listen(self.session, 'do_orm_execute', _on_execute)
+        try:
+            yield
+        finally:
+            event.remove(self.session, 'do_orm_execute', _on_execute)
+
+    def add_statement(self, statement) -> None:
+        """statement 직접 등록 (캡처 없이 점검할 때)"""
+        sql, _ = self._compile(statement)
+        self._statements.setdefault(sql, statement)
+
+    @property
+    def statements(self) -> List[object]:
+        """수집된 statement 리스트"""
+        return list(self._statements.values())
+
+    def audit(self) -> List[PlanFinding]:
+        """
+        수집된 모든 statement의 실행 계획 점검
+
+        Returns:
+            PlanFinding 리스트 (수집 순서)
+        """
+        return [self.explain(statement) for statement in self._statements.values()]
+
+    def explain(self, statement) -> PlanFinding:
+        """
+        statement 1개에 대해 EXPLAIN QUERY PLAN 실행 및 분석
+
+        Args:
+            statement: SQLAlchemy Select/Update/Delete
+
+        Returns:
+            PlanFinding
+        """
+        sql, params = self._compile(statement)
+        rows = self.session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {sql}", params
+        ).all()
+        plan = [row[-1] for row in rows]
+
+        table = _target_table(statement)
+        finding = PlanFinding(
+            name=_shape_name(table, sql),
+            sql=sql,
+            table=table.name if table is not None else None,
+            plan=plan,
+            full_scans=[detail for detail in plan if _scanned_table(detail) in self._table_names],
+            temp_btree=[detail for detail in plan if 'USE TEMP B-TREE' in detail],
+        )
+
+        if finding.has_problem and table is not None:
+            finding.proposed_index = propose_index(statement, table)
+
+        return finding
+
+    def _compile(self, statement) -> Tuple[str, tuple]:
+        """statement → (SQLite SQL, positional 파라미터)"""
+        compiled = statement.compile(
+            dialect=self.session.get_bind().dialect,
+            compile_kwargs={'render_postcompile': True}
+        )
+        params = tuple(
+            _to_driver_value(compiled.params.get(name))
+            for name in (compiled.positiontup or [])
+        )
+        return str(compiled), params
+
+
+def propose_index(statement, table) -> Optional[Tuple[str, ...]]:
+    """
+    statement의 WHERE / GROUP BY / ORDER BY에서 복합 인덱스 컬럼 순서 제안
+
+    규칙 (Equality → Sort → Range):
+    1. 동등 조건(=, IN) 컬럼
+    2. GROUP BY 컬럼, 없으면 첫 ORDER BY 컬럼
+    3. 정렬 컬럼이 없으면 첫 범위 조건 컬럼
+
+    Returns:
+        컬럼 이름 튜플 (제안할 것이 없으면 None)
+    """
+    equality: List[str] = []
+    ranges: List[str] = []
+
+    for clause in _conjuncts(statement.whereclause):
+        if not isinstance(clause, BinaryExpression):
+            continue
+        column = clause.left
+        if not isinstance(column, Column) or column.table is not table or column.primary_key:
+            continue
+        if clause.operator in EQUALITY_OPERATORS:
+            _append_unique(equality, column.name)
+        elif clause.operator in RANGE_OPERATORS:
+            _append_unique(ranges, column.name)
+
+    # PK 조건으로만 한정된 결과(id IN (...))의 정렬은 인덱스 대상이 아님
+    if not equality and not ranges:
+        return None
+
+    columns = list(equality)
+    sort_columns = _table_columns(getattr(statement, '_group_by_clauses', ()), table) \
+        or _table_columns(getattr(statement, '_order_by_clauses', ()), table)[:1]
+
+    for name in sort_columns:
+        _append_unique(columns, name)
+    if not sort_columns and ranges:
+        _append_unique(columns, ranges[0])
+
+    return tuple(columns) or None
+
+
+def merge_proposals(proposals: Sequence[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+    """
+    중복 / 접두어 관계의 제안 인덱스 병합
+
+    (ticker,) 와 (ticker, started_at) 이 함께 제안되면 (ticker, started_at)만 남깁니다.
+    """
+    unique = sorted(set(proposals), key=len, reverse=True)
+    merged: List[Tuple[str, ...]] = []
+    for candidate in unique:
+        if not any(existing[:len(candidate)] == candidate for existing in merged):
+            merged.append(candidate)
+    return merged
+
+
+def summarize_proposals(findings: Sequence[PlanFinding]) -> Dict[str, List[Tuple[Tuple[str, ...], int]]]:
+    """
+    테이블별 제안 인덱스 병합 및 순위
+
+    Returns:
+        {table: [(컬럼 튜플, 해결되는 shape 수), ...]} (shape 수 내림차순)
+    """
+    by_table: Dict[str, List[Tuple[str, ...]]] = {}
+    for finding in findings:
+        if finding.proposed_index and finding.table:
+            by_table.setdefault(finding.table, []).append(finding.proposed_index)
+
+    summary = {}
+    for table, proposals in by_table.items():
+        ranked = [
+            (merged, sum(1 for p in proposals if merged[:len(p)] == p))
+            for merged in merge_proposals(proposals)
+        ]
+        summary[table] = sorted(ranked, key=lambda item: (-item[1], item[0]))
+    return summary
+
+
+def find_redundant_indexes(
+    session: Session,
+    table_name: str,
+    composite_indexes: Sequence[Tuple[str, ...]] = ()
+) -> List[RedundantIndex]:
+    """
+    복합 인덱스의 선두 컬럼과 겹치는 단일 컬럼 인덱스 탐지
+
+    단일 컬럼 인덱스 (X)는 X로 시작하는 복합 인덱스가 (기존 또는 제안) 있으면
+    조회에 기여하지 못하고 INSERT/UPDATE 비용만 늘립니다.
+
+    Args:
+        session: DB 세션
+        table_name: 테이블 이름
+        composite_indexes: 추가로 고려할 (제안된) 복합 인덱스 컬럼 튜플
+
+    Returns:
+        RedundantIndex 리스트
+    """
+    indexes = inspect(session.get_bind()).get_indexes(table_name)
+    composites = [
+        tuple(index['column_names']) for index in indexes if len(index['column_names']) > 1
+    ] + [tuple(columns) for columns in composite_indexes if len(columns) > 1]
+
+    redundant = []
+    for index in indexes:
+        if index.get('unique') or len(index['column_names']) != 1:
+            continue
+        column = index['column_names'][0]
+        covering = next((c for c in composites if c[0] == column), None)
+        if covering:
+            redundant.append(RedundantIndex(table_name, index['name'], column, covering))
+    return redundant
+
+
+def run_repository_workload(session: Session) -> None:
+    """
+    Repository / DetectionQueryBuilder / queries.py의 모든 조회·삭제 shape 1회씩 실행
+
+    존재하지 않는 ticker/id(센티널)를 사용하므로 결과는 0건이며,
+    중간 commit이 있는 메서드도 실제 데이터를 변경하지 않습니다.
+    호출자는 실행 후 rollback 하십시오.
+    """
+    # 순환 import 방지 (repositories → database.models)
+    from src.domain.entities.patterns import SeedPatternStatus, PatternStatus
+    from src.infrastructure.database import queries
+    from src.infrastructure.database.models import DynamicBlockDetectionModel
+    from src.infrastructure.repositories.common.query_builder import DetectionQueryBuilder
+    from src.infrastructure.repositories.dynamic_block_repository_impl import DynamicBlockRepositoryImpl
+    from src.infrastructure.repositories.seed_pattern_repository_impl import SeedPatternRepositoryImpl
+    from src.infrastructure.repositories.highlight_centric_pattern_repository_impl import (
+        HighlightCentricPatternRepositoryImpl
+    )
+
+    ticker = AUDIT_TICKER
+    start, end = date(2024, 1, 1), date(2024, 12, 31)
+
+    # DynamicBlockRepositoryImpl
+    blocks = DynamicBlockRepositoryImpl(session)
+    blocks.find_by_id(AUDIT_ID)
+    blocks.find_by_ticker(ticker)
+    blocks.find_by_ticker(ticker, condition_name='seed')
+    blocks.find_by_ticker(ticker, block_type=1)
+    blocks.find_by_ticker(ticker, condition_name='seed', block_type=1)
+    blocks.find_active_blocks(ticker)
+    blocks.find_active_blocks(ticker, block_id='block1')
+    blocks.find_by_pattern_id(AUDIT_ID)
+    blocks.find_by_date_range(ticker, start, end)
+    blocks.find_by_date_range(ticker, start, end, block_type=1)
+    blocks.find_by_min_spot_count(2, start, end)
+    blocks.find_by_min_spot_count(2, start, end, ticker=ticker, block_type=1)
+    blocks.find_by_min_redetection_count(1, start, end, ticker=ticker)
+    blocks.delete_by_ticker(ticker, condition_name='seed')
+
+    # DetectionQueryBuilder
+    DetectionQueryBuilder(session, DynamicBlockDetectionModel).by_ticker(ticker) \
+        .by_status('active').between_dates(start, end).order_by_started_date().all()
+    DetectionQueryBuilder(session, DynamicBlockDetectionModel).by_ticker(ticker) \
+        .by_completed().order_by_started_date(desc=True).limit(10).all()
+    DetectionQueryBuilder(session, DynamicBlockDetectionModel).by_ticker(ticker) \
+        .after_date(start).order_by_started_date().first()
+
+    # SeedPatternRepositoryImpl
+    seeds = SeedPatternRepositoryImpl(session)
+    seeds.find_by_id(AUDIT_ID)
+    seeds.find_by_name(ticker)
+    seeds.find_by_ticker(ticker)
+    seeds.find_by_ticker(ticker, status=SeedPatternStatus.ACTIVE)
+    seeds.find_active_patterns()
+    seeds.find_active_patterns(ticker)
+    seeds.find_by_date_range(start, end)
+    seeds.find_by_date_range(start, end, ticker)
+    seeds.find_by_block_feature(start, end, block_type=1, ticker=ticker)
+    seeds.count(ticker=ticker, status=SeedPatternStatus.ACTIVE)
+    seeds.delete_by_ticker(ticker)
+
+    # HighlightCentricPatternRepositoryImpl
+    highlights = HighlightCentricPatternRepositoryImpl(session)
+    highlights.find_by_ticker(ticker)
+    highlights.find_by_ticker(ticker, status=PatternStatus.ACTIVE)
+    highlights.find_by_date_range(ticker, start, end)
+    highlights.count_by_ticker(ticker, status=PatternStatus.ACTIVE)
+
+    # queries.py
+    queries.get_latest_dates_bulk(session, [ticker])
+    queries.get_earliest_dates_bulk(session, [ticker])
+    queries.get_date_range_bulk(session, [ticker])
+    queries.get_record_count_bulk(session, [ticker])
+    queries.get_collection_stats(session, ticker)
+    queries.has_data_in_range(session, ticker, start, end)
+    queries.get_missing_dates(session, ticker, start, end)
+    queries.get_tickers_without_data(session, [ticker])
+
+
+# ========== Private Helpers ==========
+
+def _conjuncts(clause) -> List[object]:
+    """AND로 연결된 WHERE 절을 개별 조건으로 분해"""
+    if clause is None:
+        return []
+    if isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+        return [c for sub in clause.clauses for c in _conjuncts(sub)]
+    return [clause]
+
+
+def _table_columns(clauses, table) -> List[str]:
+    """ORDER BY / GROUP BY 절에서 대상 테이블 컬럼 이름 추출 (DESC 등 unwrap)"""
+    names: List[str] = []
+    for clause in clauses:
+        while isinstance(clause, UnaryExpression):
+            clause = clause.element
+        if isinstance(clause, Column) and clause.table is table:
+            _append_unique(names, clause.name)
+    return names
+
+
+def _target_table(statement):
+    """단일 테이블 statement의 대상 테이블 (조인/복수 테이블이면 None)"""
+    if isinstance(statement, (Delete, Update)):
+        return statement.table
+    froms = statement.get_final_froms()
+    if len(froms) == 1 and hasattr(froms[0], 'columns') and hasattr(froms[0], 'indexes'):
+        return froms[0]
+    return None
+
+
+def _scanned_table(detail: str) -> Optional[str]:
+    """
+    SCAN <table> (인덱스 탐색 없는 전체 순회) 대상 이름
+
+    CTE / 서브쿼리 순회(SCAN spans, SCAN (subquery-1))도 같은 형태이므로
+    호출자가 실제 테이블 이름과 대조합니다.
+    """
+    parts = detail.split()
+    if len(parts) < 2 or parts[0] != 'SCAN':
+        return None
+    if parts[1] == 'TABLE' and len(parts) > 2:  # SQLite < 3.36 형식
+        return parts[2]
+    return parts[1]
+
+
+def _shape_name(table, sql: str) -> str:
+    """리포트용 짧은 이름"""
+    prefix = table.name if table is not None else 'multi-table'
+    where = sql.split('WHERE', 1)[-1] if 'WHERE' in sql else sql
+    return f"{prefix}: {' '.join(where.split())[:120]}"
+
+
+def _append_unique(items: List[str], value: str) -> None:
+    if value not in items:
+        items.append(value)
+
+
+def _to_driver_value(value):
+    """SQLite 저장 형식에 맞춘 파라미터 변환 (Date → ISO 문자열)"""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
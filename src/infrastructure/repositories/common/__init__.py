@@ -6,6 +6,8 @@ from .converters import bool_to_int, int_to_bool
 from .base_repository import BaseDetectionRepository, BaseConditionPresetRepository, with_session
 from .mixins import UUIDMixin, DurationCalculatorMixin, ConditionPresetMapperMixin
 from .query_builder import DetectionQueryBuilder
+from .bulk import chunked, DEFAULT_CHUNK_SIZE
+from .detail_rows import build_spot_rows, build_redetection_rows, build_block_feature_rows
 
 __all__ = [
     # Converters
@@ -22,4 +24,11 @@ __all__ = [
     'ConditionPresetMapperMixin',
     # Query Builders
     'DetectionQueryBuilder',
+    # Bulk persistence
+    'chunked',
+    'DEFAULT_CHUNK_SIZE',
+    # Detail row builders
+    'build_spot_rows',
+    'build_redetection_rows',
+    'build_block_feature_rows',
 ]
@@ -0,0 +1,33 @@
+"""
+Bulk Persistence Helpers
+대량 저장용 공통 유틸리티
+"""
+from typing import Iterator, List, Sequence, TypeVar
+
+
+T = TypeVar('T')
+
+# 청크당 최대 행 수 (multi-row INSERT/UPDATE 1회 분량)
+DEFAULT_CHUNK_SIZE = 500
+
+
+def chunked(items: Sequence[T], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[T]]:
+    """
+    시퀀스를 고정 크기 청크로 분할
+
+    Args:
+        items: 분할할 시퀀스
+        size: 청크 크기 (1 이상)
+
+    Yields:
+        최대 size개 원소를 가진 리스트
+
+    Example:
+        >>> list(chunked([1, 2, 3, 4, 5], 2))
+        [[1, 2], [3, 4], [5]]
+    """
+    if size < 1:
+        raise ValueError(f"chunk size must be >= 1, got {size}")
+
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
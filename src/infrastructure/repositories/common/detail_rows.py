@@ -0,0 +1,133 @@
+"""
+Detection Detail Row Builders
+JSON 컬럼 → 정규화 자식 테이블 행 변환
+
+Repository(dual-write)와 마이그레이션(backfill)이 같은 변환 규칙을 사용하도록
+JSON에 저장되는 딕셔너리 형태(spot dict, RedetectionEvent.to_dict(),
+BlockFeatures.to_dict())를 입력으로 받습니다.
+"""
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+def _to_date(value: Union[str, date, None]) -> Optional[date]:
+    """ISO 문자열 또는 date → date"""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def build_spot_rows(
+    block_detection_id: int,
+    ticker: str,
+    block_type: int,
+    started_at: Optional[date],
+    spots: Iterable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    spot 딕셔너리 리스트 → block_spot 행 리스트
+
+    Args:
+        block_detection_id: dynamic_block_detection.id
+        ticker: 종목 코드
+        block_type: 블록 타입
+        started_at: 블록 시작일
+        spots: custom_metadata['spots'] 형태의 딕셔너리 리스트
+
+    Returns:
+        BlockSpotModel 컬럼 딕셔너리 리스트
+    """
+    return [
+        {
+            'block_detection_id': block_detection_id,
+            'ticker': ticker,
+            'block_type': block_type,
+            'started_at': _to_date(started_at),
+            'spot_number': spot.get('spot_number', i),
+            'spot_date': _to_date(spot['date']),
+            'open_price': spot.get('open'),
+            'high_price': spot.get('high'),
+            'low_price': spot.get('low'),
+            'close_price': spot.get('close'),
+            'volume': spot.get('volume'),
+        }
+        for i, spot in enumerate(spots, 1)
+    ]
+
+
+def build_redetection_rows(
+    block_detection_id: int,
+    ticker: str,
+    block_type: int,
+    started_at: Optional[date],
+    redetections: Iterable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    RedetectionEvent 딕셔너리 리스트 → block_redetection 행 리스트
+
+    Args:
+        block_detection_id: dynamic_block_detection.id
+        ticker: 종목 코드
+        block_type: 블록 타입
+        started_at: 블록 시작일
+        redetections: RedetectionEvent.to_dict() 형태의 딕셔너리 리스트
+
+    Returns:
+        BlockRedetectionModel 컬럼 딕셔너리 리스트
+    """
+    return [
+        {
+            'block_detection_id': block_detection_id,
+            'ticker': ticker,
+            'block_type': block_type,
+            'started_at': _to_date(started_at),
+            'sequence': redet['sequence'],
+            'parent_block_id': redet['parent_block_id'],
+            'redetection_started_at': _to_date(redet['started_at']),
+            'redetection_ended_at': _to_date(redet.get('ended_at')),
+            'peak_price': redet.get('peak_price'),
+            'peak_volume': redet.get('peak_volume'),
+            'status': redet.get('status', 'active'),
+        }
+        for redet in redetections
+    ]
+
+
+def build_block_feature_rows(
+    seed_pattern_id: int,
+    ticker: str,
+    block_features: Iterable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    BlockFeatures 딕셔너리 리스트 → seed_pattern_block_feature 행 리스트
+
+    Args:
+        seed_pattern_id: seed_pattern.id
+        ticker: 종목 코드
+        block_features: BlockFeatures.to_dict() 형태의 딕셔너리 리스트
+
+    Returns:
+        SeedPatternBlockFeatureModel 컬럼 딕셔너리 리스트
+    """
+    return [
+        {
+            'seed_pattern_id': seed_pattern_id,
+            'ticker': ticker,
+            'position': position,
+            'block_id': feature['block_id'],
+            'block_type': feature['block_type'],
+            'condition_name': (feature.get('metadata') or {}).get('condition_name'),
+            'started_at': _to_date(feature['started_at']),
+            'ended_at': _to_date(feature.get('ended_at')),
+            'duration_candles': feature['duration_candles'],
+            'low_price': feature['low_price'],
+            'high_price': feature['high_price'],
+            'peak_price': feature['peak_price'],
+            'peak_date': _to_date(feature['peak_date']),
+            'min_volume': feature['min_volume'],
+            'max_volume': feature['max_volume'],
+            'peak_volume': feature['peak_volume'],
+            'avg_volume': feature['avg_volume'],
+        }
+        for position, feature in enumerate(block_features)
+    ]
@@ -5,10 +5,20 @@ DynamicBlockRepository 구현체
 from typing import List, Optional
 from datetime import date
 from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, delete, func
 
 from src.domain.repositories.dynamic_block_repository import DynamicBlockRepository
 from src.domain.entities.detections import DynamicBlockDetection, BlockStatus, RedetectionEvent
 from src.infrastructure.database.models.dynamic_block_detection_model import DynamicBlockDetectionModel
+from src.infrastructure.database.models.detection_detail_models import (
+    BlockSpotModel,
+    BlockRedetectionModel
+)
+from src.infrastructure.repositories.common.bulk import chunked, DEFAULT_CHUNK_SIZE
+from src.infrastructure.repositories.common.detail_rows import (
+    build_spot_rows,
+    build_redetection_rows
+)
 
 
 class DynamicBlockRepositoryImpl(DynamicBlockRepository):
@@ -46,16 +56,77 @@ class DynamicBlockRepositoryImpl(DynamicBlockRepository):
                 self.session.flush()
                 detection.id = model.id
 
+        self._sync_detail_rows([detection])
         self.session.commit()
         return detection
 
-    def save_all(self, detections: List[DynamicBlockDetection]) -> List[DynamicBlockDetection]:
-        """여러 블록 일괄 저장"""
-        saved_detections = []
-        for detection in detections:
-            saved = self.save(detection)
-            saved_detections.append(saved)
-        return saved_detections
+    def save_all(
+        self,
+        detections: List[DynamicBlockDetection],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> List[DynamicBlockDetection]:
+        """
+        여러 블록 일괄 저장 - 청크 단위 multi-row INSERT/UPDATE, 단일 commit
+
+        - id 없는 블록: multi-row INSERT ... RETURNING id 로 ID 할당
+        - id 있는 블록: 존재하는 ID는 bulk UPDATE, DB에 없는 ID는 그대로 INSERT
+
+        save()를 반복 호출할 때의 블록당 flush/commit을 피합니다.
+        """
+        self.bulk_save(detections, chunk_size=chunk_size)
+        self.session.commit()
+        return detections
+
+    def bulk_save(
+        self,
+        detections: List[DynamicBlockDetection],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """
+        블록 일괄 기록 (commit 없음)
+
+        트랜잭션 경계를 호출자가 관리해야 할 때 사용합니다
+        (예: 패턴 + 블록을 하나의 트랜잭션으로 저장).
+
+        Args:
+            detections: 저장할 블록 리스트 (신규 블록은 id가 할당됨)
+            chunk_size: INSERT/UPDATE 1회당 최대 행 수
+        """
+        new_detections = [d for d in detections if d.id is None]
+        known_detections = [d for d in detections if d.id is not None]
+
+        for chunk in chunked(known_detections, chunk_size):
+            found_ids = set(self.session.execute(
+                select(DynamicBlockDetectionModel.id)
+                .where(DynamicBlockDetectionModel.id.in_([d.id for d in chunk]))
+            ).scalars())
+
+            update_rows = [
+                {'id': d.id, **self._to_row(d)} for d in chunk if d.id in found_ids
+            ]
+            # 모델이 없으면 기존 ID로 새로 생성 (save()와 동일)
+            insert_rows = [
+                {'id': d.id, **self._to_row(d)} for d in chunk if d.id not in found_ids
+            ]
+
+            if update_rows:
+                self.session.execute(update(DynamicBlockDetectionModel), update_rows)
+            if insert_rows:
+                self.session.execute(insert(DynamicBlockDetectionModel), insert_rows)
+
+        for chunk in chunked(new_detections, chunk_size):
+            new_ids = self.session.execute(
+                insert(DynamicBlockDetectionModel).returning(
+                    DynamicBlockDetectionModel.id, sort_by_parameter_order=True
+                ),
+                [self._to_row(d) for d in chunk]
+            ).scalars().all()
+
+            for detection, new_id in zip(chunk, new_ids):
+                detection.id = new_id
+
+        self._sync_detail_rows(detections, chunk_size=chunk_size)
+        self.session.flush()
 
     def find_by_id(self, detection_id: int) -> Optional[DynamicBlockDetection]:
         """ID로 블록 조회"""
@@ -130,8 +201,37 @@ class DynamicBlockRepositoryImpl(DynamicBlockRepository):
         models = query.order_by(DynamicBlockDetectionModel.started_at).all()
         return [self._to_entity(m) for m in models]
 
+    def find_by_min_spot_count(
+        self,
+        min_spots: int,
+        start_date: date,
+        end_date: date,
+        ticker: Optional[str] = None,
+        block_type: Optional[int] = None
+    ) -> List[DynamicBlockDetection]:
+        """spot 개수 조건으로 블록 조회 (block_spot 집계)"""
+        return self._find_by_detail_count(
+            BlockSpotModel, min_spots, start_date, end_date, ticker, block_type
+        )
+
+    def find_by_min_redetection_count(
+        self,
+        min_redetections: int,
+        start_date: date,
+        end_date: date,
+        ticker: Optional[str] = None,
+        block_type: Optional[int] = None
+    ) -> List[DynamicBlockDetection]:
+        """재탐지 횟수 조건으로 블록 조회 (block_redetection 집계)"""
+        return self._find_by_detail_count(
+            BlockRedetectionModel, min_redetections, start_date, end_date, ticker, block_type
+        )
+
     def delete_by_id(self, detection_id: int) -> bool:
         """ID로 블록 삭제"""
+        self._delete_detail_rows(
+            DynamicBlockDetectionModel.id == detection_id
+        )
         result = self.session.query(DynamicBlockDetectionModel).filter_by(
             id=detection_id
         ).delete()
@@ -141,46 +241,138 @@ class DynamicBlockRepositoryImpl(DynamicBlockRepository):
 
     def delete_by_ticker(self, ticker: str, condition_name: Optional[str] = None) -> int:
         """종목의 블록 삭제"""
-        query = self.session.query(DynamicBlockDetectionModel).filter_by(ticker=ticker)
+        filters = [DynamicBlockDetectionModel.ticker == ticker]
 
         if condition_name:
-            query = query.filter_by(condition_name=condition_name)
+            filters.append(DynamicBlockDetectionModel.condition_name == condition_name)
 
-        count = query.delete()
+        self._delete_detail_rows(*filters)
+        count = self.session.query(DynamicBlockDetectionModel).filter(*filters).delete()
         self.session.commit()
         return count
 
     # ========== Private Helper Methods ==========
 
+    def _sync_detail_rows(
+        self,
+        detections: List[DynamicBlockDetection],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """
+        정규화 자식 테이블(block_spot, block_redetection)을 엔티티 상태로 교체
+
+        블록 ID 청크마다 기존 행을 삭제하고 multi-row INSERT로 다시 기록합니다.
+        """
+        for chunk in chunked(detections, chunk_size):
+            block_ids = [d.id for d in chunk]
+            for detail_model in (BlockSpotModel, BlockRedetectionModel):
+                self.session.execute(
+                    delete(detail_model).where(detail_model.block_detection_id.in_(block_ids))
+                )
+
+            spot_rows = []
+            redetection_rows = []
+            for d in chunk:
+                spot_rows.extend(build_spot_rows(
+                    d.id, d.ticker, d.block_type, d.started_at, d.get_spots()
+                ))
+                redetection_rows.extend(build_redetection_rows(
+                    d.id, d.ticker, d.block_type, d.started_at,
+                    [redet.to_dict() for redet in d.redetections]
+                ))
+
+            if spot_rows:
+                self.session.execute(insert(BlockSpotModel), spot_rows)
+            if redetection_rows:
+                self.session.execute(insert(BlockRedetectionModel), redetection_rows)
+
+    def _delete_detail_rows(self, *block_filters) -> None:
+        """블록 삭제 전 자식 테이블 행 삭제 (SQLite는 FK CASCADE가 기본 비활성)"""
+        block_ids = select(DynamicBlockDetectionModel.id).where(*block_filters)
+        for detail_model in (BlockSpotModel, BlockRedetectionModel):
+            self.session.execute(
+                delete(detail_model)
+                .where(detail_model.block_detection_id.in_(block_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+    def _find_by_detail_count(
+        self,
+        detail_model,
+        min_count: int,
+        start_date: date,
+        end_date: date,
+        ticker: Optional[str],
+        block_type: Optional[int]
+    ) -> List[DynamicBlockDetection]:
+        """
+        자식 테이블 행 수로 블록 필터링
+
+        (ticker, block_type, started_at) 커버링 인덱스만으로 집계한 뒤
+        조건을 만족하는 블록만 로드합니다.
+
+        자식 행에서 출발하는 집계라 자식 행이 없는 블록(count 0)은 결과에 포함될 수
+        없으므로 min_count < 1은 거부합니다.
+
+        Raises:
+            ValueError: min_count < 1
+        """
+        if min_count < 1:
+            raise ValueError(
+                f"min_count must be >= 1, got {min_count} (use find_by_date_range for all blocks)"
+            )
+
+        matching_ids = select(detail_model.block_detection_id).where(
+            detail_model.started_at >= start_date,
+            detail_model.started_at <= end_date
+        )
+        if ticker:
+            matching_ids = matching_ids.where(detail_model.ticker == ticker)
+        if block_type is not None:
+            matching_ids = matching_ids.where(detail_model.block_type == block_type)
+
+        matching_ids = matching_ids.group_by(
+            detail_model.block_detection_id
+        ).having(func.count() >= min_count)
+
+        models = self.session.query(DynamicBlockDetectionModel).filter(
+            DynamicBlockDetectionModel.id.in_(matching_ids)
+        ).order_by(DynamicBlockDetectionModel.started_at).all()
+
+        return [self._to_entity(m) for m in models]
+
     def _to_model(self, entity: DynamicBlockDetection) -> DynamicBlockDetectionModel:
         """Entity → ORM Model 변환"""
+        return DynamicBlockDetectionModel(id=entity.id, **self._to_row(entity))
+
+    def _to_row(self, entity: DynamicBlockDetection) -> dict:
+        """Entity → 컬럼 딕셔너리 변환 (bulk INSERT/UPDATE용, id 제외)"""
         # Metadata에 redetections 추가 (NEW - 2025-10-25)
         metadata = entity.metadata.copy()
         if entity.redetections:
             metadata['redetections'] = [redet.to_dict() for redet in entity.redetections]
 
-        return DynamicBlockDetectionModel(
-            id=entity.id,
-            block_id=entity.block_id,
-            block_type=entity.block_type,
-            ticker=entity.ticker,
-            pattern_id=entity.pattern_id,
-            condition_name=entity.condition_name,
-            started_at=entity.started_at,
-            ended_at=entity.ended_at,
-            status=entity.status.value,
-            peak_price=entity.peak_price,
-            peak_volume=entity.peak_volume,
-            peak_date=entity.peak_date,
-            prev_close=entity.prev_close,
-            parent_blocks=entity.parent_blocks,
-            custom_metadata=metadata,
+        return {
+            'block_id': entity.block_id,
+            'block_type': entity.block_type,
+            'ticker': entity.ticker,
+            'pattern_id': entity.pattern_id,
+            'condition_name': entity.condition_name,
+            'started_at': entity.started_at,
+            'ended_at': entity.ended_at,
+            'status': entity.status.value,
+            'peak_price': entity.peak_price,
+            'peak_volume': entity.peak_volume,
+            'peak_date': entity.peak_date,
+            'prev_close': entity.prev_close,
+            'parent_blocks': entity.parent_blocks,
+            'custom_metadata': metadata,
             # Virtual Block System 필드 (NEW - 2025-10-26)
-            yaml_type=entity.yaml_type,
-            logical_level=entity.logical_level,
-            pattern_sequence=entity.pattern_sequence,
-            is_virtual=entity.is_virtual
-        )
+            'yaml_type': entity.yaml_type,
+            'logical_level': entity.logical_level,
+            'pattern_sequence': entity.pattern_sequence,
+            'is_virtual': entity.is_virtual
+        }
 
     def _update_model(self, model: DynamicBlockDetectionModel, entity: DynamicBlockDetection) -> None:
         """기존 모델 업데이트"""
@@ -3,14 +3,17 @@ Seed Pattern Repository Implementation
 
 SQLAlchemy 기반 Seed Pattern 저장소 구현
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, select, insert, update, delete
 
 from src.domain.repositories.seed_pattern_repository import SeedPatternRepository
 from src.domain.entities.patterns import SeedPattern, SeedPatternStatus, BlockFeatures
 from src.infrastructure.database.models.seed_pattern_model import SeedPatternModel
+from src.infrastructure.database.models.detection_detail_models import SeedPatternBlockFeatureModel
+from src.infrastructure.repositories.common.bulk import chunked, DEFAULT_CHUNK_SIZE
+from src.infrastructure.repositories.common.detail_rows import build_block_feature_rows
 
 
 class SeedPatternRepositoryImpl(SeedPatternRepository):
@@ -49,14 +52,72 @@ class SeedPatternRepositoryImpl(SeedPatternRepository):
                 self.session.add(model)
 
         self.session.flush()
+        self._sync_feature_rows([(model.id, seed_pattern)])
         return self._to_entity(model)
 
-    def save_all(self, seed_patterns: List[SeedPattern]) -> List[SeedPattern]:
-        """여러 seed pattern 일괄 저장"""
-        saved = []
-        for seed_pattern in seed_patterns:
-            saved.append(self.save(seed_pattern))
-        return saved
+    def save_all(
+        self,
+        seed_patterns: List[SeedPattern],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> List[SeedPattern]:
+        """
+        여러 seed pattern 일괄 저장 - 청크 단위 UPSERT
+
+        pattern_name(자연키) 기준으로 중복을 제거한 뒤(마지막 값 우선),
+        청크마다 기존 ID를 한 번에 조회하고 multi-row INSERT / UPDATE로 기록합니다.
+        save()를 반복 호출할 때의 행 단위 조회/flush를 피합니다.
+
+        엔티티의 id는 DB에 존재할 때만 사용합니다. rollback된 INSERT로 할당된 id를
+        가진 엔티티를 다시 저장하면 새로 INSERT됩니다.
+
+        Note:
+            commit은 호출자 책임입니다 (save()와 동일).
+        """
+        unique = {p.pattern_name: p for p in seed_patterns}
+        names = list(unique)
+
+        for name_chunk in chunked(names, chunk_size):
+            ids = dict(self.session.execute(
+                select(SeedPatternModel.pattern_name, SeedPatternModel.id)
+                .where(SeedPatternModel.pattern_name.in_(name_chunk))
+            ).all())
+            claimed_ids = [unique[name].id for name in name_chunk if unique[name].id]
+            found_ids = set(self.session.execute(
+                select(SeedPatternModel.id).where(SeedPatternModel.id.in_(claimed_ids))
+            ).scalars()) if claimed_ids else set()
+
+            insert_rows = []
+            update_rows = []
+            for name in name_chunk:
+                entity = unique[name]
+                row = self._to_row(entity)
+                existing_id = entity.id if entity.id in found_ids else ids.get(name)
+                if existing_id:
+                    row['id'] = existing_id
+                    ids[name] = existing_id
+                    update_rows.append(row)
+                else:
+                    insert_rows.append(row)
+
+            if insert_rows:
+                inserted = self.session.execute(
+                    insert(SeedPatternModel).returning(
+                        SeedPatternModel.pattern_name, SeedPatternModel.id
+                    ),
+                    insert_rows
+                )
+                ids.update(inserted.all())
+
+            if update_rows:
+                self.session.execute(update(SeedPatternModel), update_rows)
+
+            for name in name_chunk:
+                unique[name].id = ids[name]
+
+            self._sync_feature_rows([(ids[name], unique[name]) for name in name_chunk])
+
+        self.session.flush()
+        return list(unique.values())
 
     def find_by_id(self, seed_pattern_id: int) -> Optional[SeedPattern]:
         """ID로 seed pattern 조회"""
@@ -112,6 +173,31 @@ class SeedPatternRepositoryImpl(SeedPatternRepository):
         models = query.order_by(SeedPatternModel.detection_date.desc()).all()
         return [self._to_entity(m) for m in models]
 
+    def find_by_block_feature(
+        self,
+        start_date: date,
+        end_date: date,
+        block_type: Optional[int] = None,
+        ticker: Optional[str] = None,
+        min_peak_price: Optional[float] = None
+    ) -> List[SeedPattern]:
+        """블록 특징 조건으로 seed pattern 조회 (seed_pattern_block_feature 인덱스 사용)"""
+        matching_ids = select(SeedPatternBlockFeatureModel.seed_pattern_id).where(
+            SeedPatternBlockFeatureModel.started_at >= start_date,
+            SeedPatternBlockFeatureModel.started_at <= end_date
+        )
+        if block_type is not None:
+            matching_ids = matching_ids.where(SeedPatternBlockFeatureModel.block_type == block_type)
+        if ticker:
+            matching_ids = matching_ids.where(SeedPatternBlockFeatureModel.ticker == ticker)
+        if min_peak_price is not None:
+            matching_ids = matching_ids.where(SeedPatternBlockFeatureModel.peak_price >= min_peak_price)
+
+        models = self.session.query(SeedPatternModel).filter(
+            SeedPatternModel.id.in_(matching_ids)
+        ).order_by(SeedPatternModel.detection_date.desc()).all()
+        return [self._to_entity(m) for m in models]
+
     def find_all(
         self,
         status: Optional[SeedPatternStatus] = None,
@@ -154,12 +240,14 @@ class SeedPatternRepositoryImpl(SeedPatternRepository):
         if not model:
             return False
 
+        self._delete_feature_rows(SeedPatternModel.id == seed_pattern_id)
         self.session.delete(model)
         self.session.flush()
         return True
 
     def delete_by_ticker(self, ticker: str) -> int:
         """종목의 모든 seed pattern 삭제"""
+        self._delete_feature_rows(SeedPatternModel.ticker == ticker)
         count = self.session.query(SeedPatternModel).filter_by(ticker=ticker).delete()
         self.session.flush()
         return count
@@ -180,21 +268,55 @@ class SeedPatternRepositoryImpl(SeedPatternRepository):
 
     # === Private methods ===
 
+    def _sync_feature_rows(self, saved: List[Tuple[int, SeedPattern]]) -> None:
+        """
+        seed_pattern_block_feature 행을 엔티티의 block_features로 교체
+
+        Args:
+            saved: (seed_pattern.id, SeedPattern) 리스트
+        """
+        self.session.execute(
+            delete(SeedPatternBlockFeatureModel).where(
+                SeedPatternBlockFeatureModel.seed_pattern_id.in_([pid for pid, _ in saved])
+            )
+        )
+
+        rows = []
+        for pattern_id, entity in saved:
+            rows.extend(build_block_feature_rows(
+                pattern_id, entity.ticker, [f.to_dict() for f in entity.block_features]
+            ))
+
+        if rows:
+            self.session.execute(insert(SeedPatternBlockFeatureModel), rows)
+
+    def _delete_feature_rows(self, *pattern_filters) -> None:
+        """패턴 삭제 전 block feature 행 삭제 (SQLite는 FK CASCADE가 기본 비활성)"""
+        pattern_ids = select(SeedPatternModel.id).where(*pattern_filters)
+        self.session.execute(
+            delete(SeedPatternBlockFeatureModel)
+            .where(SeedPatternBlockFeatureModel.seed_pattern_id.in_(pattern_ids))
+            .execution_options(synchronize_session=False)
+        )
+
     def _to_model(self, entity: SeedPattern) -> SeedPatternModel:
         """Entity → Model 변환"""
-        return SeedPatternModel(
-            id=entity.id,
-            pattern_name=entity.pattern_name,
-            ticker=entity.ticker,
-            yaml_config_path=entity.yaml_config_path,
-            detection_date=entity.detection_date,
-            block_features=[f.to_dict() for f in entity.block_features],
-            price_shape=entity.price_shape,
-            volume_shape=entity.volume_shape,
-            status=entity.status.value,
-            description=entity.description,
-            custom_metadata=entity.metadata or {}
-        )
+        return SeedPatternModel(id=entity.id, **self._to_row(entity))
+
+    def _to_row(self, entity: SeedPattern) -> dict:
+        """Entity → 컬럼 딕셔너리 변환 (bulk INSERT/UPDATE용, id 제외)"""
+        return {
+            'pattern_name': entity.pattern_name,
+            'ticker': entity.ticker,
+            'yaml_config_path': entity.yaml_config_path,
+            'detection_date': entity.detection_date,
+            'block_features': [f.to_dict() for f in entity.block_features],
+            'price_shape': entity.price_shape,
+            'volume_shape': entity.volume_shape,
+            'status': entity.status.value,
+            'description': entity.description,
+            'custom_metadata': entity.metadata or {}
+        }
 
     def _update_model(self, model: SeedPatternModel, entity: SeedPattern) -> None:
         """Model 업데이트 (기존 모델에 entity 값 반영)"""
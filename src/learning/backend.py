@@ -0,0 +1,69 @@
+"""
+Lazy ML Backend Loader
+
+TensorFlow 지연 import
+
+Importing TensorFlow costs seconds of startup and hundreds of MB of RSS. Learning
+modules reference it only through these accessors, so the import happens the first
+time a model is actually built, loaded or run; metric / dataset paths never pay it.
+
+Type annotations use ``if TYPE_CHECKING: import tensorflow as tf`` together with
+``from __future__ import annotations``.
+
+Example:
+    >>> from src.learning import backend
+    >>> model = backend.keras().models.load_model(path)
+"""
+import importlib
+import os
+import sys
+import time
+from typing import Any, Optional
+
+_tensorflow: Optional[Any] = None
+_import_seconds: Optional[float] = None
+
+
+def tensorflow():
+    """Import and return the tensorflow module (first call only pays the import)"""
+    global _tensorflow, _import_seconds
+    if _tensorflow is None:
+        start = time.perf_counter()
+        _tensorflow = importlib.import_module('tensorflow')
+        _import_seconds = time.perf_counter() - start
+    return _tensorflow
+
+
+def keras():
+    """tf.keras"""
+    return tensorflow().keras
+
+
+def is_loaded() -> bool:
+    """Whether TensorFlow has been imported in this process (by anyone)"""
+    return _tensorflow is not None or 'tensorflow' in sys.modules
+
+
+def import_seconds() -> Optional[float]:
+    """Time spent importing TensorFlow through this loader (None if not imported yet)"""
+    return _import_seconds
+
+
+def set_thread_limits(intra_op: int, inter_op: int = 1):
+    """
+    Limit TensorFlow's thread pools (call before the first op runs)
+
+    Sets TF_NUM_INTRAOP_THREADS / TF_NUM_INTEROP_THREADS so a later import picks
+    them up, and applies them directly if TensorFlow is already imported.
+    """
+    os.environ['TF_NUM_INTRAOP_THREADS'] = str(intra_op)
+    os.environ['TF_NUM_INTEROP_THREADS'] = str(inter_op)
+
+    if _tensorflow is None:
+        return
+    try:
+        _tensorflow.config.threading.set_intra_op_parallelism_threads(intra_op)
+        _tensorflow.config.threading.set_inter_op_parallelism_threads(inter_op)
+    except RuntimeError:
+        # Runtime already initialized; the pools keep their size
+        pass
@@ -0,0 +1,38 @@
+"""
+Dataset Module
+
+윈도우 시퀀스 텐서 생성, shard 저장 및 학습 입력 스트리밍
+"""
+from src.learning.dataset.sequence_builder import (
+    SequenceDatasetBuilder,
+    TickerWindows,
+    sliding_windows,
+    label_days,
+)
+from src.learning.dataset.shard_store import (
+    DatasetIndex,
+    ShardInfo,
+    ShardWriter,
+    ShardedSequenceDataset,
+)
+from src.learning.dataset.data_source import (
+    DataSource,
+    ArrayDataSource,
+    ShardedDataSource,
+    prefetch_batches,
+)
+
+__all__ = [
+    'SequenceDatasetBuilder',
+    'TickerWindows',
+    'sliding_windows',
+    'label_days',
+    'DatasetIndex',
+    'ShardInfo',
+    'ShardWriter',
+    'ShardedSequenceDataset',
+    'DataSource',
+    'ArrayDataSource',
+    'ShardedDataSource',
+    'prefetch_batches',
+]
@@ -0,0 +1,342 @@
+"""
+Training Data Sources
+
+학습 / 평가 입력 파이프라인 (in-memory 배열 또는 on-disk shard 스트리밍)
+
+ModelTrainer.train / evaluate accept a DataSource in place of X/y arrays. A
+ShardedDataSource reads memmapped shards in parallel on a thread pool, mixes them
+through a shuffle buffer, and prefetches batches on a background thread, so the
+training set size is bounded by disk rather than memory. All randomness derives
+from one seed (TrainingConfig.random_seed) and the epoch number.
+"""
+import math
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.learning import backend
+from src.learning.dataset.shard_store import ShardedSequenceDataset
+
+Batch = Tuple[np.ndarray, np.ndarray]
+
+
+class DataSource:
+    """
+    Batch source interface
+
+    Subclasses implement __len__, sample_shape, num_classes, iter_batches and split.
+    """
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def sample_shape(self) -> Tuple[int, ...]:
+        """Shape of one sample (without batch axis)"""
+        raise NotImplementedError
+
+    def num_classes(self) -> int:
+        """max(label) + 1"""
+        raise NotImplementedError
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        shuffle: bool = False,
+        seed: int = 0,
+        epoch: int = 0
+    ) -> Iterator[Batch]:
+        """
+        Yield (X, y) batches for one epoch
+
+        Args:
+            batch_size: Samples per batch (last batch may be smaller)
+            shuffle: Shuffle sample order
+            seed: Base seed
+            epoch: Epoch number (mixed into the seed so each epoch differs deterministically)
+        """
+        raise NotImplementedError
+
+    def split(self, validation_fraction: float) -> Tuple['DataSource', 'DataSource']:
+        """(train, validation) sources; validation = trailing fraction (like Keras validation_split)"""
+        raise NotImplementedError
+
+    def steps(self, batch_size: int) -> int:
+        """Batches per epoch"""
+        return math.ceil(len(self) / batch_size)
+
+    def labels(self) -> np.ndarray:
+        """All labels in source order"""
+        raise NotImplementedError
+
+    def to_tf_dataset(
+        self,
+        batch_size: int,
+        shuffle: bool = False,
+        seed: int = 0,
+        prefetch: int = 2,
+        repeat: bool = False
+    ):
+        """
+        tf.data pipeline over iter_batches
+
+        Each iteration (Keras epoch) re-invokes the generator with the next epoch number.
+
+        Args:
+            batch_size: Samples per batch
+            shuffle: Shuffle per epoch
+            seed: Shuffle seed
+            prefetch: Batches read ahead in a background thread
+            repeat: Repeat indefinitely; pair with steps(batch_size) as Keras
+                steps_per_epoch / validation_steps so each repetition is one epoch
+        """
+        tf = backend.tensorflow()
+
+        epoch_counter = iter(range(1 << 62))
+
+        def generator():
+            epoch = next(epoch_counter)
+            yield from prefetch_batches(
+                self.iter_batches(batch_size, shuffle=shuffle, seed=seed, epoch=epoch),
+                prefetch
+            )
+
+        signature = (
+            tf.TensorSpec(shape=(None, *self.sample_shape), dtype=tf.float32),
+            tf.TensorSpec(shape=(None,), dtype=tf.int32),
+        )
+        dataset = tf.data.Dataset.from_generator(generator, output_signature=signature)
+        if repeat:
+            dataset = dataset.repeat()
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+
+def _epoch_rng(seed: int, epoch: int) -> np.random.Generator:
+    return np.random.default_rng([seed, epoch])
+
+
+def _split_count(total: int, validation_fraction: float) -> int:
+    if not 0.0 < validation_fraction < 1.0:
+        raise ValueError(f"validation_fraction must be in (0, 1), got {validation_fraction}")
+    return total - int(total * validation_fraction)
+
+
+class ArrayDataSource(DataSource):
+    """In-memory X / y arrays (splits are views, not copies)"""
+
+    def __init__(self, X: np.ndarray, y: np.ndarray):
+        if len(X) != len(y):
+            raise ValueError("X and y must have same length")
+        self.X = X
+        self.y = y
+
+    def __len__(self) -> int:
+        return len(self.X)
+
+    @property
+    def sample_shape(self) -> Tuple[int, ...]:
+        return tuple(self.X.shape[1:])
+
+    def num_classes(self) -> int:
+        return int(np.max(self.y) + 1)
+
+    def labels(self) -> np.ndarray:
+        return np.asarray(self.y)
+
+    def iter_batches(self, batch_size, shuffle=False, seed=0, epoch=0):
+        order = _epoch_rng(seed, epoch).permutation(len(self)) if shuffle else None
+
+        for start in range(0, len(self), batch_size):
+            if order is None:
+                yield self.X[start:start + batch_size], self.y[start:start + batch_size]
+            else:
+                idx = np.sort(order[start:start + batch_size])
+                yield self.X[idx], self.y[idx]
+
+    def split(self, validation_fraction):
+        cut = _split_count(len(self), validation_fraction)
+        return (
+            ArrayDataSource(self.X[:cut], self.y[:cut]),
+            ArrayDataSource(self.X[cut:], self.y[cut:])
+        )
+
+
+class ShardedDataSource(DataSource):
+    """
+    Streaming source over a shard directory (see ShardWriter)
+
+    Per epoch: shard order is shuffled, shards are read ahead on num_workers threads,
+    and rows pass through a shuffle buffer of shuffle_buffer samples before batching.
+    Only about shuffle_buffer + (num_workers + 1) shards of samples are in memory.
+    """
+
+    def __init__(
+        self,
+        dataset,
+        parts: Optional[List[Tuple[int, int, int]]] = None,
+        shuffle_buffer: int = 10_000,
+        num_workers: int = 4
+    ):
+        """
+        Args:
+            dataset: ShardedSequenceDataset or its directory path
+            parts: (shard_no, start_row, stop_row) ranges (None = all rows)
+            shuffle_buffer: Samples mixed together when shuffling
+            num_workers: Parallel shard reader threads
+        """
+        if not isinstance(dataset, ShardedSequenceDataset):
+            dataset = ShardedSequenceDataset(dataset)
+
+        self.dataset = dataset
+        self.parts = parts if parts is not None else [
+            (shard_no, 0, info.num_samples)
+            for shard_no, info in enumerate(dataset.index.shards)
+        ]
+        self.shuffle_buffer = max(1, shuffle_buffer)
+        self.num_workers = max(1, num_workers)
+
+    def __len__(self) -> int:
+        return sum(stop - start for _, start, stop in self.parts)
+
+    @property
+    def sample_shape(self) -> Tuple[int, ...]:
+        return self.dataset.sample_shape
+
+    def num_classes(self) -> int:
+        labels = self.dataset.index.label_counts
+        return max(int(label) for label in labels) + 1 if labels else 0
+
+    def labels(self) -> np.ndarray:
+        if not self.parts:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate([self._read_labels(part) for part in self.parts])
+
+    def split(self, validation_fraction):
+        train_parts, val_parts = [], []
+        for shard_no, start, stop in self.parts:
+            cut = start + _split_count(stop - start, validation_fraction)
+            train_parts.append((shard_no, start, cut))
+            val_parts.append((shard_no, cut, stop))
+
+        return (
+            ShardedDataSource(self.dataset, train_parts, self.shuffle_buffer, self.num_workers),
+            ShardedDataSource(self.dataset, val_parts, self.shuffle_buffer, self.num_workers)
+        )
+
+    def iter_batches(self, batch_size, shuffle=False, seed=0, epoch=0):
+        rng = _epoch_rng(seed, epoch)
+        parts = list(self.parts)
+        if shuffle:
+            parts = [parts[i] for i in rng.permutation(len(parts))]
+
+        pool_x: List[np.ndarray] = []
+        pool_y: List[np.ndarray] = []
+        pooled = 0
+        threshold = self.shuffle_buffer if shuffle else batch_size
+
+        for x, y in self._read_parts(parts):
+            pool_x.append(x)
+            pool_y.append(y)
+            pooled += len(y)
+            if pooled < threshold:
+                continue
+
+            X, Y = np.concatenate(pool_x), np.concatenate(pool_y)
+            if shuffle:
+                order = rng.permutation(len(Y))
+                X, Y = X[order], Y[order]
+
+            # Emit full batches; keep the remainder for the next round
+            full = (len(Y) // batch_size) * batch_size
+            for start in range(0, full, batch_size):
+                yield X[start:start + batch_size], Y[start:start + batch_size]
+            pool_x, pool_y = [X[full:]], [Y[full:]]
+            pooled = len(Y) - full
+
+        if pooled:
+            X, Y = np.concatenate(pool_x), np.concatenate(pool_y)
+            if shuffle:
+                order = rng.permutation(len(Y))
+                X, Y = X[order], Y[order]
+            for start in range(0, len(Y), batch_size):
+                yield X[start:start + batch_size], Y[start:start + batch_size]
+
+    # ========================================================================
+    # Shard I/O
+    # ========================================================================
+
+    def _read_part(self, part: Tuple[int, int, int]) -> Batch:
+        shard_no, start, stop = part
+        x, y = self.dataset.load_shard(shard_no)
+        # Contiguous slice of the memmap → one sequential read
+        return np.array(x[start:stop]), y[start:stop]
+
+    def _read_labels(self, part: Tuple[int, int, int]) -> np.ndarray:
+        shard_no, start, stop = part
+        return self.dataset.load_shard(shard_no)[1][start:stop]
+
+    def _read_parts(self, parts: List[Tuple[int, int, int]]) -> Iterator[Batch]:
+        """Read parts in order, keeping num_workers reads in flight"""
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            pending = deque()
+            remaining = iter(parts)
+
+            for part in remaining:
+                pending.append(executor.submit(self._read_part, part))
+                if len(pending) >= self.num_workers:
+                    break
+
+            while pending:
+                result = pending.popleft().result()
+                next_part = next(remaining, None)
+                if next_part is not None:
+                    pending.append(executor.submit(self._read_part, next_part))
+                yield result
+
+
+_END = object()
+
+
+def prefetch_batches(batches: Iterator[Batch], prefetch: int = 2) -> Iterator[Batch]:
+    """
+    Produce batches on a background thread
+
+    Keeps up to prefetch batches ready so shard I/O and shuffling overlap with
+    the consumer (model step). Producer exceptions are re-raised in the consumer.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, prefetch))
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for batch in batches:
+                if stop.is_set():
+                    return
+                buffer.put(batch)
+            buffer.put(_END)
+        except BaseException as e:  # noqa: B902 (forwarded to consumer)
+            buffer.put(e)
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue
+        while worker.is_alive():
+            try:
+                buffer.get_nowait()
+            except queue.Empty:
+                worker.join(timeout=0.01)
@@ -0,0 +1,206 @@
+"""
+Sequence Window Builder
+
+가격 시계열 + 탐지 블록 → (num_samples, sequence_length, num_features) 학습 텐서
+
+Features are extracted once per ticker through the FeatureRegistry into a float32
+(num_days, num_features) matrix. Windows are strided views over that matrix, so no
+per-window copy is made; the only copy is the final write into a shard.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.learning.feature_engineering import feature_registry, FeatureRegistry
+from src.learning.feature_engineering import block_features  # noqa: F401 (register features)
+
+
+def sliding_windows(matrix: np.ndarray, sequence_length: int, stride: int = 1) -> np.ndarray:
+    """
+    Read-only strided window view
+
+    Args:
+        matrix: (num_days, num_features) array
+        sequence_length: Window length (days)
+        stride: Step between window starts
+
+    Returns:
+        (num_windows, sequence_length, num_features) view sharing matrix memory
+    """
+    if sequence_length < 1 or stride < 1:
+        raise ValueError("sequence_length and stride must be >= 1")
+
+    num_days, num_features = matrix.shape
+    num_windows = 0 if num_days < sequence_length else (num_days - sequence_length) // stride + 1
+
+    row_stride, col_stride = matrix.strides
+    return np.lib.stride_tricks.as_strided(
+        matrix,
+        shape=(num_windows, sequence_length, num_features),
+        strides=(row_stride * stride, row_stride, col_stride),
+        writeable=False
+    )
+
+
+def window_end_positions(num_windows: int, sequence_length: int, stride: int = 1) -> np.ndarray:
+    """Row index of the last day of each window"""
+    return np.arange(num_windows) * stride + sequence_length - 1
+
+
+def valid_window_mask(matrix: np.ndarray, sequence_length: int, stride: int = 1) -> np.ndarray:
+    """
+    Windows without NaN / inf (e.g. MA120 warm-up period)
+
+    Uses a prefix count of invalid rows, so each window is checked in O(1).
+    """
+    invalid = ~np.isfinite(matrix).all(axis=1)
+    prefix = np.concatenate(([0], np.cumsum(invalid)))
+
+    num_windows = len(sliding_windows(matrix, sequence_length, stride))
+    starts = np.arange(num_windows) * stride
+    return (prefix[starts + sequence_length] - prefix[starts]) == 0
+
+
+def label_days(
+    dates: Sequence[date],
+    blocks: Iterable,
+    background_label: int = 0
+) -> np.ndarray:
+    """
+    Per-day block label
+
+    A day is labeled with the block_type of the block active on that day
+    (started_at <= day <= ended_at, open blocks run to the last day). Overlapping
+    blocks resolve to the highest block_type.
+
+    Args:
+        dates: Sorted trading dates
+        blocks: Objects with block_type / started_at / ended_at (DynamicBlockDetection)
+        background_label: Label for days outside any block
+
+    Returns:
+        int32 array aligned with dates
+    """
+    day_array = np.asarray(dates, dtype='datetime64[D]')
+    labels = np.full(len(day_array), background_label, dtype=np.int32)
+
+    for block in blocks:
+        if block.started_at is None:
+            continue
+        start = np.searchsorted(day_array, np.datetime64(block.started_at, 'D'), side='left')
+        end = (
+            len(day_array) if block.ended_at is None
+            else np.searchsorted(day_array, np.datetime64(block.ended_at, 'D'), side='right')
+        )
+        if start < end:
+            np.maximum(labels[start:end], block.block_type, out=labels[start:end])
+
+    return labels
+
+
+@dataclass
+class TickerWindows:
+    """
+    Windows of one ticker (views, not copies)
+
+    Attributes:
+        ticker: Stock ticker
+        windows: (num_windows, sequence_length, num_features) strided view
+        selection: Indices of kept windows (finite values only)
+        labels: Label of each kept window (label of its last day)
+        end_dates: Last date of each kept window
+    """
+    ticker: str
+    windows: np.ndarray
+    selection: np.ndarray
+    labels: np.ndarray
+    end_dates: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.selection)
+
+
+class SequenceDatasetBuilder:
+    """Ticker price series + blocks → windowed float32 tensors"""
+
+    def __init__(
+        self,
+        feature_names: Optional[List[str]] = None,
+        sequence_length: int = 60,
+        stride: int = 1,
+        registry: FeatureRegistry = feature_registry
+    ):
+        """
+        Args:
+            feature_names: Registry feature names (None = all context-free, causal
+                features; features normalized by whole-series min/max are excluded
+                because they leak future prices into every window)
+            sequence_length: Days per window
+            stride: Step between window starts
+            registry: FeatureRegistry used for extraction
+        """
+        if sequence_length < 1 or stride < 1:
+            raise ValueError("sequence_length and stride must be >= 1")
+
+        self.registry = registry
+        self.feature_names = feature_names or [
+            name for name in registry.list_features()
+            if not registry.get_metadata(name).requires and registry.is_causal(name)
+        ]
+        self.sequence_length = sequence_length
+        self.stride = stride
+
+    def feature_matrix(self, prices: pd.DataFrame) -> np.ndarray:
+        """
+        Extract all features once for a ticker
+
+        Args:
+            prices: OHLCV dataframe sorted by date
+
+        Returns:
+            C-contiguous float32 (num_days, num_features) matrix
+        """
+        features = self.registry.extract(self.feature_names, prices)
+        return np.ascontiguousarray(features.to_numpy(dtype=np.float32))
+
+    def build_ticker(
+        self,
+        ticker: str,
+        prices: pd.DataFrame,
+        blocks: Iterable,
+        dates: Optional[Sequence[date]] = None
+    ) -> TickerWindows:
+        """
+        Build windows for one ticker
+
+        Args:
+            ticker: Stock ticker
+            prices: OHLCV dataframe sorted by date
+            blocks: Detected blocks of the ticker (see label_days)
+            dates: Trading dates (default: prices['date'])
+
+        Returns:
+            TickerWindows
+        """
+        if dates is None:
+            dates = prices['date'].tolist()
+
+        matrix = self.feature_matrix(prices)
+        windows = sliding_windows(matrix, self.sequence_length, self.stride)
+
+        selection = np.flatnonzero(valid_window_mask(matrix, self.sequence_length, self.stride))
+        end_positions = window_end_positions(len(windows), self.sequence_length, self.stride)[selection]
+
+        day_labels = label_days(dates, blocks)
+        day_array = np.asarray(dates, dtype='datetime64[D]')
+
+        return TickerWindows(
+            ticker=ticker,
+            windows=windows,
+            selection=selection,
+            labels=day_labels[end_positions],
+            end_dates=day_array[end_positions]
+        )
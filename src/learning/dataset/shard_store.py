@@ -0,0 +1,264 @@
+"""
+Sequence Shard Store
+
+메모리 맵 .npy shard + index.json 기반 대용량 학습 데이터셋
+
+Layout of a dataset directory:
+    index.json          sequence_length, stride, feature_names, shard list
+    x_00000.npy         float32 (n, sequence_length, num_features), opened with mmap
+    y_00000.npy         int32 (n,) labels
+    dates_00000.npy     datetime64[D] (n,) last day of each window
+
+Shards are written with exact sizes, so a full-market dataset never has to fit in RAM:
+pending windows stay as views into per-ticker feature matrices until a shard is full.
+"""
+import json
+from bisect import bisect_right
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from src.learning.dataset.sequence_builder import TickerWindows
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+
+@dataclass
+class ShardInfo:
+    """Shard entry of index.json"""
+    x_file: str
+    y_file: str
+    dates_file: str
+    num_samples: int
+    tickers: List[Tuple[str, int, int]] = field(default_factory=list)  # (ticker, offset, count)
+
+
+@dataclass
+class DatasetIndex:
+    """index.json contents"""
+    sequence_length: int
+    stride: int
+    feature_names: List[str]
+    dtype: str = "float32"
+    num_samples: int = 0
+    label_counts: Dict[str, int] = field(default_factory=dict)
+    shards: List[ShardInfo] = field(default_factory=list)
+    version: int = INDEX_VERSION
+
+    @property
+    def num_features(self) -> int:
+        return len(self.feature_names)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DatasetIndex':
+        data = dict(data)
+        data['shards'] = [
+            ShardInfo(**{**shard, 'tickers': [tuple(t) for t in shard['tickers']]})
+            for shard in data.get('shards', [])
+        ]
+        return cls(**data)
+
+
+class ShardWriter:
+    """
+    Sequence shard writer
+
+    Example:
+        >>> writer = ShardWriter('data/ml/sequences', 60, 1, builder.feature_names)
+        >>> for ticker in tickers:
+        ...     writer.add(builder.build_ticker(ticker, prices, blocks))
+        >>> index = writer.close()
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        sequence_length: int,
+        stride: int,
+        feature_names: List[str],
+        shard_size: int = 50_000
+    ):
+        """
+        Args:
+            output_dir: Dataset directory (created if missing)
+            sequence_length: Window length
+            stride: Window stride (recorded in the index)
+            feature_names: Feature names (last tensor axis)
+            shard_size: Samples per shard
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be >= 1")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.shard_size = shard_size
+
+        self.index = DatasetIndex(
+            sequence_length=sequence_length,
+            stride=stride,
+            feature_names=list(feature_names)
+        )
+
+        # (TickerWindows, selection slice start, end) waiting for the current shard
+        self._pending: List[Tuple[TickerWindows, int, int]] = []
+        self._pending_count = 0
+        self._closed = False
+
+    def add(self, ticker_windows: TickerWindows):
+        """Queue a ticker's windows; full shards are written immediately"""
+        if self._closed:
+            raise ValueError("ShardWriter is closed")
+
+        expected = (self.index.sequence_length, self.index.num_features)
+        if ticker_windows.windows.shape[1:] != expected:
+            raise ValueError(
+                f"Window shape {ticker_windows.windows.shape[1:]} does not match {expected}"
+            )
+
+        start, total = 0, len(ticker_windows)
+        while start < total:
+            take = min(total - start, self.shard_size - self._pending_count)
+            self._pending.append((ticker_windows, start, start + take))
+            self._pending_count += take
+            start += take
+
+            if self._pending_count == self.shard_size:
+                self._write_shard()
+
+    def close(self) -> DatasetIndex:
+        """Write the remaining windows and index.json"""
+        if not self._closed:
+            if self._pending_count:
+                self._write_shard()
+            with open(self.output_dir / INDEX_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.index.to_dict(), f, indent=2, ensure_ascii=False)
+            self._closed = True
+        return self.index
+
+    def _write_shard(self):
+        shard_no = len(self.index.shards)
+        info = ShardInfo(
+            x_file=f"x_{shard_no:05d}.npy",
+            y_file=f"y_{shard_no:05d}.npy",
+            dates_file=f"dates_{shard_no:05d}.npy",
+            num_samples=self._pending_count
+        )
+
+        x = open_memmap(
+            self.output_dir / info.x_file,
+            mode='w+',
+            dtype=np.float32,
+            shape=(self._pending_count, self.index.sequence_length, self.index.num_features)
+        )
+        y = np.empty(self._pending_count, dtype=np.int32)
+        dates = np.empty(self._pending_count, dtype='datetime64[D]')
+
+        offset = 0
+        for ticker_windows, start, end in self._pending:
+            count = end - start
+            # Single copy: strided view → memmap slice
+            np.take(
+                ticker_windows.windows,
+                ticker_windows.selection[start:end],
+                axis=0,
+                out=x[offset:offset + count],
+                mode='clip'
+            )
+            y[offset:offset + count] = ticker_windows.labels[start:end]
+            dates[offset:offset + count] = ticker_windows.end_dates[start:end]
+            info.tickers.append((ticker_windows.ticker, offset, count))
+            offset += count
+
+        x.flush()
+        del x
+        np.save(self.output_dir / info.y_file, y)
+        np.save(self.output_dir / info.dates_file, dates)
+
+        for label, count in zip(*np.unique(y, return_counts=True)):
+            key = str(int(label))
+            self.index.label_counts[key] = self.index.label_counts.get(key, 0) + int(count)
+
+        self.index.shards.append(info)
+        self.index.num_samples += info.num_samples
+        self._pending = []
+        self._pending_count = 0
+
+
+class ShardedSequenceDataset:
+    """
+    Read-only view of a shard directory
+
+    X shards are opened with mmap_mode='r'; only touched pages are read from disk.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Dataset directory containing index.json
+        """
+        self.directory = Path(directory)
+        with open(self.directory / INDEX_FILE, 'r', encoding='utf-8') as f:
+            self.index = DatasetIndex.from_dict(json.load(f))
+
+        self._offsets = np.cumsum([0] + [s.num_samples for s in self.index.shards]).tolist()
+
+    def __len__(self) -> int:
+        return self.index.num_samples
+
+    @property
+    def num_shards(self) -> int:
+        return len(self.index.shards)
+
+    @property
+    def sample_shape(self) -> Tuple[int, int]:
+        """(sequence_length, num_features)"""
+        return self.index.sequence_length, self.index.num_features
+
+    def load_shard(self, shard_no: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            shard_no: Shard number
+
+        Returns:
+            (X memmap, y) for the shard
+        """
+        info = self.index.shards[shard_no]
+        x = np.load(self.directory / info.x_file, mmap_mode='r')
+        y = np.load(self.directory / info.y_file)
+        return x, y
+
+    def load_dates(self, shard_no: int) -> np.ndarray:
+        """Last day of each window in the shard"""
+        return np.load(self.directory / self.index.shards[shard_no].dates_file)
+
+    def iter_shards(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yield (X memmap, y) per shard"""
+        for shard_no in range(self.num_shards):
+            yield self.load_shard(shard_no)
+
+    def labels(self) -> np.ndarray:
+        """All labels (small; X is not loaded)"""
+        if not self.num_shards:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate([
+            np.load(self.directory / info.y_file) for info in self.index.shards
+        ])
+
+    def locate(self, sample_idx: int) -> Tuple[int, int]:
+        """Global sample index → (shard_no, row)"""
+        if not 0 <= sample_idx < len(self):
+            raise IndexError(f"Sample index out of range: {sample_idx}")
+        shard_no = bisect_right(self._offsets, sample_idx) - 1
+        return shard_no, sample_idx - self._offsets[shard_no]
+
+    def __getitem__(self, sample_idx: int) -> Tuple[np.ndarray, int]:
+        shard_no, row = self.locate(sample_idx)
+        x, y = self.load_shard(shard_no)
+        return np.asarray(x[row]), int(y[row])
@@ -4,10 +4,16 @@ Model Evaluation Module
 모델 성능 평가 및 분석
 """
 from src.learning.evaluation.metrics import EvaluationMetrics, ModelPerformance
-from src.learning.evaluation.confusion_matrix import ConfusionMatrixAnalyzer
+from src.learning.evaluation.confusion_matrix import (
+    ConfusionMatrixAnalyzer,
+    ConfusionMatrixAccumulator,
+    compute_confusion_matrix,
+)
 
 __all__ = [
     'EvaluationMetrics',
     'ModelPerformance',
     'ConfusionMatrixAnalyzer',
+    'ConfusionMatrixAccumulator',
+    'compute_confusion_matrix',
 ]
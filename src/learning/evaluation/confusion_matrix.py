@@ -2,12 +2,170 @@
 Confusion Matrix Analysis
 
 혼동 행렬 분석 및 시각화
+
+All classification metrics derive from one confusion matrix built with a single
+np.bincount pass (compute_confusion_matrix), or accumulated batch by batch with
+ConfusionMatrixAccumulator so large test sets never have to be held in memory.
 """
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from dataclasses import dataclass
 
 
+# ============================================================================
+# Confusion matrix construction
+# ============================================================================
+
+def _as_labels(labels: np.ndarray) -> np.ndarray:
+    """Integer label array (accepts float arrays holding integral labels)"""
+    labels = np.asarray(labels).ravel()
+    if labels.dtype.kind not in 'iu':
+        labels = labels.astype(np.int64)
+    if len(labels) and labels.min() < 0:
+        raise ValueError("Labels must be non-negative")
+    return labels
+
+
+def compute_confusion_matrix(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    num_classes: Optional[int] = None
+) -> np.ndarray:
+    """
+    Confusion matrix in one np.bincount pass
+
+    Args:
+        y_true: Ground truth labels
+        y_pred: Predicted labels
+        num_classes: Number of classes (auto-detect if None)
+
+    Returns:
+        Confusion matrix (num_classes x num_classes), rows = true, columns = predicted
+
+    Raises:
+        ValueError: If lengths differ or a label is outside [0, num_classes)
+    """
+    y_true = _as_labels(y_true)
+    y_pred = _as_labels(y_pred)
+
+    if len(y_true) != len(y_pred):
+        raise ValueError("y_true and y_pred must have same length")
+
+    observed = int(max(y_true.max(), y_pred.max())) + 1 if len(y_true) else 0
+    if num_classes is None:
+        num_classes = observed
+    elif observed > num_classes:
+        raise ValueError(f"Label {observed - 1} out of range for num_classes={num_classes}")
+
+    flat = np.bincount(y_true * num_classes + y_pred, minlength=num_classes * num_classes)
+    return flat.reshape(num_classes, num_classes)
+
+
+class ConfusionMatrixAccumulator:
+    """
+    Streaming confusion matrix
+
+    update() adds one evaluation batch; the matrix grows when a batch contains a
+    label beyond the current size (num_classes=None).
+    """
+
+    def __init__(self, num_classes: Optional[int] = None):
+        """
+        Args:
+            num_classes: Fixed number of classes (None = grow with observed labels)
+        """
+        self.fixed = num_classes is not None
+        self.matrix = np.zeros((num_classes or 0, num_classes or 0), dtype=np.int64)
+
+    @property
+    def num_classes(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def num_samples(self) -> int:
+        return int(self.matrix.sum())
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> 'ConfusionMatrixAccumulator':
+        """
+        Add one batch of labels
+
+        Raises:
+            ValueError: If a label is out of range for a fixed num_classes
+        """
+        y_true = _as_labels(y_true)
+        y_pred = _as_labels(y_pred)
+        if not len(y_true):
+            return self
+
+        observed = int(max(y_true.max(), y_pred.max())) + 1
+        if observed > self.num_classes and not self.fixed:
+            self._resize(observed)
+
+        self.matrix += compute_confusion_matrix(y_true, y_pred, self.num_classes)
+        return self
+
+    def merge(self, other: 'ConfusionMatrixAccumulator') -> 'ConfusionMatrixAccumulator':
+        """Add another accumulator (e.g. from a parallel worker)"""
+        if other.num_classes > self.num_classes:
+            if self.fixed:
+                raise ValueError("Cannot merge a larger confusion matrix into a fixed one")
+            self._resize(other.num_classes)
+        k = other.num_classes
+        self.matrix[:k, :k] += other.matrix
+        return self
+
+    def _resize(self, num_classes: int):
+        grown = np.zeros((num_classes, num_classes), dtype=np.int64)
+        k = self.num_classes
+        grown[:k, :k] = self.matrix
+        self.matrix = grown
+
+
+def class_statistics(confusion_matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Per-class counts and rates derived from a confusion matrix
+
+    Returns:
+        Arrays indexed by class id: true_positives, false_positives,
+        false_negatives, true_negatives, support, precision, recall,
+        f1_score, specificity (rates are 0.0 where the denominator is 0)
+    """
+    cm = np.asarray(confusion_matrix)
+    tp = np.diag(cm).astype(np.int64)
+    predicted = cm.sum(axis=0).astype(np.int64)
+    support = cm.sum(axis=1).astype(np.int64)
+    total = int(cm.sum())
+
+    fp = predicted - tp
+    fn = support - tp
+    tn = total - tp - fp - fn
+
+    precision = _safe_divide(tp, predicted)
+    recall = _safe_divide(tp, support)
+    f1_score = _safe_divide(2 * (precision * recall), precision + recall)
+    specificity = _safe_divide(tn, tn + fp)
+
+    return {
+        'true_positives': tp,
+        'false_positives': fp,
+        'false_negatives': fn,
+        'true_negatives': tn,
+        'support': support,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1_score,
+        'specificity': specificity,
+    }
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.zeros_like(numerator)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
 @dataclass
 class ClassMetrics:
     """클래스별 세부 지표"""
@@ -68,6 +226,18 @@ class ConfusionMatrixAnalyzer:
             self.class_names = class_names
 
         self._validate()
+        self._stats = class_statistics(self.confusion_matrix)
+
+    @classmethod
+    def from_labels(
+        cls,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        num_classes: Optional[int] = None,
+        class_names: Optional[Dict[int, str]] = None
+    ) -> 'ConfusionMatrixAnalyzer':
+        """Build from label arrays (single bincount pass)"""
+        return cls(compute_confusion_matrix(y_true, y_pred, num_classes), class_names)
 
     def _validate(self):
         """Validate confusion matrix"""
@@ -93,47 +263,17 @@ class ConfusionMatrixAnalyzer:
         if class_id < 0 or class_id >= self.num_classes:
             raise ValueError(f"Invalid class_id: {class_id}")
 
-        # TP: Correctly predicted as this class
-        true_positives = int(self.confusion_matrix[class_id, class_id])
-
-        # FP: Incorrectly predicted as this class (sum of column - TP)
-        false_positives = int(np.sum(self.confusion_matrix[:, class_id]) - true_positives)
-
-        # FN: Actually this class but predicted as other (sum of row - TP)
-        false_negatives = int(np.sum(self.confusion_matrix[class_id, :]) - true_positives)
-
-        # TN: Correctly predicted as NOT this class
-        true_negatives = int(
-            np.sum(self.confusion_matrix) - true_positives - false_positives - false_negatives
-        )
-
-        # Support: Total actual samples in this class
-        support = int(np.sum(self.confusion_matrix[class_id, :]))
-
-        # Calculate metrics
-        precision = (
-            true_positives / (true_positives + false_positives)
-            if (true_positives + false_positives) > 0
-            else 0.0
-        )
-
-        recall = (
-            true_positives / (true_positives + false_negatives)
-            if (true_positives + false_negatives) > 0
-            else 0.0
-        )
-
-        f1_score = (
-            2 * (precision * recall) / (precision + recall)
-            if (precision + recall) > 0
-            else 0.0
-        )
-
-        specificity = (
-            true_negatives / (true_negatives + false_positives)
-            if (true_negatives + false_positives) > 0
-            else 0.0
-        )
+        stats = self._stats
+        true_positives = int(stats['true_positives'][class_id])
+        false_positives = int(stats['false_positives'][class_id])
+        false_negatives = int(stats['false_negatives'][class_id])
+        true_negatives = int(stats['true_negatives'][class_id])
+        support = int(stats['support'][class_id])
+
+        precision = float(stats['precision'][class_id])
+        recall = float(stats['recall'][class_id])
+        f1_score = float(stats['f1_score'][class_id])
+        specificity = float(stats['specificity'][class_id])
 
         return ClassMetrics(
             class_id=class_id,
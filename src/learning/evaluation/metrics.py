@@ -2,12 +2,19 @@
 Evaluation Metrics
 
 ML 모델 성능 평가를 위한 지표 계산
+
+Macro / weighted / per-class metrics are derived from one confusion matrix
+(see confusion_matrix.compute_confusion_matrix) instead of rescanning the label
+arrays per class and per metric. evaluate_confusion_matrix accepts a matrix
+accumulated over evaluation batches (ConfusionMatrixAccumulator).
 """
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any
 import numpy as np
 from datetime import datetime
 
+from src.learning.evaluation.confusion_matrix import compute_confusion_matrix, class_statistics
+
 
 @dataclass
 class ModelPerformance:
@@ -220,15 +227,7 @@ class EvaluationMetrics:
         Returns:
             Confusion matrix (num_classes x num_classes)
         """
-        if num_classes is None:
-            num_classes = max(np.max(y_true), np.max(y_pred)) + 1
-
-        cm = np.zeros((num_classes, num_classes), dtype=int)
-
-        for true_label, pred_label in zip(y_true, y_pred):
-            cm[true_label, pred_label] += 1
-
-        return cm
+        return compute_confusion_matrix(y_true, y_pred, num_classes)
 
     @staticmethod
     def calculate_macro_metrics(
@@ -247,29 +246,8 @@ class EvaluationMetrics:
         Returns:
             Dictionary with macro_precision, macro_recall, macro_f1
         """
-        if classes is None:
-            classes = sorted(np.unique(y_true))
-
-        precisions = []
-        recalls = []
-        f1_scores = []
-
-        for class_id in classes:
-            precisions.append(
-                EvaluationMetrics.calculate_precision(y_true, y_pred, class_id)
-            )
-            recalls.append(
-                EvaluationMetrics.calculate_recall(y_true, y_pred, class_id)
-            )
-            f1_scores.append(
-                EvaluationMetrics.calculate_f1_score(y_true, y_pred, class_id)
-            )
-
-        return {
-            'macro_precision': float(np.mean(precisions)),
-            'macro_recall': float(np.mean(recalls)),
-            'macro_f1': float(np.mean(f1_scores))
-        }
+        cm = compute_confusion_matrix(y_true, y_pred)
+        return EvaluationMetrics.macro_metrics_from_matrix(cm, classes)
 
     @staticmethod
     def calculate_weighted_metrics(
@@ -288,27 +266,73 @@ class EvaluationMetrics:
         Returns:
             Dictionary with weighted_precision, weighted_recall, weighted_f1
         """
+        cm = compute_confusion_matrix(y_true, y_pred)
+        return EvaluationMetrics.weighted_metrics_from_matrix(cm, classes)
+
+    # ========================================================================
+    # Confusion-matrix based metrics
+    # ========================================================================
+
+    @staticmethod
+    def per_class_metrics_from_matrix(
+        confusion_matrix: np.ndarray,
+        classes: Optional[List[int]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Per-class precision / recall / F1 / support for the given classes
+
+        Args:
+            confusion_matrix: Confusion matrix (rows = true, columns = predicted)
+            classes: List of class IDs (None = classes with support > 0)
+
+        Returns:
+            Dictionary of arrays aligned with classes, plus 'classes'
+        """
+        cm = np.asarray(confusion_matrix)
         if classes is None:
-            classes = sorted(np.unique(y_true))
-
-        precisions = []
-        recalls = []
-        f1_scores = []
-        supports = []
-
-        for class_id in classes:
-            precisions.append(
-                EvaluationMetrics.calculate_precision(y_true, y_pred, class_id)
-            )
-            recalls.append(
-                EvaluationMetrics.calculate_recall(y_true, y_pred, class_id)
-            )
-            f1_scores.append(
-                EvaluationMetrics.calculate_f1_score(y_true, y_pred, class_id)
-            )
-            supports.append(int(np.sum(y_true == class_id)))
-
-        total_support = sum(supports)
+            classes = [int(c) for c in np.flatnonzero(cm.sum(axis=1))]
+
+        # Classes without any sample / prediction get zero rows
+        size = max([cm.shape[0]] + [int(c) + 1 for c in classes])
+        if size > cm.shape[0]:
+            padded = np.zeros((size, size), dtype=cm.dtype)
+            padded[:cm.shape[0], :cm.shape[1]] = cm
+            cm = padded
+
+        stats = class_statistics(cm)
+        index = np.asarray(classes, dtype=np.int64)
+
+        return {
+            'classes': list(classes),
+            'precision': stats['precision'][index],
+            'recall': stats['recall'][index],
+            'f1_score': stats['f1_score'][index],
+            'support': stats['support'][index],
+        }
+
+    @staticmethod
+    def macro_metrics_from_matrix(
+        confusion_matrix: np.ndarray,
+        classes: Optional[List[int]] = None
+    ) -> Dict[str, float]:
+        """Macro-averaged metrics from a confusion matrix"""
+        per_class = EvaluationMetrics.per_class_metrics_from_matrix(confusion_matrix, classes)
+
+        return {
+            'macro_precision': float(np.mean(per_class['precision'])),
+            'macro_recall': float(np.mean(per_class['recall'])),
+            'macro_f1': float(np.mean(per_class['f1_score']))
+        }
+
+    @staticmethod
+    def weighted_metrics_from_matrix(
+        confusion_matrix: np.ndarray,
+        classes: Optional[List[int]] = None
+    ) -> Dict[str, float]:
+        """Support-weighted metrics from a confusion matrix"""
+        per_class = EvaluationMetrics.per_class_metrics_from_matrix(confusion_matrix, classes)
+        supports = per_class['support']
+        total_support = int(supports.sum())
 
         if total_support == 0:
             return {
@@ -317,12 +341,12 @@ class EvaluationMetrics:
                 'weighted_f1': 0.0
             }
 
-        weights = [s / total_support for s in supports]
+        weights = supports / total_support
 
         return {
-            'weighted_precision': float(np.average(precisions, weights=weights)),
-            'weighted_recall': float(np.average(recalls, weights=weights)),
-            'weighted_f1': float(np.average(f1_scores, weights=weights))
+            'weighted_precision': float(np.average(per_class['precision'], weights=weights)),
+            'weighted_recall': float(np.average(per_class['recall'], weights=weights)),
+            'weighted_f1': float(np.average(per_class['f1_score'], weights=weights))
         }
 
     @staticmethod
@@ -350,49 +374,66 @@ class EvaluationMetrics:
         Returns:
             ModelPerformance object with all metrics
         """
-        if classes is None:
-            classes = sorted(np.unique(y_true))
-
-        # Overall metrics
-        accuracy = EvaluationMetrics.calculate_accuracy(y_true, y_pred)
-        macro_metrics = EvaluationMetrics.calculate_macro_metrics(y_true, y_pred, classes)
-        weighted_metrics = EvaluationMetrics.calculate_weighted_metrics(y_true, y_pred, classes)
-
-        # Per-class metrics
-        per_class_precision = {}
-        per_class_recall = {}
-        per_class_f1 = {}
-        per_class_support = {}
-
-        for class_id in classes:
-            per_class_precision[class_id] = EvaluationMetrics.calculate_precision(
-                y_true, y_pred, class_id
-            )
-            per_class_recall[class_id] = EvaluationMetrics.calculate_recall(
-                y_true, y_pred, class_id
-            )
-            per_class_f1[class_id] = EvaluationMetrics.calculate_f1_score(
-                y_true, y_pred, class_id
-            )
-            per_class_support[class_id] = int(np.sum(y_true == class_id))
-
-        # Confusion matrix
-        cm = EvaluationMetrics.calculate_confusion_matrix(y_true, y_pred, len(classes))
+        return EvaluationMetrics.evaluate_confusion_matrix(
+            compute_confusion_matrix(y_true, y_pred),
+            model_name=model_name,
+            dataset_name=dataset_name,
+            classes=classes,
+            notes=notes,
+            hyperparameters=hyperparameters
+        )
+
+    @staticmethod
+    def evaluate_confusion_matrix(
+        confusion_matrix: np.ndarray,
+        model_name: str,
+        dataset_name: str = "test_set",
+        classes: Optional[List[int]] = None,
+        notes: str = "",
+        hyperparameters: Optional[Dict[str, Any]] = None
+    ) -> ModelPerformance:
+        """
+        Confusion matrix (예: 배치별 누적 결과)로부터 ModelPerformance 생성
+
+        Args:
+            confusion_matrix: Confusion matrix (rows = true, columns = predicted)
+            model_name: Model name
+            dataset_name: Dataset name
+            classes: List of class IDs (None = classes with support > 0)
+            notes: Additional notes
+            hyperparameters: Model hyperparameters
+
+        Returns:
+            ModelPerformance object with all metrics
+        """
+        cm = np.asarray(confusion_matrix)
+        per_class = EvaluationMetrics.per_class_metrics_from_matrix(cm, classes)
+        classes = per_class['classes']
+
+        num_samples = int(cm.sum())
+        accuracy = float(np.trace(cm) / num_samples) if num_samples else 0.0
+        macro_metrics = EvaluationMetrics.macro_metrics_from_matrix(cm, classes)
+        weighted_metrics = EvaluationMetrics.weighted_metrics_from_matrix(cm, classes)
+
+        # Stored matrix covers at least classes 0..len(classes)-1
+        size = max(cm.shape[0], len(classes))
+        stored = np.zeros((size, size), dtype=np.int64)
+        stored[:cm.shape[0], :cm.shape[1]] = cm
 
         return ModelPerformance(
             model_name=model_name,
             evaluation_date=datetime.now(),
             dataset_name=dataset_name,
-            num_samples=len(y_true),
+            num_samples=num_samples,
             accuracy=accuracy,
             macro_precision=macro_metrics['macro_precision'],
             macro_recall=macro_metrics['macro_recall'],
             macro_f1=macro_metrics['macro_f1'],
-            per_class_precision=per_class_precision,
-            per_class_recall=per_class_recall,
-            per_class_f1=per_class_f1,
-            per_class_support=per_class_support,
-            confusion_matrix=cm.tolist(),
+            per_class_precision=dict(zip(classes, per_class['precision'].tolist())),
+            per_class_recall=dict(zip(classes, per_class['recall'].tolist())),
+            per_class_f1=dict(zip(classes, per_class['f1_score'].tolist())),
+            per_class_support=dict(zip(classes, per_class['support'].tolist())),
+            confusion_matrix=stored.tolist(),
             weighted_precision=weighted_metrics['weighted_precision'],
             weighted_recall=weighted_metrics['weighted_recall'],
             weighted_f1=weighted_metrics['weighted_f1'],
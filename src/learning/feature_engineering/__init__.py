@@ -1,5 +1,17 @@
 """Feature Engineering for Block Pattern Detection"""
 
 from .registry import FeatureRegistry, feature_registry
+from .intermediates import (
+    Intermediate, IntermediateCache,
+    col, ma, ema, rolling_max, rolling_std, lag, gain, loss, log1p,
+    global_min, global_max, product, difference
+)
+from .incremental import IncrementalFeatureEngine, TickerFeatureState, FeatureStateStore
 
-__all__ = ["FeatureRegistry", "feature_registry"]
+__all__ = [
+    "FeatureRegistry", "feature_registry",
+    "Intermediate", "IntermediateCache",
+    "col", "ma", "ema", "rolling_max", "rolling_std", "lag", "gain", "loss", "log1p",
+    "global_min", "global_max", "product", "difference",
+    "IncrementalFeatureEngine", "TickerFeatureState", "FeatureStateStore",
+]
@@ -3,16 +3,21 @@ Block Pattern Features
 
 Feature extraction functions for block pattern detection.
 All features are registered with the global feature_registry.
+
+Rolling windows shared between features (MA, rolling max, EMA, rolling std) are
+declared as inputs so each is computed once per extraction. Every look-back,
+including shifts and whole-series min/max, goes through inputs, which keeps the
+feature functions row-local (required by the incremental engine).
 """
 import pandas as pd
-import numpy as np
 from .registry import feature_registry
+from .intermediates import (
+    ma, ema, rolling_max, rolling_std, lag, gain, loss, log1p,
+    global_min, global_max, product, difference
+)
 from .technical_indicators import (
-    calculate_rsi, calculate_macd, calculate_bollinger_bands,
-    calculate_moving_average, calculate_ema, calculate_ma_deviation,
-    is_ma_aligned, detect_volume_spike, is_new_high, is_new_volume_high,
-    calculate_price_change, calculate_high_low_range,
-    normalize_minmax, normalize_zscore, log_transform
+    calculate_ma_deviation, is_ma_aligned,
+    calculate_high_low_range, scale_minmax
 )
 
 
@@ -23,51 +28,55 @@ from .technical_indicators import (
 @feature_registry.register(
     'price_close_normalized',
     category='price',
-    description='Min-Max normalized close price'
+    description='Min-Max normalized close price',
+    inputs={'low': global_min('close'), 'high': global_max('close')}
 )
-def price_close_normalized(df: pd.DataFrame) -> pd.Series:
-    """Normalized close price (0-1)"""
-    return normalize_minmax(df['close'])
+def price_close_normalized(df: pd.DataFrame, low: pd.Series, high: pd.Series) -> pd.Series:
+    """Normalized close price (0-1, see normalize_minmax)"""
+    return scale_minmax(df['close'], low, high)
 
 
 @feature_registry.register(
     'price_change_1d',
     category='price',
-    description='1-day price change percentage'
+    description='1-day price change percentage',
+    inputs={'prev_close': lag('close', 1)}
 )
-def price_change_1d(df: pd.DataFrame) -> pd.Series:
-    """1-day price change percentage"""
-    return calculate_price_change(df['close'], 1)
+def price_change_1d(df: pd.DataFrame, prev_close: pd.Series) -> pd.Series:
+    """1-day price change percentage (see calculate_price_change)"""
+    return (df['close'] / prev_close - 1) * 100
 
 
 @feature_registry.register(
     'price_change_5d',
     category='price',
-    description='5-day price change percentage'
+    description='5-day price change percentage',
+    inputs={'prev_close': lag('close', 5)}
 )
-def price_change_5d(df: pd.DataFrame) -> pd.Series:
-    """5-day price change percentage"""
-    return calculate_price_change(df['close'], 5)
+def price_change_5d(df: pd.DataFrame, prev_close: pd.Series) -> pd.Series:
+    """5-day price change percentage (see calculate_price_change)"""
+    return (df['close'] / prev_close - 1) * 100
 
 
 @feature_registry.register(
     'price_change_20d',
     category='price',
-    description='20-day price change percentage'
+    description='20-day price change percentage',
+    inputs={'prev_close': lag('close', 20)}
 )
-def price_change_20d(df: pd.DataFrame) -> pd.Series:
-    """20-day price change percentage"""
-    return calculate_price_change(df['close'], 20)
+def price_change_20d(df: pd.DataFrame, prev_close: pd.Series) -> pd.Series:
+    """20-day price change percentage (see calculate_price_change)"""
+    return (df['close'] / prev_close - 1) * 100
 
 
 @feature_registry.register(
     'price_high_vs_prev_close',
     category='price',
-    description='High vs previous close ratio'
+    description='High vs previous close ratio',
+    inputs={'prev_close': lag('close', 1)}
 )
-def price_high_vs_prev_close(df: pd.DataFrame) -> pd.Series:
+def price_high_vs_prev_close(df: pd.DataFrame, prev_close: pd.Series) -> pd.Series:
     """High price vs previous close"""
-    prev_close = df['close'].shift(1)
     return ((df['high'] - prev_close) / prev_close * 100).fillna(0)
 
 
@@ -84,31 +93,34 @@ def price_high_low_range(df: pd.DataFrame) -> pd.Series:
 @feature_registry.register(
     'price_new_high_6m',
     category='price',
-    description='Is 6-month new high (binary)'
+    description='Is 6-month new high (binary)',
+    inputs={'high_max': rolling_max('high', 120)}
 )
-def price_new_high_6m(df: pd.DataFrame) -> pd.Series:
-    """Is 6-month new high"""
-    return is_new_high(df['high'], 6).astype(int)
+def price_new_high_6m(df: pd.DataFrame, high_max: pd.Series) -> pd.Series:
+    """Is 6-month new high (1 month = 20 trading days, see is_new_high)"""
+    return (df['high'] >= high_max).astype(int)
 
 
 @feature_registry.register(
     'price_new_high_12m',
     category='price',
-    description='Is 12-month new high (binary)'
+    description='Is 12-month new high (binary)',
+    inputs={'high_max': rolling_max('high', 240)}
 )
-def price_new_high_12m(df: pd.DataFrame) -> pd.Series:
-    """Is 12-month new high"""
-    return is_new_high(df['high'], 12).astype(int)
+def price_new_high_12m(df: pd.DataFrame, high_max: pd.Series) -> pd.Series:
+    """Is 12-month new high (1 month = 20 trading days, see is_new_high)"""
+    return (df['high'] >= high_max).astype(int)
 
 
 @feature_registry.register(
     'price_new_high_24m',
     category='price',
-    description='Is 24-month new high (binary)'
+    description='Is 24-month new high (binary)',
+    inputs={'high_max': rolling_max('high', 480)}
 )
-def price_new_high_24m(df: pd.DataFrame) -> pd.Series:
-    """Is 24-month new high"""
-    return is_new_high(df['high'], 24).astype(int)
+def price_new_high_24m(df: pd.DataFrame, high_max: pd.Series) -> pd.Series:
+    """Is 24-month new high (1 month = 20 trading days, see is_new_high)"""
+    return (df['high'] >= high_max).astype(int)
 
 
 # ============================================================================
@@ -118,127 +130,141 @@ def price_new_high_24m(df: pd.DataFrame) -> pd.Series:
 @feature_registry.register(
     'volume_normalized',
     category='volume',
-    description='Min-Max normalized volume'
+    description='Min-Max normalized volume',
+    inputs={'low': global_min('volume'), 'high': global_max('volume')}
 )
-def volume_normalized(df: pd.DataFrame) -> pd.Series:
+def volume_normalized(df: pd.DataFrame, low: pd.Series, high: pd.Series) -> pd.Series:
     """Normalized volume (0-1)"""
-    return normalize_minmax(df['volume'])
+    return scale_minmax(df['volume'], low, high)
 
 
 @feature_registry.register(
     'volume_log_normalized',
     category='volume',
-    description='Log-transformed and normalized volume'
+    description='Log-transformed and normalized volume',
+    inputs={
+        'log_volume': log1p('volume'),
+        'low': global_min(log1p('volume')),
+        'high': global_max(log1p('volume')),
+    }
 )
-def volume_log_normalized(df: pd.DataFrame) -> pd.Series:
-    """Log-transformed and normalized volume"""
-    log_vol = log_transform(df['volume'])
-    return normalize_minmax(log_vol)
+def volume_log_normalized(
+    df: pd.DataFrame,
+    log_volume: pd.Series,
+    low: pd.Series,
+    high: pd.Series
+) -> pd.Series:
+    """Log-transformed (see log_transform) and normalized volume"""
+    return scale_minmax(log_volume, low, high)
 
 
 @feature_registry.register(
     'volume_ma5_ratio',
     category='volume',
-    description='Volume / MA5 ratio'
+    description='Volume / MA5 ratio',
+    inputs={'volume_ma': ma('volume', 5)}
 )
-def volume_ma5_ratio(df: pd.DataFrame) -> pd.Series:
+def volume_ma5_ratio(df: pd.DataFrame, volume_ma: pd.Series) -> pd.Series:
     """Volume divided by 5-day moving average"""
-    ma5 = calculate_moving_average(df['volume'], 5)
-    return (df['volume'] / ma5).fillna(1.0)
+    return (df['volume'] / volume_ma).fillna(1.0)
 
 
 @feature_registry.register(
     'volume_ma20_ratio',
     category='volume',
-    description='Volume / MA20 ratio'
+    description='Volume / MA20 ratio',
+    inputs={'volume_ma': ma('volume', 20)}
 )
-def volume_ma20_ratio(df: pd.DataFrame) -> pd.Series:
+def volume_ma20_ratio(df: pd.DataFrame, volume_ma: pd.Series) -> pd.Series:
     """Volume divided by 20-day moving average"""
-    ma20 = calculate_moving_average(df['volume'], 20)
-    return (df['volume'] / ma20).fillna(1.0)
+    return (df['volume'] / volume_ma).fillna(1.0)
 
 
 @feature_registry.register(
     'volume_ma60_ratio',
     category='volume',
-    description='Volume / MA60 ratio'
+    description='Volume / MA60 ratio',
+    inputs={'volume_ma': ma('volume', 60)}
 )
-def volume_ma60_ratio(df: pd.DataFrame) -> pd.Series:
+def volume_ma60_ratio(df: pd.DataFrame, volume_ma: pd.Series) -> pd.Series:
     """Volume divided by 60-day moving average"""
-    ma60 = calculate_moving_average(df['volume'], 60)
-    return (df['volume'] / ma60).fillna(1.0)
+    return (df['volume'] / volume_ma).fillna(1.0)
 
 
 @feature_registry.register(
     'volume_spike_ratio',
     category='volume',
-    description='Volume spike ratio (vs MA20)'
+    description='Volume spike ratio (vs MA20)',
+    inputs={'ratio': 'volume_ma20_ratio'}
 )
-def volume_spike_ratio(df: pd.DataFrame) -> pd.Series:
-    """Volume spike ratio compared to 20-day average"""
-    ma20 = calculate_moving_average(df['volume'], 20)
-    ratio = (df['volume'] / ma20).fillna(1.0)
+def volume_spike_ratio(df: pd.DataFrame, ratio: pd.Series) -> pd.Series:
+    """Volume spike ratio compared to 20-day average (same as volume_ma20_ratio)"""
     return ratio
 
 
 @feature_registry.register(
     'volume_spike_2x',
     category='volume',
-    description='Volume spike >= 2x average (binary)'
+    description='Volume spike >= 2x average (binary)',
+    inputs={'volume_ma': ma('volume', 20)}
 )
-def volume_spike_2x(df: pd.DataFrame) -> pd.Series:
-    """Volume spike >= 2x average"""
-    return detect_volume_spike(df['volume'], 20, 2.0).astype(int)
+def volume_spike_2x(df: pd.DataFrame, volume_ma: pd.Series) -> pd.Series:
+    """Volume spike >= 2x average (see detect_volume_spike)"""
+    return (df['volume'] / volume_ma >= 2.0).astype(int)
 
 
 @feature_registry.register(
     'volume_spike_3x',
     category='volume',
-    description='Volume spike >= 3x average (binary)'
+    description='Volume spike >= 3x average (binary)',
+    inputs={'volume_ma': ma('volume', 20)}
 )
-def volume_spike_3x(df: pd.DataFrame) -> pd.Series:
-    """Volume spike >= 3x average"""
-    return detect_volume_spike(df['volume'], 20, 3.0).astype(int)
+def volume_spike_3x(df: pd.DataFrame, volume_ma: pd.Series) -> pd.Series:
+    """Volume spike >= 3x average (see detect_volume_spike)"""
+    return (df['volume'] / volume_ma >= 3.0).astype(int)
 
 
 @feature_registry.register(
     'volume_new_high_6m',
     category='volume',
-    description='Is 6-month new volume high (binary)'
+    description='Is 6-month new volume high (binary)',
+    inputs={'volume_max': rolling_max('volume', 120)}
 )
-def volume_new_high_6m(df: pd.DataFrame) -> pd.Series:
-    """Is 6-month new volume high"""
-    return is_new_volume_high(df['volume'], 6).astype(int)
+def volume_new_high_6m(df: pd.DataFrame, volume_max: pd.Series) -> pd.Series:
+    """Is 6-month new volume high (see is_new_volume_high)"""
+    return (df['volume'] >= volume_max).astype(int)
 
 
 @feature_registry.register(
     'volume_new_high_12m',
     category='volume',
-    description='Is 12-month new volume high (binary)'
+    description='Is 12-month new volume high (binary)',
+    inputs={'volume_max': rolling_max('volume', 240)}
 )
-def volume_new_high_12m(df: pd.DataFrame) -> pd.Series:
-    """Is 12-month new volume high"""
-    return is_new_volume_high(df['volume'], 12).astype(int)
+def volume_new_high_12m(df: pd.DataFrame, volume_max: pd.Series) -> pd.Series:
+    """Is 12-month new volume high (see is_new_volume_high)"""
+    return (df['volume'] >= volume_max).astype(int)
 
 
 @feature_registry.register(
     'volume_new_high_24m',
     category='volume',
-    description='Is 24-month new volume high (binary)'
+    description='Is 24-month new volume high (binary)',
+    inputs={'volume_max': rolling_max('volume', 480)}
 )
-def volume_new_high_24m(df: pd.DataFrame) -> pd.Series:
-    """Is 24-month new volume high"""
-    return is_new_volume_high(df['volume'], 24).astype(int)
+def volume_new_high_24m(df: pd.DataFrame, volume_max: pd.Series) -> pd.Series:
+    """Is 24-month new volume high (see is_new_volume_high)"""
+    return (df['volume'] >= volume_max).astype(int)
 
 
 @feature_registry.register(
     'volume_prev_day_ratio',
     category='volume',
-    description='Volume vs previous day ratio'
+    description='Volume vs previous day ratio',
+    inputs={'prev_volume': lag('volume', 1)}
 )
-def volume_prev_day_ratio(df: pd.DataFrame) -> pd.Series:
+def volume_prev_day_ratio(df: pd.DataFrame, prev_volume: pd.Series) -> pd.Series:
     """Volume divided by previous day volume"""
-    prev_volume = df['volume'].shift(1)
     return (df['volume'] / prev_volume).fillna(1.0)
 
 
@@ -249,56 +275,71 @@ def volume_prev_day_ratio(df: pd.DataFrame) -> pd.Series:
 @feature_registry.register(
     'trading_value_billion',
     category='trading_value',
-    description='Trading value in billion won'
+    description='Trading value in billion won',
+    inputs={'trading_value': product('close', 'volume')}
 )
-def trading_value_billion(df: pd.DataFrame) -> pd.Series:
+def trading_value_billion(df: pd.DataFrame, trading_value: pd.Series) -> pd.Series:
     """Trading value in billion won"""
-    trading_value = df['close'] * df['volume']
     return trading_value / 100_000_000  # Convert to billion
 
 
 @feature_registry.register(
     'trading_value_normalized',
     category='trading_value',
-    description='Normalized trading value'
-)
-def trading_value_normalized(df: pd.DataFrame) -> pd.Series:
+    description='Normalized trading value',
+    inputs={
+        'trading_value': product('close', 'volume'),
+        'low': global_min(product('close', 'volume')),
+        'high': global_max(product('close', 'volume')),
+    }
+)
+def trading_value_normalized(
+    df: pd.DataFrame,
+    trading_value: pd.Series,
+    low: pd.Series,
+    high: pd.Series
+) -> pd.Series:
     """Normalized trading value"""
-    trading_value = df['close'] * df['volume']
-    return normalize_minmax(trading_value)
+    return scale_minmax(trading_value, low, high)
 
 
 @feature_registry.register(
     'trading_value_ma20_ratio',
     category='trading_value',
-    description='Trading value / MA20 ratio'
-)
-def trading_value_ma20_ratio(df: pd.DataFrame) -> pd.Series:
+    description='Trading value / MA20 ratio',
+    inputs={
+        'trading_value': product('close', 'volume'),
+        'trading_value_ma': ma(product('close', 'volume'), 20),
+    }
+)
+def trading_value_ma20_ratio(
+    df: pd.DataFrame,
+    trading_value: pd.Series,
+    trading_value_ma: pd.Series
+) -> pd.Series:
     """Trading value divided by 20-day MA"""
-    trading_value = df['close'] * df['volume']
-    ma20 = calculate_moving_average(trading_value, 20)
-    return (trading_value / ma20).fillna(1.0)
+    return (trading_value / trading_value_ma).fillna(1.0)
 
 
 @feature_registry.register(
     'trading_value_above_300b',
     category='trading_value',
-    description='Trading value >= 300 billion (binary)'
+    description='Trading value >= 300 billion (binary)',
+    inputs={'trading_value_b': 'trading_value_billion'}
 )
-def trading_value_above_300b(df: pd.DataFrame) -> pd.Series:
+def trading_value_above_300b(df: pd.DataFrame, trading_value_b: pd.Series) -> pd.Series:
     """Trading value >= 300 billion won"""
-    trading_value_b = trading_value_billion(df)
     return (trading_value_b >= 300).astype(int)
 
 
 @feature_registry.register(
     'trading_value_above_1500b',
     category='trading_value',
-    description='Trading value >= 1500 billion (binary)'
+    description='Trading value >= 1500 billion (binary)',
+    inputs={'trading_value_b': 'trading_value_billion'}
 )
-def trading_value_above_1500b(df: pd.DataFrame) -> pd.Series:
+def trading_value_above_1500b(df: pd.DataFrame, trading_value_b: pd.Series) -> pd.Series:
     """Trading value >= 1500 billion won"""
-    trading_value_b = trading_value_billion(df)
     return (trading_value_b >= 1500).astype(int)
 
 
@@ -309,98 +350,108 @@ def trading_value_above_1500b(df: pd.DataFrame) -> pd.Series:
 @feature_registry.register(
     'ma5',
     category='ma',
-    description='5-day moving average'
+    description='5-day moving average',
+    inputs={'close_ma': ma('close', 5)}
 )
-def ma5(df: pd.DataFrame) -> pd.Series:
+def ma5(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """5-day moving average"""
-    return calculate_moving_average(df['close'], 5)
+    return close_ma
 
 
 @feature_registry.register(
     'ma20',
     category='ma',
-    description='20-day moving average'
+    description='20-day moving average',
+    inputs={'close_ma': ma('close', 20)}
 )
-def ma20(df: pd.DataFrame) -> pd.Series:
+def ma20(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """20-day moving average"""
-    return calculate_moving_average(df['close'], 20)
+    return close_ma
 
 
 @feature_registry.register(
     'ma60',
     category='ma',
-    description='60-day moving average'
+    description='60-day moving average',
+    inputs={'close_ma': ma('close', 60)}
 )
-def ma60(df: pd.DataFrame) -> pd.Series:
+def ma60(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """60-day moving average"""
-    return calculate_moving_average(df['close'], 60)
+    return close_ma
 
 
 @feature_registry.register(
     'ma120',
     category='ma',
-    description='120-day moving average'
+    description='120-day moving average',
+    inputs={'close_ma': ma('close', 120)}
 )
-def ma120(df: pd.DataFrame) -> pd.Series:
+def ma120(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """120-day moving average"""
-    return calculate_moving_average(df['close'], 120)
+    return close_ma
 
 
 @feature_registry.register(
     'ma_deviation_60',
     category='ma',
-    description='MA60 deviation (close/MA * 100)'
+    description='MA60 deviation (close/MA * 100)',
+    inputs={'close_ma': ma('close', 60)}
 )
-def ma_deviation_60(df: pd.DataFrame) -> pd.Series:
+def ma_deviation_60(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """MA60 deviation (이격도)"""
-    ma = calculate_moving_average(df['close'], 60)
-    return calculate_ma_deviation(df['close'], ma)
+    return calculate_ma_deviation(df['close'], close_ma)
 
 
 @feature_registry.register(
     'ma_deviation_120',
     category='ma',
-    description='MA120 deviation (close/MA * 100)'
+    description='MA120 deviation (close/MA * 100)',
+    inputs={'close_ma': ma('close', 120)}
 )
-def ma_deviation_120(df: pd.DataFrame) -> pd.Series:
+def ma_deviation_120(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """MA120 deviation (이격도)"""
-    ma = calculate_moving_average(df['close'], 120)
-    return calculate_ma_deviation(df['close'], ma)
+    return calculate_ma_deviation(df['close'], close_ma)
 
 
 @feature_registry.register(
     'high_above_ma60',
     category='ma',
-    description='High >= MA60 (binary)'
+    description='High >= MA60 (binary)',
+    inputs={'close_ma': ma('close', 60)}
 )
-def high_above_ma60(df: pd.DataFrame) -> pd.Series:
+def high_above_ma60(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """High price >= MA60"""
-    ma = calculate_moving_average(df['close'], 60)
-    return (df['high'] >= ma).astype(int)
+    return (df['high'] >= close_ma).astype(int)
 
 
 @feature_registry.register(
     'high_above_ma120',
     category='ma',
-    description='High >= MA120 (binary)'
+    description='High >= MA120 (binary)',
+    inputs={'close_ma': ma('close', 120)}
 )
-def high_above_ma120(df: pd.DataFrame) -> pd.Series:
+def high_above_ma120(df: pd.DataFrame, close_ma: pd.Series) -> pd.Series:
     """High price >= MA120"""
-    ma = calculate_moving_average(df['close'], 120)
-    return (df['high'] >= ma).astype(int)
+    return (df['high'] >= close_ma).astype(int)
 
 
 @feature_registry.register(
     'ma_alignment',
     category='ma',
-    description='MA alignment (5 > 20 > 60) (binary)'
-)
-def ma_alignment(df: pd.DataFrame) -> pd.Series:
+    description='MA alignment (5 > 20 > 60) (binary)',
+    inputs={
+        'ma5_val': ma('close', 5),
+        'ma20_val': ma('close', 20),
+        'ma60_val': ma('close', 60),
+    }
+)
+def ma_alignment(
+    df: pd.DataFrame,
+    ma5_val: pd.Series,
+    ma20_val: pd.Series,
+    ma60_val: pd.Series
+) -> pd.Series:
     """MA alignment (정배열): MA5 > MA20 > MA60"""
-    ma5_val = calculate_moving_average(df['close'], 5)
-    ma20_val = calculate_moving_average(df['close'], 20)
-    ma60_val = calculate_moving_average(df['close'], 60)
-
     return is_ma_aligned(ma5_val, ma20_val, ma60_val).astype(int)
 
 
@@ -408,57 +459,65 @@ def ma_alignment(df: pd.DataFrame) -> pd.Series:
 # TECHNICAL INDICATORS
 # ============================================================================
 
+# MACD(12, 26, 9) intermediates (see calculate_macd)
+MACD_LINE = difference(ema('close', 12), ema('close', 26))
+MACD_SIGNAL = ema(MACD_LINE, 9)
+
 @feature_registry.register(
     'rsi_14',
     category='technical',
-    description='14-period RSI'
+    description='14-period RSI',
+    inputs={'avg_gain': ma(gain('close'), 14), 'avg_loss': ma(loss('close'), 14)}
 )
-def rsi_14(df: pd.DataFrame) -> pd.Series:
-    """RSI with 14-period"""
-    return calculate_rsi(df['close'], 14)
+def rsi_14(df: pd.DataFrame, avg_gain: pd.Series, avg_loss: pd.Series) -> pd.Series:
+    """RSI with 14-period (see calculate_rsi)"""
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
 
 
 @feature_registry.register(
     'macd',
     category='technical',
-    description='MACD line'
+    description='MACD line',
+    inputs={'macd_line': MACD_LINE}
 )
-def macd(df: pd.DataFrame) -> pd.Series:
-    """MACD line"""
-    macd_line, _, _ = calculate_macd(df['close'])
+def macd(df: pd.DataFrame, macd_line: pd.Series) -> pd.Series:
+    """MACD line (see calculate_macd)"""
     return macd_line
 
 
 @feature_registry.register(
     'macd_signal',
     category='technical',
-    description='MACD signal line'
+    description='MACD signal line',
+    inputs={'signal_line': MACD_SIGNAL}
 )
-def macd_signal(df: pd.DataFrame) -> pd.Series:
+def macd_signal(df: pd.DataFrame, signal_line: pd.Series) -> pd.Series:
     """MACD signal line"""
-    _, signal_line, _ = calculate_macd(df['close'])
     return signal_line
 
 
 @feature_registry.register(
     'macd_histogram',
     category='technical',
-    description='MACD histogram'
+    description='MACD histogram',
+    inputs={'macd_line': MACD_LINE, 'signal_line': MACD_SIGNAL}
 )
-def macd_histogram(df: pd.DataFrame) -> pd.Series:
+def macd_histogram(df: pd.DataFrame, macd_line: pd.Series, signal_line: pd.Series) -> pd.Series:
     """MACD histogram"""
-    _, _, histogram = calculate_macd(df['close'])
-    return histogram
+    return macd_line - signal_line
 
 
 @feature_registry.register(
     'bollinger_width',
     category='technical',
-    description='Bollinger band width'
+    description='Bollinger band width',
+    inputs={'middle': ma('close', 20), 'std': rolling_std('close', 20)}
 )
-def bollinger_width(df: pd.DataFrame) -> pd.Series:
-    """Bollinger band width"""
-    upper, middle, lower = calculate_bollinger_bands(df['close'])
+def bollinger_width(df: pd.DataFrame, middle: pd.Series, std: pd.Series) -> pd.Series:
+    """Bollinger band width (see calculate_bollinger_bands, 2 std)"""
+    upper = middle + (std * 2.0)
+    lower = middle - (std * 2.0)
     return (upper - lower) / middle
 
 
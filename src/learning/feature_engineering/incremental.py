@@ -0,0 +1,628 @@
+"""
+Incremental Feature Engine
+
+Per-ticker rolling state for live (end-of-day) feature computation.
+
+``FeatureRegistry.extract`` recomputes every intermediate over the full history.
+For daily scoring only the newest candle changes, so this engine keeps one small
+state object per intermediate (running sums for moving averages, EMA values,
+monotonic deques for rolling maxima, lag buffers, running min/max) and advances
+it in O(1) per candle. Because feature functions are row-local given their
+inputs (see intermediates.py), the registered functions themselves are then
+evaluated on the new rows only.
+
+Feature values of a new row equal the last row of ``extract`` over the full
+history up to that row. States serialize to JSON (FeatureStateStore) so a daily
+job resumes where the previous run stopped.
+
+Example:
+    >>> engine = IncrementalFeatureEngine()
+    >>> state, history_features = engine.warm_up('005930', history_df)
+    >>> today = engine.update(state, new_rows_df)   # features for new rows only
+    >>> FeatureStateStore('data/feature_state').save(state)
+"""
+import json
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import block_features  # noqa: F401 (register features)
+from .intermediates import Intermediate
+from .registry import FeatureRegistry, feature_registry
+
+
+# ============================================================================
+# Node states (one per intermediate spec)
+# ============================================================================
+
+class _NodeState:
+    """Streaming state of one intermediate; step() consumes one value per row"""
+
+    def step(self, *values: float) -> float:
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def load(self, data: Dict[str, Any]):
+        raise NotImplementedError
+
+
+class _ColumnState(_NodeState):
+    def step(self, value):
+        return value
+
+    def to_dict(self):
+        return {}
+
+    def load(self, data):
+        pass
+
+
+class _RollingMeanState(_NodeState):
+    """Rolling mean (running sum over a fixed window, NaN-aware like pandas)"""
+
+    # Re-sum the window every N steps to bound floating-point drift
+    RESYNC_EVERY = 1024
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: Deque[float] = deque(maxlen=window)
+        self.total = 0.0
+        self.valid = 0
+        self.steps = 0
+
+    def step(self, value):
+        if len(self.values) == self.window:
+            old = self.values[0]
+            if not math.isnan(old):
+                self.total -= old
+                self.valid -= 1
+        self.values.append(value)
+        if not math.isnan(value):
+            self.total += value
+            self.valid += 1
+
+        self.steps += 1
+        if self.steps % self.RESYNC_EVERY == 0:
+            self.total = math.fsum(v for v in self.values if not math.isnan(v))
+
+        return self.total / self.valid if self.valid >= self.window else math.nan
+
+    def to_dict(self):
+        return {'values': list(self.values), 'steps': self.steps}
+
+    def load(self, data):
+        self.values = deque(data['values'], maxlen=self.window)
+        valid = [v for v in self.values if not math.isnan(v)]
+        self.total = math.fsum(valid)
+        self.valid = len(valid)
+        self.steps = data['steps']
+
+
+class _RollingStdState(_NodeState):
+    """
+    Rolling sample standard deviation (ddof=1), O(1) per step
+
+    Keeps running sums of (value - shift) and its square, adding the incoming value
+    and subtracting the one leaving the window. shift is the window mean at the last
+    resync, which keeps the sums small and avoids cancellation in sum(x^2) - sum(x)^2/n.
+    """
+
+    # Re-sum the window every N steps to bound floating-point drift
+    RESYNC_EVERY = 1024
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: Deque[float] = deque(maxlen=window)
+        self.shift = 0.0
+        self.total = 0.0
+        self.squares = 0.0
+        self.valid = 0
+        self.steps = 0
+
+    def step(self, value):
+        if len(self.values) == self.window:
+            old = self.values[0]
+            if not math.isnan(old):
+                delta = old - self.shift
+                self.total -= delta
+                self.squares -= delta * delta
+                self.valid -= 1
+        self.values.append(value)
+        if not math.isnan(value):
+            if self.valid == 0:
+                self.shift, self.total, self.squares = value, 0.0, 0.0
+            delta = value - self.shift
+            self.total += delta
+            self.squares += delta * delta
+            self.valid += 1
+
+        self.steps += 1
+        if self.steps % self.RESYNC_EVERY == 0:
+            self._resync()
+
+        if self.valid < self.window or self.window < 2:
+            return math.nan
+        variance = (self.squares - self.total * self.total / self.valid) / (self.valid - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def _resync(self):
+        valid = [v for v in self.values if not math.isnan(v)]
+        self.valid = len(valid)
+        self.shift = math.fsum(valid) / len(valid) if valid else 0.0
+        self.total = math.fsum(v - self.shift for v in valid)
+        self.squares = math.fsum((v - self.shift) ** 2 for v in valid)
+
+    def to_dict(self):
+        return {'values': list(self.values), 'steps': self.steps}
+
+    def load(self, data):
+        self.values = deque(data['values'], maxlen=self.window)
+        self.steps = data.get('steps', 0)
+        self._resync()
+
+
+class _RollingMaxState(_NodeState):
+    """Rolling maximum via a monotonic deque of (position, value)"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.position = -1
+        self.candidates: Deque[Tuple[int, float]] = deque()
+        self.nan_flags: Deque[bool] = deque(maxlen=window)
+        self.nan_count = 0
+
+    def step(self, value):
+        self.position += 1
+
+        if len(self.nan_flags) == self.window and self.nan_flags[0]:
+            self.nan_count -= 1
+        is_nan = math.isnan(value)
+        self.nan_flags.append(is_nan)
+        self.nan_count += is_nan
+
+        if not is_nan:
+            while self.candidates and self.candidates[-1][1] <= value:
+                self.candidates.pop()
+            self.candidates.append((self.position, value))
+        while self.candidates and self.candidates[0][0] <= self.position - self.window:
+            self.candidates.popleft()
+
+        valid = len(self.nan_flags) - self.nan_count
+        return self.candidates[0][1] if valid >= self.window else math.nan
+
+    def to_dict(self):
+        return {
+            'position': self.position,
+            'candidates': [list(item) for item in self.candidates],
+            'nan_flags': list(self.nan_flags),
+        }
+
+    def load(self, data):
+        self.position = data['position']
+        self.candidates = deque((int(p), v) for p, v in data['candidates'])
+        self.nan_flags = deque(data['nan_flags'], maxlen=self.window)
+        self.nan_count = sum(self.nan_flags)
+
+
+class _EmaState(_NodeState):
+    """EMA with adjust=False (same update arithmetic as pandas ewm)"""
+
+    def __init__(self, span: int):
+        self.alpha = 2.0 / (span + 1.0)
+        self.value: Optional[float] = None
+
+    def step(self, value):
+        if math.isnan(value):
+            return math.nan if self.value is None else self.value
+        if self.value is None:
+            self.value = value
+        elif self.value != value:
+            old_weight = 1.0 - self.alpha
+            self.value = (old_weight * self.value + self.alpha * value) / (old_weight + self.alpha)
+        return self.value
+
+    def to_dict(self):
+        return {'value': self.value}
+
+    def load(self, data):
+        self.value = data['value']
+
+
+class _LagState(_NodeState):
+    """Value periods rows earlier"""
+
+    def __init__(self, periods: int):
+        self.periods = periods
+        self.values: Deque[float] = deque(maxlen=periods + 1)
+
+    def step(self, value):
+        self.values.append(value)
+        return self.values[0] if len(self.values) > self.periods else math.nan
+
+    def to_dict(self):
+        return {'values': list(self.values)}
+
+    def load(self, data):
+        self.values = deque(data['values'], maxlen=self.periods + 1)
+
+
+class _ChangeState(_LagState):
+    """gain / loss: signed part of the change over periods rows"""
+
+    def __init__(self, periods: int, positive: bool):
+        super().__init__(periods)
+        self.positive = positive
+
+    def step(self, value):
+        previous = super().step(value)
+        delta = value - previous
+        if self.positive:
+            return delta if delta > 0 else 0.0
+        return -(delta if delta < 0 else 0.0)
+
+
+class _ExtremeState(_NodeState):
+    """Running min / max over everything seen (= whole-series value at the last row)"""
+
+    def __init__(self, maximum: bool):
+        self.maximum = maximum
+        self.value = math.nan
+
+    def step(self, value):
+        if not math.isnan(value) and (
+            math.isnan(self.value)
+            or (value > self.value if self.maximum else value < self.value)
+        ):
+            self.value = value
+        return self.value
+
+    def to_dict(self):
+        return {'value': self.value}
+
+    def load(self, data):
+        self.value = data['value']
+
+
+class _ElementwiseState(_NodeState):
+    """Stateless per-row operation"""
+
+    def __init__(self, operation):
+        self.operation = operation
+
+    def step(self, *values):
+        return self.operation(*values)
+
+    def to_dict(self):
+        return {}
+
+    def load(self, data):
+        pass
+
+
+def _log1p(value: float) -> float:
+    return float(np.log1p(value))
+
+
+def _node_state(spec: Intermediate) -> _NodeState:
+    """State implementing spec (same semantics as intermediates._OPERATIONS)"""
+    kind, window = spec.kind, spec.window
+    if kind == 'column':
+        return _ColumnState()
+    if kind == 'ma':
+        return _RollingMeanState(window)
+    if kind == 'rolling_std':
+        return _RollingStdState(window)
+    if kind == 'rolling_max':
+        return _RollingMaxState(window)
+    if kind == 'ema':
+        return _EmaState(window)
+    if kind == 'lag':
+        return _LagState(window)
+    if kind in ('gain', 'loss'):
+        return _ChangeState(window, positive=(kind == 'gain'))
+    if kind in ('global_min', 'global_max'):
+        return _ExtremeState(maximum=(kind == 'global_max'))
+    if kind == 'log1p':
+        return _ElementwiseState(_log1p)
+    if kind == 'product':
+        return _ElementwiseState(lambda a, b: a * b)
+    if kind == 'difference':
+        return _ElementwiseState(lambda a, b: a - b)
+    raise ValueError(f"No incremental state for intermediate kind: {kind}")
+
+
+# ============================================================================
+# Ticker state
+# ============================================================================
+
+@dataclass
+class TickerFeatureState:
+    """Rolling state of one ticker"""
+    ticker: str
+    fingerprint: str  # engine configuration (feature names + intermediate keys)
+    nodes: Dict[str, _NodeState] = field(default_factory=dict)
+    last_index: Any = None  # index label of the last consumed row
+    rows_seen: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        last_index = self.last_index
+        if isinstance(last_index, pd.Timestamp):
+            last_index = {'timestamp': last_index.isoformat()}
+        elif isinstance(last_index, np.integer):
+            last_index = int(last_index)
+
+        return {
+            'ticker': self.ticker,
+            'fingerprint': self.fingerprint,
+            'last_index': last_index,
+            'rows_seen': self.rows_seen,
+            'nodes': {key: node.to_dict() for key, node in self.nodes.items()},
+        }
+
+
+class IncrementalFeatureEngine:
+    """
+    Incremental feature computation
+
+    Args:
+        feature_names: Features to produce (None = all enabled context-free features)
+        registry: Feature registry
+    """
+
+    def __init__(
+        self,
+        feature_names: Optional[List[str]] = None,
+        registry: FeatureRegistry = feature_registry
+    ):
+        if feature_names is None:
+            feature_names = [
+                name for name in registry.list_features()
+                if not registry.get_metadata(name).requires
+            ]
+
+        self.registry = registry
+        self.feature_names = list(feature_names)
+        self.order = registry.evaluation_order(self.feature_names)
+        self.specs = self._intermediate_order()
+        self.fingerprint = json.dumps(
+            [self.feature_names, [spec.key for spec in self.specs]]
+        )
+
+    def _intermediate_order(self) -> List[Intermediate]:
+        """All intermediates needed by the features, sources before dependents"""
+        ordered: List[Intermediate] = []
+        seen = set()
+
+        def visit(spec: Intermediate):
+            if spec in seen:
+                return
+            for source in spec.sources:
+                visit(source)
+            seen.add(spec)
+            ordered.append(spec)
+
+        for name in self.order:
+            for source in self.registry.get_metadata(name).inputs.values():
+                if isinstance(source, Intermediate):
+                    visit(source)
+        return ordered
+
+    # ========================================================================
+    # State lifecycle
+    # ========================================================================
+
+    def new_state(self, ticker: str) -> TickerFeatureState:
+        """Empty state (no history)"""
+        return TickerFeatureState(
+            ticker=ticker,
+            fingerprint=self.fingerprint,
+            nodes={spec.key: _node_state(spec) for spec in self.specs}
+        )
+
+    def warm_up(
+        self,
+        ticker: str,
+        history: pd.DataFrame,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[TickerFeatureState, pd.DataFrame]:
+        """
+        Build state from full history
+
+        Returns:
+            (state, features of every history row as produced incrementally)
+        """
+        state = self.new_state(ticker)
+        return state, self.update(state, history, context)
+
+    def state_from_dict(self, data: Dict[str, Any]) -> TickerFeatureState:
+        """
+        Restore a serialized state
+
+        Raises:
+            ValueError: If the state was built for a different feature set
+        """
+        if data['fingerprint'] != self.fingerprint:
+            raise ValueError(
+                f"Feature state of {data['ticker']} was built for a different feature set"
+            )
+
+        state = self.new_state(data['ticker'])
+        for key, node_data in data['nodes'].items():
+            state.nodes[key].load(node_data)
+        state.rows_seen = data['rows_seen']
+        last_index = data['last_index']
+        if isinstance(last_index, dict):
+            last_index = pd.Timestamp(last_index['timestamp'])
+        state.last_index = last_index
+        return state
+
+    # ========================================================================
+    # Updates
+    # ========================================================================
+
+    def update(
+        self,
+        state: TickerFeatureState,
+        rows: pd.DataFrame,
+        context: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """
+        Advance state by new rows and return their features
+
+        Args:
+            state: Ticker state (modified in place)
+            rows: New OHLCV rows, strictly after the rows already consumed
+            context: Context for features with requires (e.g. block1 info)
+
+        Returns:
+            DataFrame (index = rows.index, columns = feature_names)
+
+        Raises:
+            ValueError: If rows do not come after the state's last row
+        """
+        intermediates = self._advance(state, rows)
+        return self._evaluate(rows, intermediates, context)
+
+    def update_many(
+        self,
+        states: Dict[str, TickerFeatureState],
+        rows: Dict[str, pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Daily update of many tickers (context-free features)
+
+        States advance per ticker; the feature functions then run once over all
+        tickers' new rows stacked together.
+
+        Args:
+            states: Ticker → state (missing tickers start empty)
+            rows: Ticker → new rows
+
+        Returns:
+            DataFrame indexed by (ticker, original index)
+        """
+        frames, parts = [], {spec: [] for spec in self.specs}
+        for ticker, ticker_rows in rows.items():
+            if ticker not in states:
+                states[ticker] = self.new_state(ticker)
+            advanced = self._advance(states[ticker], ticker_rows)
+            frames.append(ticker_rows)
+            for spec in self.specs:
+                parts[spec].append(advanced[spec])
+
+        if not frames:
+            return pd.DataFrame(columns=self.feature_names)
+
+        index = pd.MultiIndex.from_tuples(
+            [(ticker, idx) for ticker, ticker_rows in rows.items() for idx in ticker_rows.index],
+            names=['ticker', None]
+        )
+        stacked = pd.concat(frames)
+        stacked.index = index
+        intermediates = {
+            spec: pd.Series(np.concatenate(parts[spec]), index=index)
+            for spec in self.specs
+        }
+        return self._evaluate(stacked, intermediates, None)
+
+    def _advance(self, state: TickerFeatureState, rows: pd.DataFrame) -> Dict[Intermediate, np.ndarray]:
+        """Step every node through rows; returns each intermediate's values for rows"""
+        if state.fingerprint != self.fingerprint:
+            raise ValueError(f"State of {state.ticker} was built for a different feature set")
+        if len(rows) and state.last_index is not None and rows.index[0] <= state.last_index:
+            raise ValueError(
+                f"{state.ticker}: rows must start after {state.last_index}, got {rows.index[0]}"
+            )
+
+        columns = {
+            spec.column: rows[spec.column].to_numpy(dtype=float)
+            for spec in self.specs if spec.kind == 'column'
+        }
+        values = {spec: np.empty(len(rows)) for spec in self.specs}
+        nodes = [(spec, state.nodes[spec.key]) for spec in self.specs]
+
+        for i in range(len(rows)):
+            for spec, node in nodes:
+                if spec.kind == 'column':
+                    values[spec][i] = node.step(float(columns[spec.column][i]))
+                else:
+                    values[spec][i] = node.step(*(values[source][i] for source in spec.sources))
+
+        if len(rows):
+            state.rows_seen += len(rows)
+            state.last_index = rows.index[-1]
+        return values
+
+    def _evaluate(
+        self,
+        rows: pd.DataFrame,
+        intermediates: Dict[Intermediate, Any],
+        context: Optional[Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """Run the registered (row-local) feature functions on the new rows"""
+        context = context or {}
+        series = {
+            spec: value if isinstance(value, pd.Series) else pd.Series(value, index=rows.index)
+            for spec, value in intermediates.items()
+        }
+        computed: Dict[str, Any] = {}
+
+        for name in self.order:
+            meta = self.registry.get_metadata(name)
+            for req in meta.requires:
+                if req not in context:
+                    raise ValueError(f"Feature '{name}' requires context key '{req}'")
+
+            kwargs = {k: context[k] for k in meta.requires}
+            for arg, source in meta.inputs.items():
+                kwargs[arg] = series[source] if isinstance(source, Intermediate) else computed[source]
+            computed[name] = meta.func(rows, **kwargs)
+
+        return pd.DataFrame({name: computed[name] for name in self.feature_names}, index=rows.index)
+
+
+# ============================================================================
+# Persistence
+# ============================================================================
+
+class FeatureStateStore:
+    """One JSON file per ticker (<directory>/<ticker>.json)"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def path(self, ticker: str) -> Path:
+        return self.directory / f"{ticker}.json"
+
+    def save(self, state: TickerFeatureState):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path(state.ticker).with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state.to_dict(), f)
+        # Atomic replace: a crash never leaves a half-written state
+        tmp_path.replace(self.path(state.ticker))
+
+    def load(self, engine: IncrementalFeatureEngine, ticker: str) -> Optional[TickerFeatureState]:
+        """
+        Stored state, or None if missing / built for another feature set
+        (the caller then warms up from full history)
+        """
+        path = self.path(ticker)
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        try:
+            return engine.state_from_dict(data)
+        except ValueError:
+            return None
+
+    def tickers(self) -> List[str]:
+        return sorted(path.stem for path in self.directory.glob('*.json'))
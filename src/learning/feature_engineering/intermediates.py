@@ -0,0 +1,223 @@
+"""
+Shared Intermediate Series
+
+Declarative specs for intermediate series (moving averages, rolling max/std, EMA, ...)
+that several features build on. Features declare the intermediates they need via
+``FeatureRegistry.register(inputs=...)`` and the registry computes each one exactly
+once per extraction through an ``IntermediateCache``.
+
+Every look-back (shift, rolling window, EMA, whole-series min/max) is expressed as
+an intermediate, so feature functions themselves are row-local: the value at row t
+depends only on row t and the inputs at row t. The incremental engine
+(see incremental.py) relies on this to update features one candle at a time.
+
+Example:
+    >>> @feature_registry.register(
+    ...     'ma_deviation_60', category='ma',
+    ...     inputs={'ma': ma('close', 60)}
+    ... )
+    ... def ma_deviation_60(df, ma):
+    ...     return calculate_ma_deviation(df['close'], ma)
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .technical_indicators import calculate_moving_average, calculate_ema
+
+
+@dataclass(frozen=True)
+class Intermediate:
+    """
+    Spec for an intermediate series
+
+    Specs are hashable and compare by value, so ``ma('close', 20)`` declared by two
+    different features refers to the same cached series.
+
+    Attributes:
+        kind: Operation ('column', 'ma', 'ema', 'rolling_max', 'rolling_std',
+              'lag', 'gain', 'loss', 'log1p', 'global_min', 'global_max',
+              'product', 'difference')
+        sources: Input specs (empty for 'column')
+        column: Column name (only for 'column')
+        window: Window / span / periods (only for windowed operations)
+    """
+    kind: str
+    sources: Tuple['Intermediate', ...] = ()
+    column: str = ""
+    window: int = 0
+
+    def __post_init__(self):
+        if self.kind not in _OPERATIONS:
+            raise ValueError(f"Unknown intermediate kind: {self.kind}")
+        if self.kind in _WINDOWED and self.window < 1:
+            raise ValueError(f"Intermediate '{self.kind}' requires window >= 1, got {self.window}")
+
+    @property
+    def is_causal(self) -> bool:
+        """
+        True if row t depends only on rows <= t
+
+        global_min / global_max look at the whole series (including future rows),
+        so any spec built on them is not causal.
+        """
+        if self.kind in _FULL_SERIES:
+            return False
+        return all(source.is_causal for source in self.sources)
+
+    @property
+    def key(self) -> str:
+        """Readable cache key (e.g. 'ma(close,20)')"""
+        if self.kind == 'column':
+            return self.column
+        args = [source.key for source in self.sources]
+        if self.window:
+            args.append(str(self.window))
+        return f"{self.kind}({','.join(args)})"
+
+
+Source = Union[str, Intermediate]
+
+
+def _as_spec(source: Source) -> Intermediate:
+    """Column name or spec -> spec"""
+    return source if isinstance(source, Intermediate) else col(source)
+
+
+def col(name: str) -> Intermediate:
+    """Raw dataframe column"""
+    return Intermediate('column', column=name)
+
+
+def ma(source: Source, window: int) -> Intermediate:
+    """Simple moving average"""
+    return Intermediate('ma', (_as_spec(source),), window=window)
+
+
+def ema(source: Source, span: int) -> Intermediate:
+    """Exponential moving average (adjust=False)"""
+    return Intermediate('ema', (_as_spec(source),), window=span)
+
+
+def rolling_max(source: Source, window: int) -> Intermediate:
+    """Rolling maximum"""
+    return Intermediate('rolling_max', (_as_spec(source),), window=window)
+
+
+def rolling_std(source: Source, window: int) -> Intermediate:
+    """Rolling sample standard deviation"""
+    return Intermediate('rolling_std', (_as_spec(source),), window=window)
+
+
+def lag(source: Source, periods: int) -> Intermediate:
+    """Value periods rows earlier (shift)"""
+    return Intermediate('lag', (_as_spec(source),), window=periods)
+
+
+def gain(source: Source) -> Intermediate:
+    """Positive part of the 1-row change (0 where falling / undefined)"""
+    return Intermediate('gain', (_as_spec(source),), window=1)
+
+
+def loss(source: Source) -> Intermediate:
+    """Negated negative part of the 1-row change (0 where rising / undefined)"""
+    return Intermediate('loss', (_as_spec(source),), window=1)
+
+
+def log1p(source: Source) -> Intermediate:
+    """log(1 + x)"""
+    return Intermediate('log1p', (_as_spec(source),))
+
+
+def global_min(source: Source) -> Intermediate:
+    """Minimum over the whole series (broadcast to every row)"""
+    return Intermediate('global_min', (_as_spec(source),))
+
+
+def global_max(source: Source) -> Intermediate:
+    """Maximum over the whole series (broadcast to every row)"""
+    return Intermediate('global_max', (_as_spec(source),))
+
+
+def product(left: Source, right: Source) -> Intermediate:
+    """Element-wise product (e.g. close * volume)"""
+    return Intermediate('product', (_as_spec(left), _as_spec(right)))
+
+
+def difference(left: Source, right: Source) -> Intermediate:
+    """Element-wise difference (e.g. EMA12 - EMA26)"""
+    return Intermediate('difference', (_as_spec(left), _as_spec(right)))
+
+
+def _gain(series: pd.Series, periods: int) -> pd.Series:
+    delta = series.diff(periods)
+    return delta.where(delta > 0, 0)
+
+
+def _loss(series: pd.Series, periods: int) -> pd.Series:
+    delta = series.diff(periods)
+    return -delta.where(delta < 0, 0)
+
+
+# Operations taking (series, window); the others take their source series only
+_WINDOWED = {'ma', 'ema', 'rolling_max', 'rolling_std', 'lag', 'gain', 'loss'}
+
+# Operations that look at the whole series (future rows included)
+_FULL_SERIES = {'global_min', 'global_max'}
+
+_OPERATIONS: Dict[str, Callable] = {
+    'column': None,
+    'ma': lambda s, w: calculate_moving_average(s, w),
+    'ema': lambda s, w: calculate_ema(s, w),
+    'rolling_max': lambda s, w: s.rolling(window=w).max(),
+    'rolling_std': lambda s, w: s.rolling(window=w).std(),
+    'lag': lambda s, w: s.shift(w),
+    'gain': _gain,
+    'loss': _loss,
+    'log1p': lambda s: np.log1p(s),
+    'global_min': lambda s: pd.Series(s.min(), index=s.index),
+    'global_max': lambda s: pd.Series(s.max(), index=s.index),
+    'product': lambda a, b: a * b,
+    'difference': lambda a, b: a - b,
+}
+
+
+class IntermediateCache:
+    """
+    Per-extraction memo of intermediate series
+
+    Sources are resolved recursively before the spec itself, so nested specs
+    (e.g. ``ema(difference(ema('close', 12), ema('close', 26)), 9)``) are evaluated
+    in dependency order and every node is computed once.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._series: Dict[Intermediate, pd.Series] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, spec: Intermediate) -> pd.Series:
+        """Return the series for spec, computing it (and its sources) on first use"""
+        if spec in self._series:
+            self.hits += 1
+            return self._series[spec]
+
+        self.misses += 1
+        if spec.kind == 'column':
+            series = self.df[spec.column]
+        else:
+            inputs = [self.get(source) for source in spec.sources]
+            operation = _OPERATIONS[spec.kind]
+            series = operation(inputs[0], spec.window) if spec.kind in _WINDOWED else operation(*inputs)
+
+        self._series[spec] = series
+        return series
+
+    def __contains__(self, spec: Intermediate) -> bool:
+        return spec in self._series
+
+    def __len__(self) -> int:
+        return len(self._series)
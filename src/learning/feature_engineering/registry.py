@@ -4,12 +4,21 @@ Feature Registry System
 This module provides a registry pattern for managing feature extraction functions.
 Features can be registered, enabled/disabled, and extracted dynamically based on
 configuration files.
+
+Features may declare inputs: shared intermediate series (see intermediates.py)
+or other features. During one extract() call every intermediate is computed once
+and features are evaluated in dependency order.
 """
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Union
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass, field
 
+from .intermediates import Intermediate, IntermediateCache
+
+# Input declaration: intermediate spec or name of another feature
+FeatureInput = Union[Intermediate, str]
+
 
 @dataclass
 class FeatureMetadata:
@@ -19,6 +28,7 @@ class FeatureMetadata:
     category: str
     description: str = ""
     requires: List[str] = field(default_factory=list)  # Required context keys
+    inputs: Dict[str, FeatureInput] = field(default_factory=dict)  # kwarg -> intermediate / feature
     enabled: bool = True
     version: str = "1.0"
 
@@ -49,7 +59,8 @@ class FeatureRegistry:
         category: str,
         description: str = "",
         requires: List[str] = None,
-        version: str = "1.0"
+        version: str = "1.0",
+        inputs: Dict[str, FeatureInput] = None
     ):
         """
         Decorator to register a feature function
@@ -60,6 +71,8 @@ class FeatureRegistry:
             description: Human-readable description
             requires: List of required context keys (e.g., ['block1_high'])
             version: Feature version for tracking changes
+            inputs: Keyword arguments resolved before the call, mapping to an
+                Intermediate spec (e.g. ma('close', 20)) or another feature name
         """
         def decorator(func: Callable):
             self._features[name] = FeatureMetadata(
@@ -68,6 +81,7 @@ class FeatureRegistry:
                 category=category,
                 description=description,
                 requires=requires or [],
+                inputs=dict(inputs or {}),
                 enabled=True,
                 version=version
             )
@@ -104,6 +118,23 @@ class FeatureRegistry:
             raise ValueError(f"Unknown feature: {name}")
         return self._features[name]
 
+    def is_causal(self, name: str) -> bool:
+        """
+        Whether a feature at row t uses only rows <= t
+
+        Features normalized by whole-series min/max (global_min / global_max
+        intermediates, directly or via feature inputs) see future rows and are
+        not causal.
+        """
+        meta = self.get_metadata(name)
+        for source in meta.inputs.values():
+            if isinstance(source, Intermediate):
+                if not source.is_causal:
+                    return False
+            elif not self.is_causal(source):
+                return False
+        return True
+
     def enable(self, name: str):
         """Enable a feature"""
         if name not in self._features:
@@ -125,6 +156,11 @@ class FeatureRegistry:
         """
         Extract selected features from data
 
+        Declared inputs are resolved through a per-call IntermediateCache, so an
+        intermediate such as MA60(close) shared by several features is computed once.
+        Feature inputs are evaluated first (dependency order) and reused, but only
+        the requested names appear in the result.
+
         Args:
             names: List of feature names to extract
             df: Input dataframe with OHLCV data
@@ -136,12 +172,10 @@ class FeatureRegistry:
         if context is None:
             context = {}
 
-        results = {}
-
-        for name in names:
-            if name not in self._features:
-                raise ValueError(f"Unknown feature: {name}")
+        cache = IntermediateCache(df)
+        computed: Dict[str, Any] = {}
 
+        for name in self.evaluation_order(names):
             meta = self._features[name]
 
             if not meta.enabled:
@@ -156,20 +190,58 @@ class FeatureRegistry:
 
             # Extract feature
             try:
-                if meta.requires:
-                    # Pass context as kwargs
-                    feature_data = meta.func(df, **{k: context[k] for k in meta.requires})
-                else:
-                    feature_data = meta.func(df)
+                kwargs = {k: context[k] for k in meta.requires}
+                for arg, source in meta.inputs.items():
+                    kwargs[arg] = (
+                        cache.get(source) if isinstance(source, Intermediate)
+                        else computed[source]
+                    )
 
-                results[name] = feature_data
+                computed[name] = meta.func(df, **kwargs)
 
             except Exception as e:
                 raise RuntimeError(
                     f"Failed to extract feature '{name}': {e}"
                 ) from e
 
-        return pd.DataFrame(results, index=df.index)
+        return pd.DataFrame({name: computed[name] for name in names}, index=df.index)
+
+    def evaluation_order(self, names: List[str]) -> List[str]:
+        """
+        Topological evaluation order for names and their feature inputs
+
+        Args:
+            names: Requested feature names
+
+        Returns:
+            Feature names (dependencies first, requested order otherwise preserved)
+
+        Raises:
+            ValueError: Unknown feature or circular feature inputs
+        """
+        order: List[str] = []
+        state: Dict[str, str] = {}  # name -> 'visiting' | 'done'
+
+        def visit(name: str, path: List[str]):
+            if name not in self._features:
+                raise ValueError(f"Unknown feature: {name}")
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                cycle = ' -> '.join(path + [name])
+                raise ValueError(f"Circular feature inputs: {cycle}")
+
+            state[name] = 'visiting'
+            for source in self._features[name].inputs.values():
+                if not isinstance(source, Intermediate):
+                    visit(source, path + [name])
+            state[name] = 'done'
+            order.append(name)
+
+        for name in names:
+            visit(name, [])
+
+        return order
 
     def get_categories(self) -> List[str]:
         """Get all feature categories"""
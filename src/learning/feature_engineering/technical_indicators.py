@@ -245,6 +245,34 @@ def normalize_minmax(series: pd.Series, feature_range: Tuple[float, float] = (0,
     return normalized
 
 
+def scale_minmax(
+    series: pd.Series,
+    min_val: pd.Series,
+    max_val: pd.Series,
+    feature_range: Tuple[float, float] = (0, 1)
+) -> pd.Series:
+    """
+    Min-Max scaling with given (per-row) bounds
+
+    Same arithmetic as normalize_minmax when min_val / max_val are the series
+    min / max; rows where max_val == min_val get feature_range[0].
+
+    Args:
+        series: Input series
+        min_val: Lower bound per row
+        max_val: Upper bound per row
+        feature_range: Target range (min, max)
+
+    Returns:
+        Scaled series
+    """
+    span = max_val - min_val
+    scaled = (series - min_val) / span
+    scaled = scaled * (feature_range[1] - feature_range[0]) + feature_range[0]
+
+    return scaled.where(span != 0, feature_range[0])
+
+
 def normalize_zscore(series: pd.Series) -> pd.Series:
     """
     Z-score normalization (standardization)
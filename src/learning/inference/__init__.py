@@ -7,10 +7,12 @@ from src.learning.inference.batch_predictor import BatchPredictor
 from src.learning.inference.realtime_predictor import RealtimePredictor
 from src.learning.inference.model_deployer import ModelDeployer
 from src.learning.inference.prediction_result import PredictionResult
+from src.learning.inference.prediction_server import PredictionServer
 
 __all__ = [
     'BatchPredictor',
     'RealtimePredictor',
     'ModelDeployer',
     'PredictionResult',
+    'PredictionServer',
 ]
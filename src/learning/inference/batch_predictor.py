@@ -7,9 +7,8 @@ from typing import List, Optional
 import time
 import numpy as np
 from datetime import datetime
-import tensorflow as tf
 
-from src.learning.inference.prediction_result import PredictionResult, BatchPredictionResult
+from src.learning.inference.prediction_result import BatchPredictionResult
 from src.learning.inference.model_deployer import ModelDeployer
 
 
@@ -71,38 +70,11 @@ class BatchPredictor:
             # Predict in batches
             predictions = model.predict(features, batch_size=batch_size, verbose=0)
 
-            # Process results
-            for idx, (ticker, (start_date, end_date), probs) in enumerate(
-                zip(tickers, dates, predictions)
-            ):
-                try:
-                    predicted_class = int(np.argmax(probs))
-                    confidence = float(probs[predicted_class])
-
-                    prediction = PredictionResult(
-                        ticker=ticker,
-                        started_at=start_date,
-                        ended_at=end_date,
-                        predicted_class=predicted_class,
-                        confidence_score=confidence,
-                        class_probabilities={
-                            class_id: float(prob)
-                            for class_id, prob in enumerate(probs)
-                        },
-                        model_name=model_name,
-                        model_version=metadata.version if metadata else "unknown",
-                        architecture_type=metadata.architecture_type if metadata else "unknown",
-                        num_features=features.shape[-1] if len(features.shape) > 1 else 0
-                    )
-
-                    result.add_prediction(prediction)
-
-                except Exception as e:
-                    result.add_error(
-                        ticker=ticker,
-                        error=str(e),
-                        details={'index': idx}
-                    )
+            # Columnar result (PredictionResult rows are built lazily on access)
+            result.model_version = metadata.version if metadata else "unknown"
+            result.architecture_type = metadata.architecture_type if metadata else "unknown"
+            result.num_features = features.shape[-1] if len(features.shape) > 1 else 0
+            result.set_columns(tickers, dates, predictions)
 
         except Exception as e:
             # Global error
@@ -147,15 +119,7 @@ class BatchPredictor:
             batch_size=batch_size
         )
 
-        # Filter by confidence
-        filtered_predictions = [
-            p for p in result.predictions
-            if p.confidence_score >= min_confidence
-        ]
-
-        # Update result
-        result.predictions = filtered_predictions
-        result.successful_predictions = len(filtered_predictions)
-        result._update_stats()
+        # Filter by confidence (vectorized mask)
+        result.filter_by_confidence(min_confidence)
 
         return result
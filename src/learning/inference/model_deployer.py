@@ -2,28 +2,98 @@
 Model Deployer
 
 모델 로드 및 배포 관리
+
+Loaded models live in an LRU cache bounded by a memory budget (estimated from the
+parameter count). Models can be preloaded on a background thread at startup and are
+warmed up with one dummy inference per entry point after loading (model.predict for
+BatchPredictor, model(x, training=False) for RealtimePredictor / PredictionServer), so
+the first real prediction on either path does not pay graph tracing.
 """
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from pathlib import Path
 import json
-import tensorflow as tf
 
-from src.learning.models.model_registry import ModelMetadata
+import numpy as np
+
+from src.learning import backend
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    from src.learning.models.model_registry import ModelMetadata
+
+
+@dataclass
+class ModelCacheStats:
+    """Per-model cache metrics (miss = load_model had to read the file)"""
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    evictions: int = 0
+    load_seconds: float = 0.0  # last load
+    warmup_seconds: float = 0.0  # last warm-up inference
+    size_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def estimate_model_bytes(model, model_path: Optional[Path] = None) -> int:
+    """
+    Approximate in-memory size of a model
+
+    float32 weights (count_params * 4); falls back to the model file size.
+    """
+    if hasattr(model, 'count_params'):
+        return int(model.count_params()) * 4
+    if model_path is not None and model_path.exists():
+        return model_path.stat().st_size
+    return 0
 
 
 class ModelDeployer:
     """모델 배포 관리자"""
 
-    def __init__(self, model_dir: str = "models"):
+    def __init__(
+        self,
+        model_dir: str = "models",
+        memory_budget_mb: Optional[float] = None,
+        warmup: bool = True,
+        preload: Optional[List[str]] = None
+    ):
         """
         Args:
             model_dir: Directory containing saved models
+            memory_budget_mb: Cache budget; least recently used models are evicted
+                beyond it (None = unbounded)
+            warmup: Run one dummy inference after loading
+            preload: Model names to load on a background thread at startup
         """
         self.model_dir = Path(model_dir)
         self.model_dir.mkdir(parents=True, exist_ok=True)
 
-        self.loaded_models: Dict[str, tf.keras.Model] = {}
+        self.memory_budget_bytes = (
+            int(memory_budget_mb * 1024 * 1024) if memory_budget_mb is not None else None
+        )
+        self.warmup = warmup
+
+        # LRU order: least recently used first
+        self.loaded_models: OrderedDict[str, tf.keras.Model] = OrderedDict()
         self.model_metadata: Dict[str, ModelMetadata] = {}
+        self.cache_stats: Dict[str, ModelCacheStats] = {}
+
+        self._lock = threading.RLock()
+        self._loading: Dict[str, threading.Event] = {}
+        self._preload_thread: Optional[threading.Thread] = None
+        self.preload_errors: Dict[str, str] = {}
+
+        if preload:
+            self.preload(preload)
 
     def load_model(
         self,
@@ -43,31 +113,66 @@ class ModelDeployer:
         Raises:
             FileNotFoundError: If model file not found
         """
-        # Check if already loaded
-        if model_name in self.loaded_models:
-            return self.loaded_models[model_name]
-
-        # Determine model path
-        if model_path is None:
-            model_path = self.model_dir / f"{model_name}.h5"
-        else:
-            model_path = Path(model_path)
+        with self._lock:
+            stats = self._stats(model_name)
+
+            # Check if already loaded
+            if model_name in self.loaded_models:
+                stats.hits += 1
+                self.loaded_models.move_to_end(model_name)
+                return self.loaded_models[model_name]
+
+            # Another thread (e.g. preload) is loading it: wait instead of loading twice
+            in_flight = self._loading.get(model_name)
+            if in_flight is None:
+                stats.misses += 1
+                self._loading[model_name] = threading.Event()
+
+        if in_flight is not None:
+            in_flight.wait()
+            return self.load_model(model_name, model_path)
+
+        # Disk I/O and warm-up run outside the lock so cached models stay available
+        try:
+            # Determine model path
+            if model_path is None:
+                model_path = self.model_dir / f"{model_name}.h5"
+            else:
+                model_path = Path(model_path)
+
+            if not model_path.exists():
+                raise FileNotFoundError(f"Model file not found: {model_path}")
+
+            # Load model
+            start = time.perf_counter()
+            model = backend.keras().models.load_model(str(model_path))
+            load_seconds = time.perf_counter() - start
+
+            warmup_seconds = self._warm_up(model) if self.warmup else 0.0
+
+            # Load metadata if exists
+            metadata = None
+            metadata_path = model_path.parent / f"{model_name}_metadata.json"
+            if metadata_path.exists():
+                from src.learning.models.model_registry import ModelMetadata
 
-        if not model_path.exists():
-            raise FileNotFoundError(f"Model file not found: {model_path}")
+                with open(metadata_path, 'r', encoding='utf-8') as f:
+                    metadata_dict = json.load(f)
+                    metadata = ModelMetadata.from_dict(metadata_dict)
 
-        # Load model
-        model = tf.keras.models.load_model(str(model_path))
-        self.loaded_models[model_name] = model
+            with self._lock:
+                stats.loads += 1
+                stats.load_seconds = load_seconds
+                stats.warmup_seconds = warmup_seconds
+                if metadata is not None:
+                    self.model_metadata[model_name] = metadata
+                self._cache_put(model_name, model, estimate_model_bytes(model, model_path))
 
-        # Load metadata if exists
-        metadata_path = model_path.parent / f"{model_name}_metadata.json"
-        if metadata_path.exists():
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata_dict = json.load(f)
-                self.model_metadata[model_name] = ModelMetadata.from_dict(metadata_dict)
+            return model
 
-        return model
+        finally:
+            with self._lock:
+                self._loading.pop(model_name).set()
 
     def save_model(
         self,
@@ -96,16 +201,17 @@ class ModelDeployer:
         # Save model
         model.save(str(model_path))
 
-        # Save metadata
-        if metadata:
-            metadata_path = model_path.parent / f"{model_name}_metadata.json"
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata.to_dict(), f, indent=2, ensure_ascii=False)
+        with self._lock:
+            # Save metadata
+            if metadata:
+                metadata_path = model_path.parent / f"{model_name}_metadata.json"
+                with open(metadata_path, 'w', encoding='utf-8') as f:
+                    json.dump(metadata.to_dict(), f, indent=2, ensure_ascii=False)
 
-            self.model_metadata[model_name] = metadata
+                self.model_metadata[model_name] = metadata
 
-        # Cache loaded model
-        self.loaded_models[model_name] = model
+            # Cache loaded model
+            self._cache_put(model_name, model, estimate_model_bytes(model, model_path))
 
     def get_model(self, model_name: str) -> Optional[tf.keras.Model]:
         """
@@ -117,7 +223,15 @@ class ModelDeployer:
         Returns:
             Loaded model or None if not loaded
         """
-        return self.loaded_models.get(model_name)
+        with self._lock:
+            model = self.loaded_models.get(model_name)
+            if model is None:
+                # Counted as a miss by the load_model call that follows
+                return None
+
+            self._stats(model_name).hits += 1
+            self.loaded_models.move_to_end(model_name)
+            return model
 
     def get_metadata(self, model_name: str) -> Optional[ModelMetadata]:
         """
@@ -136,9 +250,10 @@ class ModelDeployer:
         List all loaded models
 
         Returns:
-            List of model names
+            List of model names (least recently used first)
         """
-        return list(self.loaded_models.keys())
+        with self._lock:
+            return list(self.loaded_models.keys())
 
     def list_available_models(self) -> list:
         """
@@ -157,16 +272,124 @@ class ModelDeployer:
         Args:
             model_name: Model identifier
         """
-        if model_name in self.loaded_models:
-            del self.loaded_models[model_name]
+        with self._lock:
+            if model_name in self.loaded_models:
+                del self.loaded_models[model_name]
 
-        if model_name in self.model_metadata:
-            del self.model_metadata[model_name]
+            if model_name in self.model_metadata:
+                del self.model_metadata[model_name]
 
     def unload_all(self):
         """Unload all models from memory"""
-        self.loaded_models.clear()
-        self.model_metadata.clear()
+        with self._lock:
+            self.loaded_models.clear()
+            self.model_metadata.clear()
+
+    # ========================================================================
+    # Preload / cache
+    # ========================================================================
+
+    def preload(self, model_names: List[str], background: bool = True) -> Optional[threading.Thread]:
+        """
+        Load (and warm up) models ahead of the first request
+
+        Failures are recorded in preload_errors instead of raised.
+
+        Args:
+            model_names: Models to load, in priority order
+            background: Load on a daemon thread (default) or synchronously
+
+        Returns:
+            Preload thread (None if synchronous)
+        """
+        def run():
+            for model_name in model_names:
+                try:
+                    self.load_model(model_name)
+                except Exception as e:
+                    self.preload_errors[model_name] = str(e)
+
+        if not background:
+            run()
+            return None
+
+        self._preload_thread = threading.Thread(target=run, name='model-preload', daemon=True)
+        self._preload_thread.start()
+        return self._preload_thread
+
+    def wait_for_preload(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background preloading
+
+        Returns:
+            True if preloading finished (or was never started)
+        """
+        if self._preload_thread is None:
+            return True
+        self._preload_thread.join(timeout)
+        return not self._preload_thread.is_alive()
+
+    @property
+    def cache_size_bytes(self) -> int:
+        """Estimated bytes held by loaded models"""
+        with self._lock:
+            return sum(self._stats(name).size_bytes for name in self.loaded_models)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Cache-wide hit/miss/eviction counters and memory usage"""
+        with self._lock:
+            hits = sum(s.hits for s in self.cache_stats.values())
+            misses = sum(s.misses for s in self.cache_stats.values())
+            return {
+                'loaded_models': list(self.loaded_models.keys()),
+                'size_bytes': self.cache_size_bytes,
+                'budget_bytes': self.memory_budget_bytes,
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+                'evictions': sum(s.evictions for s in self.cache_stats.values()),
+            }
+
+    def _stats(self, model_name: str) -> ModelCacheStats:
+        if model_name not in self.cache_stats:
+            self.cache_stats[model_name] = ModelCacheStats()
+        return self.cache_stats[model_name]
+
+    def _cache_put(self, model_name: str, model, size_bytes: int):
+        """Insert as most recently used and evict LRU models beyond the budget"""
+        self.loaded_models[model_name] = model
+        self.loaded_models.move_to_end(model_name)
+        self._stats(model_name).size_bytes = size_bytes
+
+        if self.memory_budget_bytes is None:
+            return
+
+        # Never evict the model just inserted
+        while len(self.loaded_models) > 1 and self.cache_size_bytes > self.memory_budget_bytes:
+            evicted, _ = self.loaded_models.popitem(last=False)
+            self.model_metadata.pop(evicted, None)
+            self._stats(evicted).evictions += 1
+
+    @staticmethod
+    def _warm_up(model) -> float:
+        """
+        One dummy inference through each entry point before the first real request
+
+        model.predict (BatchPredictor) and model(x, training=False) (call_model in
+        RealtimePredictor / PredictionServer) trace separate functions, so both are warmed.
+
+        Returns:
+            Elapsed seconds (0.0 if the input shape is unknown)
+        """
+        input_shape = getattr(model, 'input_shape', None)
+        if not input_shape or any(dim is None for dim in input_shape[1:]):
+            return 0.0
+
+        dummy = np.zeros((1, *input_shape[1:]), dtype=np.float32)
+        start = time.perf_counter()
+        model.predict(dummy, verbose=0)
+        model(dummy, training=False)
+        return time.perf_counter() - start
 
     def get_model_info(self, model_name: str) -> Dict[str, Any]:
         """
@@ -176,16 +399,18 @@ class ModelDeployer:
             model_name: Model identifier
 
         Returns:
-            Dictionary with model info
+            Dictionary with model info (including cache metrics)
 
         Raises:
             ValueError: If model not found
         """
-        if model_name not in self.loaded_models:
-            raise ValueError(f"Model '{model_name}' not loaded")
+        with self._lock:
+            if model_name not in self.loaded_models:
+                raise ValueError(f"Model '{model_name}' not loaded")
 
-        model = self.loaded_models[model_name]
-        metadata = self.model_metadata.get(model_name)
+            model = self.loaded_models[model_name]
+            metadata = self.model_metadata.get(model_name)
+            stats = self._stats(model_name)
 
         info = {
             'model_name': model_name,
@@ -193,7 +418,8 @@ class ModelDeployer:
             'input_shape': model.input_shape,
             'output_shape': model.output_shape,
             'num_parameters': model.count_params(),
-            'num_layers': len(model.layers)
+            'num_layers': len(model.layers),
+            'cache': stats.to_dict()
         }
 
         if metadata:
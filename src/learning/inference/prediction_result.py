@@ -7,6 +7,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import numpy as np
+import pandas as pd
 
 
 @dataclass
@@ -85,9 +86,15 @@ class PredictionResult:
 
 @dataclass
 class BatchPredictionResult:
-    """배치 예측 결과"""
+    """
+    배치 예측 결과
+
+    Model outputs are held column-wise (tickers, dates, probability matrix, argmax,
+    confidence) and PredictionResult rows are only built when accessed through
+    `predictions` / `get`. Results appended one by one with add_prediction are kept
+    after the columnar rows.
+    """
 
-    predictions: List[PredictionResult] = field(default_factory=list)
     total_predictions: int = 0
     successful_predictions: int = 0
     failed_predictions: int = 0
@@ -97,15 +104,67 @@ class BatchPredictionResult:
     # Model info
     model_name: str = ""
     batch_date: datetime = field(default_factory=datetime.now)
+    model_version: str = "unknown"
+    architecture_type: str = "unknown"
+    num_features: int = 0
 
     # Errors
     errors: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Columnar rows
+    tickers: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    started_at: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    ended_at: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    probabilities: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    predicted_classes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    confidences: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+
+    # Row-wise additions (add_prediction)
+    _extra: List[PredictionResult] = field(default_factory=list, repr=False)
+    _materialized: Optional[List[PredictionResult]] = field(default=None, repr=False)
+    _confidence_sum: float = field(default=0.0, repr=False)
+
+    def set_columns(
+        self,
+        tickers: List[str],
+        dates: List[tuple],
+        probabilities: np.ndarray
+    ):
+        """
+        Store model output for a whole batch (replaces existing columnar rows)
+
+        Args:
+            tickers: Ticker per sample
+            dates: (start_date, end_date) per sample
+            probabilities: (num_samples, num_classes) class probabilities
+        """
+        probabilities = np.asarray(probabilities)
+        num_samples = len(probabilities)
+
+        self.tickers = np.asarray(tickers, dtype=object)
+        self.started_at = np.empty(num_samples, dtype=object)
+        self.ended_at = np.empty(num_samples, dtype=object)
+        if num_samples:
+            self.started_at[:] = [start for start, _ in dates]
+            self.ended_at[:] = [end for _, end in dates]
+
+        self.probabilities = probabilities
+        self.predicted_classes = (
+            probabilities.argmax(axis=1) if num_samples else np.empty(0, dtype=np.int64)
+        )
+        self.confidences = (
+            probabilities[np.arange(num_samples), self.predicted_classes]
+            if num_samples else np.empty(0, dtype=np.float32)
+        )
+
+        self._materialized = None
+        self._recount_confidence()
+
     def add_prediction(self, prediction: PredictionResult):
         """Add prediction result"""
-        self.predictions.append(prediction)
-        self.successful_predictions += 1
-        self.total_predictions = len(self.predictions)
+        self._extra.append(prediction)
+        self._materialized = None
+        self._confidence_sum += prediction.confidence_score
         self._update_stats()
 
     def add_error(self, ticker: str, error: str, details: Optional[Dict[str, Any]] = None):
@@ -118,11 +177,137 @@ class BatchPredictionResult:
         })
         self.failed_predictions += 1
 
+    def filter_by_confidence(self, min_confidence: float):
+        """Keep rows with confidence >= min_confidence (vectorized mask on columnar rows)"""
+        mask = self.confidences >= min_confidence
+
+        self.tickers = self.tickers[mask]
+        self.started_at = self.started_at[mask]
+        self.ended_at = self.ended_at[mask]
+        self.probabilities = self.probabilities[mask]
+        self.predicted_classes = self.predicted_classes[mask]
+        self.confidences = self.confidences[mask]
+        self._extra = [p for p in self._extra if p.confidence_score >= min_confidence]
+
+        self._materialized = None
+        self._recount_confidence()
+
+    # ========================================================================
+    # Row access
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return len(self.confidences) + len(self._extra)
+
+    @property
+    def predictions(self) -> List[PredictionResult]:
+        """All rows as PredictionResult (built on first access, then cached)"""
+        if self._materialized is None:
+            self._materialized = [self.get(i) for i in range(len(self))]
+        return self._materialized
+
+    @predictions.setter
+    def predictions(self, predictions: List[PredictionResult]):
+        self.set_columns([], [], np.empty((0, 0), dtype=np.float32))
+        self._extra = list(predictions)
+        self._materialized = None
+        self._recount_confidence()
+
+    def get(self, index: int) -> PredictionResult:
+        """Build the PredictionResult of one row (negative index counts from the end)"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Prediction index out of range: {index}")
+
+        num_columnar = len(self.confidences)
+        if index >= num_columnar:
+            return self._extra[index - num_columnar]
+
+        probs = self.probabilities[index]
+        return PredictionResult(
+            ticker=self.tickers[index],
+            started_at=self.started_at[index],
+            ended_at=self.ended_at[index],
+            predicted_class=int(self.predicted_classes[index]),
+            confidence_score=float(self.confidences[index]),
+            class_probabilities=dict(enumerate(probs.tolist())),
+            model_name=self.model_name,
+            model_version=self.model_version,
+            architecture_type=self.architecture_type,
+            prediction_date=self.batch_date,
+            num_features=self.num_features
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        One row per prediction (prob_<class> columns), built from the arrays
+
+        Columns: ticker, started_at, ended_at, predicted_class, confidence_score,
+        prob_0..prob_N, model_name, model_version, prediction_date
+        """
+        frame = pd.DataFrame({
+            'ticker': self.tickers,
+            'started_at': self.started_at,
+            'ended_at': self.ended_at,
+            'predicted_class': self.predicted_classes,
+            'confidence_score': self.confidences,
+        })
+        if self.probabilities.ndim == 2 and self.probabilities.shape[1]:
+            probs = pd.DataFrame(
+                self.probabilities,
+                columns=[f"prob_{c}" for c in range(self.probabilities.shape[1])]
+            )
+            frame = pd.concat([frame, probs], axis=1)
+        frame['model_name'] = self.model_name
+        frame['model_version'] = self.model_version
+        frame['prediction_date'] = self.batch_date
+
+        if self._extra:
+            extra = pd.DataFrame([{
+                'ticker': p.ticker,
+                'started_at': p.started_at,
+                'ended_at': p.ended_at,
+                'predicted_class': p.predicted_class,
+                'confidence_score': p.confidence_score,
+                **{f"prob_{c}": prob for c, prob in p.class_probabilities.items()},
+                'model_name': p.model_name,
+                'model_version': p.model_version,
+                'prediction_date': p.prediction_date,
+            } for p in self._extra])
+            frame = pd.concat([frame, extra], ignore_index=True) if len(frame) else extra
+
+        return frame
+
+    def write_to_db(self, con, table_name: str, chunksize: int = 10_000) -> int:
+        """
+        Append all rows to a table in bulk (DataFrame.to_sql, executemany per chunk)
+
+        Args:
+            con: SQLAlchemy engine / connection
+            table_name: Target table (created if missing)
+            chunksize: Rows per INSERT batch
+
+        Returns:
+            Number of rows written
+        """
+        frame = self.to_dataframe()
+        frame.to_sql(table_name, con, if_exists='append', index=False, chunksize=chunksize)
+        return len(frame)
+
+    def _recount_confidence(self):
+        """Recompute the running confidence sum after bulk changes to the rows"""
+        self._confidence_sum = (
+            float(self.confidences.sum()) + sum(p.confidence_score for p in self._extra)
+        )
+        self._update_stats()
+
     def _update_stats(self):
-        """Update aggregate statistics"""
-        if self.predictions:
-            confidences = [p.confidence_score for p in self.predictions]
-            self.average_confidence = float(np.mean(confidences))
+        """Update aggregate statistics from the running confidence sum and row count"""
+        count = len(self)
+        self.total_predictions = count
+        self.successful_predictions = count
+        self.average_confidence = self._confidence_sum / count if count else 0.0
 
     def get_summary(self) -> str:
         """Get human-readable summary"""
@@ -0,0 +1,330 @@
+"""
+Micro-batching Prediction Server
+
+동시 단일 예측 요청을 micro-batch로 묶어 실행하는 in-process 예측 서비스
+
+Concurrent ``predict`` calls are queued on an asyncio.Queue; a single batching task
+collects up to max_batch_size requests, waiting at most max_wait_ms after the first
+one, stacks them and runs one forward pass through the model's __call__ path on a
+worker thread (the event loop keeps accepting requests meanwhile). Requests whose
+feature shape does not match the model input fail on their own; the rest of the batch
+is still served.
+
+Example:
+    >>> server = PredictionServer(deployer, 'block_classifier_v1', max_batch_size=64)
+    >>> async with server:
+    ...     results = await asyncio.gather(*[
+    ...         server.predict(features[i], tickers[i], start, end)
+    ...         for i in range(len(tickers))
+    ...     ])
+    >>> server.get_stats()['latency_ms']['p99']
+"""
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+from src.learning.inference.model_deployer import ModelDeployer
+from src.learning.inference.prediction_result import PredictionResult
+from src.learning.inference.realtime_predictor import call_model, build_prediction_result
+
+
+@dataclass
+class _PendingRequest:
+    """Queued prediction request"""
+    features: np.ndarray
+    ticker: str
+    start_date: datetime
+    end_date: datetime
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class ServerStats:
+    """
+    Latency / batch statistics
+
+    Keeps the most recent `window` latencies and batch sizes.
+    """
+
+    def __init__(self, max_batch_size: int, window: int = 10_000):
+        self.max_batch_size = max_batch_size
+        self.latencies_ms: Deque[float] = deque(maxlen=window)
+        self.batch_sizes: Deque[int] = deque(maxlen=window)
+        self.total_requests = 0
+        self.total_batches = 0
+        self.failed_requests = 0
+
+    def record_batch(self, size: int, latencies_ms: List[float], failed: bool = False):
+        self.total_batches += 1
+        self.total_requests += size
+        self.batch_sizes.append(size)
+        if failed:
+            self.failed_requests += size
+        else:
+            self.latencies_ms.extend(latencies_ms)
+
+    def record_rejected(self, count: int):
+        """Requests failed before reaching the model (e.g. wrong feature shape)"""
+        self.total_requests += count
+        self.failed_requests += count
+
+    def to_dict(self) -> Dict[str, Any]:
+        latencies = np.asarray(self.latencies_ms, dtype=float)
+        sizes = np.asarray(self.batch_sizes, dtype=float)
+
+        if len(latencies):
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            latency = {
+                'p50': float(p50), 'p90': float(p90), 'p99': float(p99),
+                'max': float(latencies.max()), 'mean': float(latencies.mean())
+            }
+        else:
+            latency = {'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0, 'mean': 0.0}
+
+        mean_batch = float(sizes.mean()) if len(sizes) else 0.0
+
+        return {
+            'total_requests': self.total_requests,
+            'total_batches': self.total_batches,
+            'failed_requests': self.failed_requests,
+            'latency_ms': latency,
+            'mean_batch_size': mean_batch,
+            'batch_fill_rate': mean_batch / self.max_batch_size,
+            'full_batches': int((sizes == self.max_batch_size).sum()),
+        }
+
+
+class PredictionServer:
+    """Micro-batching wrapper around a deployed model"""
+
+    def __init__(
+        self,
+        deployer: ModelDeployer,
+        model_name: str,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        stats_window: int = 10_000
+    ):
+        """
+        Args:
+            deployer: ModelDeployer instance
+            model_name: Model identifier
+            max_batch_size: Upper bound of requests per forward pass
+            max_wait_ms: Max time to wait for more requests after the first one
+            stats_window: Number of recent requests / batches kept for statistics
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self.deployer = deployer
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self.stats = ServerStats(max_batch_size, stats_window)
+
+        self._model = None
+        self._metadata = None
+        self._sample_shape: Optional[tuple] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    async def start(self):
+        """Load the model and start the batching task"""
+        if self._worker is not None:
+            return
+
+        model = self.deployer.get_model(self.model_name)
+        if model is None:
+            model = self.deployer.load_model(self.model_name)
+        self._model = model
+        self._metadata = self.deployer.get_metadata(self.model_name)
+        self._sample_shape = _model_sample_shape(model)
+
+        # Single worker: forward passes are serialized, batching continues meanwhile
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prediction')
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._batch_loop())
+
+    async def stop(self):
+        """Serve queued requests, then stop the batching task"""
+        if self._worker is None:
+            return
+
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+        self._executor.shutdown(wait=True)
+        self._worker = None
+        self._queue = None
+        self._executor = None
+
+    async def __aenter__(self) -> 'PredictionServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    # ========================================================================
+    # Requests
+    # ========================================================================
+
+    async def predict(
+        self,
+        features: np.ndarray,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> PredictionResult:
+        """
+        Queue one prediction and wait for its micro-batch
+
+        Args:
+            features: Feature array (sequence_length, num_features)
+            ticker: Stock ticker
+            start_date: Period start date
+            end_date: Period end date
+
+        Returns:
+            PredictionResult (same as RealtimePredictor.predict_single)
+        """
+        if self._worker is None:
+            raise RuntimeError("PredictionServer is not started")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(
+            features=features,
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+            future=future,
+            enqueued_at=time.perf_counter()
+        ))
+        return await future
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Latency percentiles (ms), batch fill rate and counters"""
+        return self.stats.to_dict()
+
+    # ========================================================================
+    # Batching
+    # ========================================================================
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._run_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _run_batch(self, batch: List[_PendingRequest]):
+        loop = asyncio.get_running_loop()
+
+        batch = self._reject_mismatched(batch)
+        if not batch:
+            return
+
+        try:
+            stacked = np.stack([request.features for request in batch]).astype(np.float32, copy=False)
+            probs = await loop.run_in_executor(self._executor, call_model, self._model, stacked)
+        except Exception as e:
+            self.stats.record_batch(len(batch), [], failed=True)
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        done_at = time.perf_counter()
+        latencies = []
+        for request, request_probs in zip(batch, probs):
+            if request.future.done():  # caller cancelled
+                continue
+            request.future.set_result(build_prediction_result(
+                request_probs,
+                request.ticker,
+                request.start_date,
+                request.end_date,
+                self.model_name,
+                self._metadata,
+                stacked.shape[-1]
+            ))
+            latencies.append((done_at - request.enqueued_at) * 1000.0)
+
+        self.stats.record_batch(len(batch), latencies)
+
+    def _reject_mismatched(self, batch: List[_PendingRequest]) -> List[_PendingRequest]:
+        """
+        Fail requests whose feature shape does not match the model input
+
+        Without a known model input shape, the first request of the batch is the
+        reference. Only the mismatched requests' futures get the error.
+
+        Returns:
+            Requests that can be stacked together
+        """
+        expected = self._sample_shape or np.shape(batch[0].features)
+
+        valid = []
+        rejected = 0
+        for request in batch:
+            shape = np.shape(request.features)
+            if _shape_matches(shape, expected):
+                valid.append(request)
+                continue
+            rejected += 1
+            if not request.future.done():
+                request.future.set_exception(ValueError(
+                    f"Feature shape {shape} does not match model input {expected}"
+                ))
+
+        if rejected:
+            self.stats.record_rejected(rejected)
+        return valid
+
+
+def _model_sample_shape(model) -> Optional[tuple]:
+    """Per-sample input shape (batch dim dropped, None = any size), None if unknown"""
+    input_shape = getattr(model, 'input_shape', None)
+    if not isinstance(input_shape, tuple) or len(input_shape) < 2:
+        return None
+    return tuple(input_shape[1:])
+
+
+def _shape_matches(shape: tuple, expected: tuple) -> bool:
+    return len(shape) == len(expected) and all(
+        dim is None or dim == actual for actual, dim in zip(shape, expected)
+    )
@@ -3,15 +3,62 @@ Realtime Predictor
 
 실시간 단일 예측
 """
-from typing import Optional
+from typing import Optional, Any
 import numpy as np
 from datetime import datetime
-import tensorflow as tf
 
 from src.learning.inference.prediction_result import PredictionResult
 from src.learning.inference.model_deployer import ModelDeployer
 
 
+def call_model(model, batch: np.ndarray) -> np.ndarray:
+    """
+    Run a forward pass through the model's direct __call__ path
+
+    Keras ``predict`` builds a data adapter and callback loop on every call, which
+    dominates latency for small inputs; ``model(batch, training=False)`` does not.
+
+    Args:
+        model: Keras model (or any callable returning class probabilities)
+        batch: (batch_size, sequence_length, num_features)
+
+    Returns:
+        (batch_size, num_classes) probability array
+    """
+    outputs = model(batch, training=False)
+    return outputs.numpy() if hasattr(outputs, 'numpy') else np.asarray(outputs)
+
+
+def build_prediction_result(
+    probs: np.ndarray,
+    ticker: str,
+    start_date: datetime,
+    end_date: datetime,
+    model_name: str,
+    metadata: Optional[Any],
+    num_features: int
+) -> PredictionResult:
+    """Class probabilities of one sample → PredictionResult"""
+    predicted_class = int(np.argmax(probs))
+    confidence = float(probs[predicted_class])
+
+    return PredictionResult(
+        ticker=ticker,
+        started_at=start_date,
+        ended_at=end_date,
+        predicted_class=predicted_class,
+        confidence_score=confidence,
+        class_probabilities={
+            class_id: float(prob)
+            for class_id, prob in enumerate(probs)
+        },
+        model_name=model_name,
+        model_version=metadata.version if metadata else "unknown",
+        architecture_type=metadata.architecture_type if metadata else "unknown",
+        num_features=num_features
+    )
+
+
 class RealtimePredictor:
     """실시간 예측 실행기"""
 
@@ -58,25 +105,11 @@ class RealtimePredictor:
             features = np.expand_dims(features, axis=0)
 
         # Predict
-        probs = model.predict(features, verbose=0)[0]
-
-        predicted_class = int(np.argmax(probs))
-        confidence = float(probs[predicted_class])
+        probs = call_model(model, features)[0]
 
-        return PredictionResult(
-            ticker=ticker,
-            started_at=start_date,
-            ended_at=end_date,
-            predicted_class=predicted_class,
-            confidence_score=confidence,
-            class_probabilities={
-                class_id: float(prob)
-                for class_id, prob in enumerate(probs)
-            },
-            model_name=model_name,
-            model_version=metadata.version if metadata else "unknown",
-            architecture_type=metadata.architecture_type if metadata else "unknown",
-            num_features=features.shape[-1]
+        return build_prediction_result(
+            probs, ticker, start_date, end_date,
+            model_name, metadata, features.shape[-1]
         )
 
     def predict_with_threshold(
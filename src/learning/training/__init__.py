@@ -6,9 +6,13 @@ Training Module
 from src.learning.training.trainer import ModelTrainer
 from src.learning.training.callbacks import CallbackFactory
 from src.learning.training.config import TrainingConfig
+from src.learning.training.sweep import SearchSpace, SweepRunner, SweepResult
 
 __all__ = [
     'ModelTrainer',
     'CallbackFactory',
     'TrainingConfig',
+    'SearchSpace',
+    'SweepRunner',
+    'SweepResult',
 ]
@@ -3,12 +3,17 @@ Callback Factory
 
 학습 콜백 생성 및 관리
 """
-from typing import List
+from __future__ import annotations
+
+from typing import List, TYPE_CHECKING
 from pathlib import Path
-import tensorflow as tf
 
+from src.learning import backend
 from src.learning.training.config import TrainingConfig
 
+if TYPE_CHECKING:
+    import tensorflow as tf
+
 
 class CallbackFactory:
     """콜백 생성 팩토리"""
@@ -24,13 +29,15 @@ class CallbackFactory:
         Returns:
             List of Keras callbacks
         """
+        keras_callbacks = backend.keras().callbacks
         callbacks = []
 
         # EarlyStopping
         if config.use_early_stopping:
             callbacks.append(
-                tf.keras.callbacks.EarlyStopping(
+                keras_callbacks.EarlyStopping(
                     monitor=config.early_stopping_monitor,
+                    mode=config.early_stopping_mode,
                     patience=config.early_stopping_patience,
                     restore_best_weights=True,
                     verbose=1
@@ -40,7 +47,7 @@ class CallbackFactory:
         # ReduceLROnPlateau
         if config.use_reduce_lr:
             callbacks.append(
-                tf.keras.callbacks.ReduceLROnPlateau(
+                keras_callbacks.ReduceLROnPlateau(
                     monitor=config.reduce_lr_monitor,
                     factor=config.reduce_lr_factor,
                     patience=config.reduce_lr_patience,
@@ -57,7 +64,7 @@ class CallbackFactory:
             checkpoint_path = checkpoint_dir / f"{config.model_name}_best.h5"
 
             callbacks.append(
-                tf.keras.callbacks.ModelCheckpoint(
+                keras_callbacks.ModelCheckpoint(
                     filepath=str(checkpoint_path),
                     monitor=config.checkpoint_monitor,
                     mode=config.checkpoint_mode,
@@ -32,6 +32,7 @@ class TrainingConfig:
     use_early_stopping: bool = True
     early_stopping_patience: int = 10
     early_stopping_monitor: str = "val_loss"
+    early_stopping_mode: str = "auto"  # 'min' / 'max' / 'auto' (Keras infers from the metric name)
 
     use_reduce_lr: bool = True
     reduce_lr_patience: int = 5
@@ -54,6 +55,9 @@ class TrainingConfig:
     description: str = ""
     tags: List[str] = field(default_factory=list)
 
+    # Hyperparameter sweep (search space; see src.learning.training.sweep)
+    sweep: Optional[Dict[str, Any]] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return asdict(self)
@@ -63,9 +67,28 @@ class TrainingConfig:
         """Create from dictionary"""
         return cls(**data)
 
+    def with_overrides(self, overrides: Dict[str, Any]) -> 'TrainingConfig':
+        """
+        Copy with overridden values
+
+        Keys naming a config field replace that field; any other key is set in
+        hyperparameters. The sweep section is not copied.
+        """
+        data = self.to_dict()
+        data['sweep'] = None
+        data['hyperparameters'] = dict(data['hyperparameters'])
+
+        for key, value in overrides.items():
+            if key in data and key != 'hyperparameters':
+                data[key] = value
+            else:
+                data['hyperparameters'][key] = value
+
+        return TrainingConfig.from_dict(data)
+
     @classmethod
     def from_yaml(cls, yaml_path: str) -> 'TrainingConfig':
-        """Load from YAML file"""
+        """Load from YAML file (optional top-level 'sweep' section = search space)"""
         with open(yaml_path, 'r', encoding='utf-8') as f:
             data = yaml.safe_load(f)
         return cls.from_dict(data)
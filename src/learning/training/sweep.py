@@ -0,0 +1,512 @@
+"""
+Hyperparameter Sweep
+
+하이퍼파라미터 탐색 (grid / random search) 병렬 실행기
+
+The search space is the ``sweep`` section of a TrainingConfig YAML:
+
+    architecture: lstm
+    epochs: 50
+    hyperparameters:
+      dropout: 0.2
+    sweep:
+      method: random          # grid | random
+      num_trials: 20
+      metric: val_loss
+      mode: min
+      threads_per_worker: 1   # workers = available cores / threads_per_worker
+      parameters:
+        learning_rate: {min: 0.0001, max: 0.01, log: true}
+        batch_size: [32, 64]
+        units: {values: [64, 128, 256]}
+
+Keys naming a TrainingConfig field override that field; others go into
+hyperparameters. Trials run in a process pool whose workers are limited to
+threads_per_worker BLAS / TensorFlow threads each, so the pool fills every core
+without oversubscription. The dataset is written once as .npy (or given as a
+shard directory) and memory-mapped by every worker. Each trial trains with the
+EarlyStopping callback on the sweep metric, so unpromising trials stop early;
+results are ranked into leaderboard.json / leaderboard.csv.
+"""
+import csv
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.learning import backend
+from src.learning.dataset.data_source import ArrayDataSource, DataSource, ShardedDataSource
+from src.learning.training.config import TrainingConfig
+from src.learning.training.trainer import ModelTrainer
+
+# Native thread pools sized from the environment at library load time
+THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'NUMEXPR_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+)
+
+
+# ============================================================================
+# Search space
+# ============================================================================
+
+@dataclass
+class SearchSpace:
+    """
+    Sweep definition
+
+    Parameter specs:
+        [a, b, c] or {values: [...]}       categorical
+        {min, max, log?, type?: int}       range (random search; grid needs num)
+        {min, max, num, log?, type?}       range with num grid points
+        scalar                             fixed value
+    """
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    method: str = "grid"
+    num_trials: Optional[int] = None  # required for random, cap for grid
+    seed: int = 42
+    metric: str = "val_loss"
+    mode: str = "min"
+    max_workers: Optional[int] = None  # cap; workers never exceed available cores / threads_per_worker
+    threads_per_worker: int = 1
+    early_stopping_patience: Optional[int] = None  # None = TrainingConfig value
+
+    def __post_init__(self):
+        if self.method not in ('grid', 'random'):
+            raise ValueError(f"Unknown sweep method: {self.method}")
+        if self.mode not in ('min', 'max'):
+            raise ValueError(f"mode must be 'min' or 'max', got {self.mode}")
+        if self.method == 'random' and not self.num_trials:
+            raise ValueError("Random search requires num_trials")
+        if self.threads_per_worker < 1:
+            raise ValueError("threads_per_worker must be >= 1")
+        if not self.parameters:
+            raise ValueError("Sweep has no parameters")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SearchSpace':
+        """Create from the YAML 'sweep' section"""
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def trials(self) -> List[Dict[str, Any]]:
+        """Parameter sets to evaluate, in trial order"""
+        if self.method == 'grid':
+            names = list(self.parameters)
+            axes = [_grid_values(name, self.parameters[name]) for name in names]
+            combos = [dict(zip(names, values)) for values in itertools.product(*axes)]
+            return combos[:self.num_trials] if self.num_trials else combos
+
+        rng = np.random.default_rng(self.seed)
+        return [
+            {name: _sample(rng, spec) for name, spec in self.parameters.items()}
+            for _ in range(self.num_trials)
+        ]
+
+
+def _grid_values(name: str, spec: Any) -> List[Any]:
+    if isinstance(spec, list):
+        return spec
+    if not isinstance(spec, dict):
+        return [spec]
+    if 'values' in spec:
+        return list(spec['values'])
+    if 'num' not in spec:
+        raise ValueError(f"Grid parameter '{name}' needs 'values' or 'num'")
+
+    low, high, num = spec['min'], spec['max'], int(spec['num'])
+    if spec.get('log'):
+        points = np.geomspace(low, high, num)
+    else:
+        points = np.linspace(low, high, num)
+    return [_cast(spec, point) for point in points]
+
+
+def _sample(rng: np.random.Generator, spec: Any) -> Any:
+    if isinstance(spec, list):
+        return _to_python(spec[rng.integers(len(spec))])
+    if not isinstance(spec, dict):
+        return spec
+    if 'values' in spec:
+        values = list(spec['values'])
+        return _to_python(values[rng.integers(len(values))])
+
+    low, high = spec['min'], spec['max']
+    if spec.get('log'):
+        value = math.exp(rng.uniform(math.log(low), math.log(high)))
+    elif spec.get('type') == 'int':
+        return int(rng.integers(int(low), int(high) + 1))
+    else:
+        value = rng.uniform(low, high)
+    return _cast(spec, value)
+
+
+def _cast(spec: Dict[str, Any], value: float) -> Any:
+    if spec.get('type') == 'int':
+        return int(round(value))
+    return float(value)
+
+
+def _to_python(value: Any) -> Any:
+    """NumPy scalar → Python scalar (YAML / JSON friendly)"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# ============================================================================
+# Trials
+# ============================================================================
+
+@dataclass
+class TrialSpec:
+    """One trial (picklable, sent to a worker process)"""
+    trial_id: int
+    params: Dict[str, Any]
+    config: Dict[str, Any]  # TrainingConfig.to_dict()
+    data_path: str
+    metric: str
+    mode: str
+
+
+@dataclass
+class TrialResult:
+    """Outcome of one trial"""
+    trial_id: int
+    params: Dict[str, Any]
+    status: str  # completed | failed
+    score: Optional[float] = None
+    best_epoch: Optional[int] = None
+    epochs_run: int = 0
+    pruned: bool = False  # stopped early by EarlyStopping
+    seconds: float = 0.0
+    metrics: Dict[str, float] = field(default_factory=dict)  # at best epoch
+    error: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def summarize_history(
+    history: Dict[str, List[float]],
+    metric: str,
+    mode: str,
+    max_epochs: int
+) -> Dict[str, Any]:
+    """
+    Best epoch of a Keras history
+
+    Returns:
+        score, best_epoch (1-based), epochs_run, pruned, metrics at the best epoch
+
+    Raises:
+        ValueError: If metric is not in the history
+    """
+    values = history.get(metric)
+    if not values:
+        raise ValueError(f"Metric '{metric}' not in history: {sorted(history)}")
+
+    best = int(np.argmin(values) if mode == 'min' else np.argmax(values))
+    return {
+        'score': float(values[best]),
+        'best_epoch': best + 1,
+        'epochs_run': len(values),
+        'pruned': len(values) < max_epochs,
+        'metrics': {name: float(series[best]) for name, series in history.items() if len(series) > best},
+    }
+
+
+def open_shared_dataset(data_path: str) -> DataSource:
+    """
+    Memory-mapped data source written by share_arrays (or a shard directory)
+
+    Raises:
+        FileNotFoundError: If neither index.json nor X.npy / y.npy exist
+    """
+    path = Path(data_path)
+    if (path / 'index.json').exists():
+        # Workers are thread-limited: one read-ahead thread each
+        return ShardedDataSource(path, num_workers=1)
+
+    if not (path / 'X.npy').exists() or not (path / 'y.npy').exists():
+        raise FileNotFoundError(f"No shared dataset in {path}")
+
+    return ArrayDataSource(
+        np.load(path / 'X.npy', mmap_mode='r'),
+        np.load(path / 'y.npy', mmap_mode='r')
+    )
+
+
+def share_arrays(X: np.ndarray, y: np.ndarray, directory: Path) -> Path:
+    """Write X / y once as .npy so every worker can memory-map them"""
+    if len(X) != len(y):
+        raise ValueError("X and y must have same length")
+
+    directory.mkdir(parents=True, exist_ok=True)
+    np.save(directory / 'X.npy', np.asarray(X, dtype=np.float32))
+    np.save(directory / 'y.npy', np.asarray(y, dtype=np.int32))
+    return directory
+
+
+def run_trial(spec: TrialSpec) -> TrialResult:
+    """Train one configuration (worker entry point; failures are returned, not raised)"""
+    start = time.perf_counter()
+    try:
+        config = TrainingConfig.from_dict(spec.config)
+        trainer = ModelTrainer(config)
+        history = trainer.train(open_shared_dataset(spec.data_path))
+        summary = summarize_history(history.history, spec.metric, spec.mode, config.epochs)
+        return TrialResult(
+            trial_id=spec.trial_id,
+            params=spec.params,
+            status='completed',
+            seconds=time.perf_counter() - start,
+            **summary
+        )
+    except Exception as e:
+        return TrialResult(
+            trial_id=spec.trial_id,
+            params=spec.params,
+            status='failed',
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}"
+        )
+
+
+def _init_worker(threads: int):
+    """Process pool initializer: cap native / TensorFlow threads for this worker"""
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    backend.set_thread_limits(intra_op=threads, inter_op=1)
+
+
+@contextmanager
+def _thread_limited_env(threads: int) -> Iterator[None]:
+    """Thread limits in the environment inherited by spawned workers"""
+    saved = {name: os.environ.get(name) for name in THREAD_ENV_VARS}
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def available_cpus() -> int:
+    """Cores this process may run on (respects CPU affinity / cgroups cpusets)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+@dataclass
+class SweepResult:
+    """Ranked trial results"""
+    results: List[TrialResult]  # best first, failed last
+    leaderboard_path: Optional[Path] = None
+
+    @property
+    def best(self) -> Optional[TrialResult]:
+        completed = [r for r in self.results if r.status == 'completed']
+        return completed[0] if completed else None
+
+
+def rank_results(results: List[TrialResult], mode: str) -> List[TrialResult]:
+    """Completed trials by score (best first), then failed trials by id"""
+    sign = 1.0 if mode == 'min' else -1.0
+    completed = sorted(
+        (r for r in results if r.status == 'completed'),
+        key=lambda r: (sign * r.score, r.trial_id)
+    )
+    failed = sorted((r for r in results if r.status != 'completed'), key=lambda r: r.trial_id)
+    return completed + failed
+
+
+class SweepRunner:
+    """병렬 하이퍼파라미터 탐색 실행기"""
+
+    def __init__(
+        self,
+        base_config: TrainingConfig,
+        space: Optional[SearchSpace] = None,
+        output_dir: Optional[str] = None,
+        trial_fn: Callable[[TrialSpec], TrialResult] = run_trial,
+        mp_context: str = "spawn",
+        verbose: bool = True
+    ):
+        """
+        Args:
+            base_config: Config shared by all trials
+            space: Search space (None = base_config.sweep)
+            output_dir: Sweep directory (default: <output_dir>/sweeps/<model_name>)
+            trial_fn: Picklable top-level function run in the workers
+            mp_context: multiprocessing start method ('spawn' keeps workers free of
+                the parent's thread state)
+            verbose: Print one line per finished trial
+        """
+        if space is None:
+            if not base_config.sweep:
+                raise ValueError("No search space: pass space or add a 'sweep' section")
+            space = SearchSpace.from_dict(base_config.sweep)
+
+        self.base_config = base_config
+        self.space = space
+        self.output_dir = Path(
+            output_dir or Path(base_config.output_dir) / 'sweeps' / base_config.model_name
+        )
+        self.trial_fn = trial_fn
+        self.mp_context = mp_context
+        self.verbose = verbose
+
+    @classmethod
+    def from_yaml(cls, yaml_path: str, **kwargs) -> 'SweepRunner':
+        """TrainingConfig YAML with a 'sweep' section"""
+        return cls(TrainingConfig.from_yaml(yaml_path), **kwargs)
+
+    def worker_plan(self, num_trials: int) -> Tuple[int, int]:
+        """(workers, threads per worker) with workers * threads <= available cores"""
+        threads = min(self.space.threads_per_worker, available_cpus())
+        workers = max(1, available_cpus() // threads)
+        if self.space.max_workers:
+            workers = min(self.space.max_workers, workers)
+        return max(1, min(workers, num_trials)), threads
+
+    def build_trials(self, data_path: Path) -> List[TrialSpec]:
+        """Trial specs with per-trial model name / output directory"""
+        specs = []
+        for trial_id, params in enumerate(self.space.trials()):
+            overrides = dict(params)
+            overrides.update(
+                model_name=f"{self.base_config.model_name}_trial{trial_id:03d}",
+                output_dir=str(self.output_dir / 'trials' / f"trial_{trial_id:03d}"),
+                # Pruning: stop a trial once the sweep metric stops improving
+                use_early_stopping=True,
+                early_stopping_monitor=self.space.metric,
+                early_stopping_mode=self.space.mode,
+            )
+            if self.space.early_stopping_patience is not None:
+                overrides['early_stopping_patience'] = self.space.early_stopping_patience
+
+            specs.append(TrialSpec(
+                trial_id=trial_id,
+                params=params,
+                config=self.base_config.with_overrides(overrides).to_dict(),
+                data_path=str(data_path),
+                metric=self.space.metric,
+                mode=self.space.mode
+            ))
+        return specs
+
+    def run(
+        self,
+        X: Optional[np.ndarray] = None,
+        y: Optional[np.ndarray] = None,
+        data_path: Optional[str] = None
+    ) -> SweepResult:
+        """
+        Run all trials
+
+        Args:
+            X, y: In-memory training data (written once to <output_dir>/data)
+            data_path: Existing shard directory or share_arrays directory
+
+        Returns:
+            SweepResult (leaderboard written to output_dir)
+        """
+        if data_path is None:
+            if X is None or y is None:
+                raise ValueError("Provide X and y, or data_path")
+            data_path = share_arrays(X, y, self.output_dir / 'data')
+
+        specs = self.build_trials(Path(data_path))
+        workers, threads = self.worker_plan(len(specs))
+
+        if self.verbose:
+            print(f"🔍 Sweep: {len(specs)} trials ({self.space.method}), "
+                  f"{workers} workers x {threads} threads")
+
+        results = []
+        with _thread_limited_env(threads), ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(self.mp_context),
+            initializer=_init_worker,
+            initargs=(threads,)
+        ) as executor:
+            futures = {executor.submit(self.trial_fn, spec): spec for spec in specs}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Raised by trial_fn or a crashed worker
+                    spec = futures[future]
+                    result = TrialResult(
+                        trial_id=spec.trial_id,
+                        params=spec.params,
+                        status='failed',
+                        error=f"{type(e).__name__}: {e}"
+                    )
+                results.append(result)
+                if self.verbose:
+                    self._report(result, len(results), len(specs))
+
+        ranked = rank_results(results, self.space.mode)
+        return SweepResult(results=ranked, leaderboard_path=self.write_leaderboard(ranked))
+
+    def write_leaderboard(self, ranked: List[TrialResult]) -> Path:
+        """leaderboard.json (full results) + leaderboard.csv (one row per trial)"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        json_path = self.output_dir / 'leaderboard.json'
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'metric': self.space.metric,
+                'mode': self.space.mode,
+                'space': self.space.to_dict(),
+                'trials': [r.to_dict() for r in ranked],
+            }, f, indent=2, ensure_ascii=False)
+
+        param_names = list(self.space.parameters)
+        with open(self.output_dir / 'leaderboard.csv', 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ['rank', 'trial_id', 'status', self.space.metric, 'best_epoch',
+                 'epochs_run', 'pruned', 'seconds'] + param_names
+            )
+            for rank, r in enumerate(ranked, 1):
+                writer.writerow(
+                    [rank, r.trial_id, r.status, r.score, r.best_epoch,
+                     r.epochs_run, r.pruned, round(r.seconds, 2)]
+                    + [r.params.get(name) for name in param_names]
+                )
+
+        return json_path
+
+    def _report(self, result: TrialResult, done: int, total: int):
+        prefix = f"[{done}/{total}] trial {result.trial_id:03d}"
+        if result.status != 'completed':
+            print(f"❌ {prefix} failed: {result.error}")
+            return
+        stopped = " (early stop)" if result.pruned else ""
+        print(f"✅ {prefix} {self.space.metric}={result.score:.4f} "
+              f"epoch {result.best_epoch}/{result.epochs_run}{stopped} "
+              f"{result.seconds:.1f}s {result.params}")
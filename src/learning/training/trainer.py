@@ -3,16 +3,36 @@ Model Trainer
 
 모델 학습 오케스트레이터
 """
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import Optional, Dict, Any, Union, TYPE_CHECKING
 from pathlib import Path
 import json
 import numpy as np
-import tensorflow as tf
 
-from src.learning.models.model_registry import ModelRegistry, BaseModel, ModelMetadata
+from src.learning import backend
 from src.learning.training.config import TrainingConfig
 from src.learning.training.callbacks import CallbackFactory
 from src.learning.evaluation.metrics import EvaluationMetrics, ModelPerformance
+from src.learning.evaluation.confusion_matrix import ConfusionMatrixAccumulator
+from src.learning.dataset.data_source import DataSource, ArrayDataSource, prefetch_batches
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    from src.learning.models.model_registry import BaseModel
+
+TrainingInput = Union[np.ndarray, DataSource]
+
+
+def _create_model(config: TrainingConfig, **kwargs) -> BaseModel:
+    """ModelRegistry로 모델 생성 (모델 정의 / TensorFlow는 이 시점에 import)"""
+    from src.learning.models.model_registry import ModelRegistry
+
+    return ModelRegistry.create_model(
+        architecture=config.architecture,
+        **kwargs,
+        **config.hyperparameters
+    )
 
 
 class ModelTrainer:
@@ -29,35 +49,39 @@ class ModelTrainer:
 
     def train(
         self,
-        X_train: np.ndarray,
-        y_train: np.ndarray,
-        X_val: Optional[np.ndarray] = None,
+        X_train: TrainingInput,
+        y_train: Optional[np.ndarray] = None,
+        X_val: Optional[TrainingInput] = None,
         y_val: Optional[np.ndarray] = None
     ) -> tf.keras.callbacks.History:
         """
         Train model
 
         Args:
-            X_train: Training features
-            y_train: Training labels
-            X_val: Validation features (auto-split if None)
+            X_train: Training features, or a DataSource (e.g. ShardedDataSource)
+            y_train: Training labels (omit for DataSource)
+            X_val: Validation features / DataSource (auto-split if None)
             y_val: Validation labels
 
         Returns:
             Training history
         """
+        self._seed_everything()
+
+        if isinstance(X_train, DataSource):
+            return self._train_streaming(X_train, X_val, y_val)
+
         # Create model
         if self.model is None:
             input_shape = X_train.shape[1:]
             num_classes = int(np.max(y_train) + 1)
             num_features = X_train.shape[-1] if len(X_train.shape) > 2 else X_train.shape[1]
 
-            self.model = ModelRegistry.create_model(
-                architecture=self.config.architecture,
+            self.model = _create_model(
+                self.config,
                 input_shape=input_shape,
                 num_classes=num_classes,
-                num_features=num_features,
-                **self.config.hyperparameters
+                num_features=num_features
             )
 
         # Build Keras model
@@ -89,17 +113,71 @@ class ModelTrainer:
 
         return self.history
 
+    def _train_streaming(
+        self,
+        train_source: DataSource,
+        X_val: Optional[TrainingInput],
+        y_val: Optional[np.ndarray]
+    ) -> tf.keras.callbacks.History:
+        """DataSource 기반 학습 (tf.data 스트리밍, 전체 데이터를 메모리에 올리지 않음)"""
+        if self.model is None:
+            input_shape = train_source.sample_shape
+            self.model = _create_model(
+                self.config,
+                input_shape=input_shape,
+                num_classes=train_source.num_classes(),
+                num_features=input_shape[-1]
+            )
+
+        keras_model = self.model.get_model()
+        callbacks = CallbackFactory.create_callbacks(self.config)
+
+        # Validation source: explicit, or trailing fraction of each shard
+        if X_val is None and self.config.validation_split > 0:
+            train_source, val_source = train_source.split(self.config.validation_split)
+        elif X_val is None:
+            val_source = None
+        elif isinstance(X_val, DataSource):
+            val_source = X_val
+        else:
+            val_source = ArrayDataSource(X_val, y_val)
+
+        batch_size = self.config.batch_size
+        seed = self.config.random_seed
+
+        # Repeated datasets + explicit step counts: every epoch gets a full pass
+        self.history = keras_model.fit(
+            train_source.to_tf_dataset(
+                batch_size, shuffle=self.config.shuffle, seed=seed, repeat=True
+            ),
+            epochs=self.config.epochs,
+            steps_per_epoch=train_source.steps(batch_size),
+            validation_data=(
+                val_source.to_tf_dataset(batch_size, seed=seed, repeat=True) if val_source else None
+            ),
+            validation_steps=val_source.steps(batch_size) if val_source else None,
+            callbacks=callbacks,
+            verbose=1
+        )
+
+        return self.history
+
+    def _seed_everything(self):
+        """TrainingConfig.random_seed로 NumPy / TensorFlow 시드 고정"""
+        np.random.seed(self.config.random_seed)
+        backend.tensorflow().random.set_seed(self.config.random_seed)
+
     def evaluate(
         self,
-        X_test: np.ndarray,
-        y_test: np.ndarray
+        X_test: TrainingInput,
+        y_test: Optional[np.ndarray] = None
     ) -> ModelPerformance:
         """
         Evaluate model
 
         Args:
-            X_test: Test features
-            y_test: Test labels
+            X_test: Test features, or a DataSource (predicted batch by batch)
+            y_test: Test labels (omit for DataSource)
 
         Returns:
             ModelPerformance
@@ -110,13 +188,21 @@ class ModelTrainer:
         keras_model = self.model.get_model()
 
         # Predict
-        y_pred_probs = keras_model.predict(X_test, verbose=0)
-        y_pred = np.argmax(y_pred_probs, axis=1)
+        if isinstance(X_test, DataSource):
+            # Accumulate the confusion matrix per batch (labels are never concatenated)
+            accumulator = ConfusionMatrixAccumulator()
+            for X_batch, y_batch in prefetch_batches(X_test.iter_batches(self.config.batch_size)):
+                probs = keras_model.predict_on_batch(X_batch)
+                accumulator.update(y_batch, np.argmax(probs, axis=1))
+            confusion_matrix = accumulator.matrix
+        else:
+            y_pred_probs = keras_model.predict(X_test, verbose=0)
+            y_pred = np.argmax(y_pred_probs, axis=1)
+            confusion_matrix = EvaluationMetrics.calculate_confusion_matrix(y_test, y_pred)
 
         # Evaluate
-        performance = EvaluationMetrics.evaluate_full(
-            y_true=y_test,
-            y_pred=y_pred,
+        performance = EvaluationMetrics.evaluate_confusion_matrix(
+            confusion_matrix,
             model_name=self.config.model_name,
             dataset_name="test_set",
             notes=self.config.description,
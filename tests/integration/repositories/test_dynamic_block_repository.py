@@ -6,9 +6,10 @@ from datetime import date
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.domain.entities.detections import DynamicBlockDetection, BlockStatus
+from src.domain.entities.detections import DynamicBlockDetection, BlockStatus, RedetectionEvent
 from src.infrastructure.database.models.base import Base
 from src.infrastructure.database.models.dynamic_block_detection_model import DynamicBlockDetectionModel
+from src.infrastructure.database.models.detection_detail_models import BlockSpotModel, BlockRedetectionModel
 from src.infrastructure.repositories.dynamic_block_repository_impl import DynamicBlockRepositoryImpl
 
 
@@ -315,6 +316,32 @@ class TestDynamicBlockRepository:
         assert len(saved_detections) == 3
         assert all(d.id is not None for d in saved_detections)
 
+    def test_save_all_chunked_insert_and_update(self, repository):
+        """일괄 저장 - 청크 단위 INSERT + 기존 블록 UPDATE"""
+        existing = DynamicBlockDetection('block1', 1, '025980', 'seed')
+        existing.start(date(2024, 1, 15))
+        repository.save(existing)
+
+        existing.complete(date(2024, 1, 20))
+        new_detections = [
+            DynamicBlockDetection(f'block{i}', i, '025980', 'seed') for i in range(2, 7)
+        ]
+        for i, d in enumerate(new_detections):
+            d.start(date(2024, 2, i + 1))
+
+        repository.save_all([existing] + new_detections, chunk_size=2)
+
+        ids = [d.id for d in new_detections]
+        assert all(i is not None for i in ids)
+        assert len(set(ids)) == len(ids)
+        for d in new_detections:
+            assert repository.find_by_id(d.id).block_id == d.block_id
+
+        found = repository.find_by_id(existing.id)
+        assert found.status == BlockStatus.COMPLETED
+        assert found.ended_at == date(2024, 1, 20)
+        assert len(repository.find_by_ticker('025980')) == 6
+
     def test_parent_blocks_persistence(self, repository):
         """부모 블록 리스트 저장/조회"""
         detection = DynamicBlockDetection('block3', 3, '025980', 'seed')
@@ -341,3 +368,87 @@ class TestDynamicBlockRepository:
         found = repository.find_by_id(saved.id)
         assert found.get_metadata('entry_surge_rate') == 8.0
         assert found.get_metadata('note') == 'test'
+
+
+def _block_with_spots(block_id, ticker, started_at, num_spots):
+    """spot이 num_spots개인 블록 생성"""
+    detection = DynamicBlockDetection(block_id, int(block_id[-1]), ticker, 'seed')
+    detection.start(started_at)
+    for _ in range(num_spots):
+        detection.add_spot(started_at, 100.0, 110.0, 115.0, 95.0, 1000)
+    return detection
+
+
+class TestDynamicBlockDetailTables:
+    """정규화 자식 테이블 (block_spot, block_redetection) 테스트"""
+
+    def test_save_writes_spot_rows(self, repository, session):
+        """저장 시 spot 행 기록, 재저장 시 교체"""
+        detection = _block_with_spots('block1', '025980', date(2024, 1, 15), 1)
+        repository.save(detection)
+        assert session.query(BlockSpotModel).filter_by(block_detection_id=detection.id).count() == 1
+
+        detection.add_spot(date(2024, 1, 16), 100.0, 110.0, 115.0, 95.0, 2000)
+        repository.save(detection)
+
+        rows = session.query(BlockSpotModel).filter_by(
+            block_detection_id=detection.id
+        ).order_by(BlockSpotModel.spot_number).all()
+        assert [r.spot_number for r in rows] == [1, 2]
+        assert rows[1].spot_date == date(2024, 1, 16)
+        assert rows[1].ticker == '025980'
+        assert rows[1].started_at == date(2024, 1, 15)
+
+    def test_find_by_min_spot_count(self, repository):
+        """spot 2개 이상 블록을 SQL로 조회"""
+        repository.save_all([
+            _block_with_spots('block1', '025980', date(2024, 3, 1), 2),
+            _block_with_spots('block2', '025980', date(2024, 4, 1), 1),
+            _block_with_spots('block1', '005930', date(2024, 5, 1), 2),
+            _block_with_spots('block1', '025980', date(2023, 5, 1), 2),
+        ])
+
+        found = repository.find_by_min_spot_count(2, date(2024, 1, 1), date(2024, 12, 31))
+        assert [(d.ticker, d.started_at) for d in found] == [
+            ('025980', date(2024, 3, 1)),
+            ('005930', date(2024, 5, 1)),
+        ]
+
+        by_ticker = repository.find_by_min_spot_count(
+            2, date(2024, 1, 1), date(2024, 12, 31), ticker='005930', block_type=1
+        )
+        assert len(by_ticker) == 1
+
+        # spot 0개 블록은 spot 행 집계로 찾을 수 없으므로 거부
+        for min_spots in (0, -1):
+            with pytest.raises(ValueError):
+                repository.find_by_min_spot_count(min_spots, date(2024, 1, 1), date(2024, 12, 31))
+
+    def test_find_by_min_redetection_count(self, repository, session):
+        """재탐지 이벤트 행 기록 및 조회"""
+        detection = DynamicBlockDetection('block1', 1, '025980', 'seed')
+        detection.start(date(2024, 1, 15))
+        detection.complete(date(2024, 1, 20))
+        detection.add_redetection(RedetectionEvent(
+            sequence=1, parent_block_id='block1', started_at=date(2024, 2, 1), peak_price=120.0
+        ))
+        repository.save(detection)
+
+        row = session.query(BlockRedetectionModel).one()
+        assert row.redetection_started_at == date(2024, 2, 1)
+        assert row.status == 'active'
+
+        assert len(repository.find_by_min_redetection_count(1, date(2024, 1, 1), date(2024, 12, 31))) == 1
+        assert repository.find_by_min_redetection_count(2, date(2024, 1, 1), date(2024, 12, 31)) == []
+
+    def test_delete_removes_detail_rows(self, repository, session):
+        """블록 삭제 시 자식 행 함께 삭제"""
+        first = _block_with_spots('block1', '025980', date(2024, 1, 15), 2)
+        second = _block_with_spots('block1', '005930', date(2024, 1, 15), 1)
+        repository.save_all([first, second])
+
+        repository.delete_by_id(first.id)
+        assert session.query(BlockSpotModel).filter_by(block_detection_id=first.id).count() == 0
+
+        repository.delete_by_ticker('005930')
+        assert session.query(BlockSpotModel).count() == 0
@@ -10,6 +10,7 @@ from sqlalchemy.orm import sessionmaker
 
 from src.domain.entities.patterns import SeedPattern, SeedPatternStatus, BlockFeatures
 from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.detection_detail_models import SeedPatternBlockFeatureModel
 from src.infrastructure.repositories.seed_pattern_repository_impl import SeedPatternRepositoryImpl
 
 
@@ -147,6 +148,46 @@ class TestSeedPatternRepository:
         assert len(saved_patterns) == 3
         assert all(p.id is not None for p in saved_patterns)
 
+    def test_save_all_deduplicates_and_upserts_by_name(
+        self, repository, session, sample_seed_pattern, sample_block_features
+    ):
+        """일괄 저장 - pattern_name 기준 중복 제거 + 기존 패턴 업데이트"""
+        existing = repository.save(sample_seed_pattern)
+        session.commit()
+
+        updated = SeedPattern(
+            pattern_name='seed_v1_025980',
+            ticker='025980',
+            yaml_config_path='path/to/yaml',
+            detection_date=date(2024, 1, 15),
+            block_features=sample_block_features,
+            price_shape=[0.0, 1.0],
+            volume_shape=[0.0, 1.0],
+            description='Updated by save_all'
+        )
+        new_patterns = [
+            SeedPattern(
+                pattern_name='seed_v2_025980',
+                ticker='025980',
+                yaml_config_path='path/to/yaml',
+                detection_date=date(2024, 2, 1),
+                block_features=sample_block_features,
+                price_shape=[0.0, 1.0],
+                volume_shape=[0.0, 1.0],
+                description=description
+            )
+            for description in ('first', 'last')
+        ]
+
+        saved_patterns = repository.save_all([updated] + new_patterns, chunk_size=1)
+        session.commit()
+
+        assert len(saved_patterns) == 2
+        assert updated.id == existing.id
+        assert repository.count(ticker='025980') == 2
+        assert repository.find_by_id(existing.id).description == 'Updated by save_all'
+        assert repository.find_by_name('seed_v2_025980').description == 'last'
+
     def test_find_by_id(self, repository, session, sample_seed_pattern):
         """ID로 조회"""
         # 저장
@@ -434,3 +475,40 @@ class TestSeedPatternRepository:
         """상태 업데이트 - 없는 경우"""
         result = repository.update_status(99999, SeedPatternStatus.ARCHIVED)
         assert result is False
+
+
+class TestSeedPatternBlockFeatureTable:
+    """seed_pattern_block_feature 정규화 테이블 테스트"""
+
+    def test_save_writes_feature_rows(self, repository, session, sample_seed_pattern):
+        """저장 시 block feature 행 기록"""
+        saved = repository.save(sample_seed_pattern)
+        session.commit()
+
+        rows = session.query(SeedPatternBlockFeatureModel).filter_by(
+            seed_pattern_id=saved.id
+        ).order_by(SeedPatternBlockFeatureModel.position).all()
+        assert [r.block_id for r in rows] == ['block1', 'block2']
+        assert rows[1].peak_price == 12800
+        assert rows[0].ticker == '025980'
+
+    def test_find_by_block_feature(self, repository, session, sample_seed_pattern):
+        """블록 특징 조건으로 SQL 조회"""
+        repository.save(sample_seed_pattern)
+        session.commit()
+
+        assert len(repository.find_by_block_feature(date(2024, 2, 1), date(2024, 2, 28), block_type=2)) == 1
+        assert repository.find_by_block_feature(date(2024, 2, 1), date(2024, 2, 28), block_type=1) == []
+        assert repository.find_by_block_feature(
+            date(2024, 1, 1), date(2024, 12, 31), min_peak_price=13000
+        ) == []
+
+    def test_delete_removes_feature_rows(self, repository, session, sample_seed_pattern):
+        """패턴 삭제 시 feature 행 함께 삭제"""
+        saved = repository.save(sample_seed_pattern)
+        session.commit()
+
+        repository.delete_by_id(saved.id)
+        session.commit()
+
+        assert session.query(SeedPatternBlockFeatureModel).count() == 0
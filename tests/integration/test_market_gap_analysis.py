@@ -0,0 +1,177 @@
+"""
+Market-wide Gap Analysis Integration Tests
+(queries.get_coverage_bulk / get_missing_dates_bulk, IncrementalCollector)
+"""
+import pytest
+from datetime import date, timedelta
+from unittest.mock import Mock
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.collectors.incremental_collector import IncrementalCollector
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.stock import StockPrice
+from src.infrastructure.database import queries
+
+
+FROM_DATE = date(2024, 1, 1)
+TO_DATE = date(2024, 1, 31)
+
+# 2024년 1월 평일 = 거래일 캘린더 (23일)
+TRADING_DAYS = [
+    FROM_DATE + timedelta(days=i) for i in range(31)
+    if (FROM_DATE + timedelta(days=i)).weekday() < 5
+]
+
+
+@pytest.fixture
+def engine():
+    """테스트용 인메모리 DB 엔진"""
+    engine = create_engine('sqlite:///:memory:', echo=False)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def session_factory(engine):
+    """세션 팩토리"""
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def session(session_factory):
+    """테스트용 세션 (시세 데이터 적재)"""
+    session = session_factory()
+
+    rows = []
+    for i, day in enumerate(TRADING_DAYS):
+        # FULL: 전 거래일 보유
+        rows.append(_price_row('FULL', day))
+        # HOLE: 5번째 거래일 1일 누락
+        if i != 4:
+            rows.append(_price_row('HOLE', day))
+        # HALT: 10~15번째 거래일 거래정지 (6일 연속)
+        if not 10 <= i <= 15:
+            rows.append(_price_row('HALT', day))
+        # STALE: 마지막 3거래일 미수집
+        if i < len(TRADING_DAYS) - 3:
+            rows.append(_price_row('STALE', day))
+        # NEW: 중간 상장 (상장 전 구간은 누락 아님)
+        if i >= 8:
+            rows.append(_price_row('NEW', day))
+
+    session.execute(insert(StockPrice), rows)
+    session.commit()
+    yield session
+    session.close()
+
+
+def _price_row(ticker: str, day: date) -> dict:
+    return {
+        'ticker': ticker, 'date': day,
+        'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1000
+    }
+
+
+class TestMarketGapQueries:
+    """시장 캘린더 기반 gap 쿼리 테스트"""
+
+    def test_trading_calendar_is_union_of_dates(self, session):
+        """거래일 캘린더 = 전 종목 날짜 합집합"""
+        assert queries.get_trading_calendar(session, FROM_DATE, TO_DATE) == TRADING_DAYS
+
+    def test_coverage_bulk(self, session):
+        """단일 쿼리로 종목별 기대 거래일 / 누락 / 최신성 계산"""
+        coverage = queries.get_coverage_bulk(session, FROM_DATE, TO_DATE)
+
+        assert coverage['FULL'].missing_days == 0
+        assert coverage['FULL'].stale_days == 0
+        assert coverage['HOLE'].missing_days == 1
+        assert coverage['HALT'].missing_days == 6
+        assert coverage['STALE'].missing_days == 0
+        assert coverage['STALE'].stale_days == 3
+        assert coverage['NEW'].missing_days == 0
+        assert coverage['NEW'].first_date == TRADING_DAYS[8]
+
+    def test_coverage_bulk_includes_requested_tickers_without_data(self, session):
+        """요청 종목 중 데이터 없는 종목은 record_count=0"""
+        coverage = queries.get_coverage_bulk(session, FROM_DATE, TO_DATE, ['FULL', 'NONE'])
+
+        assert set(coverage) == {'FULL', 'NONE'}
+        assert not coverage['NONE'].has_data
+
+    def test_missing_dates_bulk(self, session):
+        """누락이 있는 종목의 누락 거래일만 반환"""
+        missing = queries.get_missing_dates_bulk(session, FROM_DATE, TO_DATE)
+
+        assert set(missing) == {'HOLE', 'HALT'}
+        assert missing['HOLE'] == [TRADING_DAYS[4]]
+        assert missing['HALT'] == TRADING_DAYS[10:16]
+
+    def test_get_missing_dates_single_ticker(self, session):
+        """단일 종목 API는 bulk 결과와 동일"""
+        assert queries.get_missing_dates(session, 'HOLE', FROM_DATE, TO_DATE) == [TRADING_DAYS[4]]
+        assert queries.get_missing_dates(session, 'FULL', FROM_DATE, TO_DATE) == []
+
+    def test_split_gap_runs(self):
+        """연속 누락이 임계값 이상이면 거래정지 구간"""
+        missing_dates = [TRADING_DAYS[2]] + TRADING_DAYS[10:16]
+
+        missing, suspended = queries.split_gap_runs(missing_dates, TRADING_DAYS)
+
+        assert missing == [TRADING_DAYS[2]]
+        assert suspended == [(TRADING_DAYS[10], TRADING_DAYS[15])]
+
+    def test_tickers_needing_update(self, session):
+        """최신일 < 목표일이거나 데이터 없는 종목"""
+        result = queries.get_tickers_needing_update(
+            session, ['FULL', 'STALE', 'NONE'], TRADING_DAYS[-1]
+        )
+
+        assert result == ['STALE', 'NONE']
+
+
+class TestIncrementalCollectorGaps:
+    """IncrementalCollector gap 분석 연동 테스트"""
+
+    @pytest.fixture
+    def collector(self, session, session_factory):
+        db = Mock(spec=DatabaseConnection)
+        db.get_session.side_effect = session_factory
+        return IncrementalCollector(db)
+
+    def test_validate_collection_reports_gaps(self, collector):
+        """검증 결과에 내부 누락 / 거래정지 포함"""
+        validation = collector.validate_collection(
+            ['FULL', 'HOLE', 'HALT', 'STALE', 'NONE'], FROM_DATE, TRADING_DAYS[-1]
+        )
+
+        assert validation['up_to_date'] == 3
+        assert validation['needs_update_tickers'] == [('STALE', TRADING_DAYS[-4])]
+        assert validation['no_data_tickers'] == ['NONE']
+
+        gaps = {ticker: (count, suspended) for ticker, count, suspended in validation['gap_tickers']}
+        assert gaps['HOLE'] == (1, [])
+        assert gaps['HALT'] == (0, [(TRADING_DAYS[10], TRADING_DAYS[15])])
+
+    def test_collection_plan_fill_gaps(self, collector):
+        """fill_gaps=True면 단발 누락 구간을 계획에 포함 (거래정지 제외)"""
+        plans = collector.get_collection_plan(
+            ['FULL', 'HOLE', 'HALT'], FROM_DATE, TRADING_DAYS[-1], fill_gaps=True
+        )
+
+        assert [(p.ticker, p.fromdate, p.todate) for p in plans] == [
+            ('HOLE', TRADING_DAYS[4], TRADING_DAYS[-1])
+        ]
+
+    def test_collection_plan_default_ignores_gaps(self, collector):
+        """기본값은 기존 증분 동작 유지"""
+        plans = collector.get_collection_plan(
+            ['FULL', 'HOLE', 'STALE'], FROM_DATE, TRADING_DAYS[-1]
+        )
+
+        assert [(p.ticker, p.fromdate) for p in plans] == [
+            ('STALE', TRADING_DAYS[-4] + timedelta(days=1))
+        ]
@@ -0,0 +1,90 @@
+"""
+ML Sequence Dataset Integration Tests
+(GenerateMLDatasetUseCase → memmap shards)
+"""
+import pytest
+import numpy as np
+from datetime import date, timedelta
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.application.use_cases.ml_dataset import GenerateMLDatasetUseCase
+from src.domain.entities.detections.dynamic_block_detection import DynamicBlockDetection
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.stock import StockPrice
+from src.infrastructure.repositories.dynamic_block_repository_impl import DynamicBlockRepositoryImpl
+from src.learning.dataset import ShardedSequenceDataset
+
+START = date(2024, 1, 1)
+FEATURES = ['price_change_1d', 'volume_ma5_ratio']
+
+
+@pytest.fixture
+def session():
+    """시세 + 블록이 적재된 인메모리 DB 세션"""
+    engine = create_engine('sqlite:///:memory:', echo=False)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    rows = []
+    for ticker, days in (('AAA', 80), ('BBB', 50), ('SHORT', 5)):
+        for i in range(days):
+            price = 1000.0 + i * (10 if ticker == 'AAA' else -1)
+            rows.append({
+                'ticker': ticker, 'date': START + timedelta(days=i),
+                'open': price, 'high': price * 1.01, 'low': price * 0.99,
+                'close': price, 'volume': 1000 + i
+            })
+    session.execute(insert(StockPrice), rows)
+
+    repo = DynamicBlockRepositoryImpl(session)
+    repo.save(DynamicBlockDetection(
+        block_id='block1', block_type=1, ticker='AAA', condition_name='seed',
+        started_at=START + timedelta(days=40), ended_at=START + timedelta(days=49)
+    ))
+    repo.save(DynamicBlockDetection(
+        block_id='block1', block_type=1, ticker='SHORT', condition_name='seed',
+        started_at=START
+    ))
+    session.commit()
+
+    yield session
+    session.close()
+    Base.metadata.drop_all(engine)
+
+
+def test_execute_writes_labeled_shards(session, tmp_path):
+    """블록 탐지 종목의 윈도우를 shard로 저장하고 블록 구간 라벨 부여"""
+    use_case = GenerateMLDatasetUseCase(session=session)
+
+    index = use_case.execute(
+        output_dir=str(tmp_path), condition_name='seed',
+        feature_names=FEATURES, sequence_length=10, stride=2, shard_size=16
+    )
+
+    # SHORT는 윈도우 길이 미만 → 제외, BBB는 블록 없음 → 대상 아님
+    dataset = ShardedSequenceDataset(str(tmp_path))
+    tickers = {t for shard in dataset.index.shards for t, _, _ in shard.tickers}
+    assert tickers == {'AAA'}
+
+    # price_change_1d 첫 행 NaN → 윈도우 시작 1부터 stride 2
+    assert index.num_samples == len(dataset) == (80 - 1 - 10) // 2 + 1
+    assert dataset.sample_shape == (10, 2)
+
+    dates = np.concatenate([dataset.load_dates(i) for i in range(dataset.num_shards)])
+    labels = dataset.labels()
+    in_block = (dates >= np.datetime64(START + timedelta(days=40))) & \
+               (dates <= np.datetime64(START + timedelta(days=49)))
+    assert in_block.any()
+    assert (labels[in_block] == 1).all() and (labels[~in_block] == 0).all()
+
+
+def test_execute_explicit_tickers(session, tmp_path):
+    """tickers 지정 시 블록이 없는 종목도 배경 라벨(0)로 포함"""
+    index = GenerateMLDatasetUseCase(session=session).execute(
+        output_dir=str(tmp_path), tickers=['BBB'],
+        feature_names=FEATURES, sequence_length=10
+    )
+
+    assert index.num_samples == 50 - 1 - 10 + 1
+    assert index.label_counts == {'0': index.num_samples}
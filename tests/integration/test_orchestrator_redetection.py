@@ -322,6 +322,57 @@ class TestDetectRedetectionsForPatterns(TestOrchestratorRedetectionIntegration):
         assert block1_p1.get_redetection_count() >= 0
         assert block1_p2.get_redetection_count() >= 0
 
+    def test_single_sweep_merges_blocks_by_start(
+        self,
+        orchestrator,
+        stocks
+    ):
+        """블록별 종료일 이후 캔들만, 캔들 순서대로 한 번씩 평가"""
+        blocks = []
+        patterns = []
+        for seq, ended_at in enumerate([date(2024, 1, 15), date(2024, 1, 1)], start=1):
+            block = DynamicBlockDetection(
+                block_id="block1",
+                block_type=1,
+                ticker="025980",
+                condition_name="seed",
+                started_at=date(2024, 1, 1),
+                ended_at=ended_at,
+                status=BlockStatus.COMPLETED,
+                peak_price=10800.0,
+                peak_volume=1200000
+            )
+            blocks.append(block)
+            patterns.append(SeedPatternTree(
+                pattern_id=PatternId.generate("025980", date(2024, 1, 1), seq),
+                ticker="025980",
+                root_block=block
+            ))
+        orchestrator.pattern_manager.active_patterns = patterns
+
+        with patch.object(orchestrator.redetection_detector, 'detect_redetections') as mock_detect:
+            orchestrator._detect_redetections_for_patterns(
+                ticker="025980",
+                stocks=stocks
+            )
+
+        calls = [(c[1]['current'].date, c[1]['block']) for c in mock_detect.call_args_list]
+
+        # 패턴1: 1/16, 1/20 (2회), 패턴2: 1/2 이후 4회
+        assert sum(1 for _, b in calls if b is blocks[0]) == 2
+        assert sum(1 for _, b in calls if b is blocks[1]) == 4
+
+        # 날짜 오름차순, 같은 날짜에서는 패턴 순서 유지
+        assert [d for d, _ in calls] == sorted(d for d, _ in calls)
+        same_day = [b for d, b in calls if d == date(2024, 1, 16)]
+        assert same_day == [blocks[0], blocks[1]]
+
+        # 각 호출의 prev는 직전 캔들
+        for c in mock_detect.call_args_list:
+            current = c[1]['current']
+            index = stocks.index(current)
+            assert c[1]['context']['prev'] is stocks[index - 1]
+
 
 class TestBuildRedetectionContext(TestOrchestratorRedetectionIntegration):
     """_build_redetection_context() 통합 테스트"""
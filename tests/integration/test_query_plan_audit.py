@@ -0,0 +1,129 @@
+"""
+Query Plan Audit Integration Tests
+"""
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.dynamic_block_detection_model import DynamicBlockDetectionModel
+from src.infrastructure.database.query_plan_audit import (
+    AUDIT_TICKER,
+    QueryPlanAuditor,
+    find_redundant_indexes,
+    merge_proposals,
+    run_repository_workload,
+    summarize_proposals,
+)
+
+
+@pytest.fixture
+def engine():
+    """테스트용 인메모리 DB 엔진"""
+    engine = create_engine('sqlite:///:memory:', echo=False)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def session(engine):
+    """테스트용 세션"""
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def _active_blocks_statement():
+    """find_active_blocks / DetectionQueryBuilder 형태 쿼리"""
+    model = DynamicBlockDetectionModel
+    return (
+        select(model)
+        .where(model.ticker == AUDIT_TICKER, model.status == 'active')
+        .order_by(model.started_at)
+    )
+
+
+class TestQueryPlanAuditor:
+    """QueryPlanAuditor 테스트"""
+
+    def test_workload_has_no_full_scans_or_sorts_on_detection_table(self, session):
+        """현재 스키마에서 블록 조회는 인덱스 탐색 + 인덱스 순서 정렬"""
+        auditor = QueryPlanAuditor(session)
+        with auditor.capture():
+            run_repository_workload(session)
+        session.rollback()
+
+        findings = auditor.audit()
+
+        assert len(findings) > 20
+        assert not [f for f in findings if f.full_scans]
+        assert summarize_proposals(findings) == {}
+
+    def test_detects_temp_btree_and_proposes_composite_index(self, session):
+        """단일 컬럼 인덱스만 있으면 임시 B-tree를 탐지하고 복합 인덱스 제안"""
+        session.execute(text("DROP INDEX idx_dbd_ticker_status_started"))
+        session.execute(text("DROP INDEX idx_dbd_ticker_condition_started"))
+        session.execute(text("DROP INDEX idx_dbd_ticker_started"))
+        session.execute(text(
+            "CREATE INDEX ix_dynamic_block_detection_status ON dynamic_block_detection (status)"
+        ))
+
+        finding = QueryPlanAuditor(session).explain(_active_blocks_statement())
+
+        assert finding.temp_btree
+        assert finding.proposed_index == ('ticker', 'status', 'started_at')
+
+    def test_composite_index_resolves_finding(self, session):
+        """복합 인덱스가 있으면 정렬 없이 탐색"""
+        finding = QueryPlanAuditor(session).explain(_active_blocks_statement())
+
+        assert not finding.has_problem
+        assert any('idx_dbd_ticker_status_started' in detail for detail in finding.plan)
+
+    def test_full_scan_detected_without_index(self, session):
+        """인덱스 없는 컬럼 조건은 풀 스캔으로 탐지"""
+        model = DynamicBlockDetectionModel
+        finding = QueryPlanAuditor(session).explain(
+            select(model).where(model.peak_price > 100)
+        )
+
+        assert finding.full_scans
+        assert finding.proposed_index == ('peak_price',)
+
+    def test_capture_deduplicates_shapes(self, session):
+        """같은 shape는 한 번만 수집"""
+        auditor = QueryPlanAuditor(session)
+        with auditor.capture():
+            session.execute(_active_blocks_statement()).all()
+            session.execute(_active_blocks_statement()).all()
+
+        assert len(auditor.statements) == 1
+
+
+class TestIndexProposals:
+    """인덱스 제안 / 중복 탐지 테스트"""
+
+    def test_merge_proposals_drops_prefixes(self):
+        """접두어 관계의 제안은 긴 쪽으로 병합"""
+        merged = merge_proposals([
+            ('ticker',),
+            ('ticker', 'started_at'),
+            ('ticker', 'started_at'),
+            ('pattern_id', 'block_type'),
+        ])
+
+        assert sorted(merged) == [('pattern_id', 'block_type'), ('ticker', 'started_at')]
+
+    def test_find_redundant_single_column_index(self, session):
+        """복합 인덱스 선두 컬럼과 같은 단일 컬럼 인덱스는 삭제 후보"""
+        session.execute(text(
+            "CREATE INDEX ix_dynamic_block_detection_ticker ON dynamic_block_detection (ticker)"
+        ))
+
+        redundant = find_redundant_indexes(session, 'dynamic_block_detection')
+
+        names = [index.index_name for index in redundant]
+        assert names == ['ix_dynamic_block_detection_ticker']
+        assert redundant[0].covered_by[0] == 'ticker'
@@ -2,7 +2,8 @@
 BlockNode 단위 테스트
 """
 import pytest
-from src.domain.entities.block_graph import BlockNode
+from src.domain.entities.block_graph import BlockGraph, BlockNode
+from src.domain.entities.conditions import Condition
 
 
 class TestBlockNode:
@@ -125,3 +126,44 @@ class TestBlockNode:
                 block_type=1,
                 name="Test"
             )
+
+    def test_spot_plan_parsed_once_on_graph_load(self):
+        """그래프 추가 시 spot 계획 1회 계산 (이전 블록 ID, 회고 범위, 제외 조건)"""
+        node = BlockNode(
+            block_id="block2",
+            block_type=2,
+            name="Block 2",
+            spot_condition=Condition("levelup", "is_levelup_spot('block1', -1, -5)"),
+            spot_entry_conditions=[
+                Condition("high", "check_day.high >= 10000"),
+                Condition("gap", "current.open > check_day.close"),
+            ],
+            exclude_conditions=["gap"]
+        )
+        assert node.spot_plan is None
+
+        BlockGraph().add_node(node)
+
+        plan = node.spot_plan
+        assert plan is not None
+        assert plan.prev_block_id == "block1"
+        assert plan.offset_range == (-1, -5)
+        assert [c.name for c in plan.entry_conditions] == ["high", "gap"]
+        assert [c.name for c in plan.levelup_entry_conditions] == ["high"]
+        assert node.get_spot_plan() is plan
+
+    def test_spot_plan_defaults(self):
+        """범위 없는 spot_condition은 D-1, D-2 기본값, spot_condition 없으면 ID 없음"""
+        node = BlockNode(
+            block_id="block2",
+            block_type=2,
+            name="Block 2",
+            spot_condition=Condition("backward", "is_backward_spot('block1')")
+        )
+
+        assert node.get_spot_plan().prev_block_id == "block1"
+        assert node.get_spot_plan().offset_range == (-1, -2)
+
+        plain = BlockNode(block_id="block1", block_type=1, name="Block 1")
+        assert plain.get_spot_plan().prev_block_id is None
+        assert plain.get_spot_plan().entry_conditions == ()
@@ -178,3 +178,18 @@ class TestExpressionEngine:
         # 유효하지 않은 표현식
         assert engine.validate_expression("current.close >=") == False
         assert engine.validate_expression("if x:") == False
+
+    def test_compiled_expression_is_cached(self):
+        """같은 표현식은 한 번만 파싱"""
+        engine = ExpressionEngine()
+        up = MockStock(ticker='025980', date=date(2024, 1, 1),
+                       open=100, high=110, low=90, close=105, volume=1000)
+        down = MockStock(ticker='025980', date=date(2024, 1, 2),
+                         open=100, high=110, low=90, close=99, volume=1000)
+
+        tree = engine.compile("current.close >= 100")
+        assert engine.compile("current.close >= 100") is tree
+
+        # 캐시된 AST로 컨텍스트만 바꿔 평가
+        assert engine.evaluate("current.close >= 100", {'current': up}) is True
+        assert engine.evaluate("current.close >= 100", {'current': down}) is False
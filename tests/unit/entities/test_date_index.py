@@ -0,0 +1,105 @@
+"""
+DateIndex 단위 테스트
+
+날짜 → 위치 조회, bisect 범위 조회, 컨텍스트 재사용
+"""
+import pytest
+from datetime import date
+
+from src.domain.entities.core import Stock, DateIndex, DATE_INDEX_KEY
+
+
+def _stock(day: int, volume: int = 1000) -> Stock:
+    return Stock(
+        ticker="025980",
+        name="테스트",
+        date=date(2024, 1, day),
+        open=100.0,
+        high=110.0,
+        low=90.0,
+        close=105.0,
+        volume=volume
+    )
+
+
+@pytest.fixture
+def stocks():
+    # 1/6, 1/7 주말 없음 (연속 날짜가 아니어도 됨)
+    return [_stock(d) for d in (2, 3, 4, 5, 8, 9, 10)]
+
+
+@pytest.mark.unit
+class TestDateIndex:
+    """DateIndex 테스트"""
+
+    def test_position_matches_linear_scan(self, stocks):
+        """모든 날짜의 위치가 선형 탐색 결과와 같음"""
+        index = DateIndex(stocks)
+
+        for i, stock in enumerate(stocks):
+            assert index.position(stock.date) == i
+        assert index.position(date(2024, 1, 6)) is None
+        assert len(index) == len(stocks)
+
+    def test_position_respects_prefix_end(self, stocks):
+        """prefix 길이 밖의 위치는 없는 것으로 처리"""
+        index = DateIndex(stocks)
+
+        assert index.position(date(2024, 1, 8), end=5) == 4
+        assert index.position(date(2024, 1, 8), end=4) is None
+
+    def test_duplicate_dates_return_first_position(self):
+        """중복 날짜는 첫 위치 반환"""
+        index = DateIndex([_stock(2), _stock(3), _stock(3)])
+
+        assert index.position(date(2024, 1, 3)) == 1
+
+    def test_bisect_counts(self, stocks):
+        """count_before / count_through 범위 조회"""
+        index = DateIndex(stocks)
+
+        assert index.count_before(date(2024, 1, 2)) == 0
+        assert index.count_before(date(2024, 1, 6)) == 4
+        assert index.count_through(date(2024, 1, 8)) == 5
+        assert index.count_through(date(2024, 2, 1)) == len(stocks)
+
+    def test_last_traded_before_skips_zero_volume(self):
+        """거래량 0인 날을 건너뛰고 마지막 정상 거래일 반환"""
+        stocks = [_stock(2), _stock(3, volume=0), _stock(4, volume=0), _stock(5)]
+        index = DateIndex(stocks)
+
+        assert index.last_traded_before(stocks, date(2024, 1, 5)) == 0
+        assert index.last_traded_before(stocks, date(2024, 1, 6)) == 3
+        assert index.last_traded_before(stocks, date(2024, 1, 2)) is None
+        # prefix 리스트 기준
+        assert index.last_traded_before(stocks[:2], date(2024, 1, 6)) == 0
+
+    def test_covers_prefix_only(self, stocks):
+        """같은 시계열의 prefix만 포함으로 판단"""
+        index = DateIndex(stocks)
+
+        assert index.covers(stocks)
+        assert index.covers(stocks[:3])
+        assert index.covers([])
+        assert not index.covers(stocks[1:])
+        assert not index.covers(stocks + [_stock(11)])
+
+    def test_for_context_reuses_valid_index(self, stocks):
+        """context의 색인이 유효하면 재사용"""
+        index = DateIndex(stocks)
+        context = {'all_stocks': stocks[:4], DATE_INDEX_KEY: index}
+
+        assert DateIndex.for_context(context) is index
+
+    def test_for_context_builds_and_caches(self, stocks):
+        """색인이 없거나 다른 시계열이면 새로 생성해서 context에 저장"""
+        context = {'all_stocks': stocks}
+        index = DateIndex.for_context(context)
+
+        assert context[DATE_INDEX_KEY] is index
+        assert DateIndex.for_context(context) is index
+
+        stale = {'all_stocks': stocks[2:], DATE_INDEX_KEY: index}
+        rebuilt = DateIndex.for_context(stale)
+        assert rebuilt is not index
+        assert rebuilt.position(date(2024, 1, 4)) == 0
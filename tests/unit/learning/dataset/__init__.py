@@ -0,0 +1 @@
+"""Dataset module tests"""
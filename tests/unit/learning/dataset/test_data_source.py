@@ -0,0 +1,133 @@
+"""
+Tests for Training Data Sources
+
+shard 스트리밍 / 셔플 / prefetch 테스트
+"""
+import pytest
+import numpy as np
+
+from src.learning.dataset import (
+    ArrayDataSource,
+    ShardedDataSource,
+    ShardWriter,
+    TickerWindows,
+    prefetch_batches,
+    sliding_windows,
+)
+
+SEQ_LEN = 4
+
+
+@pytest.fixture
+def shard_dir(tmp_path):
+    """샘플 i의 모든 값 = i 인 shard 데이터셋 (45 samples, shard 10개씩)"""
+    matrix = np.repeat(np.arange(48, dtype=np.float32)[:, None], 2, axis=1)
+    windows = sliding_windows(matrix, SEQ_LEN)  # window i = rows i..i+3
+    # 윈도우 시작 행 번호로 식별되도록 첫 행 값만 사용
+    writer = ShardWriter(str(tmp_path), SEQ_LEN, 1, ['a', 'b'], shard_size=10)
+    writer.add(TickerWindows(
+        ticker='AAA',
+        windows=windows,
+        selection=np.arange(45),
+        labels=(np.arange(45) % 3).astype(np.int32),
+        end_dates=np.arange(45).astype('datetime64[D]')
+    ))
+    writer.close()
+    return str(tmp_path)
+
+
+def _ids(batches):
+    return np.concatenate([X[:, 0, 0] for X, _ in batches]).astype(int)
+
+
+@pytest.mark.unit
+class TestShardedDataSource:
+    """ShardedDataSource 테스트"""
+
+    def test_sequential_epoch_covers_all_in_order(self, shard_dir):
+        """셔플 없이 전체 샘플을 순서대로 배치"""
+        source = ShardedDataSource(shard_dir, num_workers=3)
+
+        batches = list(source.iter_batches(batch_size=8))
+
+        assert len(source) == 45
+        assert source.steps(8) == len(batches) == 6
+        assert _ids(batches).tolist() == list(range(45))
+        assert batches[0][0].dtype == np.float32
+        np.testing.assert_array_equal(batches[0][1], np.arange(8) % 3)
+
+    def test_shuffle_is_deterministic_per_seed_and_epoch(self, shard_dir):
+        """같은 seed/epoch → 같은 순서, epoch가 바뀌면 다른 순서"""
+        source = ShardedDataSource(shard_dir, shuffle_buffer=20)
+
+        first = _ids(source.iter_batches(8, shuffle=True, seed=42, epoch=0))
+        again = _ids(source.iter_batches(8, shuffle=True, seed=42, epoch=0))
+        next_epoch = _ids(source.iter_batches(8, shuffle=True, seed=42, epoch=1))
+
+        assert first.tolist() == again.tolist()
+        assert first.tolist() != next_epoch.tolist()
+        assert sorted(first.tolist()) == list(range(45))
+        assert first.tolist() != list(range(45))
+
+    def test_labels_follow_samples(self, shard_dir):
+        """셔플 후에도 X와 y 대응 유지"""
+        source = ShardedDataSource(shard_dir, shuffle_buffer=15)
+
+        for X, y in source.iter_batches(7, shuffle=True, seed=1):
+            np.testing.assert_array_equal(X[:, 0, 0].astype(int) % 3, y)
+
+    def test_split_holds_out_tail_of_each_shard(self, shard_dir):
+        """validation = 각 shard 뒤쪽 비율"""
+        train, val = ShardedDataSource(shard_dir).split(0.2)
+
+        assert len(train) + len(val) == 45
+        assert _ids(val.iter_batches(100)).tolist() == [8, 9, 18, 19, 28, 29, 38, 39, 44]
+        assert train.num_classes() == 3
+
+    def test_labels(self, shard_dir):
+        source = ShardedDataSource(shard_dir)
+
+        np.testing.assert_array_equal(source.labels(), np.arange(45) % 3)
+
+
+@pytest.mark.unit
+class TestArrayDataSource:
+    """ArrayDataSource 테스트"""
+
+    def test_split_returns_views(self):
+        X = np.arange(20, dtype=np.float32).reshape(10, 2)
+        y = np.arange(10)
+
+        train, val = ArrayDataSource(X, y).split(0.3)
+
+        assert len(train) == 7 and len(val) == 3
+        assert np.shares_memory(train.X, X)
+
+    def test_shuffled_batches_cover_all(self):
+        source = ArrayDataSource(np.arange(10, dtype=np.float32)[:, None], np.arange(10))
+
+        seen = np.concatenate([y for _, y in source.iter_batches(3, shuffle=True, seed=7)])
+
+        assert sorted(seen.tolist()) == list(range(10))
+
+
+@pytest.mark.unit
+class TestPrefetchBatches:
+    """prefetch_batches 테스트"""
+
+    def test_yields_all_items(self):
+        assert list(prefetch_batches(iter(range(10)), prefetch=2)) == list(range(10))
+
+    def test_producer_error_is_raised(self):
+        def failing():
+            yield 1
+            raise RuntimeError("read failed")
+
+        with pytest.raises(RuntimeError, match="read failed"):
+            list(prefetch_batches(failing()))
+
+    def test_early_close_stops_producer(self):
+        iterator = prefetch_batches(iter(range(1000)), prefetch=1)
+
+        assert next(iterator) == 0
+        iterator.close()
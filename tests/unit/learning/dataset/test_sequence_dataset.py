@@ -0,0 +1,170 @@
+"""
+Tests for Sequence Dataset
+
+윈도우 텐서 생성 / shard 저장 테스트
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from src.learning.dataset import (
+    SequenceDatasetBuilder,
+    ShardWriter,
+    ShardedSequenceDataset,
+    sliding_windows,
+    label_days,
+)
+
+FEATURES = ['price_change_1d', 'volume_ma5_ratio', 'ma20']
+
+
+@pytest.fixture
+def prices():
+    """합성 OHLCV 데이터 (100일)"""
+    rng = np.random.default_rng(1)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, 100)))
+    return pd.DataFrame({
+        'date': [date(2024, 1, 1) + timedelta(days=i) for i in range(100)],
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': rng.integers(1_000, 100_000, 100).astype(float),
+    })
+
+
+def _block(block_type, started_at, ended_at=None):
+    return SimpleNamespace(block_type=block_type, started_at=started_at, ended_at=ended_at)
+
+
+@pytest.mark.unit
+class TestSlidingWindows:
+    """sliding_windows / label_days 테스트"""
+
+    def test_windows_are_views(self):
+        """윈도우는 복사 없이 원본 메모리 공유"""
+        matrix = np.arange(20, dtype=np.float32).reshape(10, 2)
+
+        windows = sliding_windows(matrix, 4, stride=3)
+
+        assert windows.shape == (3, 4, 2)
+        assert np.shares_memory(windows, matrix)
+        np.testing.assert_array_equal(windows[1], matrix[3:7])
+        np.testing.assert_array_equal(windows[2], matrix[6:10])
+
+    def test_too_short_series(self):
+        """시계열이 윈도우보다 짧으면 0개"""
+        windows = sliding_windows(np.zeros((3, 2), dtype=np.float32), 5)
+
+        assert windows.shape == (0, 5, 2)
+
+    def test_label_days_active_block(self):
+        """진행 중 블록의 block_type, 겹치면 큰 값, 미종료 블록은 끝까지"""
+        dates = [date(2024, 1, d) for d in range(1, 11)]
+        blocks = [
+            _block(1, date(2024, 1, 2), date(2024, 1, 4)),
+            _block(2, date(2024, 1, 4), date(2024, 1, 5)),
+            _block(3, date(2024, 1, 9)),
+        ]
+
+        labels = label_days(dates, blocks)
+
+        assert labels.tolist() == [0, 1, 1, 2, 2, 0, 0, 0, 3, 3]
+
+
+@pytest.mark.unit
+class TestSequenceDatasetBuilder:
+    """SequenceDatasetBuilder 테스트"""
+
+    def test_build_ticker_drops_warmup_windows(self, prices):
+        """NaN 포함 윈도우(MA20 warm-up) 제외, 라벨은 마지막 날 기준"""
+        builder = SequenceDatasetBuilder(FEATURES, sequence_length=10, stride=5)
+        blocks = [_block(1, date(2024, 3, 1), date(2024, 3, 10))]
+
+        result = builder.build_ticker('TEST', prices, blocks)
+
+        kept = result.windows[result.selection]
+        assert kept.dtype == np.float32
+        assert np.isfinite(kept).all()
+        # MA20 첫 값은 19번째 행 → 윈도우 시작 >= 19 (stride 5 → 20부터)
+        assert result.end_dates[0] == np.datetime64(date(2024, 1, 1) + timedelta(days=29))
+        assert len(result) == (100 - 20 - 10) // 5 + 1
+
+        in_block = (result.end_dates >= np.datetime64('2024-03-01')) & \
+                   (result.end_dates <= np.datetime64('2024-03-10'))
+        assert (result.labels[in_block] == 1).all()
+        assert (result.labels[~in_block] == 0).all()
+
+    def test_default_features_are_causal(self, prices):
+        """기본 피처는 미래 데이터를 보지 않음 (전체 구간 min/max 정규화 제외)"""
+        builder = SequenceDatasetBuilder()
+
+        assert builder.feature_names
+        assert 'price_close_normalized' not in builder.feature_names
+        assert 'volume_normalized' not in builder.feature_names
+
+        full = builder.feature_matrix(prices)
+        past = builder.feature_matrix(prices.iloc[:50])
+        np.testing.assert_allclose(past, full[:50], equal_nan=True)
+
+
+@pytest.mark.unit
+class TestShardStore:
+    """ShardWriter / ShardedSequenceDataset 테스트"""
+
+    def test_roundtrip_across_shards(self, prices, tmp_path):
+        """여러 종목이 shard 경계를 넘어도 원본 윈도우와 동일"""
+        builder = SequenceDatasetBuilder(FEATURES, sequence_length=10, stride=3)
+        writer = ShardWriter(str(tmp_path), 10, 3, builder.feature_names, shard_size=7)
+
+        built = [
+            builder.build_ticker('AAA', prices, [_block(1, date(2024, 2, 15))]),
+            builder.build_ticker('BBB', prices.iloc[:60].reset_index(drop=True), []),
+        ]
+        for ticker_windows in built:
+            writer.add(ticker_windows)
+        index = writer.close()
+
+        total = sum(len(tw) for tw in built)
+        assert index.num_samples == total
+        assert [s.num_samples for s in index.shards][:-1] == [7] * (len(index.shards) - 1)
+
+        dataset = ShardedSequenceDataset(str(tmp_path))
+        assert len(dataset) == total
+        assert dataset.sample_shape == (10, len(FEATURES))
+
+        expected_x = np.concatenate([tw.windows[tw.selection] for tw in built])
+        expected_y = np.concatenate([tw.labels for tw in built])
+
+        actual_x = np.concatenate([np.asarray(x) for x, _ in dataset.iter_shards()])
+        np.testing.assert_array_equal(actual_x, expected_x)
+        np.testing.assert_array_equal(dataset.labels(), expected_y)
+
+        x, y = dataset[8]
+        np.testing.assert_array_equal(x, expected_x[8])
+        assert y == expected_y[8]
+
+        assert sum(index.label_counts.values()) == total
+        tickers = [t for shard in dataset.index.shards for t, _, _ in shard.tickers]
+        assert tickers[0] == 'AAA' and tickers[-1] == 'BBB'
+
+    def test_shards_open_as_memmap(self, prices, tmp_path):
+        """X shard는 mmap으로 열림"""
+        builder = SequenceDatasetBuilder(FEATURES, sequence_length=10)
+        writer = ShardWriter(str(tmp_path), 10, 1, builder.feature_names)
+        writer.add(builder.build_ticker('AAA', prices, []))
+        writer.close()
+
+        x, _ = ShardedSequenceDataset(str(tmp_path)).load_shard(0)
+
+        assert isinstance(x, np.memmap)
+
+    def test_shape_mismatch(self, prices, tmp_path):
+        """feature 수가 index와 다르면 ValueError"""
+        builder = SequenceDatasetBuilder(FEATURES, sequence_length=10)
+        writer = ShardWriter(str(tmp_path), 10, 1, ['only_one'])
+
+        with pytest.raises(ValueError):
+            writer.add(builder.build_ticker('AAA', prices, []))
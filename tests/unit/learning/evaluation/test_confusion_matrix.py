@@ -8,7 +8,9 @@ import numpy as np
 
 from src.learning.evaluation.confusion_matrix import (
     ClassMetrics,
-    ConfusionMatrixAnalyzer
+    ConfusionMatrixAnalyzer,
+    ConfusionMatrixAccumulator,
+    compute_confusion_matrix
 )
 
 
@@ -455,3 +457,71 @@ class TestClassMetrics:
         assert "0.7500" in summary  # Precision
         assert "0.6000" in summary  # Recall
         assert "Support: 25" in summary
+
+
+@pytest.mark.unit
+class TestConfusionMatrixConstruction:
+    """bincount 기반 혼동 행렬 생성 / 누적 테스트"""
+
+    def test_compute_matches_pairwise_count(self):
+        """단일 bincount 결과가 (true, pred) 쌍 집계와 동일"""
+        rng = np.random.default_rng(0)
+        y_true = rng.integers(0, 4, 500)
+        y_pred = rng.integers(0, 4, 500)
+
+        expected = np.zeros((4, 4), dtype=int)
+        for t, p in zip(y_true, y_pred):
+            expected[t, p] += 1
+
+        np.testing.assert_array_equal(compute_confusion_matrix(y_true, y_pred), expected)
+
+    def test_compute_rejects_out_of_range_label(self):
+        """num_classes 범위를 벗어난 라벨"""
+        with pytest.raises(ValueError):
+            compute_confusion_matrix(np.array([0, 3]), np.array([0, 1]), num_classes=3)
+
+    def test_compute_empty(self):
+        """빈 입력 + num_classes 지정"""
+        cm = compute_confusion_matrix(np.array([]), np.array([]), num_classes=2)
+        np.testing.assert_array_equal(cm, np.zeros((2, 2)))
+
+    def test_accumulator_matches_full_matrix(self):
+        """배치별 누적 결과가 전체 계산과 동일 (클래스 수 자동 확장)"""
+        rng = np.random.default_rng(1)
+        y_true = rng.integers(0, 5, 1000)
+        y_pred = rng.integers(0, 5, 1000)
+        y_true[-1] = 5  # 마지막 배치에서 처음 등장하는 클래스
+
+        accumulator = ConfusionMatrixAccumulator()
+        for start in range(0, 1000, 128):
+            accumulator.update(y_true[start:start + 128], y_pred[start:start + 128])
+
+        np.testing.assert_array_equal(
+            accumulator.matrix, compute_confusion_matrix(y_true, y_pred)
+        )
+        assert accumulator.num_classes == 6
+        assert accumulator.num_samples == 1000
+
+    def test_accumulator_fixed_size_and_merge(self):
+        """고정 크기 누적기와 병합"""
+        left = ConfusionMatrixAccumulator(num_classes=3).update([0, 1], [0, 2])
+        right = ConfusionMatrixAccumulator().update([2], [2])
+
+        left.merge(right)
+
+        assert left.matrix.tolist() == [[1, 0, 0], [0, 0, 1], [0, 0, 1]]
+        with pytest.raises(ValueError):
+            left.update([3], [0])
+
+    def test_analyzer_from_labels(self):
+        """라벨로부터 분석기 생성 (지표가 EvaluationMetrics와 동일)"""
+        from src.learning.evaluation.metrics import EvaluationMetrics
+
+        y_true = np.array([0, 1, 2, 0, 1, 2])
+        y_pred = np.array([0, 1, 0, 0, 2, 2])
+
+        analyzer = ConfusionMatrixAnalyzer.from_labels(y_true, y_pred)
+        for class_id in range(3):
+            metrics = analyzer.get_class_metrics(class_id)
+            assert metrics.precision == EvaluationMetrics.calculate_precision(y_true, y_pred, class_id)
+            assert metrics.recall == EvaluationMetrics.calculate_recall(y_true, y_pred, class_id)
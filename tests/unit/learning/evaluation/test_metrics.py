@@ -299,6 +299,34 @@ class TestEvaluationMetrics:
         assert performance.weighted_recall is not None
         assert performance.weighted_f1 is not None
 
+    def test_evaluate_confusion_matrix_matches_evaluate_full(self):
+        """누적된 혼동 행렬 기반 평가가 라벨 기반 평가와 동일"""
+        from src.learning.evaluation.confusion_matrix import ConfusionMatrixAccumulator
+
+        rng = np.random.default_rng(7)
+        y_true = rng.integers(0, 4, 300)
+        y_pred = rng.integers(0, 4, 300)
+
+        accumulator = ConfusionMatrixAccumulator()
+        for start in range(0, 300, 64):
+            accumulator.update(y_true[start:start + 64], y_pred[start:start + 64])
+
+        full = EvaluationMetrics.evaluate_full(y_true, y_pred, model_name="M")
+        streamed = EvaluationMetrics.evaluate_confusion_matrix(accumulator.matrix, model_name="M")
+
+        for name in ('accuracy', 'macro_f1', 'weighted_f1', 'per_class_precision',
+                     'per_class_recall', 'per_class_support', 'confusion_matrix', 'num_samples'):
+            assert getattr(full, name) == getattr(streamed, name)
+
+    def test_macro_metrics_class_without_samples(self):
+        """classes에 샘플이 없는 클래스가 포함되면 0으로 평균에 반영"""
+        y_true = np.array([0, 0, 1])
+        y_pred = np.array([0, 0, 1])
+
+        macro = EvaluationMetrics.calculate_macro_metrics(y_true, y_pred, classes=[0, 1, 2])
+
+        assert abs(macro['macro_f1'] - 2 / 3) < 1e-9
+
 
 @pytest.mark.unit
 class TestModelPerformance:
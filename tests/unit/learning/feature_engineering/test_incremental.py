@@ -0,0 +1,155 @@
+"""
+Tests for Incremental Feature Engine
+
+증분 피처 계산 / 배치 추출 결과 일치 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.learning.feature_engineering import (
+    FeatureStateStore,
+    IncrementalFeatureEngine,
+    feature_registry,
+)
+from src.learning.feature_engineering import block_features  # noqa: F401 (register features)
+
+# Whole-series min/max: only the newest row matches a batch extract over the same history
+GLOBAL_FEATURES = {
+    'price_close_normalized', 'volume_normalized',
+    'volume_log_normalized', 'trading_value_normalized',
+}
+
+
+@pytest.fixture
+def ohlcv():
+    """합성 OHLCV 데이터 (600 거래일, 보합 / 거래량 0 포함)"""
+    rng = np.random.default_rng(3)
+    n = 600
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    close[100:103] = close[99]
+    volume = rng.integers(1_000, 1_000_000, n).astype(float)
+    volume[200] = 0.0
+    return pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.005, n)),
+        'high': close * (1 + np.abs(rng.normal(0, 0.01, n))),
+        'low': close * (1 - np.abs(rng.normal(0, 0.01, n))),
+        'close': close,
+        'volume': volume,
+    }, index=pd.bdate_range('2021-01-04', periods=n))
+
+
+def assert_frame_close(actual: pd.DataFrame, expected: pd.DataFrame):
+    for name in expected.columns:
+        np.testing.assert_allclose(
+            actual[name].to_numpy(dtype=float),
+            expected[name].to_numpy(dtype=float),
+            rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name
+        )
+
+
+@pytest.mark.unit
+class TestIncrementalParity:
+    """배치 FeatureRegistry.extract와의 일치"""
+
+    def test_default_features_are_context_free(self):
+        engine = IncrementalFeatureEngine()
+
+        assert len(engine.feature_names) == 40
+        assert all(not feature_registry.get_metadata(n).requires for n in engine.feature_names)
+
+    def test_rowwise_parity_over_full_history(self, ohlcv):
+        """전역 min/max 피처 외에는 모든 행이 배치 결과와 동일"""
+        engine = IncrementalFeatureEngine()
+
+        _, incremental = engine.warm_up('A', ohlcv)
+
+        names = [n for n in engine.feature_names if n not in GLOBAL_FEATURES]
+        assert_frame_close(incremental[names], feature_registry.extract(names, ohlcv))
+
+    def test_rolling_std_parity_across_resync_and_gaps(self):
+        """이동 표준편차 running sum: NaN 구간 / 주기적 재합산 이후에도 배치와 동일"""
+        rng = np.random.default_rng(5)
+        n = 2500
+        close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        close[700:705] = np.nan
+        df = pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close,
+                           'volume': np.ones(n)}, index=pd.bdate_range('2010-01-04', periods=n))
+        engine = IncrementalFeatureEngine(['bollinger_width'])
+
+        _, incremental = engine.warm_up('A', df)
+
+        assert_frame_close(incremental, feature_registry.extract(['bollinger_width'], df))
+
+    def test_daily_updates_match_batch_last_row(self, ohlcv):
+        """일별 update 결과 = 해당 날짜까지의 배치 추출 마지막 행 (모든 피처)"""
+        engine = IncrementalFeatureEngine()
+        state, _ = engine.warm_up('A', ohlcv.iloc[:480])
+
+        for t in range(480, 600):
+            row = engine.update(state, ohlcv.iloc[t:t + 1])
+            if t % 17 == 0 or t == 599:
+                expected = feature_registry.extract(engine.feature_names, ohlcv.iloc[:t + 1])
+                assert_frame_close(row, expected.iloc[-1:])
+
+        assert state.rows_seen == 600
+        assert state.last_index == ohlcv.index[-1]
+
+    def test_multi_row_update_equals_single_steps(self, ohlcv):
+        """여러 행 한번에 update = 한 행씩 update"""
+        engine = IncrementalFeatureEngine()
+        one, _ = engine.warm_up('A', ohlcv.iloc[:300])
+        many, _ = engine.warm_up('A', ohlcv.iloc[:300])
+
+        stepped = pd.concat([engine.update(one, ohlcv.iloc[t:t + 1]) for t in range(300, 310)])
+        batched = engine.update(many, ohlcv.iloc[300:310])
+
+        assert_frame_close(batched, stepped)
+
+    def test_update_many_stacks_tickers(self, ohlcv):
+        """여러 종목 일괄 update (종목별 상태 독립)"""
+        engine = IncrementalFeatureEngine(['ma5', 'rsi_14', 'price_new_high_6m'])
+        other = ohlcv * 1.5
+        states = {
+            'A': engine.warm_up('A', ohlcv.iloc[:500])[0],
+            'B': engine.warm_up('B', other.iloc[:500])[0],
+        }
+
+        result = engine.update_many(states, {'A': ohlcv.iloc[500:502], 'B': other.iloc[500:502]})
+
+        assert list(result.index.get_level_values('ticker')) == ['A', 'A', 'B', 'B']
+        expected_b = feature_registry.extract(engine.feature_names, other.iloc[:502]).iloc[-2:]
+        assert_frame_close(result.loc['B'], expected_b)
+
+    def test_rejects_old_rows(self, ohlcv):
+        engine = IncrementalFeatureEngine(['ma5'])
+        state, _ = engine.warm_up('A', ohlcv.iloc[:10])
+
+        with pytest.raises(ValueError):
+            engine.update(state, ohlcv.iloc[9:11])
+
+
+@pytest.mark.unit
+class TestFeatureStateStore:
+    """상태 저장 / 복원"""
+
+    def test_round_trip_resumes_identically(self, ohlcv, tmp_path):
+        engine = IncrementalFeatureEngine()
+        store = FeatureStateStore(str(tmp_path))
+        state, _ = engine.warm_up('005930', ohlcv.iloc[:550])
+        store.save(state)
+
+        restored = store.load(engine, '005930')
+        expected = engine.update(state, ohlcv.iloc[550:])
+        actual = engine.update(restored, ohlcv.iloc[550:])
+
+        assert store.tickers() == ['005930']
+        assert_frame_close(actual, expected)
+
+    def test_mismatched_feature_set_is_ignored(self, ohlcv, tmp_path):
+        store = FeatureStateStore(str(tmp_path))
+        state, _ = IncrementalFeatureEngine(['ma5']).warm_up('A', ohlcv.iloc[:20])
+        store.save(state)
+
+        assert store.load(IncrementalFeatureEngine(['ma20']), 'A') is None
+        assert store.load(IncrementalFeatureEngine(['ma5']), 'missing') is None
@@ -0,0 +1,217 @@
+"""
+Tests for Feature Registry
+
+중간 시계열 공유 / 의존성 순서 테스트
+"""
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.learning.feature_engineering import (
+    FeatureRegistry,
+    IntermediateCache,
+    feature_registry,
+    ma,
+    ema,
+    rolling_max,
+    difference,
+)
+from src.learning.feature_engineering import block_features  # noqa: F401 (register features)
+from src.learning.feature_engineering.technical_indicators import (
+    calculate_moving_average,
+    calculate_macd,
+    calculate_bollinger_bands,
+    calculate_ma_deviation,
+    detect_volume_spike,
+    is_new_high,
+)
+
+
+@pytest.fixture
+def ohlcv():
+    """합성 OHLCV 데이터 (600일)"""
+    rng = np.random.default_rng(0)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, 600)))
+    return pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.005, 600)),
+        'high': close * (1 + np.abs(rng.normal(0, 0.01, 600))),
+        'low': close * (1 - np.abs(rng.normal(0, 0.01, 600))),
+        'close': close,
+        'volume': rng.integers(1_000, 1_000_000, 600).astype(float),
+    })
+
+
+@pytest.mark.unit
+class TestIntermediateCache:
+    """IntermediateCache 테스트"""
+
+    def test_same_spec_computed_once(self, ohlcv):
+        """동일 spec은 값 비교로 같은 키 → 한 번만 계산"""
+        cache = IntermediateCache(ohlcv)
+
+        first = cache.get(ma('close', 20))
+        second = cache.get(ma('close', 20))
+
+        assert first is second
+        assert cache.misses == 2  # column(close) + ma
+        assert cache.hits == 1
+
+    def test_nested_spec_shares_sources(self, ohlcv):
+        """중첩 spec의 하위 노드도 공유"""
+        cache = IntermediateCache(ohlcv)
+        line = difference(ema('close', 12), ema('close', 26))
+
+        cache.get(ema(line, 9))
+        cache.get(ema('close', 12))
+
+        assert ema('close', 12) in cache
+        assert len(cache) == 5  # close, ema12, ema26, line, signal
+        assert cache.hits == 2  # close (ema26), ema12
+
+    def test_invalid_window(self):
+        """rolling 연산은 window >= 1 필요"""
+        with pytest.raises(ValueError):
+            ma('close', 0)
+
+
+@pytest.mark.unit
+class TestFeatureRegistryInputs:
+    """FeatureRegistry inputs 선언 테스트"""
+
+    @pytest.fixture
+    def registry(self):
+        registry = FeatureRegistry()
+        calls = []
+
+        @registry.register('base', category='test')
+        def base(df):
+            calls.append('base')
+            return df['close'] * 2
+
+        @registry.register('derived', category='test', inputs={'b': 'base', 'm': ma('close', 5)})
+        def derived(df, b, m):
+            calls.append('derived')
+            return b - m
+
+        @registry.register('top', category='test', inputs={'d': 'derived', 'b': 'base'})
+        def top(df, d, b):
+            calls.append('top')
+            return d + b
+
+        registry.calls = calls
+        return registry
+
+    def test_dependency_order(self, registry):
+        """feature 입력이 먼저 평가"""
+        assert registry.evaluation_order(['top']) == ['base', 'derived', 'top']
+
+    def test_dependencies_evaluated_once_and_not_in_output(self, registry, ohlcv):
+        """의존 feature는 한 번만 계산되고 요청하지 않으면 결과에 없음"""
+        result = registry.extract(['top'], ohlcv)
+
+        assert list(result.columns) == ['top']
+        assert registry.calls == ['base', 'derived', 'top']
+        expected = ohlcv['close'] * 4 - calculate_moving_average(ohlcv['close'], 5)
+        pd.testing.assert_series_equal(result['top'], expected, check_names=False)
+
+    def test_circular_inputs(self):
+        """순환 입력은 ValueError"""
+        registry = FeatureRegistry()
+
+        @registry.register('a', category='test', inputs={'x': 'b'})
+        def a(df, x):
+            return x
+
+        @registry.register('b', category='test', inputs={'x': 'a'})
+        def b(df, x):
+            return x
+
+        with pytest.raises(ValueError, match='Circular feature inputs: a -> b -> a'):
+            registry.extract(['a'], pd.DataFrame({'close': [1.0]}))
+
+    def test_unknown_feature_input(self):
+        """존재하지 않는 feature 입력은 ValueError"""
+        registry = FeatureRegistry()
+
+        @registry.register('a', category='test', inputs={'x': 'missing'})
+        def a(df, x):
+            return x
+
+        with pytest.raises(ValueError, match='Unknown feature: missing'):
+            registry.evaluation_order(['a'])
+
+    def test_context_and_inputs_combined(self, ohlcv):
+        """requires(context)와 inputs를 함께 전달"""
+        registry = FeatureRegistry()
+
+        @registry.register(
+            'ratio', category='test', requires=['ref'], inputs={'m': ma('close', 5)}
+        )
+        def ratio(df, ref, m):
+            return m / ref
+
+        result = registry.extract(['ratio'], ohlcv, context={'ref': 2.0})
+
+        expected = calculate_moving_average(ohlcv['close'], 5) / 2.0
+        pd.testing.assert_series_equal(result['ratio'], expected, check_names=False)
+
+
+@pytest.mark.unit
+class TestBlockFeatureParity:
+    """inputs 기반 block feature가 기존 계산식과 동일한지 검증"""
+
+    def test_ma_features(self, ohlcv):
+        result = feature_registry.extract(['ma60', 'ma_deviation_60', 'high_above_ma60'], ohlcv)
+        expected_ma = calculate_moving_average(ohlcv['close'], 60)
+
+        pd.testing.assert_series_equal(result['ma60'], expected_ma, check_names=False)
+        pd.testing.assert_series_equal(
+            result['ma_deviation_60'],
+            calculate_ma_deviation(ohlcv['close'], expected_ma),
+            check_names=False
+        )
+        pd.testing.assert_series_equal(
+            result['high_above_ma60'],
+            (ohlcv['high'] >= expected_ma).astype(int),
+            check_names=False
+        )
+
+    def test_macd_and_bollinger(self, ohlcv):
+        result = feature_registry.extract(
+            ['macd', 'macd_signal', 'macd_histogram', 'bollinger_width'], ohlcv
+        )
+        line, signal, histogram = calculate_macd(ohlcv['close'])
+        upper, middle, lower = calculate_bollinger_bands(ohlcv['close'])
+
+        pd.testing.assert_series_equal(result['macd'], line, check_names=False)
+        pd.testing.assert_series_equal(result['macd_signal'], signal, check_names=False)
+        pd.testing.assert_series_equal(result['macd_histogram'], histogram, check_names=False)
+        pd.testing.assert_series_equal(
+            result['bollinger_width'], (upper - lower) / middle, check_names=False
+        )
+
+    def test_spike_and_new_high(self, ohlcv):
+        result = feature_registry.extract(
+            ['volume_spike_2x', 'volume_spike_3x', 'price_new_high_6m'], ohlcv
+        )
+
+        pd.testing.assert_series_equal(
+            result['volume_spike_2x'],
+            detect_volume_spike(ohlcv['volume'], 20, 2.0).astype(int),
+            check_names=False
+        )
+        pd.testing.assert_series_equal(
+            result['volume_spike_3x'],
+            detect_volume_spike(ohlcv['volume'], 20, 3.0).astype(int),
+            check_names=False
+        )
+        pd.testing.assert_series_equal(
+            result['price_new_high_6m'],
+            is_new_high(ohlcv['high'], 6).astype(int),
+            check_names=False
+        )
+
+    def test_shared_rolling_max_spec(self):
+        """동일 window의 rolling_max spec은 동일 키"""
+        assert rolling_max('high', 120) == rolling_max('high', 120)
+        assert hash(rolling_max('high', 120)) == hash(rolling_max('high', 120))
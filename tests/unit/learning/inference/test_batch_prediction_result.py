@@ -0,0 +1,148 @@
+"""
+Tests for BatchPredictionResult
+
+컬럼 기반 배치 예측 결과 테스트
+"""
+import pytest
+import numpy as np
+from datetime import datetime
+from unittest.mock import Mock
+from sqlalchemy import create_engine, text
+
+from src.learning.inference.batch_predictor import BatchPredictor
+from src.learning.inference.model_deployer import ModelDeployer
+from src.learning.inference.prediction_result import BatchPredictionResult, PredictionResult
+
+START = datetime(2024, 1, 1)
+END = datetime(2024, 3, 1)
+
+PROBS = np.array([
+    [0.9, 0.05, 0.05],
+    [0.2, 0.5, 0.3],
+    [0.1, 0.1, 0.8],
+    [0.3, 0.35, 0.35],
+], dtype=np.float32)
+TICKERS = ['A', 'B', 'C', 'D']
+DATES = [(START, END)] * 4
+
+
+@pytest.fixture
+def result():
+    result = BatchPredictionResult(model_name='m', model_version='1.0', num_features=7)
+    result.set_columns(TICKERS, DATES, PROBS)
+    return result
+
+
+@pytest.mark.unit
+class TestBatchPredictionResult:
+    """BatchPredictionResult 테스트"""
+
+    def test_columns_and_stats(self, result):
+        """argmax / confidence 배열과 집계"""
+        assert result.predicted_classes.tolist() == [0, 1, 2, 1]
+        np.testing.assert_allclose(result.confidences, [0.9, 0.5, 0.8, 0.35])
+        assert result.total_predictions == result.successful_predictions == 4
+        assert result.average_confidence == pytest.approx(np.mean([0.9, 0.5, 0.8, 0.35]))
+
+    def test_rows_materialize_lazily(self, result):
+        """predictions 접근 시 PredictionResult 생성"""
+        assert result._materialized is None
+
+        row = result.predictions[2]
+
+        assert isinstance(row, PredictionResult)
+        assert (row.ticker, row.predicted_class, row.num_features) == ('C', 2, 7)
+        assert row.class_probabilities == pytest.approx({0: 0.1, 1: 0.1, 2: 0.8})
+        assert row.model_version == '1.0'
+        assert result.predictions is result.predictions
+
+    def test_get_index_bounds(self, result):
+        """음수 인덱스는 끝에서부터, 범위 밖은 IndexError"""
+        result.add_prediction(PredictionResult(
+            ticker='E', started_at=START, ended_at=END,
+            predicted_class=1, confidence_score=0.95
+        ))
+
+        assert result.get(-1).ticker == 'E'
+        assert result.get(-2).ticker == 'D'
+        assert result.get(-5).ticker == 'A'
+        assert result.average_confidence == pytest.approx((0.9 + 0.5 + 0.8 + 0.35 + 0.95) / 5)
+        for index in (5, -6):
+            with pytest.raises(IndexError):
+                result.get(index)
+
+    def test_filter_by_confidence(self, result):
+        """벡터 마스크 필터 + add_prediction 행도 함께 필터"""
+        result.add_prediction(PredictionResult(
+            ticker='E', started_at=START, ended_at=END,
+            predicted_class=1, confidence_score=0.95
+        ))
+
+        result.filter_by_confidence(0.7)
+
+        assert [p.ticker for p in result.predictions] == ['A', 'C', 'E']
+        assert result.successful_predictions == 3
+        assert result.average_confidence == pytest.approx((0.9 + 0.8 + 0.95) / 3)
+
+    def test_predictions_setter(self, result):
+        """기존 방식의 predictions 대입 호환"""
+        kept = result.predictions[:1]
+
+        result.predictions = kept
+
+        assert [p.ticker for p in result.predictions] == ['A']
+        assert result.total_predictions == 1
+
+    def test_to_dataframe_and_db(self, result):
+        """DataFrame 변환 및 bulk DB 저장"""
+        frame = result.to_dataframe()
+
+        assert list(frame['ticker']) == TICKERS
+        assert list(frame.columns[:5]) == [
+            'ticker', 'started_at', 'ended_at', 'predicted_class', 'confidence_score'
+        ]
+        np.testing.assert_allclose(frame[['prob_0', 'prob_1', 'prob_2']].to_numpy(), PROBS)
+
+        engine = create_engine('sqlite:///:memory:')
+        assert result.write_to_db(engine, 'predictions') == 4
+        with engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT ticker, predicted_class FROM predictions ORDER BY ticker"
+            )).all()
+        assert [tuple(r) for r in rows] == [('A', 0), ('B', 1), ('C', 2), ('D', 1)]
+
+
+@pytest.mark.unit
+class TestBatchPredictor:
+    """BatchPredictor 컬럼 결과 테스트"""
+
+    @pytest.fixture
+    def predictor(self):
+        model = Mock()
+        model.predict.return_value = PROBS
+        deployer = Mock(spec=ModelDeployer)
+        deployer.get_model.return_value = model
+        deployer.get_metadata.return_value = None
+        return BatchPredictor(deployer)
+
+    def test_predict_batch(self, predictor):
+        result = predictor.predict_batch('m', np.zeros((4, 5, 3)), TICKERS, DATES)
+
+        assert result.predicted_classes.tolist() == [0, 1, 2, 1]
+        assert result.num_features == 3
+        assert result.predictions[0].architecture_type == 'unknown'
+
+    def test_predict_with_confidence_filter(self, predictor):
+        result = predictor.predict_with_confidence_filter(
+            'm', np.zeros((4, 5, 3)), TICKERS, DATES, min_confidence=0.5
+        )
+
+        assert list(result.tickers) == ['A', 'B', 'C']
+
+    def test_model_failure_records_errors(self, predictor):
+        predictor.deployer.get_model.return_value.predict.side_effect = RuntimeError("boom")
+
+        result = predictor.predict_batch('m', np.zeros((4, 5, 3)), TICKERS, DATES)
+
+        assert result.failed_predictions == 4
+        assert len(result) == 0
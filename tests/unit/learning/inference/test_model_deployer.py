@@ -0,0 +1,150 @@
+"""
+Tests for ModelDeployer cache
+
+LRU / 메모리 예산 / preload / warm-up 테스트
+"""
+import threading
+import pytest
+import numpy as np
+from types import SimpleNamespace
+
+from src.learning import backend
+from src.learning.inference.model_deployer import ModelDeployer
+from src.learning.inference.realtime_predictor import RealtimePredictor
+
+MB = 1024 * 1024
+
+
+class FakeModel:
+    """count_params() * 4 bytes 크기의 가짜 Keras 모델"""
+
+    def __init__(self, name, params):
+        self.name = name
+        self.params = params
+        self.input_shape = (None, 5, 3)
+        self.output_shape = (None, 3)
+        self.layers = [1, 2]
+        self.calls = []
+
+    def count_params(self):
+        return self.params
+
+    def predict(self, batch, batch_size=None, verbose=1):
+        self.calls.append(('predict', batch.shape))
+        return np.zeros((len(batch), 3))
+
+    def __call__(self, batch, training=None):
+        self.calls.append(('call', batch.shape, training))
+        return np.zeros((len(batch), 3))
+
+
+@pytest.fixture
+def fake_keras(monkeypatch):
+    """backend.keras().models.load_model → FakeModel (파일명 기반 크기: name_<MB>)"""
+    loaded = []
+    gate = {'event': None}
+
+    def load_model(path):
+        if gate['event'] is not None:
+            gate['event'].wait(5)
+        name = path.rsplit('/', 1)[-1][:-3]
+        loaded.append(name)
+        size_mb = int(name.split('_')[-1])
+        return FakeModel(name, size_mb * MB // 4)
+
+    keras = SimpleNamespace(models=SimpleNamespace(load_model=load_model))
+    monkeypatch.setattr(backend, 'keras', lambda: keras)
+    return SimpleNamespace(loaded=loaded, gate=gate)
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    for name in ('a_1', 'b_1', 'c_2'):
+        (tmp_path / f"{name}.h5").write_bytes(b'')
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestModelDeployerCache:
+    """ModelDeployer 캐시 테스트"""
+
+    def test_hits_misses_and_warmup(self, fake_keras, model_dir):
+        """첫 load는 miss + warm-up, 이후 get/load는 hit"""
+        deployer = ModelDeployer(str(model_dir))
+
+        model = deployer.load_model('a_1')
+        assert deployer.get_model('a_1') is model
+        assert deployer.load_model('a_1') is model
+
+        assert fake_keras.loaded == ['a_1']
+        assert model.calls == [('predict', (1, 5, 3)), ('call', (1, 5, 3), False)]
+
+        cache = deployer.get_model_info('a_1')['cache']
+        assert (cache['hits'], cache['misses'], cache['loads']) == (2, 1, 1)
+        assert cache['size_bytes'] == MB
+        assert cache['load_seconds'] >= 0 and cache['warmup_seconds'] >= 0
+
+    def test_warmup_covers_realtime_entry_point(self, fake_keras, model_dir):
+        """RealtimePredictor가 쓰는 model(x, training=False) 경로도 로드 시 warm-up"""
+        deployer = ModelDeployer(str(model_dir))
+        predictor = RealtimePredictor(deployer)
+
+        predictor.predict_single('a_1', np.zeros((5, 3), dtype=np.float32), 'T', None, None)
+
+        # warm-up(predict, __call__) 후 실제 요청은 warm-up과 같은 __call__ 경로
+        assert deployer.get_model('a_1').calls == [
+            ('predict', (1, 5, 3)),
+            ('call', (1, 5, 3), False),
+            ('call', (1, 5, 3), False),
+        ]
+
+    def test_lru_eviction_under_budget(self, fake_keras, model_dir):
+        """예산 초과 시 가장 오래 사용하지 않은 모델부터 제거"""
+        deployer = ModelDeployer(str(model_dir), memory_budget_mb=3, warmup=False)
+
+        deployer.load_model('a_1')
+        deployer.load_model('b_1')
+        deployer.get_model('a_1')          # a가 최근 사용
+        deployer.load_model('c_2')         # 4MB > 3MB → b 제거
+
+        assert deployer.list_loaded_models() == ['a_1', 'c_2']
+        assert deployer.cache_size_bytes == 3 * MB
+        stats = deployer.get_cache_stats()
+        assert stats['evictions'] == 1
+        assert deployer.cache_stats['b_1'].evictions == 1
+
+    def test_oversized_model_is_still_cached(self, fake_keras, model_dir):
+        """예산보다 큰 단일 모델도 방금 로드한 모델은 유지"""
+        deployer = ModelDeployer(str(model_dir), memory_budget_mb=1, warmup=False)
+
+        deployer.load_model('a_1')
+        deployer.load_model('c_2')
+
+        assert deployer.list_loaded_models() == ['c_2']
+
+    def test_background_preload(self, fake_keras, model_dir):
+        """preload는 백그라운드 로드, 실패는 preload_errors에 기록"""
+        deployer = ModelDeployer(str(model_dir), preload=['a_1', 'missing_1', 'b_1'])
+
+        assert deployer.wait_for_preload(timeout=5)
+        assert deployer.list_loaded_models() == ['a_1', 'b_1']
+        assert 'missing_1' in deployer.preload_errors
+
+    def test_concurrent_load_waits_for_preload(self, fake_keras, model_dir):
+        """로드 중인 모델을 다른 스레드가 요청하면 중복 로드 없이 대기"""
+        fake_keras.gate['event'] = threading.Event()
+        deployer = ModelDeployer(str(model_dir), preload=['a_1'], warmup=False)
+
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(deployer.load_model('a_1')))
+        waiter.start()
+        fake_keras.gate['event'].set()
+        waiter.join(5)
+
+        assert deployer.wait_for_preload(timeout=5)
+        assert fake_keras.loaded == ['a_1']
+        assert results[0] is deployer.get_model('a_1')
+
+    def test_model_info_requires_loaded(self, fake_keras, model_dir):
+        with pytest.raises(ValueError):
+            ModelDeployer(str(model_dir)).get_model_info('a_1')
@@ -0,0 +1,177 @@
+"""
+Tests for Prediction Server
+
+micro-batching 예측 서버 테스트
+"""
+import asyncio
+import pytest
+import numpy as np
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.learning.inference.model_deployer import ModelDeployer
+from src.learning.inference.prediction_server import PredictionServer
+from src.learning.inference.realtime_predictor import RealtimePredictor
+
+START = datetime(2024, 1, 1)
+END = datetime(2024, 3, 1)
+
+
+class FakeModel:
+    """features[0, 0] 값의 클래스(mod 3)에 확률 0.8을 주는 모델"""
+
+    def __init__(self, fail: bool = False, input_shape=None):
+        self.batch_sizes = []
+        self.fail = fail
+        if input_shape is not None:
+            self.input_shape = input_shape
+
+    def __call__(self, batch, training=False):
+        assert training is False
+        self.batch_sizes.append(len(batch))
+        if self.fail:
+            raise RuntimeError("model failed")
+        probs = np.full((len(batch), 3), 0.1, dtype=np.float32)
+        probs[np.arange(len(batch)), batch[:, 0, 0].astype(int) % 3] = 0.8
+        return probs
+
+    def predict(self, *args, **kwargs):
+        raise AssertionError("predict() must not be used")
+
+
+def _deployer(model):
+    deployer = Mock(spec=ModelDeployer)
+    deployer.get_model.return_value = model
+    deployer.get_metadata.return_value = None
+    return deployer
+
+
+def _features(i):
+    return np.full((5, 2), i, dtype=np.float32)
+
+
+async def _predict_all(server, count):
+    async with server:
+        return await asyncio.gather(*[
+            server.predict(_features(i), f"T{i:03d}", START, END) for i in range(count)
+        ])
+
+
+@pytest.mark.unit
+class TestPredictionServer:
+    """PredictionServer 테스트"""
+
+    def test_concurrent_requests_coalesce_into_batches(self):
+        """동시 요청은 max_batch_size 단위 batch로 묶임"""
+        model = FakeModel()
+        server = PredictionServer(_deployer(model), 'm', max_batch_size=8, max_wait_ms=50)
+
+        results = asyncio.run(_predict_all(server, 20))
+
+        assert model.batch_sizes == [8, 8, 4]
+        assert [r.ticker for r in results] == [f"T{i:03d}" for i in range(20)]
+        assert [r.predicted_class for r in results] == [i % 3 for i in range(20)]
+        assert results[0].confidence_score == pytest.approx(0.8)
+        assert results[0].num_features == 2
+
+    def test_results_match_realtime_predictor(self):
+        """단건 예측 결과와 동일"""
+        model = FakeModel()
+        deployer = _deployer(model)
+
+        batched = asyncio.run(_predict_all(PredictionServer(deployer, 'm'), 4))
+        single = [
+            RealtimePredictor(deployer).predict_single('m', _features(i), f"T{i:03d}", START, END)
+            for i in range(4)
+        ]
+
+        for b, s in zip(batched, single):
+            assert b.predicted_class == s.predicted_class
+            assert b.class_probabilities == s.class_probabilities
+
+    def test_max_wait_flushes_partial_batch(self):
+        """요청이 적으면 max_wait 후 부분 batch 실행"""
+        model = FakeModel()
+        server = PredictionServer(_deployer(model), 'm', max_batch_size=64, max_wait_ms=1)
+
+        async def run():
+            async with server:
+                first = await server.predict(_features(1), 'A', START, END)
+                second = await server.predict(_features(2), 'B', START, END)
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert model.batch_sizes == [1, 1]
+        assert (first.predicted_class, second.predicted_class) == (1, 2)
+
+    def test_stats(self):
+        """지연 백분위수와 batch fill rate"""
+        server = PredictionServer(_deployer(FakeModel()), 'm', max_batch_size=8, max_wait_ms=50)
+
+        asyncio.run(_predict_all(server, 20))
+        stats = server.get_stats()
+
+        assert stats['total_requests'] == 20
+        assert stats['total_batches'] == 3
+        assert stats['full_batches'] == 2
+        assert stats['batch_fill_rate'] == pytest.approx((20 / 3) / 8)
+        latency = stats['latency_ms']
+        assert 0 <= latency['p50'] <= latency['p90'] <= latency['p99'] <= latency['max']
+
+    def test_model_error_propagates_to_callers(self):
+        """모델 실패 시 batch 내 모든 요청에 예외 전달"""
+        server = PredictionServer(_deployer(FakeModel(fail=True)), 'm', max_wait_ms=10)
+
+        async def run():
+            async with server:
+                return await asyncio.gather(
+                    server.predict(_features(0), 'A', START, END),
+                    server.predict(_features(1), 'B', START, END),
+                    return_exceptions=True
+                )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert server.get_stats()['failed_requests'] == 2
+
+    @pytest.mark.parametrize('input_shape', [(None, 5, 2), None])
+    def test_wrong_shape_fails_only_its_request(self, input_shape):
+        """shape이 다른 요청만 실패, 같은 batch의 나머지는 정상 예측"""
+        model = FakeModel(input_shape=input_shape)
+        server = PredictionServer(_deployer(model), 'm', max_batch_size=8, max_wait_ms=50)
+
+        async def run():
+            async with server:
+                return await asyncio.gather(
+                    server.predict(_features(1), 'A', START, END),
+                    server.predict(np.zeros((4, 2), dtype=np.float32), 'BAD', START, END),
+                    server.predict(_features(2), 'C', START, END),
+                    return_exceptions=True
+                )
+
+        good_a, bad, good_c = asyncio.run(run())
+
+        assert isinstance(bad, ValueError)
+        assert (good_a.predicted_class, good_c.predicted_class) == (1, 2)
+        assert model.batch_sizes == [2]
+        stats = server.get_stats()
+        assert (stats['total_requests'], stats['failed_requests']) == (3, 1)
+
+    def test_predict_requires_start(self):
+        server = PredictionServer(_deployer(FakeModel()), 'm')
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(server.predict(_features(0), 'A', START, END))
+
+    def test_loads_model_when_not_cached(self):
+        """get_model이 None이면 load_model 호출"""
+        model = FakeModel()
+        deployer = _deployer(None)
+        deployer.load_model.return_value = model
+
+        asyncio.run(_predict_all(PredictionServer(deployer, 'm'), 2))
+
+        deployer.load_model.assert_called_once_with('m')
+        assert sum(model.batch_sizes) == 2
@@ -0,0 +1,72 @@
+"""
+Tests for Lazy ML Backend
+
+learning 모듈 import 시 TensorFlow가 로드되지 않는지 검증
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# tensorflow import를 금지한 새 인터프리터에서 learning 패키지 import
+_PROBE = """
+import sys
+
+class BlockTensorFlow:
+    def find_spec(self, name, path=None, target=None):
+        if name.split('.')[0] in ('tensorflow', 'keras'):
+            raise ImportError('tensorflow import blocked')
+        return None
+
+sys.meta_path.insert(0, BlockTensorFlow())
+
+import src.learning.evaluation
+import src.learning.training
+import src.learning.inference
+import src.learning.dataset
+from src.learning.training import ModelTrainer, CallbackFactory, TrainingConfig
+from src.learning.inference import ModelDeployer, RealtimePredictor, BatchPredictor
+
+ModelDeployer(model_dir=sys.argv[1]).list_available_models()
+ModelTrainer(TrainingConfig())
+print('ok')
+"""
+
+
+@pytest.mark.unit
+def test_learning_modules_import_without_tensorflow(tmp_path):
+    """metric / dataset / 설정 경로는 TensorFlow 없이 import 및 생성 가능"""
+    proc = subprocess.run(
+        [sys.executable, '-c', _PROBE, str(tmp_path)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == 'ok'
+
+
+@pytest.mark.unit
+def test_backend_defers_import(monkeypatch):
+    """backend.tensorflow()는 첫 호출 시 한 번만 import"""
+    from src.learning import backend
+
+    calls = []
+    fake_tf = type('FakeTF', (), {'keras': 'keras-module'})()
+
+    def fake_import(name):
+        calls.append(name)
+        return fake_tf
+
+    monkeypatch.setattr(backend, '_tensorflow', None)
+    monkeypatch.setattr(backend, '_import_seconds', None)
+    monkeypatch.setattr(backend.importlib, 'import_module', fake_import)
+
+    assert backend.keras() == 'keras-module'
+    assert backend.tensorflow() is fake_tf
+    assert calls == ['tensorflow']
+    assert backend.import_seconds() is not None
@@ -0,0 +1 @@
+"""Training module tests"""
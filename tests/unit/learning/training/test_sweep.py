@@ -0,0 +1,245 @@
+"""
+Tests for Hyperparameter Sweep
+
+하이퍼파라미터 탐색 테스트
+"""
+import json
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import yaml
+
+from src.learning import backend
+from src.learning.training import sweep
+from src.learning.training.callbacks import CallbackFactory
+from src.learning.training.config import TrainingConfig
+from src.learning.training.sweep import (
+    SearchSpace,
+    SweepRunner,
+    TrialResult,
+    TrialSpec,
+    open_shared_dataset,
+    rank_results,
+    summarize_history,
+)
+
+
+def fake_trial(spec: TrialSpec) -> TrialResult:
+    """워커에서 실행되는 가짜 trial (memmap 데이터셋 / 스레드 제한 확인)"""
+    source = open_shared_dataset(spec.data_path)
+    config = TrainingConfig.from_dict(spec.config)
+
+    if config.learning_rate > 0.05:
+        raise RuntimeError("diverged")
+
+    return TrialResult(
+        trial_id=spec.trial_id,
+        params=spec.params,
+        status='completed',
+        score=abs(config.learning_rate - 0.01) + config.hyperparameters['units'] / 1000,
+        epochs_run=3,
+        metrics={
+            'memmap': float(isinstance(source.X, np.memmap)),
+            'samples': float(len(source)),
+            'omp_threads': float(os.environ['OMP_NUM_THREADS']),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestSearchSpace:
+    """SearchSpace 테스트"""
+
+    def test_grid_product(self):
+        """grid: 값 목록의 데카르트 곱 (YAML 순서 유지)"""
+        space = SearchSpace(parameters={
+            'learning_rate': [0.001, 0.01],
+            'units': {'values': [64, 128, 256]},
+            'dropout': 0.2,
+        })
+
+        trials = space.trials()
+
+        assert len(trials) == 6
+        assert trials[0] == {'learning_rate': 0.001, 'units': 64, 'dropout': 0.2}
+        assert trials[-1] == {'learning_rate': 0.01, 'units': 256, 'dropout': 0.2}
+
+    def test_grid_range_with_num(self):
+        """grid 범위 파라미터는 num 개 지점 (log 지원)"""
+        space = SearchSpace(parameters={'learning_rate': {'min': 1e-4, 'max': 1e-2, 'num': 3, 'log': True}})
+
+        values = [t['learning_rate'] for t in space.trials()]
+
+        np.testing.assert_allclose(values, [1e-4, 1e-3, 1e-2])
+
+    def test_random_is_seeded_and_in_range(self):
+        """random: 시드 고정 재현성, 범위 / 정수형 준수"""
+        params = {
+            'learning_rate': {'min': 1e-4, 'max': 1e-2, 'log': True},
+            'units': {'min': 16, 'max': 64, 'type': 'int'},
+            'batch_size': [32, 64],
+        }
+        first = SearchSpace(parameters=params, method='random', num_trials=20, seed=1).trials()
+        second = SearchSpace(parameters=params, method='random', num_trials=20, seed=1).trials()
+
+        assert first == second
+        for trial in first:
+            assert 1e-4 <= trial['learning_rate'] <= 1e-2
+            assert isinstance(trial['units'], int) and 16 <= trial['units'] <= 64
+            assert trial['batch_size'] in (32, 64)
+
+    def test_invalid_definitions(self):
+        with pytest.raises(ValueError):
+            SearchSpace(parameters={'a': [1]}, method='random')  # num_trials 없음
+        with pytest.raises(ValueError):
+            SearchSpace(parameters={'a': [1]}, mode='best')
+        with pytest.raises(ValueError):
+            SearchSpace(parameters={'a': {'min': 0, 'max': 1}}).trials()  # grid에 num 없음
+
+
+@pytest.mark.unit
+class TestTrainingConfigSweep:
+    """TrainingConfig sweep 섹션 / override 테스트"""
+
+    def test_from_yaml_with_sweep_section(self, tmp_path):
+        path = tmp_path / 'config.yaml'
+        path.write_text(yaml.safe_dump({
+            'architecture': 'lstm',
+            'hyperparameters': {'dropout': 0.2},
+            'sweep': {'method': 'grid', 'parameters': {'units': [32, 64]}},
+        }))
+
+        runner = SweepRunner.from_yaml(str(path), output_dir=str(tmp_path / 'sweep'))
+
+        assert runner.base_config.architecture == 'lstm'
+        assert runner.space.trials() == [{'units': 32}, {'units': 64}]
+
+    def test_with_overrides_routes_unknown_keys_to_hyperparameters(self):
+        base = TrainingConfig(hyperparameters={'dropout': 0.2}, sweep={'parameters': {}})
+
+        config = base.with_overrides({'learning_rate': 0.1, 'units': 128})
+
+        assert config.learning_rate == 0.1
+        assert config.hyperparameters == {'dropout': 0.2, 'units': 128}
+        assert config.sweep is None
+        assert base.hyperparameters == {'dropout': 0.2}
+
+    def test_runner_requires_space(self):
+        with pytest.raises(ValueError):
+            SweepRunner(TrainingConfig())
+
+
+@pytest.mark.unit
+class TestSweepHelpers:
+    """history 요약 / 순위 테스트"""
+
+    def test_summarize_history(self):
+        history = {'loss': [1.0, 0.8, 0.7, 0.75], 'val_loss': [0.9, 0.6, 0.65, 0.7]}
+
+        summary = summarize_history(history, 'val_loss', 'min', max_epochs=10)
+
+        assert summary['score'] == 0.6
+        assert summary['best_epoch'] == 2
+        assert summary['epochs_run'] == 4
+        assert summary['pruned'] is True
+        assert summary['metrics'] == {'loss': 0.8, 'val_loss': 0.6}
+
+        with pytest.raises(ValueError):
+            summarize_history(history, 'val_accuracy', 'max', 10)
+
+    def test_rank_results(self):
+        results = [
+            TrialResult(0, {}, 'completed', score=0.7),
+            TrialResult(1, {}, 'failed', error='x'),
+            TrialResult(2, {}, 'completed', score=0.9),
+        ]
+
+        assert [r.trial_id for r in rank_results(results, 'max')] == [2, 0, 1]
+        assert [r.trial_id for r in rank_results(results, 'min')] == [0, 2, 1]
+
+
+@pytest.mark.unit
+class TestSweepRunner:
+    """SweepRunner 병렬 실행 테스트"""
+
+    def test_worker_plan_does_not_oversubscribe(self):
+        space = SearchSpace(parameters={'units': [1]}, threads_per_worker=2)
+        runner = SweepRunner(TrainingConfig(), space)
+
+        workers, threads = runner.worker_plan(num_trials=1000)
+
+        assert workers * threads <= max(2, os.cpu_count())
+        assert runner.worker_plan(num_trials=1)[0] == 1
+
+    def test_worker_plan_caps_max_workers_to_cores(self, monkeypatch):
+        monkeypatch.setattr(sweep, 'available_cpus', lambda: 4)
+        space = SearchSpace(parameters={'units': [1]}, threads_per_worker=2, max_workers=16)
+
+        assert SweepRunner(TrainingConfig(), space).worker_plan(num_trials=100) == (2, 2)
+
+        space.max_workers = 1
+        assert SweepRunner(TrainingConfig(), space).worker_plan(num_trials=100) == (1, 2)
+
+    def test_build_trials_isolates_outputs_and_enables_early_stopping(self, tmp_path):
+        space = SearchSpace(parameters={'units': [32, 64]}, metric='val_accuracy',
+                            mode='max', early_stopping_patience=3)
+        runner = SweepRunner(TrainingConfig(use_early_stopping=False), space,
+                             output_dir=str(tmp_path))
+
+        specs = runner.build_trials(tmp_path / 'data')
+
+        configs = [TrainingConfig.from_dict(spec.config) for spec in specs]
+        assert len({c.output_dir for c in configs}) == 2
+        assert configs[1].model_name == 'block_classifier_v1_trial001'
+        assert all(c.use_early_stopping for c in configs)
+        assert all(c.early_stopping_monitor == 'val_accuracy' for c in configs)
+        assert all(c.early_stopping_patience == 3 for c in configs)
+        assert configs[0].hyperparameters['units'] == 32
+
+    @pytest.mark.parametrize('metric, mode', [('val_loss', 'min'), ('val_accuracy', 'max')])
+    def test_early_stopping_follows_sweep_mode(self, tmp_path, monkeypatch, metric, mode):
+        """EarlyStopping은 sweep metric 방향(min / max)으로 개선 여부 판단"""
+        created = []
+        keras = SimpleNamespace(callbacks=SimpleNamespace(
+            EarlyStopping=lambda **kwargs: created.append(kwargs)
+        ))
+        monkeypatch.setattr(backend, 'keras', lambda: keras)
+
+        space = SearchSpace(parameters={'units': [32]}, metric=metric, mode=mode)
+        runner = SweepRunner(TrainingConfig(use_reduce_lr=False, use_model_checkpoint=False),
+                             space, output_dir=str(tmp_path))
+        config = TrainingConfig.from_dict(runner.build_trials(tmp_path / 'data')[0].config)
+
+        CallbackFactory.create_callbacks(config)
+
+        assert len(created) == 1
+        assert (created[0]['monitor'], created[0]['mode']) == (metric, mode)
+
+    def test_run_in_process_pool(self, tmp_path):
+        """프로세스 풀 실행: memmap 공유, 스레드 제한, 실패 기록, leaderboard 저장"""
+        space = SearchSpace(
+            parameters={'learning_rate': [0.001, 0.01, 0.1], 'units': [10, 20]},
+            max_workers=2
+        )
+        runner = SweepRunner(
+            TrainingConfig(), space, output_dir=str(tmp_path),
+            trial_fn=fake_trial, mp_context='fork', verbose=False
+        )
+        X = np.random.default_rng(0).random((40, 5, 3))
+        y = np.arange(40) % 2
+
+        result = runner.run(X, y)
+
+        assert len(result.results) == 6
+        assert result.best.params == {'learning_rate': 0.01, 'units': 10}
+        assert [r.status for r in result.results].count('failed') == 2
+        assert result.results[-1].error == 'RuntimeError: diverged'
+        assert result.best.metrics == {'memmap': 1.0, 'samples': 40.0, 'omp_threads': 1.0}
+
+        leaderboard = json.loads(result.leaderboard_path.read_text())
+        assert leaderboard['trials'][0]['trial_id'] == result.best.trial_id
+        rows = (tmp_path / 'leaderboard.csv').read_text().strip().splitlines()
+        assert len(rows) == 7
+        assert rows[0].startswith('rank,trial_id,status,val_loss')
@@ -0,0 +1,65 @@
+"""
+Tests for Streaming Training
+
+DataSource 기반 학습 (tf.data) 다중 epoch 테스트
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.learning.dataset import ArrayDataSource
+from src.learning.training import trainer as trainer_module
+from src.learning.training.config import TrainingConfig
+from src.learning.training.trainer import ModelTrainer
+
+tf = pytest.importorskip('tensorflow')
+
+
+class _StepCounter(tf.keras.callbacks.Callback):
+    """epoch별 학습 / 검증 배치 수 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.train_steps = []
+        self.val_steps = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.train_steps.append(0)
+        self.val_steps.append(0)
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.train_steps[-1] += 1
+
+    def on_test_batch_end(self, batch, logs=None):
+        self.val_steps[-1] += 1
+
+
+@pytest.mark.unit
+def test_every_epoch_runs_all_steps(monkeypatch):
+    """steps_per_epoch / validation_steps만큼 매 epoch 데이터가 공급됨"""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(50, 4)).astype(np.float32)
+    y = (np.arange(50) % 2).astype(np.int32)
+
+    keras_model = tf.keras.Sequential([
+        tf.keras.Input(shape=(4,)),
+        tf.keras.layers.Dense(2, activation='softmax'),
+    ])
+    keras_model.compile(optimizer='adam', loss='sparse_categorical_crossentropy')
+
+    counter = _StepCounter()
+    monkeypatch.setattr(
+        trainer_module.CallbackFactory, 'create_callbacks', staticmethod(lambda config: [counter])
+    )
+
+    config = TrainingConfig(epochs=3, batch_size=8, validation_split=0.2)
+    trainer = ModelTrainer(config)
+    trainer.model = SimpleNamespace(get_model=lambda: keras_model)
+
+    history = trainer.train(ArrayDataSource(X, y))
+
+    # train 40 samples → 5 steps, validation 10 samples → 2 steps
+    assert len(history.history['loss']) == 3
+    assert counter.train_steps == [5, 5, 5]
+    assert counter.val_steps == [2, 2, 2]
@@ -0,0 +1,188 @@
+"""
+ConditionPlanner Unit Tests
+
+측정된 비용/통과율 기반 진입 조건 재배치 테스트 (결과는 YAML 순서와 동일)
+"""
+import json
+import pytest
+from contextlib import nullcontext
+from datetime import date
+from unittest.mock import Mock
+
+from src.application.services.condition_planner import ConditionPlanner, ConditionStats
+from src.application.use_cases.dynamic_block_detector import DynamicBlockDetector
+from src.domain.entities.block_graph import BlockNode
+from src.domain.entities.conditions import Condition, ExpressionEngine
+
+
+class FakeClock:
+    """속성 접근마다 비용만큼 진행하는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Candle:
+    """cheap/costly 접근 비용이 다른 테스트용 캔들"""
+
+    def __init__(self, clock: FakeClock, cheap: float, costly: float, broken: bool = False):
+        self.date = date(2024, 1, 1)
+        self._clock = clock
+        self._cheap = cheap
+        self._costly = costly
+        self._broken = broken
+
+    @property
+    def cheap(self) -> float:
+        self._clock.now += 1
+        return self._cheap
+
+    @property
+    def costly(self) -> float:
+        self._clock.now += 100
+        return self._costly
+
+    @property
+    def fragile(self) -> float:
+        if self._broken:
+            raise ZeroDivisionError("broken candle")
+        return 1.0
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def engine():
+    return ExpressionEngine()
+
+
+@pytest.fixture
+def candles(clock):
+    """cheap > 90은 10%만 통과, costly > 50은 50% 통과"""
+    return [Candle(clock, cheap=i % 100, costly=i % 2 * 100) for i in range(0, 200, 7)]
+
+
+def _detector(engine, planner=None):
+    return DynamicBlockDetector(Mock(), engine, condition_planner=planner)
+
+
+@pytest.mark.unit
+class TestConditionStats:
+    """ConditionStats 테스트"""
+
+    def test_rank_prefers_cheap_selective(self):
+        cheap = ConditionStats(evaluations=10, passed=1, total_seconds=10.0)
+        costly = ConditionStats(evaluations=10, passed=5, total_seconds=1000.0)
+
+        assert cheap.rank(is_and=True) < costly.rank(is_and=True)
+        assert ConditionStats(evaluations=10, passed=10, total_seconds=1.0).rank(is_and=True) == float('inf')
+        assert ConditionStats(evaluations=10, passed=0, total_seconds=1.0).rank(is_and=False) == float('inf')
+
+
+@pytest.mark.unit
+class TestConditionPlanner:
+    """ConditionPlanner 테스트"""
+
+    def test_profile_replays_yaml_order(self, engine, clock):
+        """YAML 순서상 먼저 나온 에러/실패가 결과를 결정"""
+        planner = ConditionPlanner(engine, clock=clock)
+        ok = Candle(clock, cheap=0, costly=0)
+        broken = Candle(clock, cheap=0, costly=0, broken=True)
+        fails_then_error = [
+            Condition("fails", "current.cheap > 50"),
+            Condition("error", "current.fragile > 0"),
+        ]
+        error_then_fails = list(reversed(fails_then_error))
+
+        assert planner.profile_conditions(fails_then_error, {'current': broken}) is False
+        with pytest.raises(ValueError):
+            planner.profile_conditions(error_then_fails, {'current': broken})
+        assert planner.profile_conditions(error_then_fails, {'current': ok}) is False
+
+        # 모든 조건이 평가되어 기록됨
+        assert planner.stats["current.fragile > 0"].errors == 2
+
+    def test_reorders_and_list_after_min_samples(self, engine, clock, candles):
+        """충분히 측정되면 싸고 선택적인 조건이 먼저, 결과는 동일"""
+        planner = ConditionPlanner(engine, min_samples=len(candles), clock=clock)
+        node = BlockNode(
+            block_id="block1", block_type=1, name="Block1",
+            entry_conditions=[
+                Condition("costly_check", "current.costly > 50"),
+                Condition("cheap_check", "current.cheap > 90"),
+            ]
+        )
+        plain = _detector(engine)
+        planned = _detector(engine, planner)
+
+        expected = [plain._check_entry_conditions(node, {'current': c}) for c in candles]
+
+        # 1회차: 프로파일, 2회차: 재배치된 순서
+        assert [planned._check_entry_conditions(node, {'current': c}) for c in candles] == expected
+        assert not planner.needs_profiling(node.entry_conditions)
+        assert [c.name for c in planner.order_conditions(node.entry_conditions)] == [
+            "cheap_check", "costly_check"
+        ]
+
+        started = clock.now
+        assert [planned._check_entry_conditions(node, {'current': c}) for c in candles] == expected
+        planned_cost = clock.now - started
+
+        started = clock.now
+        for c in candles:
+            plain._check_entry_conditions(node, {'current': c})
+        assert planned_cost < clock.now - started
+
+    def test_reorders_or_operands_inside_expression(self, engine, clock, candles):
+        """표현식 내부 or 피연산자도 재배치 (에러 없는 경우만)"""
+        planner = ConditionPlanner(engine, min_samples=5, clock=clock)
+        condition = Condition("either", "current.costly < 50 or current.cheap < 90")
+
+        for c in candles[:5]:
+            planner.profile_conditions([condition], {'current': c})
+
+        planned = planner._planned_tree(condition.expression)
+        assert planned is not None
+        assert [op.left.attr for op in planned.body.values] == ["cheap", "costly"]
+        for c in candles:
+            assert planner.evaluate(condition, {'current': c}) == condition.evaluate(engine, {'current': c})
+
+    def test_operands_with_errors_are_not_reordered(self, engine, clock):
+        """프로파일 중 에러가 난 피연산자가 있으면 원래 순서 유지"""
+        planner = ConditionPlanner(engine, min_samples=2, clock=clock)
+        condition = Condition("guarded", "current.costly > 50 or current.fragile > 0")
+
+        for broken in (True, False):
+            with pytest.raises(ValueError) if broken else nullcontext():
+                planner.profile_conditions(
+                    [condition], {'current': Candle(clock, cheap=0, costly=0, broken=broken)}
+                )
+
+        assert planner._planned_tree(condition.expression) is None
+
+    def test_save_and_load_per_yaml(self, engine, clock, candles, tmp_path):
+        """YAML 옆 .plan.json에 저장, YAML이 바뀌면 무시"""
+        yaml_path = tmp_path / "seed.yaml"
+        yaml_path.write_text("block_graph: {}\n", encoding="utf-8")
+        conditions = [Condition("cheap_check", "current.cheap > 90")]
+
+        planner = ConditionPlanner(engine, yaml_path=str(yaml_path), min_samples=3, clock=clock)
+        for c in candles[:3]:
+            planner.profile_conditions(conditions, {'current': c})
+        saved = planner.save()
+
+        assert saved == tmp_path / "seed.plan.json"
+        assert "current.cheap > 90" in json.loads(saved.read_text(encoding="utf-8"))['stats']
+
+        restored = ConditionPlanner(engine, yaml_path=str(yaml_path), min_samples=3)
+        assert restored.load()
+        assert not restored.needs_profiling(conditions)
+
+        yaml_path.write_text("block_graph: {nodes: {}}\n", encoding="utf-8")
+        assert not ConditionPlanner(engine, yaml_path=str(yaml_path)).load()
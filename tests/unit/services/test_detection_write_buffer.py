@@ -0,0 +1,169 @@
+"""
+DetectionWriteBuffer Unit Tests
+
+탐지 결과 스테이징 버퍼 단위 테스트
+"""
+import pytest
+from datetime import date
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.detection_write_buffer import DetectionWriteBuffer
+from src.domain.entities.detections import DynamicBlockDetection
+from src.domain.entities.patterns import BlockFeatures, SeedPattern
+from src.domain.repositories.dynamic_block_repository import DynamicBlockRepository
+from src.domain.repositories.seed_pattern_repository import SeedPatternRepository
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.dynamic_block_detection_model import DynamicBlockDetectionModel
+from src.infrastructure.database.models.seed_pattern_model import SeedPatternModel
+from src.infrastructure.repositories.common.bulk import DEFAULT_CHUNK_SIZE
+from src.infrastructure.repositories.dynamic_block_repository_impl import DynamicBlockRepositoryImpl
+from src.infrastructure.repositories.seed_pattern_repository_impl import SeedPatternRepositoryImpl
+
+
+def _seed_pattern(name: str, description: str = "") -> SeedPattern:
+    pattern = Mock(spec=SeedPattern)
+    pattern.pattern_name = name
+    pattern.description = description
+    return pattern
+
+
+def _block(block_id: str, started_at: date, pattern_id: str = "SEED_025980_20240115_001"):
+    block = DynamicBlockDetection(block_id, 1, "025980", "seed", pattern_id=pattern_id)
+    block.start(started_at)
+    return block
+
+
+class TestDetectionWriteBuffer:
+    """DetectionWriteBuffer 테스트"""
+
+    @pytest.fixture
+    def pattern_repo(self):
+        return Mock(spec=SeedPatternRepository)
+
+    @pytest.fixture
+    def block_repo(self):
+        return Mock(spec=DynamicBlockRepository)
+
+    def test_flush_writes_once_per_repository(self, pattern_repo, block_repo):
+        """flush 시 저장소별 save_all 1회 호출"""
+        buffer = DetectionWriteBuffer(pattern_repo, block_repo)
+        buffer.stage_pattern(_seed_pattern("P1"))
+        buffer.stage_pattern(_seed_pattern("P2"))
+        buffer.stage_blocks([_block("block1", date(2024, 1, 15)), _block("block2", date(2024, 1, 20))])
+
+        assert buffer.flush() == (2, 2)
+        pattern_repo.save_all.assert_called_once()
+        block_repo.save_all.assert_called_once()
+        assert pattern_repo.save.call_count == 0
+        assert buffer.pending_count == 0
+
+    def test_deduplicates_by_natural_key(self, pattern_repo, block_repo):
+        """자연키 기준 중복 제거 (마지막 값 우선)"""
+        buffer = DetectionWriteBuffer(pattern_repo, block_repo)
+        buffer.stage_pattern(_seed_pattern("P1", "first"))
+        buffer.stage_pattern(_seed_pattern("P1", "last"))
+        first = _block("block1", date(2024, 1, 15))
+        last = _block("block1", date(2024, 1, 15))
+        buffer.stage_blocks([first, last])
+
+        buffer.flush()
+
+        (patterns,), _ = pattern_repo.save_all.call_args
+        (blocks,), _ = block_repo.save_all.call_args
+        assert [p.description for p in patterns] == ["last"]
+        assert blocks == [last]
+
+    def test_same_block_in_different_patterns_is_kept(self, pattern_repo, block_repo):
+        """pattern_id가 다르면 별도 블록으로 취급"""
+        buffer = DetectionWriteBuffer(pattern_repo, block_repo)
+        buffer.stage_blocks([
+            _block("block1", date(2024, 1, 15), pattern_id="A"),
+            _block("block1", date(2024, 1, 15), pattern_id="B"),
+        ])
+        assert buffer.flush() == (0, 2)
+
+    def test_without_block_repository_blocks_are_ignored(self, pattern_repo):
+        """블록 저장소가 없으면 블록은 스테이징하지 않음"""
+        buffer = DetectionWriteBuffer(pattern_repo)
+        buffer.stage_blocks([_block("block1", date(2024, 1, 15))])
+        assert buffer.pending_count == 0
+        assert buffer.flush() == (0, 0)
+        pattern_repo.save_all.assert_not_called()
+
+    def test_auto_flush_on_threshold(self, pattern_repo):
+        """flush_threshold 도달 시 자동 flush"""
+        buffer = DetectionWriteBuffer(pattern_repo, flush_threshold=2)
+        buffer.stage_pattern(_seed_pattern("P1"))
+        pattern_repo.save_all.assert_not_called()
+        buffer.stage_pattern(_seed_pattern("P2"))
+        pattern_repo.save_all.assert_called_once()
+        assert buffer.pending_count == 0
+
+    def test_failed_flush_keeps_buffer(self, pattern_repo):
+        """저장 실패 시 버퍼 유지"""
+        pattern_repo.save_all.side_effect = RuntimeError("db down")
+        buffer = DetectionWriteBuffer(pattern_repo)
+        buffer.stage_pattern(_seed_pattern("P1"))
+
+        with pytest.raises(RuntimeError):
+            buffer.flush()
+        assert buffer.pending_count == 1
+
+    def test_failed_flush_rolls_back_and_retry_persists(self, monkeypatch):
+        """블록 저장 실패 → 공유 세션 rollback → 재시도 시 패턴/블록 모두 저장 (실제 SQLite)"""
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        pattern_repo = SeedPatternRepositoryImpl(session)
+        block_repo = DynamicBlockRepositoryImpl(session)
+
+        # 첫 시도: 패턴 INSERT(RETURNING id 할당) + 블록 INSERT 후 실패
+        bulk_save = block_repo.bulk_save
+        attempts = []
+
+        def flaky_bulk_save(detections, chunk_size=DEFAULT_CHUNK_SIZE):
+            attempts.append(len(detections))
+            bulk_save(detections, chunk_size=chunk_size)
+            if len(attempts) == 1:
+                raise RuntimeError("connection reset")
+
+        monkeypatch.setattr(block_repo, 'bulk_save', flaky_bulk_save)
+
+        pattern = SeedPattern(
+            pattern_name='SEED_025980_20240115_001',
+            ticker='025980',
+            yaml_config_path='presets/examples/seed.yaml',
+            detection_date=date(2024, 1, 15),
+            block_features=[BlockFeatures(
+                block_id='block1', block_type=1,
+                started_at=date(2024, 1, 15), ended_at=date(2024, 2, 10),
+                duration_candles=20, low_price=9500, high_price=12500,
+                peak_price=12000, peak_date=date(2024, 1, 25),
+                min_volume=500000, max_volume=2000000, peak_volume=1800000, avg_volume=1000000
+            )],
+            price_shape=[0.0, 1.0],
+            volume_shape=[0.0, 1.0]
+        )
+        buffer = DetectionWriteBuffer(pattern_repo, block_repo)
+        buffer.stage_pattern(pattern)
+        buffer.stage_blocks([_block("block1", date(2024, 1, 15))])
+
+        with pytest.raises(RuntimeError):
+            buffer.flush()
+        assert buffer.pending_count == 2
+        assert session.scalar(select(func.count()).select_from(SeedPatternModel)) == 0
+
+        assert buffer.flush() == (1, 1)
+        assert buffer.pending_count == 0
+
+        session.expire_all()
+        assert session.scalars(select(SeedPatternModel.id)).all() == [pattern.id]
+        assert session.scalar(select(func.count()).select_from(DynamicBlockDetectionModel)) == 1
+        session.close()
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            DetectionWriteBuffer(flush_threshold=0)
@@ -0,0 +1,156 @@
+"""
+EntryConditionPrefilter Unit Tests
+
+상태 없는 진입 조건 NumPy 마스크 테스트 (마스크 False ⇒ 인터프리터도 False)
+"""
+import random
+import pytest
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.application.services.entry_prefilter import EntryConditionPrefilter
+from src.application.services.stock_data_utils import forward_fill_with_last_valid_index
+from src.application.use_cases.dynamic_block_detector import DynamicBlockDetector
+from src.domain.entities.block_graph import BlockGraph, BlockNode
+from src.domain.entities.conditions import Condition, ExpressionEngine, function_registry
+from src.domain.entities.core import Stock
+
+
+STATE_FREE = [
+    "current.close >= 10000",
+    "prev != None and ((current.high - prev.close) / prev.close) >= 0.03",
+    "(current.close * current.volume) >= 5000000000",
+    "current.low < ma(20)",
+    "normalized_volume(20) >= 150.0",
+    "is_new_high(30)",
+    "not (current.close < ma(5)) or current.volume > volume_ma(10) * 2",
+    "current.rate >= 3.0",
+]
+
+STATEFUL = [
+    "exists('block1')",
+    "candles_between(block1.started_at, current.date) >= 2",
+    "current.close >= block1.peak_price",
+]
+
+
+class _NoPrefilter:
+    """마스크 없이 모든 캔들 평가"""
+
+    def candidate_mask(self, conditions, stocks, prev_index):
+        return None
+
+
+@pytest.fixture
+def engine():
+    return ExpressionEngine(function_registry)
+
+
+@pytest.fixture
+def series():
+    """랜덤 워크 300일 (거래정지 포함, rate 지표)"""
+    rng = random.Random(3)
+    price = 10000.0
+    raw = []
+    for i in range(300):
+        price = max(1000.0, price * (1 + rng.uniform(-0.05, 0.06)))
+        high = price * (1 + rng.uniform(0, 0.04))
+        low = price * (1 - rng.uniform(0, 0.04))
+        volume = 0 if rng.random() < 0.05 else rng.randint(100_000, 2_000_000)
+        stock = Stock(
+            ticker="025980", name="아난티", date=date(2023, 1, 2) + timedelta(days=i),
+            open=price, high=high, low=low, close=price, volume=volume
+        )
+        raw.append(stock)
+
+    stocks, last_valid_index = forward_fill_with_last_valid_index(raw)
+    for stock in stocks:
+        stock.indicators = {'rate': rng.uniform(-5, 8)}
+    return stocks, last_valid_index
+
+
+def _interpreted(engine, expression, stocks, last_valid_index):
+    """오케스트레이터 Block1 컨텍스트로 캔들마다 평가 (에러는 False)"""
+    results = []
+    for i, current in enumerate(stocks):
+        prev = stocks[last_valid_index[i]] if last_valid_index[i] >= 0 else None
+        context = {'current': current, 'prev': prev, 'all_stocks': stocks[:i + 1]}
+        try:
+            results.append(bool(engine.evaluate(expression, context)))
+        except ValueError:
+            results.append(False)
+    return np.array(results)
+
+
+@pytest.mark.unit
+class TestEntryConditionPrefilter:
+    """EntryConditionPrefilter 테스트"""
+
+    def test_state_free_analysis(self, engine):
+        prefilter = EntryConditionPrefilter(engine)
+
+        for expression in STATE_FREE:
+            assert prefilter.is_state_free(Condition("c", expression)), expression
+        for expression in STATEFUL:
+            assert not prefilter.is_state_free(Condition("c", expression)), expression
+
+    def test_stateful_conditions_give_no_mask(self, engine, series):
+        stocks, last_valid_index = series
+        prefilter = EntryConditionPrefilter(engine)
+        conditions = [Condition("c", e) for e in STATEFUL]
+
+        assert prefilter.candidate_mask(conditions, stocks, last_valid_index) is None
+
+    @pytest.mark.parametrize("expression", STATE_FREE)
+    def test_mask_matches_interpreter(self, engine, series, expression):
+        """마스크 False인 캔들은 인터프리터도 False, 나머지도 거의 일치"""
+        stocks, last_valid_index = series
+        prefilter = EntryConditionPrefilter(engine)
+
+        mask = prefilter.candidate_mask([Condition("c", expression)], stocks, last_valid_index)
+        expected = _interpreted(engine, expression, stocks, last_valid_index)
+
+        assert not np.any(expected & ~mask)
+        assert np.sum(mask & ~expected) <= len(stocks) // 10
+
+    def test_and_list_mask_skips_most_candles(self, engine, series):
+        stocks, last_valid_index = series
+        prefilter = EntryConditionPrefilter(engine)
+        conditions = [
+            Condition("surge", STATE_FREE[1]),
+            Condition("volume", STATE_FREE[4]),
+            Condition("stateful", STATEFUL[0]),
+        ]
+
+        mask = prefilter.candidate_mask(conditions, stocks, last_valid_index)
+
+        surge = _interpreted(engine, STATE_FREE[1], stocks, last_valid_index)
+        volume = _interpreted(engine, STATE_FREE[4], stocks, last_valid_index)
+
+        assert mask.sum() < len(stocks) * 0.2
+        assert not np.any(surge & volume & ~mask)
+
+    def test_detect_blocks_identical_with_prefilter(self, engine, series):
+        """사전 마스크 유무와 관계없이 같은 블록 탐지"""
+        stocks, _ = series
+        graph = BlockGraph()
+        graph.add_node(BlockNode(
+            block_id="block1", block_type=1, name="Block1",
+            entry_conditions=[
+                Condition("surge", STATE_FREE[1]),
+                Condition("above_ma", "current.close >= ma(20)"),
+            ],
+            exit_conditions=[Condition("below_ma", "current.close < ma(10)")]
+        ))
+
+        with_mask = DynamicBlockDetector(graph, engine).detect_blocks("025980", stocks)
+        without = DynamicBlockDetector(graph, engine, entry_prefilter=_NoPrefilter()).detect_blocks(
+            "025980", stocks
+        )
+
+        def summary(blocks):
+            return [(b.block_id, b.started_at, b.ended_at, b.peak_price) for b in blocks]
+
+        assert summary(with_mask) == summary(without)
+        assert with_mask
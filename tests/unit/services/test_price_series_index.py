@@ -0,0 +1,153 @@
+"""
+PriceSeriesIndex Unit Tests
+
+구간 최소/최대 조회 + SupportResistanceAnalyzer 결과 동일성 테스트
+"""
+import random
+import pytest
+from datetime import date, timedelta
+
+from src.application.services.price_series_index import PriceSeriesIndex
+from src.application.services.support_resistance_analyzer import SupportResistanceAnalyzer
+from src.domain.entities.core import Stock
+from src.domain.entities.detections import DynamicBlockDetection, BlockStatus
+
+
+BASE = date(2020, 1, 1)
+
+
+@pytest.fixture
+def stocks():
+    """랜덤 워크 300일 (주말 제외 없이 연속 날짜)"""
+    rng = random.Random(7)
+    price = 10000.0
+    result = []
+    for i in range(300):
+        price = max(1000.0, price * (1 + rng.uniform(-0.04, 0.04)))
+        high = round(price * (1 + rng.uniform(0, 0.03)))
+        low = round(price * (1 - rng.uniform(0, 0.03)))
+        result.append(Stock(
+            ticker="025980", name="아난티", date=BASE + timedelta(days=i),
+            open=price, high=high, low=low, close=price, volume=1000
+        ))
+    return result
+
+
+def _block(block_id: str, start: int, end: int, peak_price: float) -> DynamicBlockDetection:
+    return DynamicBlockDetection(
+        block_id=block_id,
+        block_type=2,
+        ticker="025980",
+        condition_name="seed",
+        started_at=BASE + timedelta(days=start),
+        ended_at=BASE + timedelta(days=end),
+        status=BlockStatus.COMPLETED,
+        peak_price=peak_price
+    )
+
+
+def _linear_retests(forward_blocks, reference_high, all_stocks, tolerance_pct):
+    """기존 구현 (날짜 필터 + 순회)"""
+    events = []
+    for block in forward_blocks:
+        for stock in all_stocks:
+            if block.started_at <= stock.date <= block.ended_at:
+                if abs(stock.high - reference_high) <= reference_high * (tolerance_pct / 100):
+                    events.append((stock.date, stock.high, block.block_id))
+    return events
+
+
+@pytest.mark.unit
+class TestPriceSeriesIndex:
+    """PriceSeriesIndex 테스트"""
+
+    def test_range_min_max_match_brute_force(self, stocks):
+        """모든 구간 길이에서 sparse table 결과 = min()/max()"""
+        index = PriceSeriesIndex(stocks)
+        rng = random.Random(11)
+
+        for _ in range(500):
+            lo = rng.randrange(len(stocks))
+            hi = rng.randrange(lo + 1, len(stocks) + 1)
+            window = stocks[lo:hi]
+            assert index.min_low(lo, hi) == min(s.low for s in window)
+            assert index.max_low(lo, hi) == max(s.low for s in window)
+            assert index.min_high(lo, hi) == min(s.high for s in window)
+            assert index.max_high(lo, hi) == max(s.high for s in window)
+
+    def test_range_is_inclusive(self, stocks):
+        """날짜 → 위치 [lo, hi), 양 끝 포함"""
+        index = PriceSeriesIndex(stocks)
+
+        assert index.range(BASE + timedelta(days=10), BASE + timedelta(days=19)) == (10, 20)
+        assert index.range(date(2019, 1, 1), date(2019, 12, 31)) == (0, 0)
+        assert index.range(date(2030, 1, 1), date(2030, 12, 31)) == (300, 300)
+
+    def test_unsorted_input_is_sorted(self, stocks):
+        """날짜 순이 아닌 입력은 정렬 후 색인"""
+        index = PriceSeriesIndex(list(reversed(stocks)))
+
+        assert [s.date for s in index.stocks] == [s.date for s in stocks]
+        assert index.min_low(0, 50) == min(s.low for s in stocks[:50])
+
+    def test_first_low_near(self, stocks):
+        """허용 오차 내 첫 저가 위치"""
+        index = PriceSeriesIndex(stocks)
+        target = stocks[42].low
+
+        position = index.first_low_near(0, len(stocks), target, 0.0)
+        assert position == next(i for i, s in enumerate(stocks) if s.low == target)
+        assert index.first_low_near(0, len(stocks), 10 ** 9, 1.0) == -1
+        assert index.first_low_near(5, 5, target, 0.0) == -1
+
+
+@pytest.mark.unit
+class TestSupportResistanceAnalyzerWithIndex:
+    """색인 경로와 기존 선형 탐색 결과 동일성"""
+
+    def test_retests_and_flips_match_linear_scan(self, stocks):
+        analyzer = SupportResistanceAnalyzer(tolerance_pct=2.0)
+        reference = _block("block1", 0, 20, stocks[15].high)
+        reference_high = reference.peak_price
+        forward_blocks = [
+            _block("block2", 30, 80, reference_high * 1.1),
+            _block("block3", 90, 150, reference_high * 0.9),
+            _block("block4", 160, 299, reference_high * 1.2),
+            _block("block5", 310, 320, reference_high),  # 데이터 범위 밖
+        ]
+
+        analysis = analyzer.analyze(reference, forward_blocks, stocks)
+
+        assert analysis.metadata['reference_low'] == min(s.low for s in stocks[:21])
+        assert [
+            (e['date'], e['price'], e['block_id']) for e in analysis.retest_events
+        ] == _linear_retests(forward_blocks, reference_high, stocks, 2.0)
+
+        tolerance = reference_high * 0.02
+        expected_flips = []
+        for i, block in enumerate(forward_blocks[:-1]):
+            if block.peak_price <= reference_high:
+                continue
+            nxt = forward_blocks[i + 1]
+            for stock in stocks:
+                if nxt.started_at <= stock.date <= nxt.ended_at and \
+                        abs(stock.low - reference_high) <= tolerance:
+                    expected_flips.append((block.block_id, stock.date))
+                    break
+        assert [
+            (f['breakout_block_id'], f['support_date'])
+            for f in analysis.resistance_to_support_flips
+        ] == expected_flips
+
+    def test_index_reused_for_same_series(self, stocks):
+        """같은 all_stocks 리스트로 반복 호출 시 색인 재사용"""
+        analyzer = SupportResistanceAnalyzer()
+        reference = _block("block1", 0, 20, stocks[15].high)
+
+        analyzer.analyze(reference, [], stocks)
+        first = analyzer._price_index
+        analyzer.analyze(reference, [], stocks)
+        assert analyzer._price_index is first
+
+        analyzer.analyze(reference, [], list(stocks))
+        assert analyzer._price_index is not first
@@ -0,0 +1,116 @@
+"""
+SeedPatternTreeManager Unit Tests
+
+종목별 활성 패턴 색인 (root 시작일 순 bisect 조회, 완료 패턴 분리) 테스트
+"""
+import random
+import pytest
+from datetime import date, timedelta
+
+from src.application.services.seed_pattern_tree_manager import SeedPatternTreeManager
+from src.domain.entities.detections import DynamicBlockDetection, BlockStatus
+from src.domain.entities.patterns import PatternStatus
+
+
+def _block(block_id, ticker, started_at, is_virtual=False, status=BlockStatus.ACTIVE):
+    return DynamicBlockDetection(
+        block_id=block_id,
+        block_type=int(block_id[-1]),
+        ticker=ticker,
+        condition_name="seed",
+        started_at=started_at,
+        ended_at=started_at if status == BlockStatus.COMPLETED else None,
+        status=status,
+        is_virtual=is_virtual
+    )
+
+
+def _linear_lookup(patterns, block):
+    """색인 도입 전 선형 탐색 기준 구현"""
+    if block.is_virtual:
+        candidates = [p for p in patterns if p.ticker == block.ticker]
+    else:
+        candidates = [
+            p for p in patterns
+            if p.ticker == block.ticker
+            and p.root_block.started_at
+            and block.started_at
+            and p.root_block.started_at <= block.started_at
+        ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.root_block.started_at)
+
+
+@pytest.mark.unit
+class TestSeedPatternTreeManager:
+    """SeedPatternTreeManager 테스트"""
+
+    def test_lookup_picks_latest_root_before_block(self):
+        manager = SeedPatternTreeManager()
+        first = manager.create_new_pattern("025980", _block("block1", "025980", date(2024, 1, 5)), date(2024, 1, 5))
+        later = manager.create_new_pattern("025980", _block("block1", "025980", date(2024, 3, 1)), date(2024, 3, 1))
+        same_day = manager.create_new_pattern("025980", _block("block1", "025980", date(2024, 3, 1)), date(2024, 3, 1))
+        manager.create_new_pattern("005930", _block("block1", "005930", date(2024, 2, 1)), date(2024, 2, 1))
+
+        assert manager.find_active_pattern_for_block(_block("block2", "025980", date(2024, 2, 20))) is first
+        # 같은 시작일이면 먼저 생성된 패턴
+        assert manager.find_active_pattern_for_block(_block("block2", "025980", date(2024, 3, 1))) is later
+        assert manager.find_active_pattern_for_block(_block("block2", "025980", None, is_virtual=True)) is later
+        assert manager.find_active_pattern_for_block(_block("block2", "025980", date(2024, 1, 1))) is None
+        assert manager.find_active_pattern_for_block(_block("block2", "000660", date(2024, 5, 1))) is None
+        assert same_day in manager.get_patterns_by_ticker("025980")
+
+    def test_completed_patterns_leave_active_index(self):
+        manager = SeedPatternTreeManager()
+        done = manager.create_new_pattern(
+            "025980", _block("block1", "025980", date(2024, 1, 5), status=BlockStatus.COMPLETED), date(2024, 1, 5)
+        )
+        running = manager.create_new_pattern(
+            "025980", _block("block1", "025980", date(2024, 1, 2)), date(2024, 1, 2)
+        )
+        other = manager.create_new_pattern(
+            "005930", _block("block1", "005930", date(2024, 1, 1), status=BlockStatus.COMPLETED), date(2024, 1, 1)
+        )
+
+        # 다른 종목 패턴은 건드리지 않음
+        assert manager.check_and_complete_patterns("025980") == [done]
+        assert other.status == PatternStatus.ACTIVE
+
+        assert manager.active_patterns == [running, other]
+        assert manager.completed_patterns == [done]
+        assert manager.get_all_patterns() == [running, other, done]
+        assert manager.get_patterns_by_ticker("025980") == [running, done]
+        assert manager.find_active_pattern_for_block(_block("block2", "025980", date(2024, 2, 1))) is running
+        assert manager.get_statistics()['patterns_by_ticker'] == {
+            '025980': {'active': 1, 'completed': 1},
+            '005930': {'active': 1, 'completed': 0},
+        }
+
+        assert manager.check_and_complete_patterns() == [other]
+        assert manager.get_statistics()['active_patterns'] == 1
+
+    def test_matches_linear_lookup_on_random_workload(self):
+        """무작위 생성/완료/조회에서 선형 탐색과 같은 패턴 선택"""
+        rng = random.Random(7)
+        manager = SeedPatternTreeManager()
+        tickers = ["025980", "005930", "000660"]
+        base = date(2024, 1, 1)
+
+        for step in range(400):
+            ticker = rng.choice(tickers)
+            day = base + timedelta(days=rng.randint(0, 60))
+            action = rng.random()
+
+            if action < 0.4:
+                status = BlockStatus.COMPLETED if rng.random() < 0.3 else BlockStatus.ACTIVE
+                manager.create_new_pattern(ticker, _block("block1", ticker, day, status=status), day)
+            elif action < 0.5:
+                manager.check_and_complete_patterns(ticker if rng.random() < 0.5 else None)
+            else:
+                block = _block("block2", ticker, day, is_virtual=rng.random() < 0.2)
+                expected = _linear_lookup(manager.active_patterns, block)
+                assert manager.find_active_pattern_for_block(block) is expected, step
+
+        assert all(p.status == PatternStatus.ACTIVE for p in manager.active_patterns)
+        assert len(manager.get_all_patterns()) == sum(manager.pattern_sequence.values())
@@ -0,0 +1,105 @@
+"""
+Stock Data Utilities Unit Tests (application layer)
+
+forward fill과 함께 계산되는 last_valid_index 배열 테스트
+"""
+import pytest
+from datetime import date
+
+from src.application.services.stock_data_utils import (
+    forward_fill_prices,
+    forward_fill_with_last_valid_index,
+    get_last_valid_stock
+)
+from src.domain.entities.core import Stock, DateIndex, DATE_INDEX_KEY
+from src.domain.entities.conditions.builtin_functions import last_valid_volume
+
+
+def _stock(day: int, volume: int, close: float = 1000.0) -> Stock:
+    return Stock(
+        ticker="025980", name="아난티", date=date(2024, 1, day),
+        open=close, high=close, low=close, close=close, volume=volume
+    )
+
+
+@pytest.fixture
+def suspended_stocks():
+    """첫 거래 전 1일 + 중간 거래 정지 2일"""
+    return [
+        _stock(1, 0, 900.0),
+        _stock(2, 100, 1000.0),
+        _stock(3, 0, 1.0),
+        _stock(4, 0, 1.0),
+        _stock(5, 200, 1100.0),
+        _stock(6, 300, 1200.0),
+    ]
+
+
+def _linear_last_valid(stocks, current_index):
+    for i in range(current_index - 1, -1, -1):
+        if stocks[i].volume > 0:
+            return i
+    return -1
+
+
+@pytest.mark.unit
+class TestForwardFillWithLastValidIndex:
+    """forward_fill_with_last_valid_index() 테스트"""
+
+    def test_matches_forward_fill_prices(self, suspended_stocks):
+        """채워진 가격은 forward_fill_prices와 동일"""
+        filled, _ = forward_fill_with_last_valid_index(suspended_stocks)
+
+        assert filled == forward_fill_prices(suspended_stocks)
+        assert filled[2].close == 1000.0
+        assert filled[3].volume == 0
+
+    def test_last_valid_index_matches_backward_scan(self, suspended_stocks):
+        """각 위치의 값이 역순 탐색 결과와 동일"""
+        filled, last_valid_index = forward_fill_with_last_valid_index(suspended_stocks)
+
+        assert last_valid_index == [-1, -1, 1, 1, 1, 4]
+        for i in range(len(filled)):
+            assert last_valid_index[i] == _linear_last_valid(filled, i)
+
+    def test_empty(self):
+        """빈 리스트"""
+        assert forward_fill_with_last_valid_index([]) == ([], [])
+
+    def test_get_last_valid_stock_uses_array(self, suspended_stocks):
+        """배열이 주어지면 같은 결과를 O(1)로 반환"""
+        filled, last_valid_index = forward_fill_with_last_valid_index(suspended_stocks)
+
+        for i in range(len(filled)):
+            assert get_last_valid_stock(filled, i, last_valid_index) is get_last_valid_stock(filled, i)
+
+
+@pytest.mark.unit
+class TestDateIndexLastValid:
+    """DateIndex + last_valid_index 조회 테스트"""
+
+    def test_last_traded_before_with_array(self, suspended_stocks):
+        """배열 유무와 관계없이 같은 위치 반환"""
+        filled, last_valid_index = forward_fill_with_last_valid_index(suspended_stocks)
+        indexed = DateIndex(filled, last_valid_index)
+        plain = DateIndex(filled)
+
+        for day in range(1, 9):
+            target = date(2024, 1, day)
+            assert indexed.last_traded_before(filled, target) == plain.last_traded_before(filled, target)
+
+    def test_length_mismatch_raises(self, suspended_stocks):
+        """배열 길이가 다르면 ValueError"""
+        with pytest.raises(ValueError):
+            DateIndex(suspended_stocks, [-1])
+
+    def test_last_valid_volume_uses_index(self, suspended_stocks):
+        """last_valid_volume()이 색인 경로와 역순 탐색에서 같은 값 반환"""
+        filled, last_valid_index = forward_fill_with_last_valid_index(suspended_stocks)
+        index = DateIndex(filled, last_valid_index)
+
+        for i in range(1, len(filled)):
+            prefix = filled[:i + 1]
+            plain = {'all_stocks': prefix, 'current': filled[i]}
+            indexed = dict(plain, **{DATE_INDEX_KEY: index})
+            assert last_valid_volume(indexed) == last_valid_volume(plain)
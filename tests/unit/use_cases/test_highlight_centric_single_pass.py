@@ -0,0 +1,167 @@
+"""
+HighlightCentricDetector single-pass 모드 단위 테스트
+
+한 번의 탐지 패스 + BlockIntervalIndex 조회
+"""
+import pytest
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+from src.application.services.block_interval_index import BlockIntervalIndex
+from src.application.use_cases.highlight_centric_detector import HighlightCentricDetector
+from src.domain.entities.core import Stock
+from src.domain.entities.detections import DynamicBlockDetection, BlockStatus
+
+
+def _block(block_type: int, started_at: date, peak_price: float) -> DynamicBlockDetection:
+    return DynamicBlockDetection(
+        block_id=f"block{block_type}",
+        block_type=block_type,
+        ticker="025980",
+        condition_name="seed",
+        started_at=started_at,
+        ended_at=started_at + timedelta(days=2),
+        status=BlockStatus.COMPLETED,
+        peak_price=peak_price
+    )
+
+
+@pytest.fixture
+def stocks():
+    base = date(2020, 1, 1)
+    return [
+        Stock(ticker="025980", name="아난티", date=base + timedelta(days=i),
+              open=100.0, high=110.0, low=90.0, close=105.0, volume=1000)
+        for i in range(200)
+    ]
+
+
+@pytest.fixture
+def blocks():
+    return [
+        _block(1, date(2020, 2, 20), 15000.0),  # highlight 이전 stronger root
+        _block(1, date(2020, 3, 10), 12000.0),  # highlight 1
+        _block(2, date(2020, 3, 20), 13000.0),
+        _block(1, date(2020, 4, 1), 11000.0),   # highlight 2
+        _block(2, date(2020, 5, 15), 14000.0),
+    ]
+
+
+@pytest.fixture
+def detector(blocks):
+    block_detector = Mock()
+    block_detector.detect_blocks.return_value = list(blocks)
+
+    highlight_node = Mock()
+    highlight_node.has_highlight_condition.return_value = True
+    block_graph = Mock()
+    block_graph.get_node.return_value = highlight_node
+
+    highlight_detector = Mock()
+    highlight_detector.find_highlights.side_effect = (
+        lambda blocks, highlight_condition, context: [b for b in blocks if b.peak_price in (12000.0, 11000.0)]
+    )
+
+    sr_analyzer = Mock()
+    sr_analyzer.analyze.side_effect = Exception("not needed")
+
+    return HighlightCentricDetector(
+        block_graph=block_graph,
+        highlight_detector=highlight_detector,
+        support_resistance_analyzer=sr_analyzer,
+        dynamic_block_detector=block_detector,
+        expression_engine=Mock()
+    )
+
+
+@pytest.mark.unit
+class TestBlockIntervalIndex:
+    """BlockIntervalIndex 테스트"""
+
+    def test_started_between_is_inclusive_and_sorted(self, blocks):
+        """시작일 범위 조회 (양 끝 포함, 시작일 순)"""
+        index = BlockIntervalIndex(list(reversed(blocks)))
+
+        result = index.started_between(date(2020, 3, 10), date(2020, 4, 1))
+        assert [b.started_at for b in result] == [
+            date(2020, 3, 10), date(2020, 3, 20), date(2020, 4, 1)
+        ]
+        assert index.started_between(date(2020, 6, 1), date(2020, 7, 1)) == []
+        assert len(index) == len(blocks)
+
+    def test_started_between_filters_block_type(self, blocks):
+        """block_type 필터"""
+        index = BlockIntervalIndex(blocks)
+
+        result = index.started_between(date(2020, 1, 1), date(2020, 12, 31), block_type=2)
+        assert [b.block_type for b in result] == [2, 2]
+
+
+@pytest.mark.unit
+class TestHighlightCentricSinglePass:
+    """single_pass=True 모드 테스트"""
+
+    def test_detects_blocks_once_per_ticker(self, detector, stocks):
+        """하이라이트 수와 관계없이 탐지 패스 1회"""
+        patterns = detector.detect_patterns(
+            ticker="025980",
+            stocks=stocks,
+            scan_from=date(2020, 3, 1),
+            scan_to=date(2020, 4, 30),
+            backward_days=30,
+            forward_days=60,
+            single_pass=True
+        )
+
+        assert len(patterns) == 2
+        assert detector.block_detector.detect_blocks.call_count == 1
+
+        # 패스 범위: scan_from - backward_days ~ scan_to + forward_days
+        passed = detector.block_detector.detect_blocks.call_args[1]['stocks']
+        assert passed[0].date == date(2020, 1, 31)
+        assert passed[-1].date == date(2020, 6, 29)
+
+    def test_backward_and_forward_queries(self, detector, stocks):
+        """backward: 더 강한 Block1 발견, forward: 루트 이후 시작 블록"""
+        patterns = detector.detect_patterns(
+            ticker="025980",
+            stocks=stocks,
+            scan_from=date(2020, 3, 1),
+            scan_to=date(2020, 3, 15),
+            backward_days=30,
+            forward_days=60,
+            single_pass=True
+        )
+
+        assert len(patterns) == 1
+        pattern = patterns[0]
+
+        assert pattern.backward_scan_result.found_stronger_root
+        assert pattern.root_block.started_at == date(2020, 2, 20)
+
+        # 루트(2/20) + 1일 ~ +60일 (4/20)
+        assert [b.started_at for b in pattern.forward_blocks] == [
+            date(2020, 3, 10), date(2020, 3, 20), date(2020, 4, 1)
+        ]
+
+    def test_backward_data_check_uses_full_series(self, detector, stocks):
+        """패스 시작일(2/9)에 캔들이 없어도 전체 시계열에 데이터가 있으면 backward scan 수행"""
+        stocks = [s for s in stocks if s.date != date(2020, 2, 9)]
+
+        patterns = detector.detect_patterns(
+            ticker="025980",
+            stocks=stocks,
+            scan_from=date(2020, 3, 10),
+            scan_to=date(2020, 3, 10),
+            backward_days=30,
+            forward_days=60,
+            single_pass=True
+        )
+
+        # 패스 첫 캔들은 2/10, highlight(3/10) backward 범위는 2/9부터
+        passed = detector.block_detector.detect_blocks.call_args[1]['stocks']
+        assert passed[0].date == date(2020, 2, 10)
+
+        assert len(patterns) == 1
+        assert patterns[0].backward_scan_result.found_stronger_root
+        assert patterns[0].root_block.started_at == date(2020, 2, 20)
@@ -0,0 +1,89 @@
+"""
+SeedPatternDetectionOrchestrator Streaming Tests
+
+완료 패턴을 종목 처리 직후 sink로 내보내고 메모리에서 제거하는 스트리밍 모드 테스트
+"""
+import json
+import queue
+import pytest
+from datetime import date, timedelta
+
+from src.application.services.pattern_sink import JsonlPatternSink, QueuePatternSink
+from src.application.use_cases.seed_pattern_detection_orchestrator import SeedPatternDetectionOrchestrator
+from src.domain.entities.block_graph import BlockGraph, BlockNode
+from src.domain.entities.conditions import Condition, ExpressionEngine, function_registry
+from src.domain.entities.core import Stock
+from src.domain.entities.patterns import PatternStatus
+
+
+def _graph():
+    graph = BlockGraph()
+    graph.add_node(BlockNode(
+        block_id="block1", block_type=1, name="Block1",
+        entry_conditions=[Condition("surge", "current.close >= prev.close * 1.05")],
+        exit_conditions=[Condition("drop", "current.close < prev.close * 0.97")]
+    ))
+    return graph
+
+
+def _stocks(ticker):
+    """급등(+6%) 후 급락(-4%)을 3번 반복하는 60일 시계열"""
+    stocks = []
+    price = 10000.0
+    for i in range(60):
+        if i % 20 == 5:
+            price *= 1.06
+        elif i % 20 == 10:
+            price *= 0.96
+        stocks.append(Stock(
+            ticker=ticker, name=ticker, date=date(2024, 1, 1) + timedelta(days=i),
+            open=price, high=price, low=price, close=price, volume=1_000_000
+        ))
+    return stocks
+
+
+def _orchestrator(**kwargs):
+    return SeedPatternDetectionOrchestrator(
+        block_graph=_graph(),
+        expression_engine=ExpressionEngine(function_registry),
+        **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestSeedPatternStreaming:
+    """스트리밍 모드 테스트"""
+
+    def test_streams_and_evicts_completed_patterns(self):
+        sink_queue = queue.Queue()
+        streaming = _orchestrator(streaming=True, pattern_sink=QueuePatternSink(sink_queue))
+        batch = _orchestrator()
+
+        for ticker in ("025980", "005930"):
+            returned = streaming.detect_patterns(ticker, _stocks(ticker), save_to_db=False)
+            expected = [p for p in batch.detect_patterns(ticker, _stocks(ticker), save_to_db=False)
+                        if p.ticker == ticker]
+
+            assert [str(p.pattern_id) for p in returned] == [str(p.pattern_id) for p in expected]
+            assert len(returned) == 3
+
+            # 완료 패턴은 sink로 전달되고 오케스트레이터에는 남지 않음
+            emitted = [sink_queue.get_nowait() for _ in range(sink_queue.qsize())]
+            assert emitted == returned
+            assert all(p.status == PatternStatus.COMPLETED for p in emitted)
+            assert streaming.get_all_patterns() == []
+
+        assert len(batch.get_all_patterns()) == 6
+
+    def test_jsonl_sink_writes_one_line_per_pattern(self, tmp_path):
+        path = tmp_path / "patterns.jsonl"
+        sink = JsonlPatternSink(str(path))
+        orchestrator = _orchestrator(streaming=True, pattern_sink=sink)
+
+        patterns = orchestrator.detect_patterns("025980", _stocks("025980"), save_to_db=False)
+        sink.close()
+
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [r['pattern_id'] for r in records] == [str(p.pattern_id) for p in patterns]
+        assert records[0]['blocks'][0]['block_id'] == "block1"
+        assert records[0]['blocks'][0]['started_at'] == str(patterns[0].root_block.started_at)